@@ -0,0 +1,35 @@
+"""
+Crawl benchmarks for Garuda Intel.
+
+Provides:
+- Synthetic site generator and local HTTP server
+- Deterministic stub Ollama ``/api/generate`` server
+- Offline hashing embedder and in-memory vector store
+- Runner reporting throughput, per-page costs and stage timings as JSON
+- Concurrent SQLite read/write benchmark of the storage engine profile
+- Link scoring throughput, per-link vs batched
+"""
+
+from .runner import StageTimer, compare_results, load_results, run_benchmark, save_results
+from .scorer import run_scorer_benchmark
+from .site import SyntheticSiteServer, SyntheticSiteSpec, build_site
+from .storage import compare_storage_profiles, run_storage_benchmark
+from .stub_ollama import StubOllamaServer
+from .vectors import HashingEmbedder, MemoryVectorStore
+
+__all__ = [
+    "HashingEmbedder",
+    "MemoryVectorStore",
+    "StageTimer",
+    "StubOllamaServer",
+    "SyntheticSiteServer",
+    "SyntheticSiteSpec",
+    "build_site",
+    "compare_results",
+    "compare_storage_profiles",
+    "load_results",
+    "run_benchmark",
+    "run_scorer_benchmark",
+    "run_storage_benchmark",
+    "save_results",
+]
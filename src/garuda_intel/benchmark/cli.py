@@ -0,0 +1,342 @@
+"""
+Crawl benchmark CLI.
+
+    garuda-bench run --entity-pages 200 --llm-latency 0.05 -o results/base.json
+    garuda-bench compare results/base.json results/new.json
+    garuda-bench storage --writers 4 --readers 8 --seconds 5
+    garuda-bench blobs --pages 3000 --html-kb 40
+    garuda-bench layout --rows 100000
+    garuda-bench entities --pages 50 --entities-per-page 60
+    garuda-bench trigrams --entities 1000000
+    garuda-bench scorer --links 50000 --domains 5000
+"""
+
+import argparse
+import json
+import logging
+import sys
+from typing import List, Optional
+
+from .runner import compare_results, load_results, run_benchmark, save_results
+from .scorer import run_scorer_benchmark
+from .site import SyntheticSiteSpec
+from .storage import (
+    compare_storage_profiles,
+    run_blob_benchmark,
+    run_entity_benchmark,
+    run_layout_benchmark,
+    run_page_write_benchmark,
+    run_trigram_benchmark,
+)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="garuda-bench",
+        description="Garuda crawl benchmark against a synthetic local site and stub LLM",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    defaults = SyntheticSiteSpec()
+    run = subparsers.add_parser("run", help="Run one benchmark crawl")
+    run.add_argument("--entity-name", default=defaults.entity_name)
+    run.add_argument("--entity-pages", type=int, default=defaults.entity_pages)
+    run.add_argument("--hub-pages", type=int, default=defaults.hub_pages)
+    run.add_argument("--duplicate-pages", type=int, default=defaults.duplicate_pages)
+    run.add_argument("--large-pages", type=int, default=defaults.large_pages)
+    run.add_argument("--large-page-kb", type=int, default=defaults.large_page_kb)
+    run.add_argument("--slow-pages", type=int, default=defaults.slow_pages)
+    run.add_argument(
+        "--slow-delay",
+        type=float,
+        default=defaults.slow_delay,
+        help="Seconds each slow endpoint waits before answering",
+    )
+    run.add_argument("--seed", type=int, default=defaults.seed, help="Site graph random seed")
+    run.add_argument(
+        "--llm-latency", type=float, default=0.0, help="Seconds the stub Ollama waits per call"
+    )
+    run.add_argument("--max-pages", type=int, help="Page budget (default: whole site)")
+    run.add_argument("--workers", type=int, default=5, help="Parallel fetch workers")
+    run.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Worker processes parsing HTML (0 = main process)",
+    )
+    run.add_argument(
+        "--group-commit",
+        action="store_true",
+        help="Batch the crawl's DB writes through one writer thread",
+    )
+    run.add_argument("--db-url", help="Database URL (default: temporary SQLite file)")
+    run.add_argument("--label", default="", help="Name stored with the results")
+    run.add_argument("-o", "--output", help="Write results JSON to this path")
+
+    compare = subparsers.add_parser("compare", help="Compare two results files")
+    compare.add_argument("baseline", help="Baseline results JSON")
+    compare.add_argument("candidate", help="Candidate results JSON")
+    compare.add_argument("--format", choices=["table", "json"], default="table")
+
+    storage = subparsers.add_parser(
+        "storage", help="Concurrent SQLite read/write throughput, baseline vs tuned engine"
+    )
+    storage.add_argument("--writers", type=int, default=4, help="Writer threads")
+    storage.add_argument("--readers", type=int, default=4, help="Reader threads")
+    storage.add_argument("--seconds", type=float, default=3.0, help="Duration per profile")
+    storage.add_argument(
+        "--pages",
+        type=int,
+        default=25,
+        help="Pages per writer in the direct vs group-commit write benchmark",
+    )
+    storage.add_argument("-o", "--output", help="Write results JSON to this path")
+
+    blobs = subparsers.add_parser(
+        "blobs", help="Database size and graph-query latency, inline HTML vs blob store"
+    )
+    blobs.add_argument("--pages", type=int, default=1000, help="Pages to store")
+    blobs.add_argument("--html-kb", type=int, default=40, help="Approximate HTML size per page")
+    blobs.add_argument(
+        "--duplicates", type=float, default=0.2, help="Share of pages repeating a body"
+    )
+    blobs.add_argument("-o", "--output", help="Write results JSON to this path")
+
+    layout = subparsers.add_parser(
+        "layout", help="Insert and id-lookup latency, joined vs flat schema layout"
+    )
+    layout.add_argument("--rows", type=int, default=50000, help="Entities to insert")
+    layout.add_argument("--lookups", type=int, default=2000, help="Random id lookups to time")
+    layout.add_argument("-o", "--output", help="Write results JSON to this path")
+
+    entities = subparsers.add_parser(
+        "entities", help="Statements and time per page of save_entities"
+    )
+    entities.add_argument("--pages", type=int, default=50, help="Pages (save_entities batches)")
+    entities.add_argument(
+        "--entities-per-page", type=int, default=60, help="Extracted entities per page"
+    )
+    entities.add_argument("-o", "--output", help="Write results JSON to this path")
+
+    trigrams = subparsers.add_parser(
+        "trigrams", help="Fuzzy entity candidate lookup latency, trigram index vs full scan"
+    )
+    trigrams.add_argument(
+        "--entities", type=int, default=100000, help="Synthetic entities to store"
+    )
+    trigrams.add_argument(
+        "--lookups", type=int, default=1000, help="Misspelled-name lookups to time"
+    )
+    trigrams.add_argument("-k", type=int, default=20, help="Candidates per lookup")
+    trigrams.add_argument("-o", "--output", help="Write results JSON to this path")
+
+    scorer = subparsers.add_parser(
+        "scorer", help="Link scoring throughput, per-link score_url vs batched score_links"
+    )
+    scorer.add_argument("--links", type=int, default=20000, help="Generated links to score")
+    scorer.add_argument("--hosts", type=int, default=300, help="Distinct hosts the links use")
+    scorer.add_argument(
+        "--domains", type=int, default=1000, help="Supplied domains the scorer holds"
+    )
+    scorer.add_argument(
+        "--page-size", type=int, default=100, help="Links per score_links call (one page)"
+    )
+    scorer.add_argument("--repeats", type=int, default=3, help="Passes per mode (best kept)")
+    scorer.add_argument("-o", "--output", help="Write results JSON to this path")
+    return parser
+
+
+def _print_results(results: dict) -> None:
+    print(
+        f"Pages:              {results['pages']} in {results['elapsed_seconds']:.2f}s "
+        f"({results['pages_per_second']:.2f} pages/s)"
+    )
+    print(
+        f"LLM calls / page:   {results['llm_calls_per_page']:.2f}  {results['llm_calls_by_kind']}"
+    )
+    print(f"Embeddings / page:  {results['embeddings_per_page']:.2f}")
+    print(f"DB writes / page:   {results['db_writes_per_page']:.2f}")
+    print(f"DB commits / page:  {results['db_commits_per_page']:.2f}")
+    print(f"\n{'Stage':<16} {'Calls':>7} {'Total s':>10} {'Mean ms':>10}")
+    for stage, s in results["stages"].items():
+        print(f"{stage:<16} {s['calls']:>7} {s['total_seconds']:>10.3f} {s['mean_ms']:>10.2f}")
+
+
+def _print_comparison(comparison: dict) -> None:
+    print(f"{'Metric':<24} {'Baseline':>12} {'Candidate':>12} {'Change':>9}")
+    for metric, c in comparison.items():
+        change = "n/a" if c["change_pct"] is None else f"{c['change_pct']:+.1f}%"
+        marker = {True: " +", False: " -", None: ""}[c["improved"]]
+        print(f"{metric:<24} {c['baseline']!s:>12} {c['candidate']!s:>12} {change:>9}{marker}")
+
+
+def cmd_run(args) -> None:
+    spec = SyntheticSiteSpec(
+        entity_name=args.entity_name,
+        entity_pages=args.entity_pages,
+        hub_pages=args.hub_pages,
+        duplicate_pages=args.duplicate_pages,
+        large_pages=args.large_pages,
+        large_page_kb=args.large_page_kb,
+        slow_pages=args.slow_pages,
+        slow_delay=args.slow_delay,
+        seed=args.seed,
+    )
+    results = run_benchmark(
+        spec,
+        llm_latency=args.llm_latency,
+        max_pages=args.max_pages,
+        max_fetch_workers=args.workers,
+        db_url=args.db_url,
+        label=args.label,
+        explorer_options={"parse_workers": args.parse_workers},
+        group_commit=args.group_commit,
+    )
+    _print_results(results)
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+
+
+def cmd_storage(args) -> None:
+    results = compare_storage_profiles(
+        writers=args.writers, readers=args.readers, seconds=args.seconds
+    )
+    print(f"{'Profile':<10} {'Writes/s':>10} {'Reads/s':>10} {'Write errs':>11} {'Read errs':>10}")
+    for profile, r in results.items():
+        print(
+            f"{profile:<10} {r['writes_per_second']:>10.1f} {r['reads_per_second']:>10.1f} "
+            f"{r['write_errors']:>11} {r['read_errors']:>10}"
+        )
+
+    writes = {
+        mode: run_page_write_benchmark(
+            group_commit=mode == "group", writers=args.writers, pages_per_writer=args.pages
+        )
+        for mode in ("direct", "group")
+    }
+    print(f"\n{'Writes':<10} {'Rows/s':>10} {'Pages/s':>10} {'Commits/page':>13}")
+    for mode, r in writes.items():
+        print(
+            f"{mode:<10} {r['rows_per_second']:>10.1f} {r['pages_per_second']:>10.2f} "
+            f"{r['commits_per_page']:>13.2f}"
+        )
+    results["page_writes"] = writes
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+
+
+def cmd_blobs(args) -> None:
+    results = run_blob_benchmark(
+        pages=args.pages, html_kb=args.html_kb, duplicate_ratio=args.duplicates
+    )
+    print(f"{'HTML':<8} {'DB MB':>8} {'Blobs MB':>9} {'Blobs':>7} {'Graph ms':>9} {'Full ms':>9}")
+    for mode, r in results.items():
+        print(
+            f"{mode:<8} {r['db_bytes'] / 1e6:>8.1f} {r['blob_bytes'] / 1e6:>9.1f} {r['blobs']:>7} "
+            f"{r['graph_query_ms']:>9.1f} {r['full_content_query_ms']:>9.1f}"
+        )
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+
+
+def cmd_layout(args) -> None:
+    results = run_layout_benchmark(rows=args.rows, lookups=args.lookups)
+    print(f"{'Layout':<8} {'Inserts/s':>10} {'Lookup us':>10} {'Generic us':>11} {'DB MB':>8}")
+    for layout, r in results.items():
+        print(
+            f"{layout:<8} {r['inserts_per_second']:>10.0f} {r['lookup_us']:>10.1f} "
+            f"{r['generic_lookup_us']:>11.1f} {r['db_bytes'] / 1e6:>8.1f}"
+        )
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+
+
+def cmd_entities(args) -> None:
+    r = run_entity_benchmark(pages=args.pages, entities_per_page=args.entities_per_page)
+    print(f"Pages:               {r['pages']} x {r['entities_per_page']} entities")
+    print(f"Entities/s:          {r['entities_per_second']}")
+    print(f"Statements per page: {r['statements_per_page']} ({r['writes_per_page']} writes)")
+    print(f"Stored:              {r['entities']} entities, {r['relationships']} relationships")
+    if args.output:
+        save_results(r, args.output)
+        print(f"\nResults written to {args.output}")
+
+
+def cmd_trigrams(args) -> None:
+    r = run_trigram_benchmark(entities=args.entities, lookups=args.lookups, k=args.k)
+    print(
+        f"Entities:       {r['entities']} ({r['trigram_rows']} trigram rows, {r['db_bytes'] / 1e6:.1f} MB)"
+    )
+    print(f"Backfill/load:  {r['backfill_seconds']} s / {r['load_seconds']} s")
+    print(f"{'Top-' + str(r['k']) + ' lookup':<16} {'p50 us':>10} {'p95 us':>10} {'Recall':>8}")
+    for label, key in (("memory, kind", "memory"), ("memory", "any_kind"), ("side table", "sql")):
+        print(
+            f"{label:<16} {r[key + '_p50_us']:>10.1f} {r[key + '_p95_us']:>10.1f} {r[key + '_recall']:>8.3f}"
+        )
+    print(f"{'full scan':<16} {r['scan_p50_us']:>10.1f}")
+    if args.output:
+        save_results(r, args.output)
+        print(f"\nResults written to {args.output}")
+
+
+def cmd_scorer(args) -> None:
+    r = run_scorer_benchmark(
+        links=args.links,
+        hosts=args.hosts,
+        domains=args.domains,
+        page_size=args.page_size,
+        repeats=args.repeats,
+    )
+    print(
+        f"Links:        {r['links']} over {r['hosts']} hosts, {r['domains']} domains, "
+        f"{r['page_size']} per page"
+    )
+    print(f"{'Mode':<12} {'Seconds':>9} {'Links/s':>10}")
+    for label, key in (("score_url", "per_link"), ("score_links", "batch")):
+        print(f"{label:<12} {r[key + '_seconds']:>9.3f} {r[key + '_links_per_second']:>10.0f}")
+    print(f"Speedup:      {r['speedup']:.2f}x (identical results: {r['identical']})")
+    if args.output:
+        save_results(r, args.output)
+        print(f"\nResults written to {args.output}")
+
+
+def cmd_compare(args) -> None:
+    comparison = compare_results(load_results(args.baseline), load_results(args.candidate))
+    if args.format == "json":
+        print(json.dumps(comparison, indent=2))
+    else:
+        _print_comparison(comparison)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point for the benchmark CLI."""
+    args = create_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+    commands = {
+        "run": cmd_run,
+        "compare": cmd_compare,
+        "storage": cmd_storage,
+        "blobs": cmd_blobs,
+        "layout": cmd_layout,
+        "entities": cmd_entities,
+        "trigrams": cmd_trigrams,
+        "scorer": cmd_scorer,
+    }
+    try:
+        commands[args.command](args)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Command failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""
+Crawl benchmark runner.
+
+Crawls a ``SyntheticSiteServer`` with a real ``IntelligentExplorer``,
+``LLMIntelExtractor`` and ``SQLAlchemyStore``, pointing the extractor at a
+``StubOllamaServer`` and embedding with ``HashingEmbedder``. Reports
+throughput, LLM calls / embeddings / DB writes per page, per-stage wall
+time of the wrapped methods and the explorer's own per-page stage
+percentiles, and saves the result as JSON so runs can be compared.
+"""
+
+import functools
+import json
+import os
+import platform
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import event
+
+from ..database.engine import SQLAlchemyStore
+from ..database.write_queue import QueuedStore
+from ..explorer.engine import IntelligentExplorer
+from ..extractor.llm import LLMIntelExtractor
+from ..types.entity import EntityProfile, EntityType
+from .site import SyntheticSiteServer, SyntheticSiteSpec
+from .stub_ollama import StubOllamaServer
+from .vectors import HashingEmbedder, MemoryVectorStore
+
+# Methods timed per stage: (owner, attribute, stage). Stages nest (``pipeline``
+# includes the llm_*, persist and embed stages), so totals are inclusive.
+LLM_STAGES = {
+    "extract_intelligence": "llm_extract",
+    "reflect_and_verify": "llm_reflect",
+    "summarize_page": "llm_summarize",
+    "rank_links": "llm_link_rank",
+    "build_embeddings_for_page": "embed",
+    "build_embeddings_for_entities": "embed",
+}
+STORE_STAGES = {
+    "save_page": "persist",
+    "save_entities": "persist",
+    "save_relationship": "persist",
+    "save_intelligence": "persist",
+    "save_links": "persist",
+}
+EXPLORER_STAGES = {
+    "_fetch_page_and_links": "fetch",
+    "_run_intelligence_pipeline": "pipeline",
+    "_generate_and_store_snippets": "embed",
+    "_learn_from_page": "learn",
+    "_enqueue_new_links": "enqueue",
+}
+
+# Metrics compared by ``compare_results``; True when higher is better
+COMPARED_METRICS = {
+    "pages_per_second": True,
+    "elapsed_seconds": False,
+    "llm_calls_per_page": False,
+    "embeddings_per_page": False,
+    "db_writes_per_page": False,
+    "db_commits_per_page": False,
+}
+
+
+class StageTimer:
+    """Thread-safe accumulator of call counts and wall time per stage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {"calls": 0, "seconds": 0.0}
+        )
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._stages[stage]["calls"] += 1
+            self._stages[stage]["seconds"] += seconds
+
+    def wrap(self, obj: Any, attr: str, stage: str) -> None:
+        """Replace ``obj.attr`` with a timed wrapper (instance attribute)."""
+        fn: Callable = getattr(obj, attr, None)
+        if fn is None:
+            return
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - start)
+
+        setattr(obj, attr, timed)
+
+    def wrap_all(self, obj: Any, stages: Dict[str, str]) -> None:
+        for attr, stage in stages.items():
+            self.wrap(obj, attr, stage)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                stage: {
+                    "calls": int(s["calls"]),
+                    "total_seconds": round(s["seconds"], 6),
+                    "mean_ms": round(1000 * s["seconds"] / s["calls"], 3) if s["calls"] else 0.0,
+                }
+                for stage, s in sorted(self._stages.items())
+            }
+
+
+class WriteCounter:
+    """
+    Counts INSERT / UPDATE / DELETE statements and commits on an engine,
+    and every statement (``statements``, reads included).
+
+    Commits stand in for fsyncs: each committed write transaction is
+    at least one sync of the journal or WAL.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.writes = 0
+        self.statements = 0
+        self.commits = 0
+        self._lock = threading.Lock()
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine, "commit", self._on_commit)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        with self._lock:
+            self.statements += 1
+            if statement.lstrip()[:6].upper() in ("INSERT", "UPDATE", "DELETE"):
+                self.writes += 1
+
+    def _on_commit(self, conn):
+        with self._lock:
+            self.commits += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.writes = 0
+            self.statements = 0
+            self.commits = 0
+
+    def close(self) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+        event.remove(self.engine, "commit", self._on_commit)
+
+
+def _per_page(value: float, pages: int) -> float:
+    return round(value / pages, 3) if pages else 0.0
+
+
+def run_benchmark(
+    spec: Optional[SyntheticSiteSpec] = None,
+    llm_latency: float = 0.0,
+    max_pages: Optional[int] = None,
+    max_fetch_workers: int = 5,
+    db_url: Optional[str] = None,
+    label: str = "",
+    explorer_options: Optional[Dict[str, Any]] = None,
+    group_commit: bool = False,
+) -> Dict[str, Any]:
+    """
+    Crawl a synthetic site once and return the measurements.
+
+    Args:
+        spec: Site shape (default ``SyntheticSiteSpec()``)
+        llm_latency: Seconds the stub Ollama sleeps per call
+        max_pages: Page budget (default: every page of the site)
+        max_fetch_workers: Parallel fetch workers of the explorer
+        db_url: SQLAlchemy URL; a throw-away SQLite file when omitted
+        label: Free-form name stored with the results
+        explorer_options: Extra ``IntelligentExplorer`` keyword arguments
+        group_commit: Persist through a ``QueuedStore`` (batched transactions)
+    """
+    spec = spec or SyntheticSiteSpec()
+    max_pages = max_pages or spec.total_pages
+    options = {
+        "use_selenium": False,
+        "max_pages_per_domain": max_pages,
+        "max_total_pages": max_pages,
+        "max_depth": 3,
+        "score_threshold": -1000.0,
+        "max_fetch_workers": max_fetch_workers,
+        # One local host: per-domain delays would dominate the measurement
+        "enable_politeness": False,
+        **(explorer_options or {}),
+    }
+
+    with (
+        tempfile.TemporaryDirectory(prefix="garuda-bench-") as tmp,
+        SyntheticSiteServer(spec) as site,
+        StubOllamaServer(latency=llm_latency) as ollama,
+    ):
+        store = SQLAlchemyStore(db_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        writes = WriteCounter(store.engine)
+        timer = StageTimer()
+        embedder = HashingEmbedder()
+        vector_store = MemoryVectorStore()
+        llm = LLMIntelExtractor(ollama_url=ollama.url, model="stub", embedder=embedder)
+        timer.wrap_all(llm, LLM_STAGES)
+        timer.wrap_all(store, STORE_STAGES)
+
+        persistence = QueuedStore(store) if group_commit else store
+        explorer = IntelligentExplorer(
+            profile=EntityProfile(name=spec.entity_name, entity_type=EntityType.COMPANY),
+            persistence=persistence,
+            vector_store=vector_store,
+            llm_extractor=llm,
+            **options,
+        )
+        timer.wrap_all(explorer, EXPLORER_STAGES)
+        if explorer.post_crawl_processor:
+            timer.wrap(explorer.post_crawl_processor, "process", "post_crawl")
+
+        # Setup (schema creation, learner loading) is not part of the measurement
+        writes.reset()
+        start = time.perf_counter()
+        try:
+            explored = explorer.explore([site.url + "/"])
+        finally:
+            if persistence is not store:
+                persistence.close()
+            elapsed = time.perf_counter() - start
+            writes.close()
+            store.engine.dispose()
+            if store.read_engine is not None:
+                store.read_engine.dispose()
+
+        pages = len(explored)
+        results = {
+            "label": label,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "spec": asdict(spec),
+            "config": {
+                "llm_latency": llm_latency,
+                "max_pages": max_pages,
+                "max_fetch_workers": max_fetch_workers,
+                "db": "custom" if db_url else "sqlite-temp",
+                "group_commit": group_commit,
+                "explorer_options": {k: v for k, v in options.items() if k != "persistence"},
+            },
+            "pages": pages,
+            "elapsed_seconds": round(elapsed, 4),
+            "pages_per_second": round(pages / elapsed, 3) if elapsed else 0.0,
+            "llm_calls": ollama.total_calls,
+            "llm_calls_by_kind": dict(ollama.calls),
+            "llm_calls_per_page": _per_page(ollama.total_calls, pages),
+            "embeddings": embedder.calls,
+            "embeddings_per_page": _per_page(embedder.calls, pages),
+            "vectors_stored": vector_store.upserts,
+            "db_writes": writes.writes,
+            "db_writes_per_page": _per_page(writes.writes, pages),
+            "db_commits": writes.commits,
+            "db_commits_per_page": _per_page(writes.commits, pages),
+            "stages": timer.summary(),
+            "pipeline_stages": explorer.get_stage_timings(),
+            "crawl_stats": explorer.get_crawl_stats(),
+        }
+    return results
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True, default=str)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(
+    baseline: Dict[str, Any], candidate: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare two result dicts metric by metric.
+
+    Returns ``{metric: {"baseline", "candidate", "change_pct", "improved"}}``
+    for the headline metrics and each stage's mean time (``stage:<name>``).
+    """
+    pairs = {
+        metric: (baseline.get(metric), candidate.get(metric), higher_better)
+        for metric, higher_better in COMPARED_METRICS.items()
+    }
+    base_stages = baseline.get("stages", {})
+    cand_stages = candidate.get("stages", {})
+    for stage in sorted(set(base_stages) | set(cand_stages)):
+        pairs[f"stage:{stage}"] = (
+            base_stages.get(stage, {}).get("mean_ms"),
+            cand_stages.get(stage, {}).get("mean_ms"),
+            False,
+        )
+
+    comparison = {}
+    for metric, (before, after, higher_better) in pairs.items():
+        change = None
+        improved = None
+        if before is not None and after is not None:
+            change = round(100.0 * (after - before) / before, 2) if before else None
+            improved = after > before if higher_better else after < before
+        comparison[metric] = {
+            "baseline": before,
+            "candidate": after,
+            "change_pct": change,
+            "improved": improved,
+        }
+    return comparison
@@ -0,0 +1,104 @@
+"""
+Link scoring throughput: per-link ``URLScorer.score_url`` against batched
+``score_links`` on a generated link list.
+"""
+
+import random
+import time
+from typing import Any, Dict, List
+
+from ..explorer.scorer import URLScorer
+from ..types.entity import EntityType
+
+_PATHS = [
+    "",
+    "/about",
+    "/news/latest",
+    "/investor/annual-report",
+    "/privacy",
+    "/board",
+    "/products/robots",
+    "/story/{n}",
+    "/{year}/05/acme-robotics-interview",
+    "/careers",
+    "/login",
+]
+_TEXTS = ["", "Acme Robotics", "Read more", "Leadership team", "Breaking news", "Bio"]
+
+
+def _synthetic_links(
+    rng: random.Random, n: int, hosts: List[str], page_size: int
+) -> List[Dict[str, str]]:
+    """*n* links in pages of *page_size*; most of a page's links stay on its own host."""
+    links = []
+    for i in range(n):
+        if i % page_size == 0:
+            page_host = rng.choice(hosts)
+        host = page_host if rng.random() < 0.7 else rng.choice(hosts)
+        path = rng.choice(_PATHS).format(n=rng.randint(1, 5000), year=rng.randint(2000, 2025))
+        href = f"https://{host}{path}"
+        if rng.random() < 0.2:
+            href += f"?id={rng.randint(1, 50)}"
+        links.append({"href": href, "text": rng.choice(_TEXTS)})
+    return links
+
+
+def run_scorer_benchmark(
+    links: int = 20000,
+    hosts: int = 300,
+    domains: int = 1000,
+    page_size: int = 100,
+    repeats: int = 3,
+    seed: int = 7,
+) -> Dict[str, Any]:
+    """
+    Score *links* generated links spread over *hosts* hosts (most links of a
+    page on that page's host) with a scorer holding *domains* supplied
+    domains (plus learned boosts for a tenth of them), once per link through
+    ``score_url`` and once per page of *page_size* links through
+    ``score_links``. Each mode keeps its best of *repeats* passes.
+    """
+    rng = random.Random(seed)
+    domain_names = [f"site{i}.example.org" for i in range(domains)]
+    scorer = URLScorer(
+        "Acme Robotics Inc",
+        EntityType.COMPANY,
+        patterns=[
+            {"pattern": r"/investor", "weight": 30},
+            {"pattern": r"/(news|press)/", "weight": 20},
+            {"pattern": r"/\d{4}/\d{2}/", "weight": 10},
+        ],
+        domains=[{"domain": d, "weight": rng.randint(0, 20)} for d in domain_names]
+        + [{"domain": "acme.com", "weight": 20, "is_official": True}],
+    )
+    for d in domain_names[::10]:
+        scorer.boost_domain(d, 25)
+
+    host_names = [rng.choice(domain_names) for _ in range(hosts // 2)]
+    host_names += [f"www{i}.acme.com" for i in range(hosts // 4)]
+    host_names += [f"cdn{i}.other.net" for i in range(hosts - len(host_names))]
+    link_list = _synthetic_links(rng, links, host_names, page_size)
+    pages = [link_list[i : i + page_size] for i in range(0, len(link_list), page_size)]
+
+    per_link_seconds = batch_seconds = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        per_link = [scorer.score_url(link["href"], link["text"], 1) for link in link_list]
+        per_link_seconds = min(per_link_seconds, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        batched = [result for page in pages for result in scorer.score_links(page, 1)]
+        batch_seconds = min(batch_seconds, time.perf_counter() - start)
+
+    return {
+        "links": len(link_list),
+        "hosts": len(set(host_names)),
+        "domains": len(scorer.domains),
+        "page_size": page_size,
+        "identical": per_link == batched,
+        "per_link_seconds": round(per_link_seconds, 4),
+        "batch_seconds": round(batch_seconds, 4),
+        "per_link_links_per_second": round(len(link_list) / per_link_seconds, 1),
+        "batch_links_per_second": round(len(link_list) / batch_seconds, 1),
+        "speedup": round(per_link_seconds / batch_seconds, 2),
+    }
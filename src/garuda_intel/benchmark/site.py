@@ -0,0 +1,242 @@
+"""
+Synthetic website for crawl benchmarks.
+
+``build_site`` turns a ``SyntheticSiteSpec`` into a deterministic page graph:
+a home page linking to hub pages, hubs linking to entity (team member) pages,
+plus near-duplicate copies, very large pages and slow endpoints.
+``SyntheticSiteServer`` serves the graph from a local threaded HTTP server so
+``IntelligentExplorer`` can crawl it without the internet.
+"""
+
+import html
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+FIRST_NAMES = [
+    "Ada",
+    "Boris",
+    "Chloe",
+    "Dmitri",
+    "Elena",
+    "Farid",
+    "Greta",
+    "Hiro",
+    "Ines",
+    "Jonas",
+    "Kira",
+    "Luca",
+    "Mara",
+    "Nils",
+    "Olga",
+    "Pavel",
+]
+LAST_NAMES = [
+    "Alvarez",
+    "Brandt",
+    "Costa",
+    "Dubois",
+    "Eriksen",
+    "Fischer",
+    "Garcia",
+    "Hansen",
+    "Ivanova",
+    "Jensen",
+    "Kowalski",
+    "Larsen",
+    "Moreau",
+    "Novak",
+]
+TITLES = [
+    "Chief Executive Officer",
+    "Chief Technology Officer",
+    "Head of Research",
+    "VP Engineering",
+    "General Counsel",
+    "Head of Sales",
+    "Lead Designer",
+]
+FILLER = (
+    "The team works on industrial automation, sensor fusion and field robotics. "
+    "Projects are delivered together with partners across Europe and Asia. "
+    "Quarterly reviews track safety, delivery time and customer satisfaction. "
+)
+
+
+@dataclass
+class SyntheticSiteSpec:
+    """Shape of the generated site; the same spec always yields the same pages."""
+
+    entity_name: str = "Acme Robotics"
+    entity_pages: int = 40
+    hub_pages: int = 4
+    duplicate_pages: int = 4
+    large_pages: int = 2
+    large_page_kb: int = 256
+    slow_pages: int = 2
+    slow_delay: float = 0.5
+    people_per_page: int = 2
+    cross_links: int = 2
+    seed: int = 7
+
+    @property
+    def total_pages(self) -> int:
+        return (
+            1
+            + self.hub_pages
+            + self.entity_pages
+            + self.duplicate_pages
+            + self.large_pages
+            + self.slow_pages
+        )
+
+
+@dataclass
+class SyntheticPage:
+    path: str
+    html: str
+    kind: str
+    delay: float = 0.0
+
+
+def _person(index: int) -> str:
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    last = LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]
+    suffix = index // (len(FIRST_NAMES) * len(LAST_NAMES))
+    return f"{first} {last}" + (f" {suffix + 1}" if suffix else "")
+
+
+def _render(title: str, paragraphs: List[str], links: List[tuple]) -> str:
+    body = "".join(f"<p>{html.escape(p)}</p>" for p in paragraphs)
+    nav = "".join(f'<li><a href="{href}">{html.escape(text)}</a></li>' for href, text in links)
+    return (
+        f"<html><head><title>{html.escape(title)}</title></head><body>"
+        f"<h1>{html.escape(title)}</h1>{body}<ul>{nav}</ul></body></html>"
+    )
+
+
+def _member_paragraphs(spec: SyntheticSiteSpec, page_index: int) -> List[str]:
+    paragraphs = []
+    for j in range(spec.people_per_page):
+        person_index = page_index * spec.people_per_page + j
+        title = TITLES[person_index % len(TITLES)]
+        paragraphs.append(f"{_person(person_index)} is the {title} of {spec.entity_name}.")
+    paragraphs.append(FILLER)
+    return paragraphs
+
+
+def build_site(spec: SyntheticSiteSpec) -> Dict[str, SyntheticPage]:
+    """Generate the page graph as ``{path: SyntheticPage}``."""
+    rng = random.Random(spec.seed)
+    name = spec.entity_name
+    hubs = [f"/hub/{h}" for h in range(spec.hub_pages)]
+    members = [f"/team/{i}" for i in range(spec.entity_pages)]
+    duplicates = [f"/mirror/{i}" for i in range(spec.duplicate_pages)]
+    large = [f"/report/{i}" for i in range(spec.large_pages)]
+    slow = [f"/archive/{i}" for i in range(spec.slow_pages)]
+
+    pages: Dict[str, SyntheticPage] = {}
+    home_links = [(h, f"{name} team directory {h.rsplit('/', 1)[1]}") for h in hubs]
+    home_links += [(p, f"{name} annual report {p.rsplit('/', 1)[1]}") for p in large]
+    pages["/"] = SyntheticPage(
+        "/", _render(f"{name}", [f"Welcome to {name}.", FILLER], home_links), "home"
+    )
+
+    # Members, duplicates and slow pages are spread round-robin over the hubs
+    hub_members: Dict[str, List[tuple]] = {h: [] for h in hubs}
+    for i, path in enumerate(members + duplicates + slow):
+        if hubs:
+            hub_members[hubs[i % len(hubs)]].append((path, f"{name} profile {path}"))
+    for h, hub in enumerate(hubs):
+        others = [(o, f"{name} team directory {o.rsplit('/', 1)[1]}") for o in hubs if o != hub]
+        pages[hub] = SyntheticPage(
+            hub,
+            _render(f"{name} team {h}", [f"People working at {name}."], hub_members[hub] + others),
+            "hub",
+        )
+
+    member_html: List[str] = []
+    for i, path in enumerate(members):
+        peers = rng.sample(members, min(spec.cross_links, len(members)))
+        links = [(p, f"{name} profile {p}") for p in peers if p != path]
+        if hubs:
+            links.append((hubs[i % len(hubs)], f"{name} team directory"))
+        page_html = _render(f"{name} team member {i}", _member_paragraphs(spec, i), links)
+        member_html.append(page_html)
+        pages[path] = SyntheticPage(path, page_html, "entity")
+
+    for i, path in enumerate(duplicates):
+        # Same body as a member page, different URL (mirror / tracking variant)
+        source = member_html[i % len(member_html)] if member_html else ""
+        pages[path] = SyntheticPage(path, source, "duplicate")
+
+    repeats = max(1, (spec.large_page_kb * 1024) // len(FILLER))
+    for i, path in enumerate(large):
+        paragraphs = [f"{name} annual report {i}."] + [FILLER] * repeats
+        pages[path] = SyntheticPage(path, _render(f"{name} report {i}", paragraphs, []), "large")
+
+    for i, path in enumerate(slow):
+        index = spec.entity_pages + i
+        pages[path] = SyntheticPage(
+            path,
+            _render(f"{name} archive {i}", _member_paragraphs(spec, index), []),
+            "slow",
+            delay=spec.slow_delay,
+        )
+    return pages
+
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    pages: Dict[str, SyntheticPage] = {}
+
+    def do_GET(self):
+        page = self.pages.get(self.path.split("?", 1)[0].split("#", 1)[0])
+        if page is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        if page.delay:
+            time.sleep(page.delay)
+        body = page.html.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class SyntheticSiteServer:
+    """Serves a ``build_site`` graph on ``127.0.0.1``; usable as a context manager."""
+
+    def __init__(self, spec: Optional[SyntheticSiteSpec] = None, port: int = 0):
+        self.spec = spec or SyntheticSiteSpec()
+        self.pages = build_site(self.spec)
+        handler = type("SiteHandler", (_SiteHandler,), {"pages": self.pages})
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "SyntheticSiteServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "SyntheticSiteServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
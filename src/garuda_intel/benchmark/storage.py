@@ -0,0 +1,710 @@
+"""
+Concurrent SQLite read/write benchmark.
+
+Writer threads upsert pages while reader threads list pages and look up
+page content, all against one database file, for a fixed time. The
+``baseline`` profile is the bare ``create_engine(url)`` the store used to
+open (rollback journal, default pool, everything through one engine); the
+``tuned`` profile is ``create_store_engine`` plus the read-only pool from
+``create_read_engine``. Lock errors are counted, not raised.
+
+``run_page_write_benchmark`` persists synthetic crawled pages (page,
+entities, relationships, intel, links, timing) from several threads, once
+directly and once through a group-committing ``QueuedStore``, reporting
+rows/sec and commits (fsyncs) per page.
+
+``run_blob_benchmark`` stores the same synthetic crawl (HTML bodies, some
+identical) with HTML inline and in the blob store, reporting database and
+blob file sizes and the latency of the entities-graph page query, plus the
+old query that loaded every page's full content row.
+
+``run_layout_benchmark`` inserts entities into a joined-layout and a
+flat-layout schema (``database.layout``) and times inserts, typed lookups
+by id and generic ``entries`` lookups by id on the resulting database.
+
+``run_entity_benchmark`` feeds ``save_entities`` page-sized batches of
+extracted entities (new and already-known names, kind upgrades, parent
+and suggested relationships) and counts the statements each page costs.
+
+``run_trigram_benchmark`` fills a database with synthetic entity names and
+times fuzzy candidate lookups (misspelled known names) through the
+in-memory trigram index, the ``entity_name_trigrams`` side table and a
+full scan of ``entities``, with the recall of the misspelled entity.
+"""
+
+import os
+import random
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import joinedload, sessionmaker
+
+from ..database.engine import SQLAlchemyStore
+from ..database.engine_factory import create_read_engine, create_store_engine
+from ..database.layout import ensure_entries_view, flat_metadata
+from ..database.models import (
+    FLAT_LAYOUT,
+    Base,
+    Entity,
+    Page,
+    PageContent,
+    Relationship,
+    entity_name_trigrams,
+    entries_table,
+)
+from ..database.names import normalize_entity_name
+from ..database.trigrams import TrigramIndex, ensure_trigram_index, name_trigrams, sql_candidates
+from ..database.repositories.page_repository import PageRepository
+from ..database.write_queue import QueuedStore
+from .runner import WriteCounter
+
+STORAGE_PROFILES = ("baseline", "tuned")
+# Page text size written per upsert
+PAGE_TEXT_BYTES = 4096
+
+
+def _open(profile: str, url: str):
+    if profile == "baseline":
+        engine = create_engine(url, future=True)
+        Base.metadata.create_all(engine)
+        return [engine], PageRepository(sessionmaker(engine, expire_on_commit=False, future=True))
+    engine = create_store_engine(url)
+    Base.metadata.create_all(engine)
+    read_engine = create_read_engine(url)
+    return [engine, read_engine], PageRepository(
+        sessionmaker(engine, expire_on_commit=False, future=True),
+        read_session_maker=sessionmaker(read_engine, expire_on_commit=False, future=True),
+    )
+
+
+def run_storage_benchmark(
+    profile: str = "tuned",
+    writers: int = 4,
+    readers: int = 4,
+    seconds: float = 3.0,
+    seed: int = 7,
+) -> Dict[str, Any]:
+    """Run writers and readers concurrently on a fresh database file."""
+    if profile not in STORAGE_PROFILES:
+        raise ValueError(f"profile must be one of {STORAGE_PROFILES}")
+    with tempfile.TemporaryDirectory(prefix="garuda-storage-bench-") as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'storage.db')}"
+        engines, repo = _open(profile, url)
+        text = "lorem ipsum " * (PAGE_TEXT_BYTES // 12)
+        urls: List[str] = []
+        urls_lock = threading.Lock()
+        counts = {"writes": 0, "reads": 0, "write_errors": 0, "read_errors": 0}
+        counts_lock = threading.Lock()
+        stop = threading.Event()
+
+        def count(key: str) -> None:
+            with counts_lock:
+                counts[key] += 1
+
+        def writer(worker: int) -> None:
+            n = 0
+            while not stop.is_set():
+                url_n = f"https://example.com/w{worker}/p{n}"
+                try:
+                    repo.save_page(
+                        {
+                            "url": url_n,
+                            "text_content": text,
+                            "domain_key": "example.com",
+                            "page_type": "general",
+                            "score": float(n % 100),
+                        }
+                    )
+                except OperationalError:
+                    count("write_errors")
+                    continue
+                with urls_lock:
+                    urls.append(url_n)
+                count("writes")
+                n += 1
+
+        def reader(worker: int) -> None:
+            rng = random.Random(seed + worker)
+            while not stop.is_set():
+                try:
+                    with urls_lock:
+                        target = rng.choice(urls) if urls else None
+                    if target and rng.random() < 0.7:
+                        repo.get_page_content_by_url(target)
+                    else:
+                        repo.get_all_pages(sort="score", limit=50)
+                except OperationalError:
+                    count("read_errors")
+                    continue
+                count("reads")
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+        threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        for engine in engines:
+            engine.dispose()
+
+    return {
+        "profile": profile,
+        "writers": writers,
+        "readers": readers,
+        "elapsed_seconds": round(elapsed, 4),
+        **counts,
+        "writes_per_second": round(counts["writes"] / elapsed, 2),
+        "reads_per_second": round(counts["reads"] / elapsed, 2),
+    }
+
+
+def compare_storage_profiles(**kwargs) -> Dict[str, Dict[str, Any]]:
+    """``run_storage_benchmark`` once per profile: ``{profile: results}``."""
+    return {
+        profile: run_storage_benchmark(profile=profile, **kwargs) for profile in STORAGE_PROFILES
+    }
+
+
+def _write_page(
+    store: Any, worker: int, n: int, entities_per_page: int, links_per_page: int
+) -> None:
+    """The writes the explorer makes for one page; result-less ones are deferred when queued."""
+    defer = (
+        store.defer
+        if isinstance(store, QueuedStore)
+        else (lambda method, *a, **kw: getattr(store, method)(*a, **kw))
+    )
+    url = f"https://example.com/w{worker}/p{n}"
+    page_id = store.save_page({"url": url, "text_content": "lorem ipsum " * 200, "score": 50.0})
+    entity_ids = (
+        store.save_entities(
+            [
+                {"name": f"Person {worker}-{n}-{i}", "kind": "person", "page_id": page_id}
+                for i in range(entities_per_page)
+            ]
+        )
+        or {}
+    )
+    ids = list(entity_ids.values())
+    for target in ids[1:]:
+        defer(
+            "save_relationship",
+            from_id=ids[0],
+            to_id=target,
+            relation_type="related-entity",
+            meta={"page_id": page_id},
+        )
+    store.save_intelligence(
+        finding={"basic_info": {"official_name": "Acme"}},
+        confidence=80.0,
+        page_id=page_id,
+        entity_id=ids[0] if ids else None,
+        entity_name="Acme",
+    )
+    defer(
+        "save_links",
+        url,
+        [
+            {"href": f"https://example.com/w{worker}/p{n}/l{i}", "text": f"link {i}"}
+            for i in range(links_per_page)
+        ],
+    )
+    defer("save_page_timing", page_id, {"total_ms": 1.0, "stages": {}})
+
+
+def run_page_write_benchmark(
+    group_commit: bool = False,
+    writers: int = 4,
+    pages_per_writer: int = 25,
+    entities_per_page: int = 5,
+    links_per_page: int = 10,
+) -> Dict[str, Any]:
+    """Persist ``writers * pages_per_writer`` synthetic pages on a fresh SQLite file."""
+    with tempfile.TemporaryDirectory(prefix="garuda-write-bench-") as tmp:
+        store = SQLAlchemyStore(f"sqlite:///{os.path.join(tmp, 'writes.db')}")
+        counter = WriteCounter(store.engine)
+        target = QueuedStore(store) if group_commit else store
+
+        def writer(worker: int) -> None:
+            for n in range(pages_per_writer):
+                _write_page(target, worker, n, entities_per_page, links_per_page)
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if group_commit:
+            target.close()
+        elapsed = time.perf_counter() - start
+        counter.close()
+        store.engine.dispose()
+        store.read_engine.dispose()
+
+    pages = writers * pages_per_writer
+    return {
+        "group_commit": group_commit,
+        "writers": writers,
+        "pages": pages,
+        "elapsed_seconds": round(elapsed, 4),
+        "rows": counter.writes,
+        "rows_per_second": round(counter.writes / elapsed, 1),
+        "pages_per_second": round(pages / elapsed, 2),
+        "commits": counter.commits,
+        "commits_per_page": round(counter.commits / pages, 2),
+    }
+
+
+def _synthetic_html(rng: random.Random, n: int, kb: int) -> str:
+    words = ["acme", "rocket", "board", "team", "press", "contact", "jane", "doe", "launch"]
+    paragraphs = "".join(
+        f"<p>{' '.join(rng.choice(words) for _ in range(60))}</p>"
+        for _ in range(max(1, kb * 1024 // 420))
+    )
+    return (
+        f"<html><head><title>Page {n}</title></head><body><nav>menu</nav>{paragraphs}</body></html>"
+    )
+
+
+def _time_query(store: SQLAlchemyStore, options, repeats: int) -> float:
+    """Median milliseconds to load every page with *options* on its content."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with store.ReadSession() as s:
+            for row in s.query(Page).options(options).limit(3000).all():
+                if row.content:
+                    row.content.extracted_json
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(sorted(timings)[len(timings) // 2], 2)
+
+
+def run_blob_benchmark(
+    pages: int = 1000,
+    html_kb: int = 40,
+    duplicate_ratio: float = 0.2,
+    repeats: int = 5,
+    seed: int = 7,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Store *pages* synthetic pages of about *html_kb* KB of HTML (a
+    *duplicate_ratio* share repeating earlier bodies) once inline and once
+    in the blob store: ``{"inline": results, "blobs": results}``.
+    """
+    results = {}
+    for mode in ("inline", "blobs"):
+        rng = random.Random(seed)
+        bodies: List[str] = []
+        with tempfile.TemporaryDirectory(prefix="garuda-blob-bench-") as tmp:
+            db_path = os.path.join(tmp, "crawler.db")
+            store = SQLAlchemyStore(
+                f"sqlite:///{db_path}", blob_path="auto" if mode == "blobs" else None
+            )
+            start = time.perf_counter()
+            for n in range(pages):
+                if bodies and rng.random() < duplicate_ratio:
+                    html = rng.choice(bodies)
+                else:
+                    html = _synthetic_html(rng, n, html_kb)
+                    bodies.append(html)
+                store.save_page(
+                    {
+                        "url": f"https://example.com/p{n}",
+                        "html": html,
+                        "text_content": "lorem ipsum " * 100,
+                        "extracted": {"entities": [{"name": f"Person {n}", "kind": "person"}]},
+                    }
+                )
+            write_seconds = time.perf_counter() - start
+
+            graph_query = joinedload(Page.content).load_only(
+                PageContent.extracted_json, PageContent.metadata_json
+            )
+            results[mode] = {
+                "pages": pages,
+                "write_seconds": round(write_seconds, 3),
+                "blobs": len(store.blobs) if store.blobs is not None else 0,
+                "graph_query_ms": _time_query(store, graph_query, repeats),
+                "full_content_query_ms": _time_query(store, joinedload(Page.content), repeats),
+            }
+            with store.engine.connect() as conn:
+                conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+            store.engine.dispose()
+            store.read_engine.dispose()
+            if store.blobs is not None:
+                store.blobs.close()
+            results[mode]["db_bytes"] = os.path.getsize(db_path)
+            results[mode]["blob_bytes"] = (
+                os.path.getsize(store.blobs.path) if store.blobs is not None else 0
+            )
+    return results
+
+
+def _median_us(timings: List[float]) -> float:
+    return round(sorted(timings)[len(timings) // 2] * 1e6, 1)
+
+
+def _p95_us(timings: List[float]) -> float:
+    return round(sorted(timings)[int(len(timings) * 0.95)] * 1e6, 1)
+
+
+def run_layout_benchmark(
+    rows: int = 50000,
+    lookups: int = 2000,
+    batch_size: int = 500,
+    seed: int = 7,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Insert *rows* entities in batches into each schema layout, then time
+    *lookups* random id lookups: ``{"joined": results, "flat": results}``.
+
+    Runs with the joined models (the flat schema is derived from them).
+    """
+    if FLAT_LAYOUT:
+        raise RuntimeError(
+            "Run the layout benchmark with the joined layout (unset GARUDA_SCHEMA_LAYOUT)"
+        )
+    rng = random.Random(seed)
+    ids = [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in range(rows)]
+    probe = [rng.choice(ids) for _ in range(lookups)]
+    now = datetime.utcnow()
+
+    results = {}
+    for layout in ("joined", "flat"):
+        with tempfile.TemporaryDirectory(prefix="garuda-layout-bench-") as tmp:
+            db_path = os.path.join(tmp, "layout.db")
+            engine = create_store_engine(f"sqlite:///{db_path}")
+            metadata = Base.metadata if layout == "joined" else flat_metadata()
+            metadata.create_all(engine)
+            entities = metadata.tables["entities"]
+            if layout == "flat":
+                # The generic lookups below then read the view instead of the table
+                ensure_entries_view(engine, metadata)
+
+            start = time.perf_counter()
+            for i in range(0, rows, batch_size):
+                batch = [
+                    {"id": id_, "name": f"Entity {i + n}", "kind": "company", "data": {"n": i + n}}
+                    for n, id_ in enumerate(ids[i : i + batch_size])
+                ]
+                stamps = {"entry_type": "entity", "created_at": now, "updated_at": now}
+                with engine.begin() as conn:
+                    if layout == "joined":
+                        conn.execute(
+                            insert(entries_table), [{"id": b["id"], **stamps} for b in batch]
+                        )
+                        conn.execute(insert(entities), batch)
+                    else:
+                        conn.execute(insert(entities), [{**b, **stamps} for b in batch])
+            insert_seconds = time.perf_counter() - start
+
+            # Lookups on the raw DB-API connection: the storage cost without ORM overhead
+            if layout == "joined":
+                typed = (
+                    "SELECT entities.*, entries.entry_type, entries.created_at FROM entities "
+                    "JOIN entries ON entries.id = entities.id WHERE entities.id = ?"
+                )
+            else:
+                typed = "SELECT * FROM entities WHERE id = ?"
+            generic = "SELECT entry_type FROM entries WHERE id = ?"
+            typed_timings, generic_timings = [], []
+            raw = engine.raw_connection()
+            try:
+                cursor = raw.cursor()
+                for id_ in probe:
+                    t0 = time.perf_counter()
+                    cursor.execute(typed, (str(id_),)).fetchall()
+                    t1 = time.perf_counter()
+                    cursor.execute(generic, (str(id_),)).fetchall()
+                    generic_timings.append(time.perf_counter() - t1)
+                    typed_timings.append(t1 - t0)
+                cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                raw.close()
+            engine.dispose()
+
+            results[layout] = {
+                "rows": rows,
+                "insert_seconds": round(insert_seconds, 3),
+                "inserts_per_second": round(rows / insert_seconds, 1),
+                "lookup_us": _median_us(typed_timings),
+                "generic_lookup_us": _median_us(generic_timings),
+                "db_bytes": os.path.getsize(db_path),
+            }
+    return results
+
+
+def _entity_batch(
+    rng: random.Random, page: int, size: int, known: List[str], page_id: str
+) -> List[Dict]:
+    """One page's extracted entities (the page's company first), about half seen on earlier pages."""
+    kinds = ("person", "company", "location", "product", "entity")
+    upgrades = {"person": "ceo", "company": "subsidiary", "location": "headquarters"}
+    batch, primary = [], f"Company {page}"
+    for i in range(size):
+        if known and rng.random() < 0.5:
+            name = rng.choice(known)
+            kind = rng.choice(kinds)
+            kind = upgrades.get(kind, kind) if rng.random() < 0.2 else kind
+        else:
+            name, kind = (
+                (primary, "company") if i == 0 else (f"Entity {page}-{i}", rng.choice(kinds))
+            )
+            known.append(name)
+        entity = {"name": name, "kind": kind, "data": {"seen_on": page}, "page_id": page_id}
+        if rng.random() < 0.2:
+            entity["suggested_relationship"] = {"target": primary, "relation_type": "works_at"}
+        batch.append(entity)
+    return batch
+
+
+def run_entity_benchmark(
+    pages: int = 50, entities_per_page: int = 60, seed: int = 7
+) -> Dict[str, Any]:
+    """
+    Save *pages* batches of *entities_per_page* entities on a fresh SQLite
+    file and count the statements and time ``save_entities`` takes per page.
+    """
+    rng = random.Random(seed)
+    known: List[str] = []
+    statements = writes = 0
+    elapsed = 0.0
+    with tempfile.TemporaryDirectory(prefix="garuda-entity-bench-") as tmp:
+        store = SQLAlchemyStore(f"sqlite:///{os.path.join(tmp, 'entities.db')}", blob_path=None)
+        counter = WriteCounter(store.engine)
+        for page in range(pages):
+            page_id = store.save_page(
+                {"url": f"https://example.com/p{page}", "text_content": "lorem"}
+            )
+            batch = _entity_batch(rng, page, entities_per_page, known, page_id)
+            primary = store.save_entities(batch[:1])[(batch[0]["name"], batch[0]["kind"])]
+            for entity in batch[1:]:
+                entity["primary_entity_id"] = primary
+            counter.reset()
+            start = time.perf_counter()
+            store.save_entities(batch[1:])
+            elapsed += time.perf_counter() - start
+            statements += counter.statements
+            writes += counter.writes
+        with store.Session() as s:
+            entities = s.query(Entity).count()
+            relationships = s.query(Relationship).count()
+        counter.close()
+        store.engine.dispose()
+        store.read_engine.dispose()
+
+    return {
+        "pages": pages,
+        "entities_per_page": entities_per_page,
+        "entities": entities,
+        "relationships": relationships,
+        "elapsed_seconds": round(elapsed, 4),
+        "entities_per_second": round(pages * (entities_per_page - 1) / elapsed, 1),
+        "statements_per_page": round(statements / pages, 1),
+        "writes_per_page": round(writes / pages, 1),
+    }
+
+
+def _synthetic_names(rng: random.Random, n: int) -> List[tuple]:
+    """*n* distinct ``(name, kind)``: people from first and last name pools, organizations and places."""
+    onsets = [
+        "",
+        "b",
+        "br",
+        "c",
+        "ch",
+        "d",
+        "dr",
+        "f",
+        "fl",
+        "g",
+        "gr",
+        "h",
+        "j",
+        "k",
+        "kl",
+        "l",
+        "m",
+        "n",
+        "p",
+        "pr",
+        "qu",
+        "r",
+        "s",
+        "sch",
+        "sh",
+        "sl",
+        "st",
+        "t",
+        "th",
+        "tr",
+        "v",
+        "w",
+        "z",
+    ]
+    vowels = ["a", "e", "i", "o", "u", "y", "ai", "ea", "ie", "ou", "oo"]
+    codas = ["", "", "", "n", "r", "s", "l", "t", "ck", "ng", "rd", "x", "m", "nd", "st"]
+    syllables = [a + b + c for a in onsets for b in vowels for c in codas]
+
+    def word(parts: int) -> str:
+        return "".join(rng.choice(syllables) for _ in range(parts)).capitalize()
+
+    first = [word(rng.randint(1, 2)) for _ in range(3000)]
+    last = [word(rng.randint(2, 3)) for _ in range(20000)]
+    suffixes = ["Systems", "Group", "Holdings", "Labs", "Capital", "Energy", "Foods", "Motors", ""]
+    names = set()
+    while len(names) < n:
+        kind = rng.choice(("person", "person", "company", "company", "location", "product"))
+        if kind == "person":
+            name = f"{rng.choice(first)} {rng.choice(last)}"
+        elif kind == "company":
+            name = f"{word(rng.randint(2, 3))} {rng.choice(suffixes)}".strip()
+        elif kind == "location":
+            name = f"{word(2)} {rng.choice(['City', 'Valley', 'Harbor', 'Springs'])}"
+        else:
+            name = f"{word(2)} {rng.randint(1, 999)}"
+        names.add((name, kind))
+    return sorted(names)
+
+
+def _misspell(rng: random.Random, name: str) -> str:
+    """*name* with one character dropped, replaced, doubled or two swapped."""
+    i = rng.randrange(1, len(name) - 1)
+    op = rng.choice(("drop", "replace", "double", "swap"))
+    if op == "drop":
+        return name[:i] + name[i + 1 :]
+    if op == "replace":
+        return name[:i] + rng.choice("aeioulnrst") + name[i + 1 :]
+    if op == "double":
+        return name[:i] + name[i] + name[i:]
+    return name[: i - 1] + name[i] + name[i - 1] + name[i + 1 :]
+
+
+def run_trigram_benchmark(
+    entities: int = 100000,
+    lookups: int = 1000,
+    k: int = 20,
+    sql_lookups: int = 200,
+    scan_lookups: int = 3,
+    batch_size: int = 5000,
+    seed: int = 7,
+) -> Dict[str, Any]:
+    """
+    Store *entities* synthetic entities, backfill the trigram side table,
+    load the in-memory index and time top-*k* candidate lookups for
+    misspelled known names (recall: share of lookups returning the entity
+    misspelled): *lookups* through the in-memory index, with and without
+    the entity's kind, *sql_lookups* through the side table, and
+    *scan_lookups* by reading every name of the kind and ranking it in
+    Python (what fuzzy lookups did before).
+    """
+    rng = random.Random(seed)
+    names = _synthetic_names(rng, entities)
+    ids = [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in names]
+    now = datetime.utcnow()
+
+    with tempfile.TemporaryDirectory(prefix="garuda-trigram-bench-") as tmp:
+        db_path = os.path.join(tmp, "trigrams.db")
+        store = SQLAlchemyStore(f"sqlite:///{db_path}", blob_path=None)
+        engine = store.engine
+        entities_table = Entity.__table__
+        for i in range(0, len(names), batch_size):
+            batch = [
+                {"id": id_, "name": name, "name_norm": normalize_entity_name(name), "kind": kind}
+                for id_, (name, kind) in zip(ids[i : i + batch_size], names[i : i + batch_size])
+            ]
+            stamps = {"entry_type": "entity", "created_at": now, "updated_at": now}
+            with engine.begin() as conn:
+                if FLAT_LAYOUT:
+                    conn.execute(insert(entities_table), [{**b, **stamps} for b in batch])
+                else:
+                    conn.execute(insert(entries_table), [{"id": b["id"], **stamps} for b in batch])
+                    conn.execute(insert(entities_table), batch)
+
+        start = time.perf_counter()
+        ensure_trigram_index(engine, batch_size=batch_size)
+        backfill_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        index = TrigramIndex(engine)
+        index.load()
+        load_seconds = time.perf_counter() - start
+
+        probe = [rng.randrange(len(names)) for _ in range(lookups)]
+        queries = [(ids[p], _misspell(rng, names[p][0]), names[p][1]) for p in probe]
+
+        # With the kind, as entity lookups pass it, and without
+        memory_timings, any_kind_timings, found, any_kind_found = [], [], 0, 0
+        for entity_id, query, kind in queries:
+            t0 = time.perf_counter()
+            hits = index.candidates(query, k, kinds=[kind])
+            t1 = time.perf_counter()
+            any_kind_hits = index.candidates(query, k)
+            any_kind_timings.append(time.perf_counter() - t1)
+            memory_timings.append(t1 - t0)
+            found += any(hit == entity_id for hit, _ in hits)
+            any_kind_found += any(hit == entity_id for hit, _ in any_kind_hits)
+
+        sql_timings, sql_found = [], 0
+        with store.Session() as session:
+            for entity_id, query, kind in queries[:sql_lookups]:
+                t0 = time.perf_counter()
+                hits = sql_candidates(session, query, k, kinds=[kind])
+                sql_timings.append(time.perf_counter() - t0)
+                sql_found += entity_id in hits
+
+        scan_timings = []
+        for entity_id, query, kind in queries[:scan_lookups]:
+            t0 = time.perf_counter()
+            grams = name_trigrams(normalize_entity_name(query))
+            with engine.connect() as conn:
+                rows = conn.execute(
+                    select(entities_table.c.id, entities_table.c.name_norm).where(
+                        entities_table.c.kind == kind
+                    )
+                ).all()
+            scored = []
+            for row_id, name_norm in rows:
+                other = name_trigrams(name_norm)
+                scored.append((len(grams & other) / len(grams | other), row_id))
+            scored.sort(reverse=True)
+            scan_timings.append(time.perf_counter() - t0)
+
+        with engine.connect() as conn:
+            trigram_rows = conn.execute(
+                select(func.count()).select_from(entity_name_trigrams)
+            ).scalar()
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        engine.dispose()
+        store.read_engine.dispose()
+        db_bytes = os.path.getsize(db_path)
+
+    return {
+        "entities": len(names),
+        "trigram_rows": trigram_rows,
+        "distinct_trigrams": len(index._postings),
+        "db_bytes": db_bytes,
+        "backfill_seconds": round(backfill_seconds, 2),
+        "load_seconds": round(load_seconds, 2),
+        "k": k,
+        "memory_p50_us": _median_us(memory_timings),
+        "memory_p95_us": _p95_us(memory_timings),
+        "memory_recall": round(found / len(queries), 3),
+        "any_kind_p50_us": _median_us(any_kind_timings),
+        "any_kind_p95_us": _p95_us(any_kind_timings),
+        "any_kind_recall": round(any_kind_found / len(queries), 3),
+        "sql_p50_us": _median_us(sql_timings),
+        "sql_p95_us": _p95_us(sql_timings),
+        "sql_recall": round(sql_found / len(sql_timings), 3),
+        "scan_p50_us": _median_us(scan_timings),
+    }
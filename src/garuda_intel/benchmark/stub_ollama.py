@@ -0,0 +1,159 @@
+"""
+Deterministic stand-in for Ollama's ``/api/generate`` endpoint.
+
+Responses are derived from the prompt alone, so a benchmark run gives the
+same extractions every time: extraction prompts yield the persons named in
+the analysed text ("<First Last> is the <Title> of <Org>."), reflection
+prompts are verified, link-ranking and relevance prompts get stable scores,
+and everything else (summaries) gets a short text. An optional per-call
+latency models model inference time.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+_TEXT_RE = re.compile(r"=== TEXT TO ANALYZE ===(.*?)CRITICAL RULES:", re.S)
+_PERSON_RE = re.compile(
+    r"([A-Z][a-z]+ [A-Z][a-z]+(?: \d+)?) is the ([A-Za-z ]+) of ([A-Z][\w ]+?)\."
+)
+
+
+def _stable_score(text: str) -> int:
+    return 40 + int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:4], 16) % 60
+
+
+def classify_prompt(prompt: str) -> str:
+    """Name the pipeline call a prompt belongs to."""
+    if "=== TEXT TO ANALYZE ===" in prompt:
+        return "extract"
+    if "QA auditor" in prompt:
+        return "reflect"
+    if "Navigational Decision" in prompt:
+        return "link_rank"
+    if "data validator" in prompt:
+        return "relevance"
+    return "generate"
+
+
+def stub_response(prompt: str, confidence: int = 85) -> Tuple[str, str]:
+    """Return ``(kind, response_text)`` for a prompt."""
+    kind = classify_prompt(prompt)
+    if kind == "extract":
+        match = _TEXT_RE.search(prompt)
+        text = match.group(1) if match else ""
+        persons, relationships, orgs = [], [], []
+        for name, title, org in _PERSON_RE.findall(text):
+            persons.append({"name": name, "title": title, "organization": org})
+            relationships.append(
+                {
+                    "source": name,
+                    "target": org,
+                    "relation_type": "works_at",
+                    "source_type": "person",
+                    "target_type": "organization",
+                }
+            )
+            orgs.append(org)
+        result: Dict = {"persons": persons, "relationships": relationships}
+        if orgs:
+            result["basic_info"] = {"official_name": orgs[0], "industry": "Robotics"}
+        return kind, json.dumps(result)
+    if kind == "reflect":
+        return kind, json.dumps(
+            {
+                "is_verified": True,
+                "confidence_score": confidence,
+                "reason": "stub",
+            }
+        )
+    if kind == "link_rank":
+        return kind, json.dumps({"score": _stable_score(prompt), "reason": "stub"})
+    if kind == "relevance":
+        return kind, json.dumps({"relevant": True, "score": confidence})
+    return kind, f"Summary ({len(prompt)} characters of input)."
+
+
+class _OllamaHandler(BaseHTTPRequestHandler):
+    stub: "StubOllamaServer" = None
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/api/generate":
+            self.send_response(404)
+            self.end_headers()
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            payload = {}
+        kind, text = stub_response(payload.get("prompt", ""), self.stub.confidence)
+        self.stub._record(kind)
+        if self.stub.latency:
+            time.sleep(self.stub.latency)
+        body = json.dumps(
+            {
+                "model": payload.get("model", "stub"),
+                "response": text,
+                "done": True,
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubOllamaServer:
+    """
+    Local ``/api/generate`` server with configurable latency.
+
+    ``calls`` counts requests per prompt kind (extract, reflect, link_rank,
+    relevance, generate).
+    """
+
+    def __init__(self, latency: float = 0.0, confidence: int = 85, port: int = 0):
+        self.latency = latency
+        self.confidence = confidence
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+        handler = type("OllamaHandler", (_OllamaHandler,), {"stub": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/api/generate"
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def _record(self, kind: str) -> None:
+        with self._lock:
+            self.calls[kind] += 1
+
+    def start(self) -> "StubOllamaServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubOllamaServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,63 @@
+"""
+Offline embedding and vector-store stand-ins for benchmarks.
+
+``HashingEmbedder`` is a feature-hashing encoder with the
+``SentenceTransformer.encode`` signature: deterministic, dependency-free and
+fast enough that it does not dominate the measurement. ``MemoryVectorStore``
+keeps upserted points in a dict instead of Qdrant.
+"""
+
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..vector.base import VectorStore
+
+
+class HashingEmbedder:
+    """Bag-of-words feature hashing into ``dim`` buckets; counts ``encode`` calls."""
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def encode(self, text: str, normalize_embeddings: bool = True) -> np.ndarray:
+        with self._lock:
+            self.calls += 1
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for token in text.lower().split():
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dim
+            vec[bucket] += 1.0 if digest[4] & 1 else -1.0
+        if normalize_embeddings:
+            norm = float(np.linalg.norm(vec))
+            if norm:
+                vec /= norm
+        return vec
+
+
+class MemoryVectorStore(VectorStore):
+    """In-process vector store; ``search`` is brute-force cosine similarity."""
+
+    def __init__(self):
+        self.points: Dict[str, Dict[str, Any]] = {}
+        self.upserts = 0
+
+    def upsert(self, point_id: str, vector: List[float], payload: Dict[str, Any]):
+        self.upserts += 1
+        self.points[str(point_id)] = {"vector": vector, "payload": payload}
+
+    def search(self, query_vector: List[float], top_k: int = 10, filter_: Optional[Any] = None):
+        query = np.asarray(query_vector, dtype=np.float32)
+        scored = [
+            (float(np.dot(query, np.asarray(p["vector"], dtype=np.float32))), pid, p["payload"])
+            for pid, p in self.points.items()
+        ]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [
+            {"id": pid, "score": score, "payload": payload}
+            for score, pid, payload in scored[:top_k]
+        ]
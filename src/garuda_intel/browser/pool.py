@@ -0,0 +1,214 @@
+"""
+Pool of headless Selenium drivers for concurrent JS-rendered fetching.
+
+Drivers are created lazily up to ``size`` and handed out one per caller.
+A driver is health-checked before reuse when it last failed or sat idle,
+and recycled (quit and replaced) after ``recycle_after`` pages to cap
+Chrome's memory growth. Each driver carries its own page-load timeout.
+
+``get_shared_pool()`` returns a process-wide pool so short crawls (the chat
+pipeline) reuse warm drivers instead of starting Chrome per request.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .selenium import SeleniumBrowser
+
+
+class BrowserPoolTimeout(RuntimeError):
+    """No driver became free within the acquire timeout."""
+
+
+class BrowserPool:
+    def __init__(
+        self,
+        size: int = 3,
+        headless: bool = True,
+        page_load_timeout: int = 10,
+        recycle_after: int = 50,
+        block_resources: bool = True,
+        health_check_interval: float = 30.0,
+        acquire_timeout: float = 120.0,
+        browser_factory: Optional[Callable[[], SeleniumBrowser]] = None,
+    ):
+        """
+        Args:
+            size: Maximum concurrent drivers
+            headless: Run Chrome headless
+            page_load_timeout: Per-driver page-load timeout in seconds
+            recycle_after: Pages a driver serves before it is replaced (0 = never)
+            block_resources: Block images, fonts and media to cut render time
+            health_check_interval: Idle seconds after which a driver is checked before reuse
+            acquire_timeout: Seconds to wait for a free driver
+            browser_factory: Builds an un-started browser (defaults to SeleniumBrowser)
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.recycle_after = recycle_after
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+        self.browser_factory = browser_factory or (
+            lambda: SeleniumBrowser(
+                headless=headless, timeout=page_load_timeout, block_resources=block_resources
+            )
+        )
+        self.logger = logging.getLogger(__name__)
+        self._cond = threading.Condition()
+        self._idle: List[Tuple[SeleniumBrowser, float]] = []
+        self._suspect: set = set()
+        self._live = 0
+        self._closed = False
+        self.stats = {
+            "browsers_started": 0,
+            "browsers_recycled": 0,
+            "browsers_unhealthy": 0,
+            "browser_pages": 0,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _start_browser(self) -> SeleniumBrowser:
+        browser = self.browser_factory()
+        browser._init_driver()
+        with self._cond:
+            self.stats["browsers_started"] += 1
+        return browser
+
+    def start(self) -> "BrowserPool":
+        """Start one driver eagerly so a missing Chrome fails fast."""
+        browser = self.acquire()
+        self.release(browser)
+        return self
+
+    def acquire(self, timeout: Optional[float] = None) -> SeleniumBrowser:
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("BrowserPool is closed")
+                browser = None
+                if self._idle:
+                    browser, idle_since = self._idle.pop()
+                    needs_check = (
+                        id(browser) in self._suspect
+                        or time.monotonic() - idle_since >= self.health_check_interval
+                    )
+                    self._suspect.discard(id(browser))
+                elif self._live < self.size:
+                    self._live += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise BrowserPoolTimeout(
+                            f"No browser free after {timeout:.0f}s (pool size {self.size})"
+                        )
+                    self._cond.wait(remaining)
+                    continue
+
+            if browser is None:
+                try:
+                    return self._start_browser()
+                except Exception:
+                    with self._cond:
+                        self._live -= 1
+                        self._cond.notify()
+                    raise
+            if needs_check and not browser.is_healthy():
+                with self._cond:
+                    self.stats["browsers_unhealthy"] += 1
+                self._discard(browser)
+                continue
+            return browser
+
+    def release(self, browser: SeleniumBrowser, failed: bool = False) -> None:
+        """Return a driver; it is replaced if worn out, or re-checked if *failed*."""
+        recycle = self.recycle_after and browser.pages_loaded >= self.recycle_after
+        if recycle or self._closed:
+            if recycle:
+                with self._cond:
+                    self.stats["browsers_recycled"] += 1
+            self._discard(browser)
+            return
+        with self._cond:
+            if failed:
+                self._suspect.add(id(browser))
+            self._idle.append((browser, time.monotonic()))
+            self._cond.notify()
+
+    def _discard(self, browser: SeleniumBrowser) -> None:
+        try:
+            browser.close()
+        finally:
+            with self._cond:
+                self._suspect.discard(id(browser))
+                self._live -= 1
+                self._cond.notify()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[SeleniumBrowser]:
+        browser = self.acquire(timeout)
+        failed = False
+        try:
+            yield browser
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.release(browser, failed=failed)
+
+    def fetch(self, url: str, with_links: bool = True) -> Tuple[str, List[Dict[str, str]]]:
+        """Render *url* on a pooled driver; returns (html, links)."""
+        browser = self.acquire()
+        html = ""
+        try:
+            html = browser.get_page(url)
+            links = browser.find_links(url) if with_links and html else []
+        finally:
+            with self._cond:
+                self.stats["browser_pages"] += 1
+            # get_page swallows driver errors; re-check before reuse
+            self.release(browser, failed=not html)
+        return html, links
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for browser, _ in idle:
+            self._discard(browser)
+
+
+_shared_pool: Optional[BrowserPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_pool(**kwargs) -> BrowserPool:
+    """
+    Process-wide pool, created on first use with *kwargs*; later calls
+    return the same pool. Closed at interpreter exit.
+    """
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None or _shared_pool._closed:
+            _shared_pool = BrowserPool(**kwargs)
+        return _shared_pool
+
+
+@atexit.register
+def close_shared_pool() -> None:
+    global _shared_pool
+    with _shared_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.close()
@@ -11,11 +11,22 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
 
+# URL patterns blocked via CDP when ``block_resources`` is on (images are
+# already disabled through content-settings prefs)
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav", "*.m4a", "*.mov", "*.avi",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+]
+
+
 class SeleniumBrowser:
-    def __init__(self, headless: bool = True, timeout: int = 10):
+    def __init__(self, headless: bool = True, timeout: int = 10, block_resources: bool = False):
         self.timeout = timeout
         self.driver = None
         self.headless = headless
+        self.block_resources = block_resources
+        self.pages_loaded = 0
         self.logger = logging.getLogger(__name__)
     
     def __enter__(self):
@@ -40,12 +51,37 @@ class SeleniumBrowser:
             "profile.managed_default_content_settings.images": 2,
             "profile.managed_default_content_settings.stylesheets": 2,
         }
+        if self.block_resources:
+            prefs["profile.managed_default_content_settings.media_stream"] = 2
+            prefs["profile.managed_default_content_settings.plugins"] = 2
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_argument("--autoplay-policy=user-gesture-required")
         options.add_experimental_option("prefs", prefs)
         self.driver = webdriver.Chrome(options=options)
         self.driver.set_page_load_timeout(self.timeout)
+        self.pages_loaded = 0
+        if self.block_resources:
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd(
+                    "Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_PATTERNS}
+                )
+            except Exception as e:
+                self.logger.debug(f"Resource blocking unavailable: {e}")
     
+    def is_healthy(self) -> bool:
+        """True if the driver session still answers commands."""
+        if not self.driver:
+            return False
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
     def get_page(self, url: str, wait_for_selector: Optional[str] = None) -> str:
         try:
+            self.pages_loaded += 1
             self.driver.get(url)
             if wait_for_selector:
                 WebDriverWait(self.driver, self.timeout).until(
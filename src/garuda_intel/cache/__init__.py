@@ -6,5 +6,6 @@ Provides multi-layer caching for embeddings, LLM responses, and search results.
 from .cache_manager import CacheManager
 from .embedding_cache import EmbeddingCache
 from .llm_cache import LLMCache
+from .search_cache import SearchCache, normalize_query
 
-__all__ = ["CacheManager", "EmbeddingCache", "LLMCache"]
+__all__ = ["CacheManager", "EmbeddingCache", "LLMCache", "SearchCache", "normalize_query"]
@@ -0,0 +1,152 @@
+"""
+Cache for web search results using SQLite backend with TTL.
+Gap-filling, agent runs and chat cycles repeat the same queries within
+hours; results are keyed by provider and normalized query.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold and collapse whitespace so trivially different queries share a key."""
+    return _WHITESPACE_RE.sub(" ", (query or "").casefold()).strip()
+
+
+class SearchCache:
+    """
+    SQLite-based cache for search results with TTL support.
+    Persists across restarts so repeated queries skip the search provider.
+    """
+
+    def __init__(self, db_path: str = "data/search_cache.db", ttl_seconds: int = 86400):
+        """
+        Initialize search result cache.
+
+        Args:
+            db_path: Path to SQLite database file
+            ttl_seconds: Time-to-live in seconds (default: 1 day)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.logger = logging.getLogger(__name__)
+
+        # Ensure directory exists
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._init_db()
+        self.logger.info(f"SearchCache initialized: db_path={db_path}, ttl={ttl_seconds}s")
+
+    def _init_db(self):
+        """Create cache table if it doesn't exist."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    query_hash TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    max_results INTEGER NOT NULL,
+                    results TEXT NOT NULL,
+                    created_at INTEGER NOT NULL,
+                    expires_at INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_search_expires_at ON search_cache(expires_at)
+            """)
+            conn.commit()
+
+    def _key(self, provider: str, query: str, max_results: int) -> str:
+        """Generate hash for (provider, normalized query, result count)."""
+        raw = f"{provider}\x00{normalize_query(query)}\x00{max_results}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, provider: str, query: str, max_results: int) -> Optional[List[Dict]]:
+        """
+        Get cached results for a query.
+
+        Returns:
+            Cached result list or None if not found or expired
+        """
+        query_hash = self._key(provider, query, max_results)
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT results FROM search_cache WHERE query_hash = ? AND expires_at > ?",
+                (query_hash, int(time.time())),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put(self, provider: str, query: str, max_results: int, results: List[Dict]) -> None:
+        """Cache the results for a query."""
+        now = int(time.time())
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO search_cache
+                (query_hash, provider, query, max_results, results, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    self._key(provider, query, max_results),
+                    provider,
+                    normalize_query(query),
+                    max_results,
+                    json.dumps(results, default=str),
+                    now,
+                    now + self.ttl_seconds,
+                ),
+            )
+            conn.commit()
+
+    def cleanup_expired(self) -> int:
+        """
+        Remove expired cache entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "DELETE FROM search_cache WHERE expires_at <= ?", (int(time.time()),)
+            )
+            deleted_count = cursor.rowcount
+            conn.commit()
+        if deleted_count > 0:
+            self.logger.info(f"Cleaned up {deleted_count} expired search cache entries")
+        return deleted_count
+
+    def clear(self) -> None:
+        """Clear all cached results."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM search_cache")
+            conn.commit()
+        self.logger.info("Search cache cleared")
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache size and other metrics
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            total_count = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+            valid_count = conn.execute(
+                "SELECT COUNT(*) FROM search_cache WHERE expires_at > ?", (int(time.time()),)
+            ).fetchone()[0]
+        return {
+            "total_entries": total_count,
+            "valid_entries": valid_count,
+            "expired_entries": total_count - valid_count,
+            "ttl_seconds": self.ttl_seconds,
+        }
@@ -50,6 +50,10 @@ class Settings:
     embedding_cache_size: int = 10000
     llm_cache_path: str = "/app/data/llm_cache.db"
     llm_cache_ttl_seconds: int = 604800  # 7 days
+    search_cache_path: str = "/app/data/search_cache.db"
+    search_cache_ttl_seconds: int = 86400  # 1 day
+    search_max_concurrency: int = 5  # Ceiling; lowered automatically when rate limited
+    fetch_archive_root: Optional[str] = None  # API crawls may only archive to named dirs under this
     
     # Phase 2 v2 optimizations
     # Semantic chunking settings
@@ -72,6 +76,9 @@ class Settings:
     chat_max_search_cycles: int = 3  # Maximum number of search/crawl cycles in chat
     chat_max_pages: int = 5  # Maximum pages to crawl per chat search cycle
     chat_use_selenium: bool = False  # Use Selenium for chat crawling
+    browser_pool_size: int = 3  # Headless drivers in the shared Selenium pool
+    browser_recycle_after: int = 50  # Pages per driver before it is restarted
+    browser_block_resources: bool = True  # Block images, fonts and media when rendering
     chat_rag_quality_threshold: float = 0.7  # Minimum RAG similarity score threshold
     chat_min_high_quality_hits: int = 2  # Minimum high-quality RAG hits before considering sufficient
     chat_extract_related_entities: bool = True  # Extract related entities during chat crawl
@@ -155,6 +162,10 @@ class Settings:
             embedding_cache_size=int(os.environ.get("GARUDA_EMBEDDING_CACHE_SIZE", "10000")),
             llm_cache_path=os.environ.get("GARUDA_LLM_CACHE_PATH", "/app/data/llm_cache.db"),
             llm_cache_ttl_seconds=int(os.environ.get("GARUDA_LLM_CACHE_TTL", "604800")),
+            search_cache_path=os.environ.get("GARUDA_SEARCH_CACHE_PATH", "/app/data/search_cache.db"),
+            search_cache_ttl_seconds=int(os.environ.get("GARUDA_SEARCH_CACHE_TTL", "86400")),
+            search_max_concurrency=int(os.environ.get("GARUDA_SEARCH_MAX_CONCURRENCY", "5")),
+            fetch_archive_root=os.environ.get("GARUDA_FETCH_ARCHIVE_ROOT") or None,
             # Phase 2 optimizations
             use_semantic_chunking=_as_bool(os.environ.get("GARUDA_USE_SEMANTIC_CHUNKING"), True),
             enable_quality_validation=_as_bool(os.environ.get("GARUDA_ENABLE_QUALITY_VALIDATION"), True),
@@ -168,6 +179,9 @@ class Settings:
             chat_max_search_cycles=int(os.environ.get("GARUDA_CHAT_MAX_SEARCH_CYCLES", "3")),
             chat_max_pages=int(os.environ.get("GARUDA_CHAT_MAX_PAGES", "5")),
             chat_use_selenium=_as_bool(os.environ.get("GARUDA_CHAT_USE_SELENIUM"), False),
+            browser_pool_size=int(os.environ.get("GARUDA_BROWSER_POOL_SIZE", "3")),
+            browser_recycle_after=int(os.environ.get("GARUDA_BROWSER_RECYCLE_AFTER", "50")),
+            browser_block_resources=_as_bool(os.environ.get("GARUDA_BROWSER_BLOCK_RESOURCES"), True),
             chat_rag_quality_threshold=float(os.environ.get("GARUDA_CHAT_RAG_QUALITY_THRESHOLD", "0.7")),
             chat_min_high_quality_hits=int(os.environ.get("GARUDA_CHAT_MIN_HIGH_QUALITY_HITS", "2")),
             chat_extract_related_entities=_as_bool(os.environ.get("GARUDA_CHAT_EXTRACT_RELATED_ENTITIES"), True),
@@ -17,9 +17,19 @@ from .models import (
     Intelligence,
     Seed,
     Fingerprint,
+    PageSimHash,
     Pattern,
     Domain,
     Link,
+    CrawlSession,
+    FrontierEntry,
+    CrawlBudget,
+    CrawlWorkerState,
+    SeenUrl,
+    UrlFilter,
+    CrawlDomainStat,
+    CrawlPageTypeStat,
+    CrawlStageTiming,
     MediaItem,
     MediaContent,
     DynamicFieldDefinition,
@@ -43,9 +53,19 @@ __all__ = [
     "Intelligence",
     "Seed",
     "Fingerprint",
+    "PageSimHash",
     "Pattern",
     "Domain",
     "Link",
+    "CrawlSession",
+    "FrontierEntry",
+    "CrawlBudget",
+    "CrawlWorkerState",
+    "SeenUrl",
+    "UrlFilter",
+    "CrawlDomainStat",
+    "CrawlPageTypeStat",
+    "CrawlStageTiming",
     "MediaItem",
     "MediaContent",
     # Dynamic field models
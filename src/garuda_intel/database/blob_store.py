@@ -0,0 +1,293 @@
+"""
+Content-addressed store for raw page HTML.
+
+``page_content.html`` used to hold every crawled body inline, which made the
+main database mostly HTML and slowed every query that touched the table
+(SQLite walks a row's overflow pages to reach the columns after ``html``).
+Bodies of at least ``min_size`` characters are now written to a separate
+SQLite file (``crawler.blobs.db`` beside ``crawler.db``), compressed with
+zstd when ``zstandard`` is installed and gzip otherwise, keyed by their
+SHA-256 digest. ``page_content.html_digest`` references the blob and
+``html`` is left NULL; identical bodies are stored once.
+
+Bodies are loaded lazily: ``PageContent.load_html()`` (used by ``to_dict``
+and the page repository) reads the blob through the store that loaded the
+row, so queries that do not need the HTML never touch it.
+
+Page text stays inline: the FTS5 (SQLite) and tsvector (PostgreSQL) search
+indexes read it from ``page_content.text``.
+
+``migrate_page_html`` (``garuda-db blobs-migrate``) moves the bodies of
+existing rows into the store.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import event, func, inspect, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import object_session
+
+from .engine_factory import sqlite_file_path
+from .models import PageContent
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+logger = logging.getLogger(__name__)
+
+CODECS = ("zstd", "gzip")
+# Bodies shorter than this (in characters) stay inline in page_content.html
+DEFAULT_MIN_SIZE = 1024
+# Session.info key under which the store's sessions carry their BlobStore
+SESSION_INFO_KEY = "blob_store"
+
+
+def blob_digest(body: bytes) -> str:
+    return "sha256:" + hashlib.sha256(body).hexdigest()
+
+
+def default_blob_path(db_path: str) -> str:
+    """``crawler.db`` -> ``crawler.blobs.db``."""
+    root, ext = os.path.splitext(db_path)
+    return f"{root}.blobs{ext or '.db'}"
+
+
+class BlobStore:
+    """
+    Compressed, deduplicated bodies in a SQLite file, addressed by digest.
+
+    Thread-safe: crawl writers and web readers share one instance.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        codec: Optional[str] = None,
+        compression_level: int = 3,
+        min_size: int = DEFAULT_MIN_SIZE,
+    ):
+        """
+        Args:
+            path: SQLite file for the blobs (created if missing)
+            codec: "zstd" or "gzip" for new blobs; defaults to zstd when available
+            compression_level: Compression level for new blobs
+            min_size: Bodies shorter than this (characters) are left inline
+        """
+        if codec is None:
+            codec = "zstd" if zstandard is not None else "gzip"
+        if codec not in CODECS:
+            raise ValueError(f"Unknown blob codec: {codec}")
+        if codec == "zstd" and zstandard is None:
+            raise ImportError("zstd blobs require the 'zstandard' package")
+        self.path = path
+        self.codec = codec
+        self.compression_level = compression_level
+        self.min_size = min_size
+        self._lock = threading.Lock()
+        self.stats = {
+            "blobs_written": 0,
+            "blobs_deduplicated": 0,
+            "blob_bytes_in": 0,
+            "blob_bytes_stored": 0,
+            "blob_reads": 0,
+            "blob_misses": 0,
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                codec TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_size INTEGER NOT NULL,
+                body BLOB NOT NULL
+            );
+        """)
+        self._compressor = (
+            zstandard.ZstdCompressor(level=compression_level) if codec == "zstd" else None
+        )
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._compressor is not None:
+            return self._compressor.compress(data)
+        return gzip.compress(data, compresslevel=min(9, max(1, self.compression_level)))
+
+    @staticmethod
+    def _decompress(codec: str, data: bytes) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise ImportError("Reading zstd blobs requires the 'zstandard' package")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def accepts(self, body: Optional[str]) -> bool:
+        """True if *body* is large enough to be moved out of the row."""
+        return body is not None and len(body) >= self.min_size
+
+    def put(self, body: str) -> str:
+        """Store *body* (once per distinct content) and return its digest."""
+        data = body.encode("utf-8")
+        digest = blob_digest(data)
+        with self._lock:
+            self.stats["blob_bytes_in"] += len(data)
+            exists = self._db.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if exists:
+                self.stats["blobs_deduplicated"] += 1
+                return digest
+            stored = self._compress(data)
+            self._db.execute(
+                "INSERT OR IGNORE INTO blobs (digest, codec, size, stored_size, body) VALUES (?, ?, ?, ?, ?)",
+                (digest, self.codec, len(data), len(stored), stored),
+            )
+            self._db.commit()
+            self.stats["blobs_written"] += 1
+            self.stats["blob_bytes_stored"] += len(stored)
+        return digest
+
+    def get(self, digest: str) -> Optional[str]:
+        """The body stored under *digest*, or None if it is not in the store."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT codec, body FROM blobs WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                self.stats["blob_misses"] += 1
+                return None
+            self.stats["blob_reads"] += 1
+        return self._decompress(row[0], row[1]).decode("utf-8")
+
+    def __contains__(self, digest: str) -> bool:
+        with self._lock:
+            return (
+                self._db.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+                is not None
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM blobs").fetchone()[0]
+
+    def prune(self, referenced: Iterable[str]) -> int:
+        """Delete blobs whose digest is not in *referenced*; returns the number removed."""
+        keep = set(referenced)
+        with self._lock:
+            digests = [d for (d,) in self._db.execute("SELECT digest FROM blobs") if d not in keep]
+            self._db.executemany("DELETE FROM blobs WHERE digest = ?", [(d,) for d in digests])
+            self._db.commit()
+        return len(digests)
+
+    def copy_from(self, path: str) -> int:
+        """Add the blobs of the store file at *path* missing here; returns the number added."""
+        with self._lock:
+            before = self._db.total_changes
+            self._db.execute("ATTACH DATABASE ? AS source", (path,))
+            try:
+                self._db.execute("INSERT OR IGNORE INTO blobs SELECT * FROM source.blobs")
+                self._db.commit()
+            finally:
+                self._db.execute("DETACH DATABASE source")
+            return self._db.total_changes - before
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            count, size, stored = self._db.execute(
+                "SELECT count(*), coalesce(sum(size), 0), coalesce(sum(stored_size), 0) FROM blobs"
+            ).fetchone()
+        return {"blobs": count, "bytes": size, "stored_bytes": stored}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+@event.listens_for(PageContent, "load")
+def _attach_blob_store(target: PageContent, context) -> None:
+    """Give loaded rows the store their session reads blobs from (see ``load_html``)."""
+    # Rows loaded by Session.merge() have no query context
+    session = context.session if context is not None else object_session(target)
+    target._blob_store = session.info.get(SESSION_INFO_KEY) if session is not None else None
+
+
+def open_blob_store(url: str, blob_path: Optional[str] = "auto") -> Optional[BlobStore]:
+    """
+    Blob store for the database at *url*.
+
+    ``blob_path="auto"`` puts it beside a SQLite database file and returns
+    None (HTML kept inline) for in-memory SQLite and other backends; None
+    always keeps HTML inline.
+    """
+    if blob_path == "auto":
+        db_path = sqlite_file_path(url)
+        blob_path = default_blob_path(db_path) if db_path else None
+    return BlobStore(blob_path) if blob_path else None
+
+
+def ensure_blob_columns(engine: Engine) -> None:
+    """Add ``page_content.html_digest`` to databases created before it existed."""
+    columns = {c["name"] for c in inspect(engine).get_columns(PageContent.__tablename__)}
+    if "html_digest" in columns:
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE page_content ADD COLUMN html_digest VARCHAR(71)"))
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_page_content_html_digest ON page_content (html_digest)"
+            )
+        )
+
+
+def migrate_page_html(engine: Engine, blobs: BlobStore, batch_size: int = 200) -> Dict[str, int]:
+    """
+    Move inline ``page_content.html`` bodies of at least ``blobs.min_size``
+    characters into *blobs*, one committed batch at a time.
+
+    Returns ``{"rows": moved, "bytes": html bytes moved out of the table}``.
+    """
+    table = PageContent.__table__
+    pending = (
+        select(table.c.id, table.c.html)
+        .where(table.c.html.is_not(None), func.length(table.c.html) >= blobs.min_size)
+        .limit(batch_size)
+    )
+    moved = moved_bytes = 0
+    with engine.connect() as conn:
+        while True:
+            rows = conn.execute(pending).all()
+            if not rows:
+                break
+            for row in rows:
+                conn.execute(
+                    update(table)
+                    .where(table.c.id == row.id)
+                    .values(html=None, html_digest=blobs.put(row.html))
+                )
+                moved_bytes += len(row.html.encode("utf-8"))
+            conn.commit()
+            moved += len(rows)
+            logger.info(f"Moved {moved} page bodies to {blobs.path}")
+    return {"rows": moved, "bytes": moved_bytes}
+
+
+def referenced_digests(engine: Engine) -> set:
+    """Digests referenced by ``page_content.html_digest``."""
+    column = PageContent.__table__.c.html_digest
+    with engine.connect() as conn:
+        return set(conn.execute(select(column).where(column.is_not(None)).distinct()).scalars())
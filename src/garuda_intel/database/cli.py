@@ -50,38 +50,50 @@ def get_store(db_url: str) -> SQLAlchemyStore:
 # ============================================================================
 
 def cmd_entity_list(store: SQLAlchemyStore, args: argparse.Namespace) -> None:
-    """List entities in the database."""
-    with store.Session() as session:
-        stmt = select(Entity)
-        
-        if args.kind:
-            stmt = stmt.where(Entity.kind == args.kind)
-        if args.name:
-            stmt = stmt.where(Entity.name.ilike(f"%{args.name}%"))
-        
-        stmt = stmt.order_by(Entity.created_at.desc()).limit(args.limit)
-        
-        entities = session.execute(stmt).scalars().all()
-        
-        if args.format == "json":
-            print(json.dumps([
-                {
-                    "id": str(e.id),
-                    "name": e.name,
-                    "kind": e.kind,
-                    "data": e.data,
-                    "created_at": e.created_at.isoformat() if e.created_at else None,
-                }
+    """List entities in the database, newest first, one keyset page at a time."""
+    filters = {"kind": args.kind, "name_like": args.name}
+    
+    if args.all:
+        # Stream every entity in batches; JSON output is one object per line
+        count = 0
+        for e in store.iter_listing("entities", **filters):
+            if args.format == "json":
+                print(json.dumps(
+                    {k: e[k] for k in ("id", "name", "kind", "data", "created_at")}, default=str
+                ))
+            else:
+                _print_entity_row(e, header=count == 0)
+            count += 1
+        if args.format != "json":
+            print(f"\nTotal: {count} entities")
+        return
+    
+    page = store.list_page("entities", cursor=args.cursor, limit=args.limit, **filters)
+    entities = page["items"]
+    
+    if args.format == "json":
+        print(json.dumps({
+            "items": [
+                {k: e[k] for k in ("id", "name", "kind", "data", "created_at")}
                 for e in entities
-            ], indent=2))
-        else:
-            print(f"\n{'ID':<40} {'Name':<30} {'Kind':<15} {'Created':<20}")
-            print("-" * 105)
-            for e in entities:
-                created = e.created_at.strftime("%Y-%m-%d %H:%M") if e.created_at else "N/A"
-                print(f"{str(e.id):<40} {e.name[:28]:<30} {(e.kind or 'N/A'):<15} {created:<20}")
-        
-        print(f"\nTotal: {len(entities)} entities")
+            ],
+            "next_cursor": page["next_cursor"],
+        }, indent=2, default=str))
+        return
+    
+    for i, e in enumerate(entities):
+        _print_entity_row(e, header=i == 0)
+    print(f"\nShown: {len(entities)} entities")
+    if page["next_cursor"]:
+        print(f"Next page: --cursor {page['next_cursor']}")
+
+
+def _print_entity_row(e: dict, header: bool = False) -> None:
+    if header:
+        print(f"\n{'ID':<40} {'Name':<30} {'Kind':<15} {'Created':<20}")
+        print("-" * 105)
+    created = e["created_at"][:16].replace("T", " ") if e["created_at"] else "N/A"
+    print(f"{e['id']:<40} {e['name'][:28]:<30} {(e['kind'] or 'N/A'):<15} {created:<20}")
 
 
 def cmd_entity_get(store: SQLAlchemyStore, args: argparse.Namespace) -> None:
@@ -514,6 +526,107 @@ def cmd_stats(store: SQLAlchemyStore, args: argparse.Namespace) -> None:
             print(f"  Discovery Logs:    {stats['discovery_logs']:>10}")
 
 
+def cmd_stage_timings(store: SQLAlchemyStore, args: argparse.Namespace) -> None:
+    """Show per-stage pipeline timings (p50/p95) of recent crawls."""
+    crawls = store.get_stage_timings(crawl_id=args.crawl_id, limit=args.limit)
+
+    if args.format == "json":
+        print(json.dumps(crawls, indent=2))
+        return
+    if not crawls:
+        print("No stage timings recorded yet.")
+        return
+    for crawl in crawls:
+        print(f"\n=== Crawl {crawl['crawl_id']} ({crawl['entity_name'] or '-'}, "
+              f"{crawl['pages']} pages, {crawl['created_at']}) ===\n")
+        print(f"  {'Stage':<14} {'Pages':>6} {'p50 ms':>10} {'p95 ms':>10} {'Max ms':>10}  Counts")
+        for stage, t in crawl["stages"].items():
+            counts = ", ".join(f"{k}={v}" for k, v in t["counts"].items())
+            print(f"  {stage:<14} {t['pages']:>6} {t['p50_ms']:>10.1f} {t['p95_ms']:>10.1f} "
+                  f"{t['max_ms']:>10.1f}  {counts}")
+
+
+def cmd_fts_rebuild(store: SQLAlchemyStore, args: argparse.Namespace) -> None:
+    """Rebuild the FTS5 keyword-search indexes from their tables."""
+    from .fts import backfill_fts
+
+    counts = backfill_fts(store.engine)
+    if not counts:
+        print("Full-text indexes need a SQLite database with FTS5; searches use ILIKE.")
+        return
+    for table, rows in counts.items():
+        print(f"  {table:<24} {rows:>10} rows")
+
+
+def cmd_trigrams_rebuild(store: SQLAlchemyStore, args: argparse.Namespace) -> None:
+    """Write the name trigrams of entities that have none (rows written outside the ORM)."""
+    from .trigrams import ensure_trigram_index
+
+    indexed = ensure_trigram_index(store.engine, batch_size=args.batch_size)
+    print(f"Indexed the name trigrams of {indexed} entities")
+
+
+def cmd_blobs_migrate(store: SQLAlchemyStore, args: argparse.Namespace) -> None:
+    """Move inline page HTML into the blob store, optionally reclaiming the space."""
+    import os
+
+    from sqlalchemy import text
+
+    from .blob_store import referenced_digests
+    from .engine_factory import sqlite_file_path
+    from .fts import backfill_fts
+
+    if store.blobs is None:
+        print("No blob store for this database (SQLite files only); HTML stays inline.")
+        return
+    db_path = sqlite_file_path(args.db_url)
+    size_before = os.path.getsize(db_path) if db_path else None
+
+    moved = store.migrate_page_html(batch_size=args.batch_size)
+    print(f"Moved {moved['rows']} page bodies ({moved['bytes'] / 1e6:.1f} MB) to {store.blobs.path}")
+    if args.prune:
+        removed = store.blobs.prune(referenced_digests(store.engine))
+        print(f"Pruned {removed} unreferenced blobs")
+    if args.vacuum and db_path:
+        with store.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM"))
+            conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+        # VACUUM may renumber the rowids the FTS indexes point at
+        backfill_fts(store.engine)
+    summary = store.blobs.summary()
+    print(f"Blob store: {summary['blobs']} blobs, {summary['bytes'] / 1e6:.1f} MB "
+          f"-> {summary['stored_bytes'] / 1e6:.1f} MB compressed")
+    if db_path:
+        print(f"Database file: {size_before / 1e6:.1f} MB -> {os.path.getsize(db_path) / 1e6:.1f} MB"
+              + ("" if args.vacuum else " (run with --vacuum to reclaim freed pages)"))
+
+
+def cmd_migrate_layout(store: SQLAlchemyStore, args: argparse.Namespace) -> None:
+    """Copy the database into a new flat-layout one (re-run to catch up)."""
+    from .blob_store import BlobStore, default_blob_path
+    from .engine_factory import create_store_engine, sqlite_file_path
+    from .layout import migrate_to_flat
+
+    target = create_store_engine(args.target_url)
+    counts = migrate_to_flat(
+        store.engine, target, batch_size=args.batch_size,
+        progress=(lambda table, rows: print(f"  {table:<28} {rows:>10}", end="\r")) if args.verbose else None,
+    )
+    target.dispose()
+    deleted = counts.pop("deleted")
+    for table, rows in counts.items():
+        if rows:
+            print(f"  {table:<28} {rows:>10} rows")
+    print(f"Copied {sum(counts.values())} rows, removed {deleted} deleted since the last run")
+
+    target_path = sqlite_file_path(args.target_url)
+    if store.blobs is not None and target_path:
+        with BlobStore(default_blob_path(target_path)) as blobs:
+            print(f"Copied {blobs.copy_from(store.blobs.path)} page bodies to {blobs.path}")
+    print("Re-run to catch up with new writes; run once more with writers stopped, then "
+          "open the target with GARUDA_SCHEMA_LAYOUT=flat.")
+
+
 def cmd_init_db(store: SQLAlchemyStore, args: argparse.Namespace) -> None:
     """Initialize/migrate database tables."""
     from .models import Base
@@ -548,7 +661,9 @@ def create_parser() -> argparse.ArgumentParser:
     entity_list = subparsers.add_parser("entity-list", help="List entities")
     entity_list.add_argument("--kind", help="Filter by entity kind")
     entity_list.add_argument("--name", help="Filter by name (partial match)")
-    entity_list.add_argument("--limit", type=int, default=50, help="Maximum results")
+    entity_list.add_argument("--limit", type=int, default=50, help="Entities per page (max 1000)")
+    entity_list.add_argument("--cursor", help="Continue after a previous page (its 'Next page' cursor)")
+    entity_list.add_argument("--all", action="store_true", help="Stream every entity instead of one page")
     entity_list.add_argument("--format", choices=["table", "json"], default="table")
     
     # entity get
@@ -694,6 +809,39 @@ def create_parser() -> argparse.ArgumentParser:
     stats = subparsers.add_parser("stats", help="Show database statistics")
     stats.add_argument("--format", choices=["table", "json"], default="table")
     
+    # stage-timings
+    timings = subparsers.add_parser("stage-timings", help="Show per-stage crawl pipeline timings")
+    timings.add_argument("--crawl-id", help="Show a single crawl")
+    timings.add_argument("--limit", type=int, default=5, help="Number of recent crawls")
+    timings.add_argument("--format", choices=["table", "json"], default="table")
+    
+    # fts-rebuild
+    subparsers.add_parser(
+        "fts-rebuild", help="Rebuild full-text search indexes (after VACUUM or an upgrade)"
+    )
+    
+    # trigrams-rebuild
+    trigrams_rebuild = subparsers.add_parser(
+        "trigrams-rebuild", help="Index the name trigrams of entities missing from the fuzzy-lookup index"
+    )
+    trigrams_rebuild.add_argument("--batch-size", type=int, default=1000, help="Entities per commit")
+    
+    # blobs-migrate
+    blobs_migrate = subparsers.add_parser(
+        "blobs-migrate", help="Move inline page HTML into the compressed blob store"
+    )
+    blobs_migrate.add_argument("--batch-size", type=int, default=200, help="Rows per commit")
+    blobs_migrate.add_argument("--prune", action="store_true", help="Delete blobs no page references")
+    blobs_migrate.add_argument("--vacuum", action="store_true",
+                               help="VACUUM the database afterwards to shrink the file")
+    
+    # migrate-layout
+    migrate_layout = subparsers.add_parser(
+        "migrate-layout", help="Copy the database into a new flat-layout database (GARUDA_SCHEMA_LAYOUT=flat)"
+    )
+    migrate_layout.add_argument("--target-url", required=True, help="Database URL of the flat copy")
+    migrate_layout.add_argument("--batch-size", type=int, default=500, help="Rows per read/write batch")
+    
     # init
     subparsers.add_parser("init", help="Initialize database tables")
     
@@ -956,9 +1104,11 @@ def _get_db_manager(args):
     """Create a DatabaseManager from CLI args."""
     import os
     from ..services.database_manager import DatabaseManager
-    data_dir = os.path.dirname(args.db_url.replace("sqlite:///", "")) or "/app/data"
+    from .engine_factory import sqlite_file_path
+    db_file = sqlite_file_path(args.db_url)
+    data_dir = (os.path.dirname(db_file) if db_file else "") or "/app/data"
     qdrant_url = os.environ.get("GARUDA_QDRANT_URL") or os.environ.get("QDRANT_URL")
-    return DatabaseManager(data_dir=data_dir, qdrant_url=qdrant_url)
+    return DatabaseManager(data_dir=data_dir, qdrant_url=qdrant_url, database_url=args.db_url)
 
 
 def cmd_db_list(store: SQLAlchemyStore, args: argparse.Namespace) -> None:
@@ -1048,6 +1198,11 @@ def main() -> None:
         "rel-record": cmd_rel_record,
         "rel-high-confidence": cmd_rel_high_confidence,
         "stats": cmd_stats,
+        "stage-timings": cmd_stage_timings,
+        "fts-rebuild": cmd_fts_rebuild,
+        "trigrams-rebuild": cmd_trigrams_rebuild,
+        "blobs-migrate": cmd_blobs_migrate,
+        "migrate-layout": cmd_migrate_layout,
         "init": cmd_init_db,
         "db-list": cmd_db_list,
         "db-create": cmd_db_create,
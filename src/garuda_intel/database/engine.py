@@ -1,13 +1,40 @@
 import json
 import logging
+import string
 import uuid
-from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from sqlalchemy import create_engine, select, func, or_, String
-from sqlalchemy.orm import sessionmaker, aliased
+from sqlalchemy import inspect, select, func, or_, and_, update, String, literal_column
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased, selectinload, sessionmaker
 
 from .store import PersistenceStore
+from .blob_store import SESSION_INFO_KEY, ensure_blob_columns, migrate_page_html, open_blob_store
+from .engine_factory import create_read_engine, create_store_engine
+from .layout import check_layout, prepare_layout
+from .names import add_aliases, ensure_name_columns, name_match, name_prefix_match, normalize_entity_name
+from .trigrams import ensure_trigram_index, trigram_candidates
+from .pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    ensure_listing_indexes,
+    keyset_page,
+    listing_keys,
+    listing_query,
+)
+from .fts import INTEL_FTS, PAGE_FTS, SNIPPET_FTS, ensure_fts, fts_hits, fts_match_query
+from .postgres import (
+    INTEL_DOCUMENT,
+    INTEL_TSV,
+    PAGE_TSV,
+    SNIPPET_TSV,
+    ensure_pg_search,
+    pg_text_search,
+    pg_tsquery,
+    strip_highlight,
+)
+from .write_queue import BatchSessionFactory
 from .models import (
     Base,
     Page,
@@ -16,30 +43,123 @@ from .models import (
     Intelligence,
     Link,
     Fingerprint,
+    PageSimHash,
+    CrawlSession,
+    FrontierEntry,
+    CrawlBudget,
+    CrawlWorkerState,
+    SeenUrl,
+    UrlFilter,
+    CrawlDomainStat,
+    CrawlPageTypeStat,
+    CrawlStageTiming,
     Pattern,
     Domain,
     Entity,
     Relationship,
+    entity_name_trigrams,
 )
 from ..types.page.fingerprint import PageFingerprint
+from ..discover.url_canonical import canonicalize_url
 from .helpers import uuid5_url as _uuid5_url, uuid4 as _uuid4, as_dict as _as_dict
 from .repositories.page_repository import PageRepository
 
 
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _recency(entity: Entity) -> tuple:
+    """``max()`` key of ``ORDER BY last_seen DESC NULLS LAST, updated_at DESC NULLS LAST``."""
+    key = []
+    for value in (entity.last_seen, entity.updated_at):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        key += [value is not None, value or datetime.min]
+    return tuple(key)
+
+
+def _guid_key(value: Any) -> Optional[uuid.UUID]:
+    """*value* (a UUID or its string) as a UUID, None if it is not one."""
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value).strip())
+    except ValueError:
+        return None
+
+
 class SQLAlchemyStore(PersistenceStore):
     # Constants for graph traversal
     MAX_RECURSION_DEPTH = 10  # Maximum depth to prevent infinite loops in graph traversal
     
-    def __init__(self, url: str = "sqlite:///crawler.db"):
-        self.engine = create_engine(url, future=True)
+    def __init__(
+        self,
+        url: str = "sqlite:///crawler.db",
+        sqlite_pragmas: Optional[Dict[str, Any]] = None,
+        blob_path: Optional[str] = "auto",
+    ):
+        """
+        Args:
+            url: SQLAlchemy database URL
+            sqlite_pragmas: Per-connection PRAGMAs for SQLite files
+                (default ``engine_factory.SQLITE_PRAGMAS``; ``{}`` disables)
+            blob_path: SQLite file for large page HTML bodies; "auto" puts
+                ``<db>.blobs.db`` beside a SQLite database file, None keeps
+                HTML inline (see ``blob_store``)
+        """
+        self.engine = create_store_engine(url, pragmas=sqlite_pragmas)
         self.logger = logging.getLogger(__name__)
+        check_layout(self.engine)
+        existing_tables = set(inspect(self.engine).get_table_names())
         Base.metadata.create_all(self.engine)
-        self.Session = sessionmaker(self.engine, expire_on_commit=False, future=True)
+        prepare_layout(self.engine)
+        ensure_blob_columns(self.engine)
+        ensure_name_columns(self.engine)
+        # Backfilled once, when the side table is created (an O(entities)
+        # scan); `garuda-db trigrams-rebuild` fills in rows written otherwise
+        if entity_name_trigrams.name not in existing_tables:
+            ensure_trigram_index(self.engine)
+        ensure_listing_indexes(self.engine)
+        self.blobs = open_blob_store(url, blob_path)
+        session_info = {SESSION_INFO_KEY: self.blobs}
+        # Keyword/fuzzy search indexes: FTS5 on SQLite, tsvector + pg_trgm on
+        # PostgreSQL ({"tsvector": bool, "trigram": bool}); ILIKE otherwise
+        self.fts_enabled = ensure_fts(self.engine)
+        self.pg_search = ensure_pg_search(self.engine)
+        # Bindable to a shared batch session by the group-commit writer (QueuedStore)
+        self.Session = BatchSessionFactory(
+            sessionmaker(self.engine, expire_on_commit=False, future=True, info=session_info)
+        )
+        # Separate read-only pool for SQLite files (list/search/detail reads)
+        self.read_engine = create_read_engine(url, pragmas=sqlite_pragmas)
+        self._read_sessionmaker = (
+            sessionmaker(self.read_engine, expire_on_commit=False, future=True, info=session_info)
+            if self.read_engine is not None else None
+        )
         self.PageContent = PageContent
         self.Page = Page
         
         # Initialize repositories
-        self._page_repo = PageRepository(self.Session)
+        self._page_repo = PageRepository(
+            self.Session, read_session_maker=self._read_sessionmaker, blob_store=self.blobs
+        )
+
+    @property
+    def ReadSession(self) -> sessionmaker:
+        """Session factory for read-only queries (the read/write one when no read pool exists)."""
+        return getattr(self, "_read_sessionmaker", None) or self.Session
+
+    def _fts_query(self, keyword: str) -> Optional[str]:
+        """MATCH expression for *keyword* when FTS is enabled, else None (use ILIKE)."""
+        if not getattr(self, "fts_enabled", False):
+            return None
+        return fts_match_query(keyword)
+
+    def _pg_query(self, keyword: str) -> Optional[str]:
+        """``to_tsquery`` text for *keyword* when the PostgreSQL indexes exist, else None."""
+        if not getattr(self, "pg_search", {}).get("tsvector"):
+            return None
+        return pg_tsquery(keyword)
 
     def get_session(self):
         """
@@ -89,6 +209,16 @@ class SQLAlchemyStore(PersistenceStore):
     def save_page(self, page: Dict) -> str:
         return self._page_repo.save_page(page)
 
+    def stash_html(self, html: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """``(html, html_digest)`` for a PageContent row; large bodies go to ``self.blobs``."""
+        return self._page_repo.stash_html(html)
+
+    def migrate_page_html(self, batch_size: int = 200) -> Dict[str, int]:
+        """Move inline HTML bodies of existing rows into the blob store."""
+        if self.blobs is None:
+            return {"rows": 0, "bytes": 0}
+        return migrate_page_html(self.engine, self.blobs, batch_size=batch_size)
+
     # -------- Intelligence --------
     def save_intelligence(
         self,
@@ -135,7 +265,7 @@ class SQLAlchemyStore(PersistenceStore):
         min_confidence: float = 0.0,
         limit: int = 100,
     ) -> List[Dict]:
-        with self.Session() as s:
+        with self.ReadSession() as s:
             stmt = select(Intelligence).where(Intelligence.confidence >= min_confidence)
             if entity_id:
                 stmt = stmt.where(Intelligence.entity_id == entity_id)
@@ -157,12 +287,47 @@ class SQLAlchemyStore(PersistenceStore):
             ]
 
     def search_intelligence_data(self, query: str) -> List[Dict]:
-        with self.Session() as s:
-            stmt = select(Intelligence).where(
-                func.cast(Intelligence.data, String).ilike(f"%{query}%")
+        match = self._fts_query(query)
+        pg_query = self._pg_query(query) if match is None else None
+        with self.ReadSession() as s:
+            if pg_query is not None:
+                condition, rank, highlight = pg_text_search(INTEL_TSV, INTEL_DOCUMENT)
+                stmt = select(Intelligence, rank, highlight).where(condition).order_by(rank.desc())
+                rows = s.execute(stmt, {"q": pg_query}).all()
+                return [
+                    {
+                        "id": r.id,
+                        "entity_id": r.entity_id,
+                        "data": _as_dict(r.data),
+                        "rank": rank_,
+                        "highlight": highlight_,
+                    }
+                    for r, rank_, highlight_ in rows
+                ]
+            if match is None:
+                stmt = select(Intelligence).where(
+                    func.cast(Intelligence.data, String).ilike(f"%{query}%")
+                )
+                rows = s.execute(stmt).scalars().all()
+                return [{"id": r.id, "entity_id": r.entity_id, "data": _as_dict(r.data)} for r in rows]
+
+            hits = fts_hits(INTEL_FTS)
+            stmt = (
+                select(Intelligence, hits.c.rank, hits.c.highlight)
+                .join(hits, hits.c.rid == literal_column("intelligence.rowid"))
+                .order_by(hits.c.rank.desc())
             )
-            rows = s.execute(stmt).scalars().all()
-            return [{"id": r.id, "entity_id": r.entity_id, "data": _as_dict(r.data)} for r in rows]
+            rows = s.execute(stmt, {"q": match}).all()
+            return [
+                {
+                    "id": r.id,
+                    "entity_id": r.entity_id,
+                    "data": _as_dict(r.data),
+                    "rank": rank,
+                    "highlight": highlight,
+                }
+                for r, rank, highlight in rows
+            ]
 
     # -------- Links / Relationships --------
     def save_links(self, from_url: str, links: List[Dict]):
@@ -174,9 +339,20 @@ class SQLAlchemyStore(PersistenceStore):
             return
         with self.Session() as s:
             from_pid = self._resolve_page_id(s, from_url)
+            seen = set()
             for l in links:
                 to_url = l.get("href")
-                to_pid = self._resolve_page_id(s, to_url) if to_url else None
+                # The href is stored as written; its canonical form only
+                # collapses tracking/ordering variants of one target
+                canonical = canonicalize_url(to_url) if to_url else to_url
+                if canonical in seen:
+                    continue
+                seen.add(canonical)
+                to_pid = None
+                if to_url:
+                    to_pid = self._resolve_page_id(s, to_url)
+                    if to_pid is None and canonical != to_url:
+                        to_pid = self._resolve_page_id(s, canonical)
                 link = Link(
                     id=_uuid4(),
                     from_url=from_url,
@@ -236,7 +412,632 @@ class SQLAlchemyStore(PersistenceStore):
             )
             s.commit()
 
+    def save_page_simhash(
+        self,
+        page_id: str,
+        url: str,
+        simhash: str,
+        bands: List[int],
+        canonical_page_id: Optional[str] = None,
+        distance: Optional[int] = None,
+    ) -> None:
+        """Upsert the SimHash fingerprint row for a page."""
+        with self.Session() as s:
+            row = s.execute(
+                select(PageSimHash).where(PageSimHash.page_id == page_id)
+            ).scalar_one_or_none()
+            if row is None:
+                row = PageSimHash(id=_uuid4(), page_id=page_id)
+                s.add(row)
+            row.url = url
+            row.simhash = simhash
+            row.band_0, row.band_1, row.band_2, row.band_3 = bands
+            row.canonical_page_id = canonical_page_id
+            row.distance = distance
+            s.commit()
+
+    def find_simhash_candidates(
+        self, bands: List[int], url: Optional[str] = None, limit: int = 200
+    ) -> List[Dict]:
+        """Indexed band lookup for canonical near-duplicate candidates, excluding *url*."""
+        with self.Session() as s:
+            stmt = select(PageSimHash).where(
+                or_(
+                    PageSimHash.band_0 == bands[0],
+                    PageSimHash.band_1 == bands[1],
+                    PageSimHash.band_2 == bands[2],
+                    PageSimHash.band_3 == bands[3],
+                ),
+                PageSimHash.canonical_page_id.is_(None),
+            )
+            if url is not None:
+                stmt = stmt.where(PageSimHash.url != url)
+            stmt = stmt.limit(limit)
+            rows = s.execute(stmt).scalars().all()
+            return [
+                {
+                    "page_id": str(r.page_id),
+                    "url": r.url,
+                    "simhash": r.simhash,
+                    "canonical_page_id": str(r.canonical_page_id) if r.canonical_page_id else None,
+                }
+                for r in rows
+            ]
+
+    # -------- Crawl sessions / durable frontier --------
+    def open_crawl_session(self, session_key: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        with self.Session() as s:
+            row = s.execute(
+                select(CrawlSession).where(CrawlSession.session_key == session_key)
+            ).scalar_one_or_none()
+            if row is None:
+                row = CrawlSession(
+                    id=_uuid4(),
+                    session_key=session_key,
+                    status="running",
+                    pages_explored=0,
+                    domain_counts_json={},
+                    params_json=params or {},
+                )
+                s.add(row)
+            else:
+                row.status = "running"
+            s.commit()
+            return row.to_dict()
+
+    def save_crawl_checkpoint(
+        self,
+        session_id: str,
+        pages_explored: int,
+        domain_counts: Dict[str, int],
+        stats: Optional[Dict] = None,
+        status: str = "running",
+    ) -> None:
+        with self.Session() as s:
+            row = s.get(CrawlSession, uuid.UUID(str(session_id)))
+            if row is None:
+                return
+            row.pages_explored = pages_explored
+            row.domain_counts_json = dict(domain_counts)
+            if stats is not None:
+                row.stats_json = dict(stats)
+            row.status = status
+            row.last_checkpoint_at = datetime.utcnow()
+            s.commit()
+
+    def frontier_push_batch(self, session_id: str, entries: List[Dict]) -> int:
+        if not entries:
+            return 0
+        sid = uuid.UUID(str(session_id))
+        # Collapse duplicates within the batch, keeping the best score
+        by_norm: Dict[str, Dict] = {}
+        for e in entries:
+            prev = by_norm.get(e["url_norm"])
+            if prev is None or e.get("score", 0.0) > prev.get("score", 0.0):
+                by_norm[e["url_norm"]] = e
+
+        inserted = 0
+        norms = list(by_norm)
+        with self.Session() as s:
+            for i in range(0, len(norms), 500):
+                chunk = norms[i:i + 500]
+                existing = {
+                    r.url_norm: r
+                    for r in s.execute(
+                        select(FrontierEntry).where(
+                            FrontierEntry.session_id == sid,
+                            FrontierEntry.url_norm.in_(chunk),
+                        )
+                    ).scalars()
+                }
+                for norm in chunk:
+                    e = by_norm[norm]
+                    score = float(e.get("score", 0.0))
+                    row = existing.get(norm)
+                    if row is not None:
+                        if row.state == "queued" and score > (row.score or 0.0):
+                            row.score = score
+                        continue
+                    s.add(
+                        FrontierEntry(
+                            id=_uuid4(),
+                            session_id=sid,
+                            url=e["url"],
+                            url_norm=norm,
+                            score=score,
+                            depth=int(e.get("depth", 0)),
+                            link_text=e.get("link_text"),
+                            state="queued",
+                        )
+                    )
+                    inserted += 1
+            s.commit()
+        return inserted
+
+    def frontier_lease_batch(
+        self, session_id: str, limit: int, owner: str, lease_seconds: int = 600
+    ) -> List[Dict]:
+        sid = uuid.UUID(str(session_id))
+        now = datetime.utcnow()
+        claimable = or_(
+            FrontierEntry.state == "queued",
+            and_(FrontierEntry.state == "leased", FrontierEntry.lease_expires_at < now),
+        )
+        table = FrontierEntry.__table__
+        claimable_t = or_(
+            table.c.state == "queued",
+            and_(table.c.state == "leased", table.c.lease_expires_at < now),
+        )
+        expires = now + timedelta(seconds=lease_seconds)
+        with self.Session() as s:
+            rows = s.execute(
+                select(FrontierEntry)
+                .where(FrontierEntry.session_id == sid, claimable)
+                .order_by(FrontierEntry.score.desc(), FrontierEntry.depth.asc())
+                .limit(limit)
+            ).scalars().all()
+            # Conditional per-row claim: concurrent workers that selected the
+            # same candidates cannot both take a row
+            leased = []
+            for r in rows:
+                res = s.execute(
+                    update(table)
+                    .where(table.c.id == r.id, claimable_t)
+                    .values(state="leased", lease_owner=owner, lease_expires_at=expires)
+                )
+                if res.rowcount == 1:
+                    leased.append(r.to_dict() | {"state": "leased"})
+            s.commit()
+            return leased
+
+    def frontier_set_state(
+        self, session_id: str, url_norms: List[str], state: str, owner: Optional[str] = None
+    ) -> int:
+        if not url_norms:
+            return 0
+        sid = uuid.UUID(str(session_id))
+        table = FrontierEntry.__table__
+        updated = 0
+        with self.Session() as s:
+            for i in range(0, len(url_norms), 500):
+                stmt = update(table).where(
+                    table.c.session_id == sid, table.c.url_norm.in_(url_norms[i:i + 500])
+                )
+                if owner is not None:
+                    # Fenced: rows another worker took over after the lease expired are left alone
+                    stmt = stmt.where(table.c.state == "leased", table.c.lease_owner == owner)
+                updated += s.execute(
+                    stmt.values(state=state, lease_owner=None, lease_expires_at=None)
+                ).rowcount
+            s.commit()
+        return updated
+
+    def frontier_renew_leases(
+        self, session_id: str, url_norms: List[str], owner: str, lease_seconds: int = 600
+    ) -> List[str]:
+        if not url_norms:
+            return []
+        sid = uuid.UUID(str(session_id))
+        table = FrontierEntry.__table__
+        expires = datetime.utcnow() + timedelta(seconds=lease_seconds)
+        held = []
+        with self.Session() as s:
+            for i in range(0, len(url_norms), 500):
+                owned = and_(
+                    table.c.session_id == sid,
+                    table.c.url_norm.in_(url_norms[i:i + 500]),
+                    table.c.state == "leased",
+                    table.c.lease_owner == owner,
+                )
+                s.execute(update(table).where(owned).values(lease_expires_at=expires))
+                held.extend(s.execute(select(table.c.url_norm).where(owned)).scalars())
+            s.commit()
+        return held
+
+    def frontier_release_leases(self, session_id: str) -> int:
+        sid = uuid.UUID(str(session_id))
+        table = FrontierEntry.__table__
+        with self.Session() as s:
+            res = s.execute(
+                update(table)
+                .where(table.c.session_id == sid, table.c.state == "leased")
+                .values(state="queued", lease_owner=None, lease_expires_at=None)
+            )
+            s.commit()
+            return res.rowcount
+
+    def frontier_urls_in_state(self, session_id: str, states: List[str]) -> List[str]:
+        sid = uuid.UUID(str(session_id))
+        with self.Session() as s:
+            return list(
+                s.execute(
+                    select(FrontierEntry.url_norm).where(
+                        FrontierEntry.session_id == sid,
+                        FrontierEntry.state.in_(states),
+                    )
+                ).scalars()
+            )
+
+    def frontier_count_in_state(
+        self, session_id: str, states: List[str], exclude: Optional[List[str]] = None
+    ) -> int:
+        sid = uuid.UUID(str(session_id))
+        stmt = select(func.count()).where(
+            FrontierEntry.session_id == sid, FrontierEntry.state.in_(states)
+        )
+        if exclude:
+            stmt = stmt.where(FrontierEntry.url_norm.not_in(exclude))
+        with self.Session() as s:
+            return s.execute(stmt).scalar() or 0
+
+    def frontier_counts(self, session_id: str) -> Dict[str, int]:
+        sid = uuid.UUID(str(session_id))
+        now = datetime.utcnow()
+        with self.Session() as s:
+            rows = s.execute(
+                select(FrontierEntry.state, func.count())
+                .where(FrontierEntry.session_id == sid)
+                .group_by(FrontierEntry.state)
+            ).all()
+            counts = {state: n for state, n in rows}
+            # Expired leases are claimable again
+            expired = s.execute(
+                select(func.count()).where(
+                    FrontierEntry.session_id == sid,
+                    FrontierEntry.state == "leased",
+                    FrontierEntry.lease_expires_at < now,
+                )
+            ).scalar() or 0
+        if expired:
+            counts["leased"] -= expired
+            counts["queued"] = counts.get("queued", 0) + expired
+        return counts
+
+    def claim_crawl_budget(self, session_id: str, key: str, limit: int) -> bool:
+        if limit <= 0:
+            return False
+        sid = uuid.UUID(str(session_id))
+        table = CrawlBudget.__table__
+        stmt = (
+            update(table)
+            .where(
+                table.c.session_id == sid,
+                table.c.budget_key == key,
+                table.c.used < limit,
+            )
+            .values(used=table.c.used + 1)
+        )
+        for _ in range(2):
+            with self.Session() as s:
+                if s.execute(stmt).rowcount == 1:
+                    s.commit()
+                    return True
+                exists = s.execute(
+                    select(CrawlBudget.id).where(
+                        CrawlBudget.session_id == sid, CrawlBudget.budget_key == key
+                    )
+                ).first()
+                if exists:
+                    return False
+                s.add(CrawlBudget(id=_uuid4(), session_id=sid, budget_key=key, used=1))
+                try:
+                    s.commit()
+                    return True
+                except IntegrityError:
+                    # Another worker created the counter first; retry the update
+                    s.rollback()
+        return False
+
+    def release_crawl_budget(self, session_id: str, key: str) -> None:
+        sid = uuid.UUID(str(session_id))
+        table = CrawlBudget.__table__
+        with self.Session() as s:
+            s.execute(
+                update(table)
+                .where(
+                    table.c.session_id == sid,
+                    table.c.budget_key == key,
+                    table.c.used > 0,
+                )
+                .values(used=table.c.used - 1)
+            )
+            s.commit()
+
+    def get_crawl_budgets(self, session_id: str) -> Dict[str, int]:
+        sid = uuid.UUID(str(session_id))
+        with self.Session() as s:
+            rows = s.execute(
+                select(CrawlBudget.budget_key, CrawlBudget.used).where(
+                    CrawlBudget.session_id == sid
+                )
+            ).all()
+            return {key: used for key, used in rows}
+
+    def save_crawl_worker(
+        self,
+        session_id: str,
+        worker_id: str,
+        status: str,
+        stats: Dict,
+        hostname: Optional[str] = None,
+        pid: Optional[int] = None,
+    ) -> None:
+        with self.Session() as s:
+            row = s.execute(
+                select(CrawlWorkerState).where(CrawlWorkerState.worker_id == worker_id)
+            ).scalar_one_or_none()
+            if row is None:
+                row = CrawlWorkerState(
+                    id=_uuid4(),
+                    session_id=uuid.UUID(str(session_id)),
+                    worker_id=worker_id,
+                )
+                s.add(row)
+            row.status = status
+            row.stats_json = dict(stats)
+            row.hostname = hostname or row.hostname
+            row.pid = pid or row.pid
+            row.heartbeat_at = datetime.utcnow()
+            s.commit()
+
+    def get_crawl_workers(self, session_id: str) -> List[Dict]:
+        sid = uuid.UUID(str(session_id))
+        with self.Session() as s:
+            rows = s.execute(
+                select(CrawlWorkerState).where(CrawlWorkerState.session_id == sid)
+            ).scalars().all()
+            return [r.to_dict() for r in rows]
+
+    # -------- Visited-URL sets --------
+    def save_seen_urls(self, scope: str, entries: List[Tuple[int, str]]) -> bool:
+        if not entries:
+            return True
+        by_hash = dict(entries)
+        hashes = list(by_hash)
+        with self.Session() as s:
+            for i in range(0, len(hashes), 500):
+                chunk = hashes[i:i + 500]
+                known = set(
+                    s.execute(
+                        select(SeenUrl.url_hash).where(
+                            SeenUrl.scope == scope, SeenUrl.url_hash.in_(chunk)
+                        )
+                    ).scalars()
+                )
+                s.add_all(
+                    SeenUrl(id=_uuid4(), scope=scope, url_hash=h, url=by_hash[h])
+                    for h in chunk
+                    if h not in known
+                )
+            s.commit()
+        return True
+
+    def seen_urls_exist(self, scope: str, url_hashes: List[int]) -> List[int]:
+        if not url_hashes:
+            return []
+        with self.Session() as s:
+            return list(
+                s.execute(
+                    select(SeenUrl.url_hash).where(
+                        SeenUrl.scope == scope, SeenUrl.url_hash.in_(list(url_hashes))
+                    )
+                ).scalars()
+            )
+
+    def save_url_filter(self, scope: str, state: Dict) -> None:
+        with self.Session() as s:
+            row = s.execute(
+                select(UrlFilter).where(UrlFilter.scope == scope)
+            ).scalar_one_or_none()
+            if row is None:
+                row = UrlFilter(id=_uuid4(), scope=scope)
+                s.add(row)
+            row.num_bits = state["num_bits"]
+            row.num_hashes = state["num_hashes"]
+            row.item_count = state.get("item_count", 0)
+            row.capacity = state.get("capacity")
+            row.error_rate = state.get("error_rate")
+            row.bits = state["bits"]
+            s.commit()
+
+    def load_url_filter(self, scope: str) -> Optional[Dict]:
+        with self.Session() as s:
+            row = s.execute(
+                select(UrlFilter).where(UrlFilter.scope == scope)
+            ).scalar_one_or_none()
+            if row is None:
+                return None
+            return {
+                "num_bits": row.num_bits,
+                "num_hashes": row.num_hashes,
+                "item_count": row.item_count,
+                "capacity": row.capacity,
+                "error_rate": row.error_rate,
+                "bits": row.bits,
+            }
+
+    # -------- Crawl learning --------
+    _DOMAIN_STAT_FIELDS = (
+        "total_crawls", "successful_crawls", "intel_yield", "avg_intel_quality",
+        "first_seen", "last_seen",
+    )
+    _PAGE_TYPE_STAT_FIELDS = (
+        "entity_type", "page_type", "total_count", "success_count", "avg_quality",
+        "confidence", "last_seen",
+    )
+
+    def _domain_stat_dict(self, r: CrawlDomainStat) -> Dict:
+        return {
+            "domain": r.domain,
+            **{f: getattr(r, f) for f in self._DOMAIN_STAT_FIELDS},
+            "page_type_distribution": dict(r.page_type_distribution_json or {}),
+            "entity_type_distribution": dict(r.entity_type_distribution_json or {}),
+        }
+
+    def _page_type_stat_dict(self, r: CrawlPageTypeStat) -> Dict:
+        return {
+            "pattern_key": r.pattern_key,
+            **{f: getattr(r, f) for f in self._PAGE_TYPE_STAT_FIELDS},
+            "extraction_hints": list(r.extraction_hints_json or []),
+        }
+
+    def load_crawl_learning(self) -> Dict[str, List[Dict]]:
+        with self.Session() as s:
+            domains = [
+                self._domain_stat_dict(r) for r in s.execute(select(CrawlDomainStat)).scalars()
+            ]
+            page_types = [
+                self._page_type_stat_dict(r)
+                for r in s.execute(select(CrawlPageTypeStat)).scalars()
+            ]
+        return {"domains": domains, "page_types": page_types}
+
+    def save_crawl_learning(
+        self,
+        domains: List[Dict],
+        page_types: List[Dict],
+        merge: Optional[Callable[[str, Optional[Dict], Dict], Dict]] = None,
+    ) -> bool:
+        with self.Session() as s:
+            if domains:
+                # Locked so concurrent learners merge into each other's counts
+                existing = {
+                    r.domain: r for r in s.execute(
+                        select(CrawlDomainStat)
+                        .where(CrawlDomainStat.domain.in_([d["domain"] for d in domains]))
+                        .with_for_update()
+                    ).scalars()
+                }
+                for d in domains:
+                    row = existing.get(d["domain"])
+                    if merge is not None:
+                        d = merge("domain", row and self._domain_stat_dict(row), d)
+                    if row is None:
+                        row = CrawlDomainStat(id=_uuid4(), domain=d["domain"])
+                        s.add(row)
+                    for f in self._DOMAIN_STAT_FIELDS:
+                        if f in d:
+                            setattr(row, f, d[f])
+                    row.page_type_distribution_json = dict(d.get("page_type_distribution") or {})
+                    row.entity_type_distribution_json = dict(d.get("entity_type_distribution") or {})
+            if page_types:
+                existing = {
+                    r.pattern_key: r for r in s.execute(
+                        select(CrawlPageTypeStat)
+                        .where(
+                            CrawlPageTypeStat.pattern_key.in_([p["pattern_key"] for p in page_types])
+                        )
+                        .with_for_update()
+                    ).scalars()
+                }
+                for p in page_types:
+                    row = existing.get(p["pattern_key"])
+                    if merge is not None:
+                        p = merge("page_type", row and self._page_type_stat_dict(row), p)
+                    if row is None:
+                        row = CrawlPageTypeStat(id=_uuid4(), pattern_key=p["pattern_key"])
+                        s.add(row)
+                    for f in self._PAGE_TYPE_STAT_FIELDS:
+                        if f in p:
+                            setattr(row, f, p[f])
+                    row.extraction_hints_json = list(p.get("extraction_hints") or [])
+            s.commit()
+        return True
+
+    # -------- Pipeline timing --------
+    def save_page_timing(self, page_id: str, timing: Dict) -> None:
+        with self.Session() as s:
+            pc = s.execute(
+                select(PageContent).where(PageContent.page_id == page_id)
+            ).scalar_one_or_none()
+            if pc is None:
+                return
+            # Reassign so the JSON column is flagged as changed
+            pc.metadata_json = {**(pc.metadata_json or {}), "pipeline_timing": timing}
+            s.commit()
+
+    def save_stage_timings(
+        self,
+        crawl_id: str,
+        stages: Dict[str, Dict],
+        entity_name: Optional[str] = None,
+        keep_crawls: int = 50,
+    ) -> bool:
+        with self.Session() as s:
+            existing = {
+                r.stage: r for r in s.execute(
+                    select(CrawlStageTiming).where(CrawlStageTiming.crawl_id == crawl_id)
+                ).scalars()
+            }
+            for stage, summary in stages.items():
+                row = existing.get(stage)
+                if row is None:
+                    row = CrawlStageTiming(id=_uuid4(), crawl_id=crawl_id, stage=stage)
+                    s.add(row)
+                row.entity_name = entity_name
+                row.pages = int(summary.get("pages", 0))
+                for f in ("total_ms", "p50_ms", "p95_ms", "max_ms"):
+                    setattr(row, f, float(summary.get(f, 0.0)))
+                row.counts_json = dict(summary.get("counts") or {})
+            s.flush()
+
+            # Rolling window: drop the rows of crawls older than the newest keep_crawls
+            latest = (
+                select(CrawlStageTiming.crawl_id)
+                .group_by(CrawlStageTiming.crawl_id)
+                .order_by(func.max(CrawlStageTiming.created_at).desc())
+            )
+            crawl_ids = s.execute(latest).scalars().all()
+            stale = crawl_ids[max(keep_crawls, 1):]
+            if stale:
+                for row in s.execute(
+                    select(CrawlStageTiming).where(CrawlStageTiming.crawl_id.in_(stale))
+                ).scalars():
+                    s.delete(row)
+            s.commit()
+        return True
+
+    def get_stage_timings(self, crawl_id: Optional[str] = None, limit: int = 5) -> List[Dict]:
+        with self.ReadSession() as s:
+            if crawl_id:
+                crawl_ids = [crawl_id]
+            else:
+                crawl_ids = s.execute(
+                    select(CrawlStageTiming.crawl_id)
+                    .group_by(CrawlStageTiming.crawl_id)
+                    .order_by(func.max(CrawlStageTiming.created_at).desc())
+                    .limit(limit)
+                ).scalars().all()
+            if not crawl_ids:
+                return []
+            rows = s.execute(
+                select(CrawlStageTiming)
+                .where(CrawlStageTiming.crawl_id.in_(crawl_ids))
+                .order_by(CrawlStageTiming.created_at, CrawlStageTiming.stage)
+            ).scalars().all()
+
+        crawls: Dict[str, Dict] = {}
+        for r in rows:
+            crawl = crawls.setdefault(r.crawl_id, {
+                "crawl_id": r.crawl_id,
+                "entity_name": r.entity_name,
+                "created_at": r.created_at.isoformat() if r.created_at else None,
+                "pages": 0,
+                "stages": {},
+            })
+            crawl["pages"] = max(crawl["pages"], r.pages)
+            crawl["stages"][r.stage] = {
+                "pages": r.pages,
+                "total_ms": r.total_ms,
+                "p50_ms": r.p50_ms,
+                "p95_ms": r.p95_ms,
+                "max_ms": r.max_ms,
+                "counts": dict(r.counts_json or {}),
+            }
+        return [crawls[c] for c in crawl_ids if c in crawls]
+
     # -------- Patterns / Domains --------
+
     def save_patterns(self, patterns: List[Dict]):
         if not patterns:
             return
@@ -312,13 +1113,38 @@ class SQLAlchemyStore(PersistenceStore):
                 return type_hierarchy[new_kind] == existing_kind
             return False
         
+        named = [e for e in entities if e.get("name")]
+        # Names equal ignoring case have equal normalized names, so the
+        # name_norm index finds every candidate (plus some resolved away below)
+        candidate_norms = {normalize_entity_name(e["name"]) for e in named} | {
+            normalize_entity_name(e["suggested_relationship"]["target"])
+            for e in named
+            if e.get("suggested_relationship") and e["suggested_relationship"].get("target")
+        }
+        # Key for entities created below, as the database's lower() would give
+        # it (SQLite's built-in lower() folds ASCII letters only)
+        sql_lower = (
+            (lambda value: value.translate(_ASCII_LOWER))
+            if self.engine.dialect.name == "sqlite" else str.lower
+        )
+
         mapping: Dict[tuple, str] = {}
         with self.Session() as s:
-            for e in entities:
-                name = e.get("name")
-                if not name:
-                    continue
-                    
+            # Every candidate in one query: same name, or same name ignoring case
+            by_name: Dict[str, List[Entity]] = {}
+            by_lower: Dict[str, List[Entity]] = {}
+            if named:
+                rows = s.execute(
+                    select(Entity, func.lower(Entity.name)).where(Entity.name_norm.in_(candidate_norms))
+                ).all()
+                for entity, lowered in rows:
+                    by_name.setdefault(entity.name, []).append(entity)
+                    by_lower.setdefault(lowered, []).append(entity)
+
+            entry_types: Dict[uuid.UUID, str] = {}
+            links: List[Tuple[Any, Any, Optional[str]]] = []
+            for e in named:
+                name = e["name"]
                 kind = (e.get("kind") or "entity").strip().lower()
                 data = _as_dict(e.get("data") or e.get("attrs"))
                 meta = _as_dict(e.get("meta"))
@@ -330,37 +1156,13 @@ class SQLAlchemyStore(PersistenceStore):
 
                 key = (name, kind)
                 
-                # First try exact match
-                existing = (
-                    s.execute(
-                        select(Entity)
-                        .where(Entity.name == name, Entity.kind == kind)
-                        .order_by(
-                            Entity.last_seen.desc().nullslast(),
-                            Entity.updated_at.desc().nullslast(),
-                        )
-                        .limit(1)
-                    )
-                    .scalars()
-                    .first()
+                # First try exact match, then name-only (several kinds may share a name);
+                # the most recently seen wins, entities of this batch included
+                existing = max(
+                    (c for c in by_name.get(name, ()) if c.kind == kind), key=_recency, default=None
                 )
-                
-                # If no exact match, try name-only lookup for potential merge
-                # Use .first() since multiple entities may have the same name with different kinds
-                if not existing:
-                    existing = (
-                        s.execute(
-                            select(Entity)
-                            .where(func.lower(Entity.name) == name.lower())
-                            .order_by(
-                                Entity.last_seen.desc().nullslast(),
-                                Entity.updated_at.desc().nullslast(),
-                            )
-                            .limit(1)
-                        )
-                        .scalars()
-                        .first()
-                    )
+                if existing is None:
+                    existing = max(by_lower.get(name.lower(), ()), key=_recency, default=None)
                 
                 if existing:
                     # Merge data - keep existing values, add new ones
@@ -391,60 +1193,49 @@ class SQLAlchemyStore(PersistenceStore):
                         existing.kind = kind
                     
                     existing.last_seen = datetime.now(timezone.utc)
-                    eid = existing.id
+                    entity = existing
+                    # Matched ids come back as UUIDs, as if (re)loaded from the database
+                    eid = _guid_key(existing.id)
                 else:
-                    eid = _uuid4()
-                    
                     # Add parent_type to metadata if tracking type hierarchy
                     if parent_type:
                         meta["parent_type"] = parent_type
                     
-                    s.add(
-                        Entity(
-                            id=eid,
-                            name=name,
-                            kind=kind,
-                            data=data,
-                            metadata_json=meta,
-                            last_seen=datetime.now(timezone.utc),
-                        )
+                    entity = Entity(
+                        id=_uuid4(),
+                        name=name,
+                        kind=kind,
+                        data=data,
+                        metadata_json=meta,
+                        last_seen=datetime.now(timezone.utc),
                     )
+                    s.add(entity)
+                    by_name.setdefault(name, []).append(entity)
+                    by_lower.setdefault(sql_lower(name), []).append(entity)
+                    eid = entity.id
+                entry_types[_guid_key(eid)] = entity.entry_type
                 mapping[key] = eid
 
                 # Wire contextual relationships if context provided
                 if page_id:
-                    self._upsert_relationship(s, page_id, eid, "mentions_entity")
+                    links.append((page_id, eid, "mentions_entity"))
                 if primary_entity_id:
-                    self._upsert_relationship(s, primary_entity_id, eid, rel_type)
+                    links.append((primary_entity_id, eid, rel_type))
                 
                 # Handle suggested relationships from entity extraction
                 if suggested_rel:
                     target_name = suggested_rel.get("target")
-                    suggested_rel_type = suggested_rel.get("relation_type", "related")
-                    
                     if target_name:
-                        # Look up target entity by name
-                        target_entity = (
-                            s.execute(
-                                select(Entity)
-                                .where(func.lower(Entity.name) == target_name.lower())
-                                .order_by(
-                                    Entity.last_seen.desc().nullslast(),
-                                    Entity.updated_at.desc().nullslast(),
-                                )
-                                .limit(1)
-                            )
-                            .scalars()
-                            .first()
-                        )
+                        target_entity = max(by_lower.get(target_name.lower(), ()), key=_recency, default=None)
                         if target_entity:
-                            self._upsert_relationship(s, eid, target_entity.id, suggested_rel_type)
+                            links.append((eid, target_entity.id, suggested_rel.get("relation_type", "related")))
 
+            self._add_relationships(s, links, entry_types)
             s.commit()
         return mapping
 
     def get_entities(self, name_like: Optional[str] = None, kind: Optional[str] = None, limit: int = 100) -> List[Dict]:
-        with self.Session() as s:
+        with self.ReadSession() as s:
             stmt = select(Entity)
             if name_like:
                 stmt = stmt.where(Entity.name.ilike(f"%{name_like}%"))
@@ -464,6 +1255,41 @@ class SQLAlchemyStore(PersistenceStore):
                 for r in rows
             ]
 
+    # -------- Keyset listings --------
+    def list_page(
+        self,
+        listing: str,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order: str = "created",
+        **filters,
+    ) -> Dict[str, Any]:
+        """
+        One page of *listing* ("entities", "pages", "intelligence" or
+        "relationships") in keyset *order* (see ``database.pagination``).
+
+        Returns ``{"items": [row dicts], "next_cursor": str | None}``; pass
+        ``next_cursor`` back as *cursor* for the following page. Raises
+        ValueError for an unknown listing, order, filter or cursor.
+        """
+        keys = listing_keys(listing, order)
+        stmt = listing_query(listing, filters)
+        with self.ReadSession() as s:
+            rows, next_cursor = keyset_page(s, stmt, keys, cursor, max(1, min(limit, MAX_PAGE_SIZE)))
+            return {"items": [r.to_dict() for r in rows], "next_cursor": next_cursor}
+
+    def iter_listing(
+        self, listing: str, order: str = "created", batch_size: int = 500, **filters
+    ) -> Iterator[Dict]:
+        """Every row dict of *listing*, one short read transaction per *batch_size* rows."""
+        cursor = None
+        while True:
+            page = self.list_page(listing, cursor=cursor, limit=batch_size, order=order, **filters)
+            yield from page["items"]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return
+
     # -------- Refresh helpers --------
     def get_pending_refresh(self, limit: int = 50) -> List[Dict]:
         with self.Session() as s:
@@ -489,12 +1315,102 @@ class SQLAlchemyStore(PersistenceStore):
         entity_type: Optional[str] = None,
         page_type: Optional[str] = None,
     ) -> List[Dict]:
-        with self.Session() as s:
+        match = self._fts_query(keyword)
+        if match is None:
+            pg_query = self._pg_query(keyword)
+            if pg_query is not None:
+                return self._search_intel_pg(pg_query, limit, entity_type, page_type)
+            return self._search_intel_like(keyword, limit, entity_type, page_type)
+        with self.ReadSession() as s:
+            content = PageContent.__table__
+            hits = fts_hits(PAGE_FTS)
+            stmt = (
+                select(
+                    Page.url,
+                    Page.entity_type,
+                    Page.page_type,
+                    Page.score,
+                    hits.c.snippet,
+                    hits.c.highlight,
+                    hits.c.rank,
+                )
+                .join(content, Page.id == content.c.page_id)
+                .join(hits, hits.c.rid == literal_column("page_content.rowid"))
+                .order_by(hits.c.rank.desc(), Page.score.desc().nullslast())
+                .limit(limit)
+            )
+            if entity_type:
+                stmt = stmt.where(Page.entity_type == entity_type)
+            if page_type:
+                stmt = stmt.where(Page.page_type == page_type)
+            rows = s.execute(stmt, {"q": match}).all()
+            return [
+                {
+                    "url": r[0],
+                    "entity_type": r[1],
+                    "page_type": r[2],
+                    "score": r[3],
+                    "snippet": r[4],
+                    "highlight": r[5],
+                    "rank": r[6],
+                }
+                for r in rows
+            ]
+
+    def _search_intel_pg(
+        self,
+        query: str,
+        limit: int,
+        entity_type: Optional[str],
+        page_type: Optional[str],
+    ) -> List[Dict]:
+        """``search_intel`` on PostgreSQL: tsvector index on page text."""
+        with self.ReadSession() as s:
+            content = PageContent.__table__
+            condition, rank, highlight = pg_text_search(PAGE_TSV, "page_content.text")
+            stmt = (
+                select(Page.url, Page.entity_type, Page.page_type, Page.score, highlight, rank)
+                .join(content, Page.id == content.c.page_id)
+                .where(condition)
+                .order_by(rank.desc(), Page.score.desc().nullslast())
+                .limit(limit)
+            )
+            if entity_type:
+                stmt = stmt.where(Page.entity_type == entity_type)
+            if page_type:
+                stmt = stmt.where(Page.page_type == page_type)
+            rows = s.execute(stmt, {"q": query}).all()
+            return [
+                {
+                    "url": r[0],
+                    "entity_type": r[1],
+                    "page_type": r[2],
+                    "score": r[3],
+                    "snippet": strip_highlight(r[4]),
+                    "highlight": r[4],
+                    "rank": r[5],
+                }
+                for r in rows
+            ]
+
+    def _search_intel_like(
+        self,
+        keyword: str,
+        limit: int,
+        entity_type: Optional[str],
+        page_type: Optional[str],
+    ) -> List[Dict]:
+        """``search_intel`` without FTS: ILIKE scan of page text."""
+        with self.ReadSession() as s:
             # Use explicit alias to avoid automatic aliasing warning for overlapping tables
             # Both Page and PageContent inherit from BasicDataEntry (polymorphic inheritance)
             page_content_alias = aliased(PageContent)
             
             kw_like = f"%{keyword}%"
+            if s.get_bind().dialect.name == "postgresql":
+                position, greatest = func.strpos, func.greatest
+            else:
+                position, greatest = func.instr, func.max
             stmt = (
                 select(
                     Page.url,
@@ -503,7 +1419,7 @@ class SQLAlchemyStore(PersistenceStore):
                     Page.score,
                     func.substr(
                         page_content_alias.text,
-                        func.max(1, func.instr(func.lower(page_content_alias.text), keyword.lower()) - 60),
+                        greatest(1, position(func.lower(page_content_alias.text), keyword.lower()) - 60),
                         200,
                     ).label("snippet"),
                 )
@@ -554,12 +1470,10 @@ class SQLAlchemyStore(PersistenceStore):
             - sources_count: Number of intelligence sources
             - pages: List of pages mentioning this entity
         """
-        with self.Session() as s:
-            # Find all entities matching the name (case-insensitive)
+        with self.ReadSession() as s:
+            # Find all entities matching the name (normalized prefix or alias)
             entities = s.execute(
-                select(Entity).where(
-                    func.lower(Entity.name).like(f"%{entity_name.lower()}%")
-                )
+                select(Entity).where(name_prefix_match(entity_name))
             ).scalars().all()
             
             if not entities:
@@ -701,24 +1615,57 @@ class SQLAlchemyStore(PersistenceStore):
     def _resolve_page_id(self, session, url: Optional[str]) -> Optional[str]:
         return self._page_repo.resolve_page_id(session, url)
 
+    def _add_relationships(
+        self, session, links: List[Tuple[Any, Any, Optional[str]]], entry_types: Dict[uuid.UUID, str]
+    ) -> None:
+        """
+        Add ``(from_id, to_id, relation_type)`` relationships as
+        ``_upsert_relationship`` does, looking up the endpoint types missing
+        from *entry_types* (``{id: entry_type}``) in one query.
+        """
+        from .models import entries_table
+
+        links = [link for link in links if all(link)]
+        unknown = {
+            key for from_id, to_id, _ in links for key in (_guid_key(from_id), _guid_key(to_id))
+            if key is not None and key not in entry_types
+        }
+        if unknown:
+            entry_types = dict(entry_types)
+            entry_types.update(session.execute(
+                select(entries_table.c.id, entries_table.c.entry_type).where(entries_table.c.id.in_(unknown))
+            ).all())
+        session.add_all(
+            Relationship(
+                id=_uuid4(),
+                source_id=from_id,
+                target_id=to_id,
+                relation_type=relation_type,
+                source_type=entry_types.get(_guid_key(from_id)),
+                target_type=entry_types.get(_guid_key(to_id)),
+                metadata_json={},
+            )
+            for from_id, to_id, relation_type in links
+        )
+
     def _upsert_relationship(self, session, from_id: str, to_id: str, relation_type: str, meta: Optional[Dict] = None) -> Optional[Relationship]:
         if not from_id or not to_id or not relation_type:
             return None
         
-        # Determine source and target types by querying the entries table
-        from .models import BasicDataEntry
+        # Determine source and target types by querying the entries table (or view)
+        from .models import entries_table
         source_type = None
         target_type = None
         
         try:
             source_entry = session.execute(
-                select(BasicDataEntry.entry_type).where(BasicDataEntry.id == from_id)
+                select(entries_table.c.entry_type).where(entries_table.c.id == from_id)
             ).scalar_one_or_none()
             if source_entry:
                 source_type = source_entry
                 
             target_entry = session.execute(
-                select(BasicDataEntry.entry_type).where(BasicDataEntry.id == to_id)
+                select(entries_table.c.entry_type).where(entries_table.c.id == to_id)
             ).scalar_one_or_none()
             if target_entry:
                 target_type = target_entry
@@ -764,19 +1711,31 @@ class SQLAlchemyStore(PersistenceStore):
             return []
         
         # First try exact and fuzzy matches
-        with self.Session() as s:
-            stmt = select(Entity).where(func.lower(Entity.name).like(f"%{name.lower()}%"))
-            if kind:
-                stmt = stmt.where(Entity.kind == kind)
+        with self.ReadSession() as s:
+            if getattr(self, "pg_search", {}).get("trigram"):
+                # pg_trgm index: substring matches plus trigram-similar names (typos)
+                stmt = select(Entity).where(
+                    or_(Entity.name.ilike(f"%{name}%"), Entity.name.op("%")(name), name_match([name]))
+                )
+            else:
+                # name_norm index: names and aliases starting with the normalized
+                # name, plus the names sharing the most trigrams with it
+                similar_ids = trigram_candidates(s, name, kinds=[kind] if kind else None, engine=self.engine)
+                stmt = select(Entity).where(or_(name_prefix_match(name), Entity.id.in_(similar_ids)))
+            
+            # Get potential candidates (kind checked here, so the name index is used)
+            stmt = stmt.options(selectinload(Entity.aliases))
+            candidates = [c for c in s.execute(stmt).scalars() if not kind or c.kind == kind]
             
-            # Get potential candidates
-            candidates = s.execute(stmt).scalars().all()
+            def string_similarity(candidate: Entity) -> float:
+                # Best of the name and the aliases (a match may be by alias)
+                return max(self._name_similarity(name, n) for n in [candidate.name, *(a.alias for a in candidate.aliases)])
             
             if not embedder or not candidates:
                 # Return exact/fuzzy matches if no embedder or no candidates
                 # Use lower threshold (0.6) for string-based matching
                 string_threshold = max(0.6, threshold - 0.2)
-                return [c for c in candidates if self._name_similarity(name, c.name) >= string_threshold]
+                return [c for c in candidates if string_similarity(c) >= string_threshold]
             
             # Use embedding similarity for better matching
             try:
@@ -793,7 +1752,7 @@ class SQLAlchemyStore(PersistenceStore):
                 return similar
             except Exception as e:
                 self.logger.warning(f"Embedding similarity failed, using fuzzy match: {e}")
-                return [c for c in candidates if self._name_similarity(name, c.name) >= threshold]
+                return [c for c in candidates if string_similarity(c) >= threshold]
 
     def merge_entities(self, source_id: str, target_id: str) -> bool:
         """
@@ -888,6 +1847,9 @@ class SQLAlchemyStore(PersistenceStore):
                 for page in s.execute(select(Page).where(Page.entity_id == source_id)).scalars().all():
                     page.entity_id = target_id
                 
+                # The source's names now find the target
+                add_aliases(s, target.id, [source.name] + [a.alias for a in source.aliases], source="merge")
+                
                 # Soft-merge: keep the source entity as a subordinate
                 merge_timestamp = datetime.now(timezone.utc).isoformat()
                 if not source.metadata_json:
@@ -941,18 +1903,45 @@ class SQLAlchemyStore(PersistenceStore):
             Entity UUID if found, None otherwise
         """
         all_names = [name] + aliases
+        norms = [normalize_entity_name(n) for n in all_names]
         
         with self.Session() as s:
-            for alias in all_names:
-                stmt = select(Entity).where(func.lower(Entity.name) == alias.lower())
-                if kind:
-                    stmt = stmt.where(Entity.kind == kind)
-                
-                entity = s.execute(stmt).scalar_one_or_none()
-                if entity:
-                    return str(entity.id)
+            candidates = [
+                e for e in s.execute(
+                    select(Entity).where(name_match(all_names)).order_by(Entity.created_at)
+                ).scalars()
+                if not kind or e.kind == kind
+            ]
+            if not candidates:
+                return None
+            
+            # The entity named like the earliest given name, else the oldest alias match
+            by_norm = {}
+            for entity in candidates:
+                by_norm.setdefault(entity.name_norm, entity)
+            entity = next((by_norm[n] for n in norms if n in by_norm), candidates[0])
+            
+            # The other names now resolve to it directly
+            if add_aliases(s, entity.id, all_names, source="resolved"):
+                s.commit()
+            return str(entity.id)
+
+    def add_entity_aliases(self, entity_id: str, aliases: List[str], source: str = "manual") -> int:
+        """
+        Record alternative names of an entity, found by name lookups from then on.
         
-        return None
+        Args:
+            entity_id: Entity UUID
+            aliases: Alternative names (its own name and known aliases are skipped)
+            source: Where the aliases come from
+            
+        Returns:
+            Number of aliases added
+        """
+        with self.Session() as s:
+            added = add_aliases(s, entity_id, aliases, source=source)
+            s.commit()
+            return added
 
     def get_entity_relations(
         self, 
@@ -1003,7 +1992,7 @@ class SQLAlchemyStore(PersistenceStore):
             
             visited.add(visit_key)
             
-            with self.Session() as s:
+            with self.ReadSession() as s:
                 if eid_type == "entity":
                     return self._traverse_entity(s, eid, current_depth, visited, direction, include_pages, include_intel)
                 elif eid_type == "page":
@@ -1274,12 +2263,12 @@ class SQLAlchemyStore(PersistenceStore):
                 
                 # Look up entity
                 entity_kind = entity_type.rstrip('s')  # persons -> person, etc.
-                entity = session.execute(
-                    select(Entity).where(
-                        func.lower(Entity.name) == entity_name.lower(),
-                        Entity.kind == entity_kind
-                    )
-                ).scalar_one_or_none()
+                entity = next((
+                    e for e in session.execute(
+                        select(Entity).where(name_match([entity_name])).order_by(Entity.created_at)
+                    ).scalars()
+                    if e.kind == entity_kind
+                ), None)
                 
                 if entity:
                     visit_key = (str(entity.id), "entity")
@@ -1515,7 +2504,7 @@ class SQLAlchemyStore(PersistenceStore):
             Relationship object if found, None otherwise
         """
         try:
-            with self.Session() as s:
+            with self.ReadSession() as s:
                 stmt = select(Relationship).where(
                     Relationship.source_id == source_id,
                     Relationship.target_id == target_id
@@ -1539,7 +2528,7 @@ class SQLAlchemyStore(PersistenceStore):
             List of Relationship objects
         """
         try:
-            with self.Session() as s:
+            with self.ReadSession() as s:
                 outgoing = s.execute(
                     select(Relationship).where(Relationship.source_id == entity_id)
                 ).scalars().all()
@@ -1643,7 +2632,7 @@ class SQLAlchemyStore(PersistenceStore):
         try:
             from collections import defaultdict
             
-            with self.Session() as s:
+            with self.ReadSession() as s:
                 stmt = select(Relationship)
                 if relation_type:
                     stmt = stmt.where(Relationship.relation_type == relation_type)
@@ -1693,16 +2682,38 @@ class SQLAlchemyStore(PersistenceStore):
         """Full-text keyword search over semantic_snippets."""
         from .models import SemanticSnippet
 
-        kw_like = f"%{keyword}%"
-        with self.Session() as s:
+        match = self._fts_query(keyword)
+        pg_query = self._pg_query(keyword) if match is None else None
+        with self.ReadSession() as s:
+            if pg_query is not None:
+                condition, rank, highlight = pg_text_search(SNIPPET_TSV, "semantic_snippets.text")
+                stmt = (
+                    select(SemanticSnippet, rank, highlight)
+                    .where(condition)
+                    .order_by(rank.desc(), SemanticSnippet.created_at.desc())
+                    .limit(limit)
+                )
+                rows = s.execute(stmt, {"q": pg_query}).all()
+                return [{**r.to_dict(), "rank": rank_, "highlight": hl} for r, rank_, hl in rows]
+            if match is None:
+                stmt = (
+                    select(SemanticSnippet)
+                    .where(SemanticSnippet.text.ilike(f"%{keyword}%"))
+                    .order_by(SemanticSnippet.created_at.desc())
+                    .limit(limit)
+                )
+                rows = s.execute(stmt).scalars().all()
+                return [r.to_dict() for r in rows]
+
+            hits = fts_hits(SNIPPET_FTS)
             stmt = (
-                select(SemanticSnippet)
-                .where(SemanticSnippet.text.ilike(kw_like))
-                .order_by(SemanticSnippet.created_at.desc())
+                select(SemanticSnippet, hits.c.rank, hits.c.highlight)
+                .join(hits, hits.c.rid == literal_column("semantic_snippets.rowid"))
+                .order_by(hits.c.rank.desc(), SemanticSnippet.created_at.desc())
                 .limit(limit)
             )
-            rows = s.execute(stmt).scalars().all()
-            return [r.to_dict() for r in rows]
+            rows = s.execute(stmt, {"q": match}).all()
+            return [{**r.to_dict(), "rank": rank, "highlight": highlight} for r, rank, highlight in rows]
 
     def get_neighbouring_snippets(
         self,
@@ -1714,7 +2725,7 @@ class SQLAlchemyStore(PersistenceStore):
         """Return snippets adjacent to *chunk_index* on the same page."""
         from .models import SemanticSnippet
 
-        with self.Session() as s:
+        with self.ReadSession() as s:
             conditions = [SemanticSnippet.page_id == page_id]
             if direction == "prev":
                 conditions.append(SemanticSnippet.chunk_index.between(
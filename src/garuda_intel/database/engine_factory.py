@@ -0,0 +1,143 @@
+"""
+Engine construction for ``SQLAlchemyStore``.
+
+SQLite file databases are written concurrently by the webapp, the task
+queue worker, the directory watcher, crawls and agents. ``create_store_engine``
+gives them a profile suited to that: every pooled connection gets WAL
+journaling (readers never block the writer), ``synchronous=NORMAL``, a
+larger page cache, memory-mapped reads and a busy timeout so a writer waits
+for the lock instead of failing with "database is locked".
+``create_read_engine`` opens the same file read-only (``mode=ro`` plus
+``query_only``) in its own pool for read-heavy callers such as the webapp.
+
+PostgreSQL gets a larger pool with pre-ping (connections survive server
+restarts and idle timeouts); other backends, and in-memory SQLite, get
+SQLAlchemy's defaults.
+"""
+
+import sqlite3
+from typing import Dict, Optional, Union
+from urllib.request import pathname2url
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+# Applied on every connection, in this order. ``cache_size`` is negative
+# KiB (64 MiB); ``mmap_size`` is bytes (256 MiB); ``busy_timeout`` is ms.
+SQLITE_PRAGMAS: Dict[str, Union[int, str]] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 15000,
+    "cache_size": -65536,
+    "mmap_size": 268435456,
+    "temp_store": "MEMORY",
+}
+
+# Pool sized for many threads sharing one store (webapp requests, task
+# queue, watcher, crawl workers); SQLite still serialises the writes
+SQLITE_POOL_SIZE = 10
+SQLITE_MAX_OVERFLOW = 20
+SQLITE_POOL_TIMEOUT = 30
+
+# PostgreSQL takes concurrent writers, so the crawl workers, task queue and
+# webapp can each hold a connection
+POSTGRES_POOL_SIZE = 20
+POSTGRES_MAX_OVERFLOW = 20
+
+
+def sqlite_file_path(url: str) -> Optional[str]:
+    """Database file of a SQLite *url*; None for other backends and in-memory."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return None
+    database = parsed.database or ""
+    if not database or database == ":memory:" or database.startswith("file:"):
+        return None
+    return database
+
+
+def _apply_pragmas(engine: Engine, pragmas: Dict[str, Union[int, str]]) -> None:
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def create_store_engine(
+    url: str,
+    pragmas: Optional[Dict[str, Union[int, str]]] = None,
+    pool_size: int = SQLITE_POOL_SIZE,
+    max_overflow: int = SQLITE_MAX_OVERFLOW,
+) -> Engine:
+    """Read/write engine for *url*, with the SQLite profile for file databases."""
+    if make_url(url).get_backend_name() == "postgresql":
+        return create_engine(
+            url,
+            future=True,
+            pool_size=POSTGRES_POOL_SIZE,
+            max_overflow=POSTGRES_MAX_OVERFLOW,
+            pool_timeout=SQLITE_POOL_TIMEOUT,
+            pool_pre_ping=True,
+        )
+    if sqlite_file_path(url) is None:
+        return create_engine(url, future=True)
+    engine = create_engine(
+        url,
+        future=True,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=SQLITE_POOL_TIMEOUT,
+        connect_args={
+            "check_same_thread": False,
+            "timeout": SQLITE_PRAGMAS["busy_timeout"] / 1000.0,
+        },
+    )
+    _apply_pragmas(engine, SQLITE_PRAGMAS if pragmas is None else pragmas)
+    return engine
+
+
+def create_read_engine(
+    url: str,
+    pragmas: Optional[Dict[str, Union[int, str]]] = None,
+    pool_size: int = SQLITE_POOL_SIZE,
+    max_overflow: int = SQLITE_MAX_OVERFLOW,
+) -> Optional[Engine]:
+    """
+    Read-only engine on an existing SQLite database file.
+
+    Returns None when *url* is not a SQLite file database; callers then read
+    through their read/write engine.
+    """
+    path = sqlite_file_path(url)
+    if path is None:
+        return None
+    uri = f"file:{pathname2url(path)}?mode=ro"
+    timeout = SQLITE_PRAGMAS["busy_timeout"] / 1000.0
+
+    def connect():
+        return sqlite3.connect(uri, uri=True, timeout=timeout, check_same_thread=False)
+
+    engine = create_engine(
+        "sqlite://",
+        future=True,
+        creator=connect,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=SQLITE_POOL_TIMEOUT,
+    )
+    # The journal mode belongs to the file and is set by the writer
+    read_pragmas = {
+        k: v
+        for k, v in (SQLITE_PRAGMAS if pragmas is None else pragmas).items()
+        if k != "journal_mode"
+    }
+    read_pragmas["query_only"] = "ON"
+    _apply_pragmas(engine, read_pragmas)
+    return engine
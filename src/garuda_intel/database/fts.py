@@ -0,0 +1,197 @@
+"""
+SQLite FTS5 full-text indexes for page text, snippets and intelligence.
+
+Keyword search used to ``ILIKE '%kw%'`` page text, snippet text and the
+string cast of every intelligence JSON blob: a full table scan per query.
+``ensure_fts`` creates external-content FTS5 tables over those columns
+(the text is not stored twice; the index points at the content rows by
+``rowid``) and triggers that keep them in sync on insert, update and
+delete. Intelligence is indexed through a view that flattens the JSON
+string values into one text column.
+
+Matches are ranked with ``bm25()`` and returned with a ``snippet()``
+excerpt, plain and with the matched terms marked. Rows are tied to the
+index by ``rowid``, which ``VACUUM`` may renumber for these tables: run
+``backfill_fts`` (``garuda-db fts-rebuild``) after a VACUUM or when the
+index is suspected to be stale.
+
+Non-SQLite engines, and SQLite builds without FTS5, report
+``fts_available() == False``; callers keep their ILIKE queries for them.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import Float, Integer, String, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+PAGE_FTS = "page_content_fts"
+SNIPPET_FTS = "semantic_snippets_fts"
+INTEL_FTS = "intelligence_fts"
+INTEL_FTS_SOURCE = "intelligence_fts_source"
+
+# Markers around matched terms in ``highlight`` results (markdown bold)
+HIGHLIGHT_OPEN = "**"
+HIGHLIGHT_CLOSE = "**"
+# Tokens of context returned by snippet()
+SNIPPET_TOKENS = 32
+
+_TOKENIZE = "tokenize='unicode61 remove_diacritics 2', prefix='2 3'"
+
+
+def _flatten_json(ref: str) -> str:
+    """SQL expression joining the string values of JSON column *ref*."""
+    return (
+        f"CASE WHEN json_valid({ref}) THEN "
+        f"(SELECT group_concat(value, ' ') FROM json_tree({ref}) WHERE type = 'text') END"
+    )
+
+
+def _sync_triggers(
+    table: str,
+    fts: str,
+    watched: List[str],
+    columns: List[str],
+    values_new: List[str],
+    values_old: List[str],
+) -> List[str]:
+    """Insert/delete/update triggers on *table* mirroring *watched* into *fts* *columns*."""
+    cols = ", ".join(columns)
+    insert = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {', '.join(values_new)});"
+    delete = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {', '.join(values_old)});"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {', '.join(watched)} ON {table} "
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+FTS_DDL: List[str] = [
+    # Page text
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {PAGE_FTS} USING fts5("
+    f"text, content='page_content', {_TOKENIZE})",
+    *_sync_triggers("page_content", PAGE_FTS, ["text"], ["text"], ["new.text"], ["old.text"]),
+    # Snippet text
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SNIPPET_FTS} USING fts5("
+    f"text, content='semantic_snippets', {_TOKENIZE})",
+    *_sync_triggers(
+        "semantic_snippets", SNIPPET_FTS, ["text"], ["text"], ["new.text"], ["old.text"]
+    ),
+    # Intelligence: entity name + flattened JSON string values
+    f"CREATE VIEW IF NOT EXISTS {INTEL_FTS_SOURCE} AS "
+    f"SELECT rowid AS intel_rowid, entity_name, {_flatten_json('data')} AS body FROM intelligence",
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {INTEL_FTS} USING fts5("
+    f"entity_name, body, content='{INTEL_FTS_SOURCE}', content_rowid='intel_rowid', {_TOKENIZE})",
+    *_sync_triggers(
+        "intelligence",
+        INTEL_FTS,
+        ["entity_name", "data"],
+        ["entity_name", "body"],
+        ["new.entity_name", _flatten_json("new.data")],
+        ["old.entity_name", _flatten_json("old.data")],
+    ),
+]
+
+FTS_TABLES = (PAGE_FTS, SNIPPET_FTS, INTEL_FTS)
+
+# FTS5's 'rebuild' cannot read a content view that calls json_tree(), so the
+# intelligence index is cleared and refilled from the view instead
+_REBUILD: Dict[str, List[str]] = {
+    PAGE_FTS: [f"INSERT INTO {PAGE_FTS}({PAGE_FTS}) VALUES ('rebuild')"],
+    SNIPPET_FTS: [f"INSERT INTO {SNIPPET_FTS}({SNIPPET_FTS}) VALUES ('rebuild')"],
+    INTEL_FTS: [
+        f"INSERT INTO {INTEL_FTS}({INTEL_FTS}) VALUES ('delete-all')",
+        f"INSERT INTO {INTEL_FTS}(rowid, entity_name, body) "
+        f"SELECT intel_rowid, entity_name, body FROM {INTEL_FTS_SOURCE}",
+    ],
+}
+
+
+def _rebuild(conn, table: str) -> None:
+    for stmt in _REBUILD[table]:
+        conn.execute(text(stmt))
+
+
+def fts_available(engine: Engine) -> bool:
+    """True when *engine* is SQLite with the FTS5 module."""
+    if engine.dialect.name != "sqlite":
+        return False
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("CREATE VIRTUAL TABLE IF NOT EXISTS temp._fts5_probe USING fts5(x)"))
+            conn.execute(text("DROP TABLE temp._fts5_probe"))
+        return True
+    except OperationalError:
+        return False
+
+
+def ensure_fts(engine: Engine) -> bool:
+    """
+    Create the FTS tables, source view and sync triggers if missing.
+
+    Indexes created on a database that already holds rows are backfilled
+    immediately. Returns False (and changes nothing) when FTS5 is unavailable.
+    """
+    if not fts_available(engine):
+        return False
+    with engine.begin() as conn:
+        existing = set(
+            conn.execute(
+                text(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN "
+                    f"('{PAGE_FTS}', '{SNIPPET_FTS}', '{INTEL_FTS}')"
+                )
+            ).scalars()
+        )
+        for stmt in FTS_DDL:
+            conn.execute(text(stmt))
+        for table in FTS_TABLES:
+            if table not in existing:
+                _rebuild(conn, table)
+    return True
+
+
+def backfill_fts(engine: Engine) -> Dict[str, int]:
+    """Rebuild every FTS index from its content table; ``{fts_table: rows}``."""
+    if not ensure_fts(engine):
+        return {}
+    counts = {}
+    with engine.begin() as conn:
+        for table in FTS_TABLES:
+            _rebuild(conn, table)
+            counts[table] = conn.execute(text(f"SELECT count(*) FROM {table}_docsize")).scalar()
+    return counts
+
+
+def fts_match_query(keyword: str) -> Optional[str]:
+    """
+    FTS5 MATCH expression for a user keyword, or None if it has no terms.
+
+    The words are searched as a phrase with the last word as a prefix, the
+    closest token-level equivalent of the old ``ILIKE '%keyword%'``.
+    """
+    tokens = re.findall(r"\w+", keyword or "")
+    if not tokens:
+        return None
+    return '"' + " ".join(tokens) + '"*'
+
+
+def fts_hits(fts_table: str, alias: str = "fts_hits"):
+    """
+    Subquery of ``rid, rank, snippet, highlight`` for ``:q`` on *fts_table*.
+
+    ``rank`` is ``-bm25()`` (higher is better); the excerpts come from the
+    best-matching column. Join ``rid`` to the content table's ``rowid``.
+    """
+    return (
+        text(
+            f"SELECT rowid AS rid, -bm25({fts_table}) AS rank, "
+            f"snippet({fts_table}, -1, '', '', '…', {SNIPPET_TOKENS}) AS snippet, "
+            f"snippet({fts_table}, -1, '{HIGHLIGHT_OPEN}', '{HIGHLIGHT_CLOSE}', '…', {SNIPPET_TOKENS}) "
+            f"AS highlight FROM {fts_table} WHERE {fts_table} MATCH :q"
+        )
+        .columns(rid=Integer, rank=Float, snippet=String, highlight=String)
+        .subquery(alias)
+    )
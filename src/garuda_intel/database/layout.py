@@ -0,0 +1,237 @@
+"""
+Schema layouts of the ``BasicDataEntry`` models.
+
+With the default ``joined`` layout every model row also has a row in the
+shared ``entries`` table (id, entry_type, created_at, updated_at): inserts
+write two rows and every ORM read joins ``entries``, whose primary key
+index grows with every object of every type.
+
+With ``GARUDA_SCHEMA_LAYOUT=flat`` each model table owns those four
+columns. ``entries`` becomes a ``UNION ALL`` view over the model tables, so
+generic lookups by id (relationship endpoint types, orphan checks) keep
+working through ``models.entries_table``. Relationship endpoints are then
+plain GUID columns, without a foreign key constraint.
+
+The layout is chosen at import time and must match the database:
+``check_layout`` refuses to open a database of the other layout.
+``migrate_to_flat`` (``garuda-db migrate-layout``) copies a joined
+database into a new flat one while the source stays in use; re-running it
+catches up with rows written since, and a last run with writers stopped
+completes the switch.
+"""
+
+import logging
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Index,
+    MetaData,
+    Table,
+    UniqueConstraint,
+    delete,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine
+
+from .models import FLAT_LAYOUT, Base, entries_table
+
+logger = logging.getLogger(__name__)
+
+ENTRY_COLUMNS = ("entry_type", "created_at", "updated_at")
+
+
+def entry_tables(metadata: MetaData) -> List[Table]:
+    """Model tables of a flat-layout *metadata* (those owning ``entry_type``)."""
+    return [t for t in metadata.sorted_tables if "entry_type" in t.c and t.name != "entries"]
+
+
+def entries_view_sql(metadata: MetaData) -> str:
+    """``SELECT`` of the ``entries`` view over the tables of *metadata*."""
+    columns = ", ".join(("id",) + ENTRY_COLUMNS)
+    return " UNION ALL ".join(f"SELECT {columns} FROM {t.name}" for t in entry_tables(metadata))
+
+
+def ensure_entries_view(engine: Engine, metadata: Optional[MetaData] = None) -> None:
+    """Create or refresh the ``entries`` view of a flat-layout database."""
+    body = entries_view_sql(metadata if metadata is not None else Base.metadata)
+    with engine.begin() as conn:
+        if engine.dialect.name == "sqlite":
+            current = conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'view' AND name = 'entries'")
+            ).scalar()
+            ddl = f"CREATE VIEW entries AS {body}"
+            if current != ddl:
+                conn.execute(text("DROP VIEW IF EXISTS entries"))
+                conn.execute(text(ddl))
+        else:
+            conn.execute(text(f"CREATE OR REPLACE VIEW entries AS {body}"))
+
+
+def check_layout(engine: Engine) -> None:
+    """Raise RuntimeError if the database at *engine* uses the other schema layout."""
+    insp = inspect(engine)
+    if FLAT_LAYOUT and "entries" in insp.get_table_names():
+        raise RuntimeError(
+            "Database uses the joined schema layout but GARUDA_SCHEMA_LAYOUT=flat; "
+            "copy it with `garuda-db migrate-layout` or unset GARUDA_SCHEMA_LAYOUT"
+        )
+    if not FLAT_LAYOUT and "entries" in insp.get_view_names():
+        raise RuntimeError("Database uses the flat schema layout; set GARUDA_SCHEMA_LAYOUT=flat")
+
+
+def prepare_layout(engine: Engine) -> None:
+    """Layout-specific setup after ``create_all``: the ``entries`` view when flat."""
+    if FLAT_LAYOUT:
+        ensure_entries_view(engine)
+
+
+def _flat_table(table: Table, metadata: MetaData) -> Table:
+    """Copy of joined-layout model *table* owning the ``entries`` columns."""
+    columns = []
+    for c in table.columns:
+        fks = [
+            ForeignKey(fk.target_fullname, ondelete=fk.ondelete)
+            for fk in c.foreign_keys
+            if fk.column.table is not entries_table
+        ]
+        columns.append(
+            Column(
+                c.name,
+                c.type,
+                *fks,
+                primary_key=c.primary_key,
+                nullable=c.nullable,
+                index=c.index,
+                unique=c.unique,
+            )
+        )
+    for name in ENTRY_COLUMNS:
+        source = entries_table.c[name]
+        columns.append(Column(name, source.type, nullable=source.nullable))
+    constraints = [
+        UniqueConstraint(*[c.name for c in uc.columns], name=uc.name)
+        for uc in table.constraints
+        if isinstance(uc, UniqueConstraint) and len(uc.columns) > 1
+    ]
+    flat = Table(table.name, metadata, *columns, *constraints)
+    for ix in table.indexes:
+        cols = list(ix.columns)
+        if len(cols) == 1 and cols[0].index and ix.name == f"ix_{table.name}_{cols[0].name}":
+            continue  # created by the column's own index=True
+        Index(ix.name, *[flat.c[c.name] for c in cols], unique=ix.unique)
+    return flat
+
+
+def flat_metadata() -> MetaData:
+    """Schema of the flat layout, derived from the models of the running layout."""
+    if FLAT_LAYOUT:
+        return Base.metadata
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        if table is entries_table:
+            continue
+        if any(fk.column.table is entries_table for fk in table.foreign_keys):
+            _flat_table(table, metadata)
+        else:
+            table.to_metadata(metadata)  # not an entry: entity_name_trigrams
+    return metadata
+
+
+def _upsert(table: Table, dialect: str):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Layout migration supports SQLite and PostgreSQL targets, not {dialect}")
+    stmt = insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={c.name: stmt.excluded[c.name] for c in table.columns if not c.primary_key},
+    )
+
+
+def _delete_missing(source: Engine, target: Engine, metadata: MetaData, batch_size: int) -> int:
+    """Delete target rows whose id is gone from the source (rows deleted between passes)."""
+    deleted = 0
+    for table in reversed(entry_tables(metadata)):
+        with target.connect() as conn:
+            target_ids = set(conn.execute(select(table.c.id)).scalars())
+        if not target_ids:
+            continue
+        with source.connect() as conn:
+            source_ids = set(conn.execute(select(Base.metadata.tables[table.name].c.id)).scalars())
+        gone = list(target_ids - source_ids)
+        for i in range(0, len(gone), batch_size):
+            with target.begin() as conn:
+                conn.execute(delete(table).where(table.c.id.in_(gone[i : i + batch_size])))
+        deleted += len(gone)
+    return deleted
+
+
+def migrate_to_flat(
+    source: Engine,
+    target: Engine,
+    batch_size: int = 500,
+    progress: Optional[Callable[[str, int], None]] = None,
+) -> Dict[str, int]:
+    """
+    Copy joined-layout database *source* into flat-layout database *target*.
+
+    Rows are read in primary-key order, *batch_size* per short read
+    transaction, and upserted into *target*, so the source can keep serving
+    reads and writes. Running it again updates changed rows, adds new ones
+    and deletes rows removed from the source since the previous run.
+
+    Returns ``{table: rows copied}`` plus ``"deleted"``. *progress* is called
+    with ``(table, rows copied so far)`` after each batch.
+    """
+    from .fts import ensure_fts
+    from .postgres import ensure_pg_search
+    from .trigrams import ensure_trigram_index
+
+    if FLAT_LAYOUT:
+        raise RuntimeError(
+            "Run the layout migration with the joined layout (unset GARUDA_SCHEMA_LAYOUT)"
+        )
+    if "entries" in inspect(target).get_table_names():
+        raise RuntimeError("Target database uses the joined layout")
+    metadata = flat_metadata()
+    metadata.create_all(target)
+    ensure_entries_view(target, metadata)
+
+    counts: Dict[str, int] = {"deleted": _delete_missing(source, target, metadata, batch_size)}
+    for table in entry_tables(metadata):
+        src = Base.metadata.tables[table.name]
+        query = (
+            select(*src.columns, *[entries_table.c[name] for name in ENTRY_COLUMNS])
+            .join(entries_table, entries_table.c.id == src.c.id)
+            .order_by(src.c.id)
+            .limit(batch_size)
+        )
+        upsert = _upsert(table, target.dialect.name)
+        copied, last_id = 0, None
+        while True:
+            batch = query if last_id is None else query.where(src.c.id > last_id)
+            with source.connect() as conn:
+                rows = [dict(r) for r in conn.execute(batch).mappings()]
+            if not rows:
+                break
+            with target.begin() as conn:
+                conn.execute(upsert, rows)
+            copied += len(rows)
+            last_id = rows[-1]["id"]
+            if progress:
+                progress(table.name, copied)
+        counts[table.name] = copied
+        logger.info(f"Copied {copied} rows of {table.name}")
+
+    # Search indexes are built once over the copied rows
+    ensure_fts(target)
+    ensure_pg_search(target)
+    ensure_trigram_index(target)
+    return counts
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import uuid
 from datetime import datetime
 from typing import Optional, Any
@@ -15,14 +16,22 @@ from sqlalchemy import (
     Boolean,
     UniqueConstraint,
     Index,
+    BigInteger,
+    LargeBinary,
+    Column,
+    MetaData,
+    Table,
 )
-from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship
+from sqlalchemy.orm import Mapped, MappedColumn, declarative_base, mapped_column, relationship
 from sqlalchemy.types import TypeDecorator, CHAR
 
 try:
-    from sqlalchemy.dialects.postgresql import UUID as PGUUID
+    from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 except ImportError:
-    PGUUID = None
+    JSONB = PGUUID = None
+
+# JSON document column: JSONB on PostgreSQL (binary, GIN-indexable), JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql") if JSONB is not None else JSON
 
 
 class GUID(TypeDecorator):
@@ -59,42 +68,101 @@ class GUID(TypeDecorator):
 Base = declarative_base()
 
 
-class BasicDataEntry(Base):
-    __tablename__ = "entries"
+# Storage layout of the BasicDataEntry models, fixed at import time:
+# - "joined" (default): joined-table inheritance; every row also has a row in
+#   the shared ``entries`` table holding id/entry_type/created_at/updated_at
+# - "flat": each model table owns those columns and ``entries`` is a
+#   UNION ALL view over them (see ``database.layout``)
+SCHEMA_LAYOUTS = ("joined", "flat")
+SCHEMA_LAYOUT = os.environ.get("GARUDA_SCHEMA_LAYOUT", "joined")
+if SCHEMA_LAYOUT not in SCHEMA_LAYOUTS:
+    raise ValueError(f"GARUDA_SCHEMA_LAYOUT must be one of {SCHEMA_LAYOUTS}, not {SCHEMA_LAYOUT!r}")
+FLAT_LAYOUT = SCHEMA_LAYOUT == "flat"
+
+
+if FLAT_LAYOUT:
+    class BasicDataEntry(Base):
+        __abstract__ = True
+
+        entry_type: Mapped[str] = mapped_column(String, nullable=False)
+        created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+        updated_at: Mapped[datetime] = mapped_column(
+            DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        )
+
+    # Generic lookups by id (entry_type, timestamps) go through the view
+    entries_table = Table(
+        "entries",
+        MetaData(),
+        Column("id", GUID(), primary_key=True),
+        Column("entry_type", String),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+    )
+else:
+    class BasicDataEntry(Base):
+        __tablename__ = "entries"
+
+        id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, default=uuid.uuid4)
+        entry_type: Mapped[str] = mapped_column(String, nullable=False)
+        created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+        updated_at: Mapped[datetime] = mapped_column(
+            DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        )
+
+        __mapper_args__ = {
+            "polymorphic_on": entry_type,
+            "polymorphic_identity": "entry",
+        }
+
+    entries_table = BasicDataEntry.__table__
+
+
+def entry_id_column() -> MappedColumn:
+    """Primary key of a BasicDataEntry model (a foreign key to ``entries`` when joined)."""
+    if FLAT_LAYOUT:
+        return mapped_column(GUID(), primary_key=True, default=uuid.uuid4)
+    return mapped_column(GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True)
 
-    id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, default=uuid.uuid4)
-    entry_type: Mapped[str] = mapped_column(String, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
-    )
 
-    __mapper_args__ = {
-        "polymorphic_on": entry_type,
-        "polymorphic_identity": "entry",
-    }
+def entry_ref_column(**kwargs) -> MappedColumn:
+    """Reference to a row of any BasicDataEntry model (no database constraint when flat)."""
+    if FLAT_LAYOUT:
+        return mapped_column(GUID(), **kwargs)
+    return mapped_column(GUID(), ForeignKey("entries.id", ondelete="CASCADE"), **kwargs)
+
+
+def entry_mapper_args(identity: str, id_column: MappedColumn) -> dict:
+    """``__mapper_args__`` of a BasicDataEntry model with polymorphic *identity*."""
+    if FLAT_LAYOUT:
+        # Each table is its own polymorphic base so entry_type is filled in on insert
+        return {"polymorphic_on": "entry_type", "polymorphic_identity": identity}
+    return {"polymorphic_identity": identity, "inherit_condition": id_column == BasicDataEntry.id}
 
 
 class Entity(BasicDataEntry):
     __tablename__ = "entities"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     name: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    # Lookup key: normalize_entity_name(name), kept in sync by database.names
+    # (old value loaded on change: database.trigrams removes its trigrams)
+    name_norm: Mapped[Optional[str]] = mapped_column(String, nullable=True, active_history=True)
     kind: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
-    data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    metadata_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    data: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    metadata_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     last_seen: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     incoming_relationships: Mapped[list["Relationship"]] = relationship(
         "Relationship",
+        primaryjoin="Entity.id == Relationship.target_id",
         foreign_keys="Relationship.target_id",
         back_populates="target_entity",
         cascade="all, delete-orphan",
     )
     outgoing_relationships: Mapped[list["Relationship"]] = relationship(
         "Relationship",
+        primaryjoin="Entity.id == Relationship.source_id",
         foreign_keys="Relationship.source_id",
         back_populates="source_entity",
         cascade="all, delete-orphan",
@@ -102,42 +170,48 @@ class Entity(BasicDataEntry):
 
     __table_args__ = (
         Index('ix_entity_name_kind', 'name', 'kind'),
+        Index('ix_entity_name_norm_kind', 'name_norm', 'kind'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "entity",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("entity", id)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "name": self.name,
+            "kind": self.kind,
+            "data": self.data or {},
+            "meta": self.metadata_json or {},
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
 
 
 class Relationship(BasicDataEntry):
     __tablename__ = "relationships"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
-    source_id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), nullable=False, index=True
-    )
-    target_id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), nullable=False, index=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
+    source_id: Mapped[uuid.UUID] = entry_ref_column(nullable=False, index=True)
+    target_id: Mapped[uuid.UUID] = entry_ref_column(nullable=False, index=True)
     relation_type: Mapped[str] = mapped_column(String, nullable=False, index=True)
     # Type information for source and target nodes (e.g., "entity", "page", "intelligence")
     # These are optional for backward compatibility with existing data
     source_type: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
     target_type: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
-    metadata_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    metadata_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     # Legacy Entity-specific relationship mappings for backward compatibility
     # These are maintained for existing code that expects Entity relationships,
     # but should not be used for non-Entity relationships (Page, Intelligence, etc.)
     # Use source_id/target_id directly for multi-node type relationships
+    # Explicit join conditions: with the flat layout there is no foreign key to follow
     source_entity: Mapped["Entity"] = relationship(
-        "Entity", foreign_keys=[source_id], back_populates="outgoing_relationships"
+        "Entity", primaryjoin="Entity.id == Relationship.source_id",
+        foreign_keys=[source_id], back_populates="outgoing_relationships",
     )
     target_entity: Mapped["Entity"] = relationship(
-        "Entity", foreign_keys=[target_id], back_populates="incoming_relationships"
+        "Entity", primaryjoin="Entity.id == Relationship.target_id",
+        foreign_keys=[target_id], back_populates="incoming_relationships",
     )
 
     __table_args__ = (
@@ -145,18 +219,25 @@ class Relationship(BasicDataEntry):
         Index('ix_relationship_source_type', 'source_id', 'relation_type'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "relationship",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("relationship", id)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "source_id": str(self.source_id),
+            "target_id": str(self.target_id),
+            "relation_type": self.relation_type,
+            "source_type": self.source_type,
+            "target_type": self.target_type,
+            "metadata": self.metadata_json or {},
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
 
 
 class Page(BasicDataEntry):
     __tablename__ = "pages"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     url: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
     title: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     page_type: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
@@ -180,10 +261,7 @@ class Page(BasicDataEntry):
         Index('ix_page_entity_type', 'entity_id', 'page_type'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "page",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("page", id)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -209,38 +287,96 @@ Entity.pages = relationship(
 )
 
 
+class EntityAlias(BasicDataEntry):
+    """Alternative name of an entity, matched by the same normalized key as ``Entity.name_norm``."""
+    __tablename__ = "entity_aliases"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    entity_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(), ForeignKey("entities.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    alias: Mapped[str] = mapped_column(String, nullable=False)
+    alias_norm: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    # Where the alias came from: "merge", "resolved", "manual", ...
+    source: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+
+    entity: Mapped["Entity"] = relationship("Entity", foreign_keys=[entity_id], back_populates="aliases")
+
+    __table_args__ = (
+        UniqueConstraint("entity_id", "alias_norm", name="uq_entity_alias"),
+    )
+
+    __mapper_args__ = entry_mapper_args("entity_alias", id)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "entity_id": str(self.entity_id),
+            "alias": self.alias,
+            "alias_norm": self.alias_norm,
+            "source": self.source,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
+
+Entity.aliases = relationship(
+    "EntityAlias",
+    back_populates="entity",
+    foreign_keys="EntityAlias.entity_id",
+    cascade="all, delete-orphan",
+)
+
+
+# Character trigrams of Entity.name_norm, one row per trigram and entity,
+# kept in step by database.trigrams. Not an entry: no row in ``entries``.
+# Rows are removed by primary key from the old name's trigrams, so there is
+# no foreign key (whose checks would need a second index on entity_id).
+entity_name_trigrams = Table(
+    "entity_name_trigrams",
+    Base.metadata,
+    Column("trigram", String, primary_key=True),
+    Column("entity_id", GUID(), primary_key=True),
+    sqlite_with_rowid=False,
+)
+
+
 class PageContent(BasicDataEntry):
     __tablename__ = "page_content"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     page_id: Mapped[uuid.UUID] = mapped_column(
         GUID(), ForeignKey("pages.id", ondelete="CASCADE"), nullable=False, unique=True, index=True
     )
 
     page_url: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
     html: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Digest of the body in the blob store when it was moved out of ``html``
+    html_digest: Mapped[Optional[str]] = mapped_column(String(71), nullable=True, index=True)
     text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    metadata_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    extracted_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    metadata_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    extracted_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     fetch_ts: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow)
 
     page: Mapped["Page"] = relationship(
         "Page", foreign_keys=[page_id], back_populates="content"
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "page_content",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("page_content", id)
+
+    def load_html(self) -> Optional[str]:
+        """The HTML body, read from the blob store when it is not inline."""
+        if self.html is not None or not self.html_digest:
+            return self.html
+        # Set on load by blob_store for sessions of a store with blobs
+        blobs = getattr(self, "_blob_store", None)
+        return blobs.get(self.html_digest) if blobs is not None else None
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": str(self.id),
             "page_id": str(self.page_id),
             "page_url": self.page_url,
-            "html": self.html,
+            "html": self.load_html(),
             "text": self.text,
             "metadata_json": self.metadata_json,
             "extracted_json": self.extracted_json,
@@ -259,22 +395,18 @@ Page.content = relationship(
 class Seed(BasicDataEntry):
     __tablename__ = "seeds"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     query: Mapped[str] = mapped_column(String)
     entity_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     source: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
-    __mapper_args__ = {"polymorphic_identity": "seed", "inherit_condition": id == BasicDataEntry.id}
+    __mapper_args__ = entry_mapper_args("seed", id)
 
 
 class Intelligence(BasicDataEntry):
     __tablename__ = "intelligence"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     entity_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         GUID(), ForeignKey("entities.id", ondelete="SET NULL"), nullable=True, index=True
     )
@@ -284,7 +416,7 @@ class Intelligence(BasicDataEntry):
         GUID(), ForeignKey("pages.id", ondelete="SET NULL"), nullable=True, index=True
     )
     confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    data: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     entity: Mapped["Entity"] = relationship(
         "Entity", foreign_keys=[entity_id], back_populates="intelligence"
@@ -297,10 +429,19 @@ class Intelligence(BasicDataEntry):
         Index('ix_intelligence_entity_page', 'entity_id', 'page_id'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "intelligence",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("intelligence", id)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "entity_id": str(self.entity_id) if self.entity_id else None,
+            "entity_name": self.entity_name,
+            "entity_type": self.entity_type,
+            "page_id": str(self.page_id) if self.page_id else None,
+            "confidence": self.confidence,
+            "data": self.data or {},
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
 
 
 Entity.intelligence = relationship(
@@ -318,9 +459,7 @@ Page.intelligence = relationship(
 class Fingerprint(BasicDataEntry):
     __tablename__ = "fingerprints"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     page_id: Mapped[uuid.UUID] = mapped_column(
         GUID(), ForeignKey("pages.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -332,16 +471,13 @@ class Fingerprint(BasicDataEntry):
     purpose: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     sample_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    metadata_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    metadata_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     page: Mapped["Page"] = relationship(
         "Page", foreign_keys=[page_id], back_populates="fingerprints"
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "fingerprint",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("fingerprint", id)
 
 
 Page.fingerprints = relationship(
@@ -352,48 +488,73 @@ Page.fingerprints = relationship(
 )
 
 
+class PageSimHash(BasicDataEntry):
+    """Locality-sensitive SimHash of a page's cleaned text.
+
+    The 64-bit fingerprint is stored as hex plus four indexed 16-bit bands so
+    near-duplicate candidates can be found with indexed equality lookups.
+    Pages detected as near-duplicates point at their canonical page.
+    """
+    __tablename__ = "page_simhashes"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    page_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(), ForeignKey("pages.id", ondelete="CASCADE"), nullable=False, unique=True, index=True
+    )
+    url: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    simhash: Mapped[str] = mapped_column(String(16), nullable=False)
+    band_0: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    band_1: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    band_2: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    band_3: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    canonical_page_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        GUID(), ForeignKey("pages.id", ondelete="SET NULL"), nullable=True, index=True
+    )
+    distance: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    __mapper_args__ = entry_mapper_args("page_simhash", id)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "page_id": str(self.page_id),
+            "url": self.url,
+            "simhash": self.simhash,
+            "canonical_page_id": str(self.canonical_page_id) if self.canonical_page_id else None,
+            "distance": self.distance,
+        }
+
+
 class Pattern(BasicDataEntry):
     __tablename__ = "patterns"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     entity_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     pattern: Mapped[str] = mapped_column(String, nullable=False)
     weight: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     source: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
-    __mapper_args__ = {
-        "polymorphic_identity": "pattern",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("pattern", id)
 
 
 class Domain(BasicDataEntry):
     __tablename__ = "domains"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     entity_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     domain: Mapped[str] = mapped_column(String, nullable=False)
     weight: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     is_official: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
     source: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
-    __mapper_args__ = {
-        "polymorphic_identity": "domain",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("domain", id)
 
 
 class Link(BasicDataEntry):
     """URL-to-URL link with optional Page relations."""
     __tablename__ = "links"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     from_url: Mapped[str] = mapped_column(String, nullable=False)
     to_url: Mapped[str] = mapped_column(String, nullable=False)
     from_page_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -415,19 +576,241 @@ class Link(BasicDataEntry):
     from_page: Mapped[Optional["Page"]] = relationship("Page", foreign_keys=[from_page_id])
     to_page: Mapped[Optional["Page"]] = relationship("Page", foreign_keys=[to_page_id])
 
-    __mapper_args__ = {
-        "polymorphic_identity": "link",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("link", id)
+
+
+class CrawlSession(BasicDataEntry):
+    """Checkpointed state of a resumable crawl.
+
+    Holds the counters the explorer keeps in memory (pages explored,
+    per-domain page counts, crawl stats) so that a restarted crawl can pick
+    up from its persisted frontier instead of starting again from seeds.
+    """
+    __tablename__ = "crawl_sessions"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    session_key: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default="running", index=True
+    )  # running, completed, interrupted
+    pages_explored: Mapped[int] = mapped_column(Integer, default=0)
+    domain_counts_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    stats_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    params_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    last_checkpoint_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    __mapper_args__ = entry_mapper_args("crawl_session", id)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "session_key": self.session_key,
+            "status": self.status,
+            "pages_explored": self.pages_explored or 0,
+            "domain_counts": self.domain_counts_json or {},
+            "stats": self.stats_json or {},
+            "params": self.params_json or {},
+            "last_checkpoint_at": (
+                self.last_checkpoint_at.isoformat() if self.last_checkpoint_at else None
+            ),
+        }
+
+
+class FrontierEntry(BasicDataEntry):
+    """Durable crawl frontier row.
+
+    One row per normalized URL per crawl session. ``state`` moves from
+    ``queued`` to ``leased`` (claimed by a worker until ``lease_expires_at``)
+    to ``done`` or ``skipped``. Expired leases are treated as queued again.
+    """
+    __tablename__ = "frontier_entries"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    session_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(), ForeignKey("crawl_sessions.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    url: Mapped[str] = mapped_column(String, nullable=False)
+    url_norm: Mapped[str] = mapped_column(String, nullable=False)
+    score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    depth: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    link_text: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    state: Mapped[str] = mapped_column(String(16), nullable=False, default="queued")
+    lease_owner: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("session_id", "url_norm", name="uq_frontier_session_url"),
+        Index("ix_frontier_session_state_score", "session_id", "state", "score"),
+    )
+
+    __mapper_args__ = entry_mapper_args("frontier_entry", id)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "url": self.url,
+            "url_norm": self.url_norm,
+            "score": self.score,
+            "depth": self.depth,
+            "link_text": self.link_text,
+            "state": self.state,
+        }
+
+
+class CrawlBudget(BasicDataEntry):
+    """Shared page budget counter for a crawl session.
+
+    Workers claim budget with a conditional increment (``used < limit``) so
+    per-domain and total page limits hold across processes and hosts.
+    """
+    __tablename__ = "crawl_budgets"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    session_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(), ForeignKey("crawl_sessions.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    budget_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    used: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("session_id", "budget_key", name="uq_crawl_budget_session_key"),
+    )
+
+    __mapper_args__ = entry_mapper_args("crawl_budget", id)
+
+
+class CrawlWorkerState(BasicDataEntry):
+    """Heartbeat and counters of one crawl worker within a session."""
+    __tablename__ = "crawl_workers"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    session_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(), ForeignKey("crawl_sessions.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    worker_id: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    hostname: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    pid: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="running")
+    stats_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    __mapper_args__ = entry_mapper_args("crawl_worker", id)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "hostname": self.hostname,
+            "pid": self.pid,
+            "status": self.status,
+            "stats": self.stats_json or {},
+            "heartbeat_at": self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+        }
+
+
+class SeenUrl(BasicDataEntry):
+    """Exact tier of a persisted visited-URL set.
+
+    ``url_hash`` is the signed 64-bit fingerprint of the canonical URL; rows
+    are only consulted when the scope's Bloom filter reports a hit.
+    """
+    __tablename__ = "seen_urls"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    scope: Mapped[str] = mapped_column(String(255), nullable=False)
+    url_hash: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    url: Mapped[str] = mapped_column(String, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("scope", "url_hash", name="uq_seen_url_scope_hash"),
+    )
+
+    __mapper_args__ = entry_mapper_args("seen_url", id)
+
+
+class UrlFilter(BasicDataEntry):
+    """Persisted Bloom filter bits for a visited-URL scope."""
+    __tablename__ = "url_filters"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    scope: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    num_bits: Mapped[int] = mapped_column(Integer, nullable=False)
+    num_hashes: Mapped[int] = mapped_column(Integer, nullable=False)
+    item_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    capacity: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    error_rate: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    bits: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    __mapper_args__ = entry_mapper_args("url_filter", id)
+
+
+class CrawlDomainStat(BasicDataEntry):
+    """Learned crawl statistics for one domain, carried across crawls.
+
+    Counters are decayed (halved every ``decay_days``) on each update so old
+    observations fade; ``intel_yield`` / ``total_crawls`` is the domain's
+    intel yield per fetched page.
+    """
+    __tablename__ = "crawl_domain_stats"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    domain: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    total_crawls: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    successful_crawls: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    intel_yield: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    avg_intel_quality: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    page_type_distribution_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    entity_type_distribution_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    first_seen: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    last_seen: Mapped[Optional[float]] = mapped_column(Float, nullable=True, index=True)
+
+    __mapper_args__ = entry_mapper_args("crawl_domain_stat", id)
+
+
+class CrawlPageTypeStat(BasicDataEntry):
+    """Learned extraction outcome for an (entity type, page type) pair."""
+    __tablename__ = "crawl_page_type_stats"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    pattern_key: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    entity_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    page_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    total_count: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    success_count: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    avg_quality: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    confidence: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    extraction_hints_json: Mapped[Optional[list]] = mapped_column(JSONDocument, nullable=True)
+    last_seen: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    __mapper_args__ = entry_mapper_args("crawl_page_type_stat", id)
+
+
+class CrawlStageTiming(BasicDataEntry):
+    """Per-stage pipeline timing of one crawl (p50 / p95 over its pages)."""
+    __tablename__ = "crawl_stage_timings"
+
+    id: Mapped[uuid.UUID] = entry_id_column()
+    crawl_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    entity_name: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    stage: Mapped[str] = mapped_column(String(100), nullable=False)
+    pages: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    p50_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    p95_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    max_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    counts_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("crawl_id", "stage", name="uq_crawl_stage_timing"),
+    )
+
+    __mapper_args__ = entry_mapper_args("crawl_stage_timing", id)
 
 
 class MediaItem(BasicDataEntry):
     """Base class for media items (images, videos, audio)."""
     __tablename__ = "media_items"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     url: Mapped[str] = mapped_column(String, nullable=False, index=True)
     media_type: Mapped[str] = mapped_column(String, nullable=False, index=True)  # image, video, audio
     source_page_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -447,7 +830,7 @@ class MediaItem(BasicDataEntry):
     width: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     height: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     duration: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # for video/audio
-    metadata_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    metadata_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     
     # Processing status
     processed: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -457,10 +840,7 @@ class MediaItem(BasicDataEntry):
     source_page: Mapped[Optional["Page"]] = relationship("Page", foreign_keys=[source_page_id])
     entity: Mapped[Optional["Entity"]] = relationship("Entity", foreign_keys=[entity_id])
 
-    __mapper_args__ = {
-        "polymorphic_identity": "media_item",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("media_item", id)
 
 
 class MediaContent(BasicDataEntry):
@@ -471,9 +851,7 @@ class MediaContent(BasicDataEntry):
     """
     __tablename__ = "media_content"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     media_url: Mapped[str] = mapped_column(String, index=True, nullable=False)
     media_type: Mapped[str] = mapped_column(String, nullable=False)  # image, video, audio, pdf
     extracted_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -484,12 +862,12 @@ class MediaContent(BasicDataEntry):
     )
     
     # Entity mentions - list of entity IDs found in media content
-    entities_mentioned: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    entities_mentioned: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     
     # Processing details
     processing_method: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    metadata_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    metadata_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     # Relationships
     page: Mapped[Optional["Page"]] = relationship(
@@ -501,10 +879,7 @@ class MediaContent(BasicDataEntry):
         Index('ix_media_content_type', 'media_type'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "media_content",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("media_content", id)
 
 
 # Add back-reference to Page
@@ -528,9 +903,7 @@ class DynamicFieldDefinition(BasicDataEntry):
     """
     __tablename__ = "dynamic_field_definitions"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     # Field identification
     field_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     display_name: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
@@ -546,10 +919,10 @@ class DynamicFieldDefinition(BasicDataEntry):
     success_rate: Mapped[float] = mapped_column(Float, default=0.0)  # Extraction success rate
     
     # Schema definition for complex fields
-    schema_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    schema_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     
     # Example values and validation
-    example_values: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    example_values: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     validation_pattern: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     
     # Parent field for hierarchical structures (e.g., address.city)
@@ -582,10 +955,7 @@ class DynamicFieldDefinition(BasicDataEntry):
         Index('ix_dynamic_field_entity_importance', 'entity_type', 'importance'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "dynamic_field_definition",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("dynamic_field_definition", id)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
@@ -625,9 +995,7 @@ class EntityFieldValue(BasicDataEntry):
     """
     __tablename__ = "entity_field_values"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     
     # Entity association
     entity_id: Mapped[uuid.UUID] = mapped_column(
@@ -645,7 +1013,7 @@ class EntityFieldValue(BasicDataEntry):
     # Value storage - supports different types
     value_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     value_number: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    value_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    value_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     value_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Quality metrics
@@ -680,10 +1048,7 @@ class EntityFieldValue(BasicDataEntry):
         Index('ix_entity_field_confidence', 'entity_id', 'confidence'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "entity_field_value",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("entity_field_value", id)
 
     def get_value(self) -> Any:
         """Get the value in its appropriate type."""
@@ -721,9 +1086,7 @@ class FieldDiscoveryLog(BasicDataEntry):
     """
     __tablename__ = "field_discovery_logs"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     
     # What was discovered
     field_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
@@ -751,17 +1114,14 @@ class FieldDiscoveryLog(BasicDataEntry):
     raw_response: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Metadata
-    metadata_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    metadata_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     __table_args__ = (
         Index('ix_discovery_log_field_entity', 'field_name', 'entity_type'),
         Index('ix_discovery_log_success', 'was_successful', 'discovery_method'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "field_discovery_log",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("field_discovery_log", id)
 
 
 # Add back-reference to Entity for dynamic field values
@@ -781,9 +1141,7 @@ class Task(BasicDataEntry):
     """
     __tablename__ = "tasks"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     task_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     status: Mapped[str] = mapped_column(
         String(20), nullable=False, default="pending", index=True
@@ -791,10 +1149,10 @@ class Task(BasicDataEntry):
     priority: Mapped[int] = mapped_column(Integer, default=0)  # higher = more urgent
     
     # Task configuration
-    params_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    params_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     
     # Results
-    result_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    result_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     progress: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # 0.0 - 1.0
     progress_message: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
@@ -808,10 +1166,7 @@ class Task(BasicDataEntry):
         Index('ix_task_type_status', 'task_type', 'status'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "task",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("task", id)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
@@ -840,14 +1195,12 @@ class ChatPlan(BasicDataEntry):
     """
     __tablename__ = "chat_plans"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     session_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
     original_prompt: Mapped[str] = mapped_column(Text, nullable=False)
     generalized_task: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    plan_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    memory_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    plan_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    memory_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     status: Mapped[str] = mapped_column(
         String(20), nullable=False, default="active", index=True
     )  # active, completed, failed, exhausted
@@ -856,7 +1209,7 @@ class ChatPlan(BasicDataEntry):
     cycle_number: Mapped[int] = mapped_column(Integer, default=1)
     total_steps_executed: Mapped[int] = mapped_column(Integer, default=0)
     final_answer: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    sources_json: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    sources_json: Mapped[Optional[list]] = mapped_column(JSONDocument, nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     __table_args__ = (
@@ -864,10 +1217,7 @@ class ChatPlan(BasicDataEntry):
         Index('ix_chat_plan_status', 'status'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "chat_plan",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("chat_plan", id)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -893,16 +1243,14 @@ class ChatPlanStep(BasicDataEntry):
     """A single step within a ChatPlan execution."""
     __tablename__ = "chat_plan_steps"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     plan_id: Mapped[uuid.UUID] = mapped_column(
         GUID(), ForeignKey("chat_plans.id", ondelete="CASCADE"), nullable=False, index=True
     )
     step_index: Mapped[int] = mapped_column(Integer, nullable=False)
     tool_name: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    tool_input: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    tool_output: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    tool_input: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    tool_output: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     status: Mapped[str] = mapped_column(
         String(20), nullable=False, default="pending"
     )  # pending, running, completed, failed, skipped
@@ -919,10 +1267,7 @@ class ChatPlanStep(BasicDataEntry):
         Index('ix_chat_plan_step_plan', 'plan_id', 'step_index'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "chat_plan_step",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("chat_plan_step", id)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -958,29 +1303,24 @@ class ChatMemoryEntry(BasicDataEntry):
     """
     __tablename__ = "chat_memory_entries"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     plan_id: Mapped[uuid.UUID] = mapped_column(
         GUID(), ForeignKey("chat_plans.id", ondelete="CASCADE"), nullable=False, index=True
     )
     key: Mapped[str] = mapped_column(String(200), nullable=False)
-    value_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    value_json: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     step_index: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     tool_name: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     plan: Mapped["ChatPlan"] = relationship(
-        "ChatPlan", foreign_keys=[plan_id],
+        "ChatPlan", foreign_keys=[plan_id], overlaps="memory_entries",
     )
 
     __table_args__ = (
         Index('ix_chat_memory_plan_key', 'plan_id', 'key'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "chat_memory_entry",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("chat_memory_entry", id)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -1011,11 +1351,9 @@ class StepPattern(BasicDataEntry):
     """
     __tablename__ = "step_patterns"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     generalized_task: Mapped[str] = mapped_column(Text, nullable=False)
-    tool_sequence: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    tool_sequence: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
     reward_score: Mapped[float] = mapped_column(Float, default=1.0)
     times_used: Mapped[int] = mapped_column(Integer, default=1)
     times_succeeded: Mapped[int] = mapped_column(Integer, default=1)
@@ -1025,10 +1363,7 @@ class StepPattern(BasicDataEntry):
         Index('ix_step_pattern_reward', 'reward_score'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "step_pattern",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("step_pattern", id)
 
 
 # ---------------------------------------------------------------------------
@@ -1044,21 +1379,16 @@ class StructureKind(BasicDataEntry):
     """
     __tablename__ = "structure_kinds"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True, index=True)
     color: Mapped[str] = mapped_column(String(30), nullable=False, default="#94a3b8")
     priority: Mapped[int] = mapped_column(Integer, nullable=False, default=40)
     parent_kind: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    aliases_json: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    aliases_json: Mapped[Optional[list]] = mapped_column(JSONDocument, nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     is_builtin: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    __mapper_args__ = {
-        "polymorphic_identity": "structure_kind",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("structure_kind", id)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -1081,19 +1411,14 @@ class StructureRelation(BasicDataEntry):
     """
     __tablename__ = "structure_relations"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True, index=True)
     color: Mapped[str] = mapped_column(String(60), nullable=False, default="rgba(148,163,184,0.20)")
     directed: Mapped[bool] = mapped_column(Boolean, default=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     is_builtin: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    __mapper_args__ = {
-        "polymorphic_identity": "structure_relation",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("structure_relation", id)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -1114,17 +1439,12 @@ class UserSetting(BasicDataEntry):
     """
     __tablename__ = "user_settings"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     key: Mapped[str] = mapped_column(String(200), nullable=False, unique=True, index=True)
-    value_json: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    value_json: Mapped[Optional[Any]] = mapped_column(JSONDocument, nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    __mapper_args__ = {
-        "polymorphic_identity": "user_setting",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("user_setting", id)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -1144,9 +1464,7 @@ class SemanticSnippet(BasicDataEntry):
     """
     __tablename__ = "semantic_snippets"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        GUID(), ForeignKey("entries.id", ondelete="CASCADE"), primary_key=True
-    )
+    id: Mapped[uuid.UUID] = entry_id_column()
     text: Mapped[str] = mapped_column(Text, nullable=False)
     chunk_index: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     prev_context: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -1159,16 +1477,13 @@ class SemanticSnippet(BasicDataEntry):
     entity_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         GUID(), ForeignKey("entities.id", ondelete="SET NULL"), nullable=True, index=True
     )
-    entity_refs_json: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    entity_refs_json: Mapped[Optional[list]] = mapped_column(JSONDocument, nullable=True)
 
     __table_args__ = (
         Index('ix_snippet_page_entity', 'page_id', 'entity_id'),
     )
 
-    __mapper_args__ = {
-        "polymorphic_identity": "semantic_snippet",
-        "inherit_condition": id == BasicDataEntry.id,
-    }
+    __mapper_args__ = entry_mapper_args("semantic_snippet", id)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -0,0 +1,191 @@
+"""
+Normalized entity names and aliases.
+
+Entity lookups used to filter on ``lower(name) = x`` or ``lower(name) LIKE
+'%x%'``; neither can use an index, so each lookup scanned ``entities``, once
+per extracted entity on every page. ``Entity.name_norm`` now holds
+``normalize_entity_name(name)`` (lowercased, legal suffix and punctuation
+stripped: "Acme Corp." -> "acme"), indexed with ``kind`` and set whenever a
+name is assigned. ``entity_aliases`` maps other names of an entity to it
+under the same key.
+
+- ``name_match``: exact normalized match on the name or an alias
+- ``name_prefix_match``: normalized prefix match (index range scan)
+- ``name_word_match``: a word of the normalized name starts with the query
+  ("nadella" finds "Satya Nadella"), among the trigram candidates of the
+  query (``trigrams.py``), or ``name_prefix_match``
+- ``ensure_name_columns``: adds and backfills ``name_norm`` in databases
+  created before it existed
+"""
+
+import logging
+import re
+import uuid
+from typing import Iterable, List, Optional
+
+from sqlalchemy import and_, bindparam, event, inspect, or_, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .models import Entity, EntityAlias
+
+logger = logging.getLogger(__name__)
+
+# Common company suffixes removed from the end of names
+LEGAL_SUFFIXES = (
+    "corporation",
+    "corp",
+    "inc",
+    "incorporated",
+    "llc",
+    "ltd",
+    "limited",
+    "co",
+    "company",
+    "plc",
+    "ag",
+    "gmbh",
+    "sa",
+)
+# Sorts after every other character, closing the range of a prefix scan
+_MAX_CHAR = "\U0010ffff"
+# Trigram candidates checked by name_word_match
+WORD_MATCH_CANDIDATES = 200
+
+
+def normalize_entity_name(name: Optional[str]) -> str:
+    """Lookup key of an entity name: lowercased, legal suffix, punctuation and extra spaces removed."""
+    if not name:
+        return ""
+    normalized = name.lower().strip()
+    for suffix in LEGAL_SUFFIXES:
+        if normalized.endswith(f" {suffix}"):
+            normalized = normalized[: -len(suffix) - 1]
+        if normalized.endswith(f" {suffix}."):
+            normalized = normalized[: -len(suffix) - 2]
+    normalized = re.sub(r"[^\w\s]", "", normalized)
+    return re.sub(r"\s+", " ", normalized).strip()
+
+
+@event.listens_for(Entity.name, "set")
+def _set_name_norm(target: Entity, value, oldvalue, initiator) -> None:
+    """Keep ``name_norm`` in step with every assignment of ``name``."""
+    target.name_norm = normalize_entity_name(value)
+
+
+def _norms(names: Iterable[str]) -> List[str]:
+    return sorted({n for n in (normalize_entity_name(name) for name in names) if n})
+
+
+def name_match(names: Iterable[str]):
+    """Condition on ``Entity``: normalized name or an alias equal to that of one of *names*."""
+    norms = _norms(names)
+    if not norms:
+        return Entity.id.is_(None)  # matches nothing
+    aliased_ids = select(EntityAlias.entity_id).where(EntityAlias.alias_norm.in_(norms))
+    return or_(Entity.name_norm.in_(norms), Entity.id.in_(aliased_ids))
+
+
+def name_prefix_match(prefix: str):
+    """Condition on ``Entity``: normalized name or an alias starting with that of *prefix*."""
+    norm = normalize_entity_name(prefix)
+    if not norm:
+        return Entity.id.is_(None)
+    # A range rather than LIKE 'x%', which SQLite only serves from an index
+    # for case-insensitively collated columns
+    aliased_ids = select(EntityAlias.entity_id).where(
+        EntityAlias.alias_norm >= norm, EntityAlias.alias_norm < norm + _MAX_CHAR
+    )
+    return or_(
+        and_(Entity.name_norm >= norm, Entity.name_norm < norm + _MAX_CHAR),
+        Entity.id.in_(aliased_ids),
+    )
+
+
+def name_word_match(session: Session, query: str, k: int = WORD_MATCH_CANDIDATES):
+    """
+    Condition on ``Entity``: a word of the normalized name starts with the
+    normalized *query*, or the name or an alias does (``name_prefix_match``).
+    Names are only checked word by word among the *k* entities sharing the
+    most trigrams with *query*, so no ``LIKE '%x%'`` scans the table.
+    """
+    from .trigrams import trigram_candidates  # trigrams imports this module
+
+    norm = normalize_entity_name(query)
+    if not norm:
+        return Entity.id.is_(None)
+    word_prefix = or_(
+        Entity.name_norm.startswith(norm, autoescape=True),
+        Entity.name_norm.contains(f" {norm}", autoescape=True),
+    )
+    candidates = trigram_candidates(session, norm, k)
+    return or_(name_prefix_match(query), and_(Entity.id.in_(candidates), word_prefix))
+
+
+def add_aliases(
+    session: Session, entity_id, aliases: Iterable[str], source: Optional[str] = None
+) -> int:
+    """
+    Record *aliases* of entity *entity_id* in *session* (not committed),
+    skipping its own name and aliases it already has. Returns the number added.
+    """
+    entity = session.get(Entity, entity_id)
+    if entity is None:
+        return 0
+    known = {entity.name_norm} | set(
+        session.execute(
+            select(EntityAlias.alias_norm).where(EntityAlias.entity_id == entity.id)
+        ).scalars()
+    )
+    added = 0
+    for alias in aliases:
+        norm = normalize_entity_name(alias)
+        if not norm or norm in known:
+            continue
+        known.add(norm)
+        session.add(
+            EntityAlias(
+                id=uuid.uuid4(),
+                entity_id=entity.id,
+                alias=alias.strip(),
+                alias_norm=norm,
+                source=source,
+            )
+        )
+        added += 1
+    return added
+
+
+def ensure_name_columns(engine: Engine, batch_size: int = 1000) -> int:
+    """
+    Add ``entities.name_norm`` and its index to databases created before
+    they existed, and fill it in for rows without one. Returns the number of
+    rows filled in.
+    """
+    table = Entity.__table__
+    columns = {c["name"] for c in inspect(engine).get_columns(table.name)}
+    if "name_norm" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN name_norm VARCHAR"))
+            conn.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS ix_entity_name_norm_kind ON {table.name} (name_norm, kind)"
+                )
+            )
+    pending = select(table.c.id, table.c.name).where(table.c.name_norm.is_(None)).limit(batch_size)
+    filled = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(pending).all()
+            if not rows:
+                break
+            conn.execute(
+                update(table)
+                .where(table.c.id == bindparam("row_id"))
+                .values(name_norm=bindparam("norm")),
+                [{"row_id": r.id, "norm": normalize_entity_name(r.name)} for r in rows],
+            )
+        filled += len(rows)
+    if filled:
+        logger.info(f"Filled in name_norm of {filled} entities")
+    return filled
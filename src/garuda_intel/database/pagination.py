@@ -0,0 +1,183 @@
+"""
+Keyset (cursor) pagination over entities, pages, intelligence and relationships.
+
+List APIs used to load fixed slices (20,000 entities, 3,000 pages, ...),
+silently truncating large databases, and ``OFFSET`` paging rescans every
+skipped row. Here a page continues after the sort key of the last row of
+the previous one:
+
+- ``created``: ``(created_at, id)``, newest first, every listing
+- ``score``: ``(score, id)``, highest first, pages (``score``) and
+  intelligence (``confidence``)
+
+NULL keys sort last. The cursor is the last row's key as URL-safe base64
+JSON, opaque to clients. ``ensure_listing_indexes`` creates the indexes
+these orders read, so a page costs one index range scan however deep it
+is, and rows inserted meanwhile neither shift nor repeat later pages.
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Column, DateTime, select, text, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .models import Entity, Intelligence, Page, Relationship
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+LISTINGS = {
+    "entities": Entity,
+    "pages": Page,
+    "intelligence": Intelligence,
+    "relationships": Relationship,
+}
+ORDERS = ("created", "score")
+# Column behind order="score", for the listings that have one
+SCORE_COLUMNS = {"pages": "score", "intelligence": "confidence"}
+# Accepted filters: exact match, or case-insensitive substring for "<column>_like"
+LISTING_FILTERS = {
+    "entities": ("kind", "name_like"),
+    "pages": ("entity_type", "page_type", "domain_key"),
+    "intelligence": ("entity_id", "page_id", "entity_type", "entity_name_like"),
+    "relationships": ("relation_type", "source_id", "target_id", "source_type", "target_type"),
+}
+
+
+def listing_model(listing: str):
+    try:
+        return LISTINGS[listing]
+    except KeyError:
+        raise ValueError(
+            f"Unknown listing {listing!r}; expected one of {sorted(LISTINGS)}"
+        ) from None
+
+
+def listing_keys(listing: str, order: str = "created") -> List[Column]:
+    """``[key, id]`` columns of *listing* in *order* (both descending, NULL keys last)."""
+    model = listing_model(listing)
+    if order == "created":
+        attribute = model.created_at
+    elif order == "score" and listing in SCORE_COLUMNS:
+        attribute = getattr(model, SCORE_COLUMNS[listing])
+    else:
+        raise ValueError(f"{listing} cannot be ordered by {order!r}")
+    column = attribute.property.columns[0]
+    # The id of the same table, so one (key, id) index serves the order
+    # ("entries" for created_at in the joined layout)
+    return [column, column.table.c.id]
+
+
+def listing_query(listing: str, filters: Optional[Dict[str, Any]] = None):
+    """``select()`` of *listing* with *filters* (see ``LISTING_FILTERS``; empty values ignored)."""
+    model = listing_model(listing)
+    stmt = select(model)
+    for name, value in (filters or {}).items():
+        if value is None or value == "":
+            continue
+        if name not in LISTING_FILTERS[listing]:
+            raise ValueError(f"{listing} cannot be filtered by {name!r}")
+        if name.endswith("_like"):
+            stmt = stmt.where(getattr(model, name[:-5]).ilike(f"%{value}%"))
+        else:
+            stmt = stmt.where(getattr(model, name) == value)
+    return stmt
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [
+        v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, uuid.UUID) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[Column]) -> List[Any]:
+    """Key values in *cursor*; ValueError if it is not a cursor of *keys*."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("wrong number of keys")
+        return [
+            datetime.fromisoformat(v) if v is not None and isinstance(k.type, DateTime) else v
+            for k, v in zip(keys, values)
+        ]
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor {cursor!r}") from e
+
+
+def keyset_page(
+    session: Session,
+    stmt,
+    keys: Sequence[Column],
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[list, Optional[str]]:
+    """
+    Up to *limit* rows of ORM ``select()`` *stmt* after *cursor* in
+    ``(key, id)`` order (*keys*, see ``listing_keys``), and the cursor of
+    the next page (None after the last page).
+    """
+    key, id_column = keys
+
+    def fetch(query, n):
+        query = query.order_by(key.desc().nullslast(), id_column.desc()).limit(n)
+        return list(session.execute(query).scalars().all())
+
+    if not cursor:
+        rows = fetch(stmt, limit + 1)
+    else:
+        value, last_id = decode_cursor(cursor, keys)
+        if value is None:
+            rows = fetch(stmt.where(key.is_(None), id_column < last_id), limit + 1)
+        else:
+            # Row-value comparison: an index range scan, where an OR of the
+            # per-column conditions would walk the index from the start
+            rows = fetch(stmt.where(tuple_(key, id_column) < tuple_(value, last_id)), limit + 1)
+            if len(rows) <= limit:
+                # Rows without a key sort last and never compare below the cursor
+                rows += fetch(stmt.where(key.is_(None)), limit + 1 - len(rows))
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor([getattr(rows[-1], k.key) for k in keys])
+
+
+def keyset_iter(
+    session: Session, stmt, keys: Sequence[Column], batch_size: int = 1000
+) -> Iterator[Any]:
+    """Every row of *stmt* in *keys* order, fetched *batch_size* rows at a time by ``keyset_page``."""
+    cursor = None
+    while True:
+        rows, cursor = keyset_page(session, stmt, keys, cursor, batch_size)
+        yield from rows
+        if cursor is None:
+            return
+
+
+def ensure_listing_indexes(engine: Engine) -> None:
+    """Create the indexes of the ``created`` and ``score`` orders if missing."""
+    if engine.dialect.name not in ("sqlite", "postgresql"):
+        return
+    # SQLite reads an ascending index backwards for DESC (NULLs last);
+    # PostgreSQL needs the index in the exact ORDER BY direction
+    direction = " DESC NULLS LAST" if engine.dialect.name == "postgresql" else ""
+    indexes = {}
+    for listing in LISTINGS:
+        orders = ("created", "score") if listing in SCORE_COLUMNS else ("created",)
+        for order in orders:
+            column = listing_keys(listing, order)[0]
+            name = f"ix_{column.table.name}_{column.name}_id"
+            indexes[name] = (
+                f"CREATE INDEX IF NOT EXISTS {name} ON {column.table.name} "
+                f"({column.name}{direction}, id{' DESC' if direction else ''})"
+            )
+    with engine.begin() as conn:
+        for ddl in indexes.values():
+            conn.execute(text(ddl))
@@ -0,0 +1,147 @@
+"""
+PostgreSQL search indexes for ``SQLAlchemyStore``.
+
+On PostgreSQL the store's keyword and fuzzy-name lookups use server-side
+indexes instead of ``ILIKE`` scans:
+
+- ``pg_trgm`` GIN index on ``entities.name`` for ``ILIKE '%name%'`` and
+  trigram-similarity (``%``) lookups
+- GIN indexes on ``to_tsvector()`` of page text and snippet text, and of
+  intelligence entity names plus the string values of the JSONB ``data``
+
+The indexes are expression indexes, so no column is added; queries must
+use the same expressions (``PAGE_TSV``, ``SNIPPET_TSV``, ``INTEL_TSV``)
+for the planner to pick them. The ``simple`` text-search configuration
+matches the SQLite FTS5 tokenizer: lower-cased words, no stemming, which
+suits the mixed-language crawl content.
+"""
+
+import logging
+import re
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, func, literal_column, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import DBAPIError
+
+from .fts import HIGHLIGHT_CLOSE, HIGHLIGHT_OPEN
+
+logger = logging.getLogger(__name__)
+
+PG_TS_CONFIG = "simple"
+# ts_headline() options; matched terms are marked like the SQLite highlights
+PG_HEADLINE_OPTIONS = f'StartSel="{HIGHLIGHT_OPEN}", StopSel="{HIGHLIGHT_CLOSE}", MaxWords=35, MinWords=15, MaxFragments=1'
+
+
+def _tsv(expr: str) -> str:
+    return f"to_tsvector('{PG_TS_CONFIG}'::regconfig, {expr})"
+
+
+def _text_tsv(column: str) -> str:
+    return _tsv(f"coalesce({column}, ''::text)")
+
+
+def _intel_tsv(prefix: str = "") -> str:
+    name = _tsv(f"coalesce({prefix}entity_name, '')")
+    return (
+        f"({name} || "
+        f"jsonb_to_tsvector('{PG_TS_CONFIG}'::regconfig, coalesce({prefix}data, '{{}}'::jsonb), "
+        f"'[\"string\"]'::jsonb))"
+    )
+
+
+# Query-side expressions (table-qualified); the index DDL below uses the
+# same expressions on bare columns
+PAGE_TSV = _text_tsv("page_content.text")
+SNIPPET_TSV = _text_tsv("semantic_snippets.text")
+INTEL_TSV = _intel_tsv("intelligence.")
+
+INTEL_DOCUMENT = (
+    "coalesce(intelligence.entity_name, '') || ' ' || coalesce(intelligence.data::text, '')"
+)
+
+PG_TRIGRAM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_entities_name_trgm ON entities USING gin (name gin_trgm_ops)",
+]
+PG_TSVECTOR_DDL = [
+    f"CREATE INDEX IF NOT EXISTS ix_page_content_text_tsv ON page_content USING gin ({_text_tsv('text')})",
+    f"CREATE INDEX IF NOT EXISTS ix_semantic_snippets_text_tsv ON semantic_snippets "
+    f"USING gin ({_text_tsv('text')})",
+    f"CREATE INDEX IF NOT EXISTS ix_intelligence_data_tsv ON intelligence USING gin ({_intel_tsv()})",
+]
+
+
+def is_postgres(engine: Engine) -> bool:
+    return engine.dialect.name == "postgresql"
+
+
+def _apply(engine: Engine, statements, feature: str) -> bool:
+    try:
+        with engine.begin() as conn:
+            for stmt in statements:
+                conn.execute(text(stmt))
+        return True
+    except DBAPIError as e:
+        logger.warning(f"PostgreSQL {feature} indexes unavailable, falling back to ILIKE: {e}")
+        return False
+
+
+def ensure_pg_search(engine: Engine) -> Dict[str, bool]:
+    """
+    Create the trigram and tsvector indexes if missing.
+
+    Returns ``{"trigram": bool, "tsvector": bool}`` for what is usable
+    (``pg_trgm`` needs a role allowed to create the extension, or an
+    administrator to create it once); ``{}`` for other backends.
+    """
+    if not is_postgres(engine):
+        return {}
+    return {
+        "trigram": _apply(engine, PG_TRIGRAM_DDL, "trigram"),
+        "tsvector": _apply(engine, PG_TSVECTOR_DDL, "tsvector"),
+    }
+
+
+def pg_tsquery(keyword: str) -> Optional[str]:
+    """
+    ``to_tsquery`` text for a user keyword, or None if it has no terms.
+
+    Same semantics as ``fts.fts_match_query``: the words as a phrase, the
+    last one as a prefix.
+    """
+    tokens = [t.lower() for t in re.findall(r"\w+", keyword or "")]
+    if not tokens:
+        return None
+    return " <-> ".join(tokens) + ":*"
+
+
+def pg_text_search(tsv: str, document: str):
+    """
+    ``(condition, rank, highlight)`` expressions matching ``:q`` (a
+    ``pg_tsquery``) against index expression *tsv*; ``highlight`` is a
+    ``ts_headline()`` excerpt of the SQL expression *document*.
+    """
+    config = literal_column(f"'{PG_TS_CONFIG}'::regconfig")
+    query = func.to_tsquery(config, bindparam("q"))
+    vector = literal_column(tsv)
+    return (
+        vector.op("@@")(query),
+        func.ts_rank_cd(vector, query).label("rank"),
+        func.ts_headline(config, literal_column(document), query, PG_HEADLINE_OPTIONS).label(
+            "highlight"
+        ),
+    )
+
+
+def strip_highlight(excerpt: Optional[str]) -> Optional[str]:
+    """Plain excerpt from a marked ``highlight`` one."""
+    if excerpt is None:
+        return None
+    return excerpt.replace(HIGHLIGHT_OPEN, "").replace(HIGHLIGHT_CLOSE, "")
+
+
+def schema_url(server_url: str, schema: str) -> str:
+    """*server_url* with ``search_path`` set to *schema* (then ``public``, for extensions)."""
+    url = make_url(server_url).update_query_dict({"options": f"-csearch_path={schema},public"})
+    return url.render_as_string(hide_password=False)
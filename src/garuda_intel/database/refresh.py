@@ -2,22 +2,29 @@
 Refresh runner: re-fetch known pages using stored fingerprints to detect deltas.
 """
 import logging
+import time
 import requests
 from bs4 import BeautifulSoup
-from typing import List
-from .persistence.store import PersistenceStore
-from .models.page_fingerprint import PageFingerprint
-from .extractor import ContentExtractor
+from typing import Optional
+from .store import PersistenceStore
+from ..extractor.engine import ContentExtractor
+from ..discover.fetch_archive import FetchArchive
 
 
 class RefreshRunner:
-    def __init__(self, store: PersistenceStore, use_selenium: bool = False, vector_store=None, llm_extractor=None):
+    def __init__(self, store: PersistenceStore, use_selenium: bool = False, vector_store=None, llm_extractor=None,
+                 fetch_archive: Optional[FetchArchive] = None, replay: bool = False):
+        if replay and fetch_archive is None:
+            raise ValueError("replay=True requires a fetch_archive")
         self.store = store
         self.use_selenium = use_selenium
         self.extractor = ContentExtractor()
         self.logger = logging.getLogger(__name__)
         self.vector_store = vector_store
         self.llm_extractor = llm_extractor
+        # Raw responses are archived; in replay they are served from it
+        self.fetch_archive = fetch_archive
+        self.replay = replay
 
     def run(self, batch: int = 50):
         """Run  a refresh cycle on pending pages.
@@ -32,7 +39,8 @@ class RefreshRunner:
             if not html:
                 continue
             soup = BeautifulSoup(html, "html.parser")
-            fingerprints = self.store.get_fingerprints(url)
+            get_fingerprints = getattr(self.store, "get_fingerprints", None)
+            fingerprints = get_fingerprints(url) if get_fingerprints else []
             if fingerprints:
                 # Focused extraction per stored selectors
                 snippets = []
@@ -77,8 +85,20 @@ class RefreshRunner:
                     self.logger.warning(f"Vector upsert failed during refresh for {url}: {e}")
 
     def _fetch(self, url: str) -> str:
+        if self.replay:
+            hit = self.fetch_archive.lookup(url)
+            return hit.text if hit is not None and hit.status == 200 else ""
         try:
+            started = time.monotonic()
             resp = requests.get(url, timeout=8, headers={"User-Agent": "Mozilla/5.0"})
+            if self.fetch_archive is not None:
+                try:
+                    self.fetch_archive.record(
+                        url, resp.status_code, dict(resp.headers), resp.content,
+                        time.monotonic() - started,
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Archiving {url} failed: {e}")
             if resp.status_code == 200:
                 return resp.text
         except Exception:
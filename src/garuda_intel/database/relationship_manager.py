@@ -18,7 +18,7 @@ from collections import defaultdict
 from sqlalchemy import select, func
 
 from .store import PersistenceStore
-from .models import Entity, Relationship, BasicDataEntry
+from .models import Entity, Relationship, entries_table
 from ..extractor.llm import LLMIntelExtractor
 
 
@@ -422,14 +422,14 @@ Only include relationships where confidence >= {min_confidence}.
                         continue
                     
                     # Check for orphaned relationships
-                    # Check against BasicDataEntry (entries table) to support all node types
+                    # Check against the entries table (or view) to support all node types
                     # (Entity, Page, Intelligence, Seed, etc.), not just Entity
                     source_exists = session.execute(
-                        select(BasicDataEntry.id).where(BasicDataEntry.id == rel.source_id)
+                        select(entries_table.c.id).where(entries_table.c.id == rel.source_id)
                     ).scalar_one_or_none()
                     
                     target_exists = session.execute(
-                        select(BasicDataEntry.id).where(BasicDataEntry.id == rel.target_id)
+                        select(entries_table.c.id).where(entries_table.c.id == rel.target_id)
                     ).scalar_one_or_none()
                     
                     if not source_exists or not target_exists:
@@ -523,8 +523,8 @@ Only include relationships where confidence >= {min_confidence}.
                     # Check if source_type is missing
                     if not rel.source_type:
                         source_entry = session.execute(
-                            select(BasicDataEntry.entry_type).where(
-                                BasicDataEntry.id == rel.source_id
+                            select(entries_table.c.entry_type).where(
+                                entries_table.c.id == rel.source_id
                             )
                         ).scalar_one_or_none()
                         
@@ -535,8 +535,8 @@ Only include relationships where confidence >= {min_confidence}.
                     # Check if target_type is missing
                     if not rel.target_type:
                         target_entry = session.execute(
-                            select(BasicDataEntry.entry_type).where(
-                                BasicDataEntry.id == rel.target_id
+                            select(entries_table.c.entry_type).where(
+                                entries_table.c.id == rel.target_id
                             )
                         ).scalar_one_or_none()
                         
@@ -1,7 +1,7 @@
 """Page and PageContent repository - handles all page-related database operations."""
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from sqlalchemy import select, func, or_
 from sqlalchemy.orm import sessionmaker, aliased
@@ -13,9 +13,24 @@ from ..helpers import uuid5_url, uuid4, as_dict
 class PageRepository:
     """Repository for Page and PageContent operations."""
     
-    def __init__(self, session_maker: sessionmaker):
+    def __init__(
+        self,
+        session_maker: sessionmaker,
+        read_session_maker: Optional[sessionmaker] = None,
+        blob_store=None,
+    ):
         self.Session = session_maker
+        # Listing and lookups go through a read-only pool when one exists
+        self.ReadSession = read_session_maker or session_maker
+        # Large HTML bodies go to this BlobStore when set (see database.blob_store)
+        self.blobs = blob_store
         self.logger = logging.getLogger(__name__)
+
+    def stash_html(self, html: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """``(html, html_digest)`` column values for a body: large ones go to the blob store."""
+        if self.blobs is None or not self.blobs.accepts(html):
+            return html, None
+        return None, self.blobs.put(html)
         
     def get_all_pages(
         self,
@@ -30,7 +45,7 @@ class PageRepository:
         q_norm = (q or "").strip().lower()
         pc = aliased(PageContent, flat=True)
         try:
-            with self.Session() as s:
+            with self.ReadSession() as s:
                 stmt = select(Page).outerjoin(pc, Page.id == pc.page_id)
 
                 conditions = []
@@ -71,7 +86,7 @@ class PageRepository:
 
     def get_page_by_url(self, url: str) -> Optional[Dict]:
         """Get page metadata by URL."""
-        with self.Session() as s:
+        with self.ReadSession() as s:
             p = s.execute(select(Page).where(Page.url == url)).scalar_one_or_none()
             if not p:
                 return None
@@ -79,14 +94,14 @@ class PageRepository:
 
     def get_page_content_by_url(self, url: str) -> Optional[Dict]:
         """Get page content (HTML, text, metadata) by URL."""
-        with self.Session() as s:
+        with self.ReadSession() as s:
             page_id = s.execute(select(Page.id).where(Page.url == url)).scalar_one_or_none()
             if not page_id:
                 return None
             pc = s.execute(select(PageContent).where(PageContent.page_id == page_id)).scalar_one_or_none()
             if pc:
                 return {
-                    "html": pc.html,
+                    "html": pc.load_html(),
                     "text": pc.text,
                     "metadata": as_dict(pc.metadata_json),
                     "extracted": as_dict(pc.extracted_json),
@@ -118,6 +133,8 @@ class PageRepository:
                 text_length=page.get("text_length"),
             )
             
+            html, html_digest = self.stash_html(page.get("html", ""))
+
             # Check if PageContent already exists for this page_id
             existing_pc = s.execute(
                 select(PageContent).where(PageContent.page_id == page_id)
@@ -125,7 +142,8 @@ class PageRepository:
             
             if existing_pc:
                 # Update existing PageContent
-                existing_pc.html = page.get("html", "")
+                existing_pc.html = html
+                existing_pc.html_digest = html_digest
                 existing_pc.text = page.get("text_content", "")
                 existing_pc.metadata_json = page.get("metadata", {}) or {}
                 existing_pc.extracted_json = page.get("extracted", {}) or {}
@@ -136,7 +154,8 @@ class PageRepository:
                 pc = PageContent(
                     id=uuid4(),
                     page_id=page_id,
-                    html=page.get("html", ""),
+                    html=html,
+                    html_digest=html_digest,
                     text=page.get("text_content", ""),
                     metadata_json=page.get("metadata", {}) or {},
                     extracted_json=page.get("extracted", {}) or {},
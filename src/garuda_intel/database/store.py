@@ -1,5 +1,5 @@
 import abc
-from typing import List, Dict, Optional, Any
+from typing import Callable, List, Dict, Optional, Any, Tuple
 from ..types.page.fingerprint import PageFingerprint
 
 
@@ -46,6 +46,197 @@ class PersistenceStore(abc.ABC):
     @abc.abstractmethod
     def has_visited(self, url: str) -> bool: ...
 
+    # -- Near-duplicate fingerprint helpers ---------------------------------
+
+    def save_page_simhash(
+        self,
+        page_id: str,
+        url: str,
+        simhash: str,
+        bands: List[int],
+        canonical_page_id: Optional[str] = None,
+        distance: Optional[int] = None,
+    ) -> None:
+        """Persist a page's SimHash fingerprint.
+
+        Default implementation is a no-op so that stores without fingerprint
+        support continue to work.
+        """
+        return None
+
+    def find_simhash_candidates(
+        self, bands: List[int], url: Optional[str] = None, limit: int = 200
+    ) -> List[Dict]:
+        """Return canonical fingerprints sharing at least one band with *bands*.
+
+        Rows that are themselves duplicates (``canonical_page_id`` set) and rows
+        for *url* are excluded before *limit* applies. Each dict carries
+        ``page_id``, ``url``, ``simhash`` (hex) and ``canonical_page_id``.
+        Default implementation returns no candidates.
+        """
+        return []
+
+    # -- Durable crawl frontier helpers ------------------------------------
+
+    def open_crawl_session(self, session_key: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """Load or create the crawl session identified by *session_key*.
+
+        Returns the session dict (``id``, ``status``, ``pages_explored``,
+        ``domain_counts``, ``stats``). Default implementation returns None,
+        meaning the store cannot persist crawl state.
+        """
+        return None
+
+    def save_crawl_checkpoint(
+        self,
+        session_id: str,
+        pages_explored: int,
+        domain_counts: Dict[str, int],
+        stats: Optional[Dict] = None,
+        status: str = "running",
+    ) -> None:
+        """Persist the explorer's in-memory counters for *session_id*."""
+        return None
+
+    def frontier_push_batch(self, session_id: str, entries: List[Dict]) -> int:
+        """Insert queued frontier rows (``url``, ``url_norm``, ``score``,
+        ``depth``, ``link_text``). Known URLs keep their state; queued ones
+        keep the higher score. Returns the number of new rows."""
+        return 0
+
+    def frontier_lease_batch(
+        self, session_id: str, limit: int, owner: str, lease_seconds: int = 600
+    ) -> List[Dict]:
+        """Claim up to *limit* queued (or lease-expired) rows, best score first."""
+        return []
+
+    def frontier_set_state(
+        self, session_id: str, url_norms: List[str], state: str, owner: Optional[str] = None
+    ) -> int:
+        """Move the given rows to *state* and clear their leases; with *owner*,
+        only rows still leased to it. Returns the number of rows updated."""
+        return 0
+
+    def frontier_renew_leases(
+        self, session_id: str, url_norms: List[str], owner: str, lease_seconds: int = 600
+    ) -> List[str]:
+        """Extend *owner*'s leases on the given rows; returns those it still holds."""
+        return list(url_norms)
+
+    def frontier_release_leases(self, session_id: str) -> int:
+        """Return every leased row of the session to ``queued``; returns the count."""
+        return 0
+
+    def frontier_urls_in_state(self, session_id: str, states: List[str]) -> List[str]:
+        """Normalized URLs of rows currently in any of *states*."""
+        return []
+
+    def frontier_count_in_state(
+        self, session_id: str, states: List[str], exclude: Optional[List[str]] = None
+    ) -> int:
+        """Number of rows in any of *states*, not counting the URLs in *exclude*."""
+        return 0
+
+    def frontier_counts(self, session_id: str) -> Dict[str, int]:
+        """Number of frontier rows per state."""
+        return {}
+
+    def claim_crawl_budget(self, session_id: str, key: str, limit: int) -> bool:
+        """Atomically take one unit of the *key* budget if ``used < limit``."""
+        return True
+
+    def release_crawl_budget(self, session_id: str, key: str) -> None:
+        """Give back one unit of the *key* budget."""
+        return None
+
+    def get_crawl_budgets(self, session_id: str) -> Dict[str, int]:
+        """Used units per budget key."""
+        return {}
+
+    def save_crawl_worker(
+        self,
+        session_id: str,
+        worker_id: str,
+        status: str,
+        stats: Dict,
+        hostname: Optional[str] = None,
+        pid: Optional[int] = None,
+    ) -> None:
+        """Upsert a worker heartbeat row with its counters."""
+        return None
+
+    def get_crawl_workers(self, session_id: str) -> List[Dict]:
+        """Heartbeat rows of all workers of *session_id*."""
+        return []
+
+    # -- Visited-URL set helpers -------------------------------------------
+
+    def save_seen_urls(self, scope: str, entries: List[Tuple[int, str]]) -> bool:
+        """Persist ``(url_hash, canonical_url)`` pairs for *scope*.
+
+        Returns True when persisted. The default returns False so callers
+        keep their exact in-memory tier.
+        """
+        return False
+
+    def seen_urls_exist(self, scope: str, url_hashes: List[int]) -> List[int]:
+        """Subset of *url_hashes* present in *scope*."""
+        return []
+
+    def save_url_filter(self, scope: str, state: Dict) -> None:
+        """Upsert the Bloom filter state (``num_bits``, ``num_hashes``,
+        ``item_count``, ``capacity``, ``error_rate``, ``bits``) for *scope*."""
+        return None
+
+    def load_url_filter(self, scope: str) -> Optional[Dict]:
+        """Bloom filter state saved for *scope*, or None."""
+        return None
+
+    # -- Crawl learning ----------------------------------------------------
+
+    def load_crawl_learning(self) -> Dict[str, List[Dict]]:
+        """All persisted learner rows: ``{"domains": [...], "page_types": [...]}``."""
+        return {"domains": [], "page_types": []}
+
+    def save_crawl_learning(
+        self,
+        domains: List[Dict],
+        page_types: List[Dict],
+        merge: Optional[Callable[[str, Optional[Dict], Dict], Dict]] = None,
+    ) -> bool:
+        """Upsert learner rows keyed by ``domain`` / ``pattern_key``.
+
+        With *merge*, each given row is a delta: ``merge(kind, stored, delta)``
+        (``kind`` is ``"domain"`` or ``"page_type"``) runs inside the write
+        transaction against the locked stored row, or None, and returns the
+        row to write. Returns True when persisted; the default keeps learning
+        in memory.
+        """
+        return False
+
+    # -- Pipeline timing ---------------------------------------------------
+
+    def save_page_timing(self, page_id: str, timing: Dict) -> None:
+        """Attach a page's stage timing to its stored metadata (optional)."""
+        return None
+
+    def save_stage_timings(
+        self,
+        crawl_id: str,
+        stages: Dict[str, Dict],
+        entity_name: Optional[str] = None,
+        keep_crawls: int = 50,
+    ) -> bool:
+        """Store one crawl's per-stage summary, keeping the latest *keep_crawls* crawls.
+
+        Returns True when persisted; the default does nothing.
+        """
+        return False
+
+    def get_stage_timings(self, crawl_id: Optional[str] = None, limit: int = 5) -> List[Dict]:
+        """Stage summaries of *crawl_id* or of the latest *limit* crawls, newest first."""
+        return []
+
     # -- Semantic snippet helpers ------------------------------------------
 
     def search_snippets(self, keyword: str, limit: int = 20) -> List[Dict]:
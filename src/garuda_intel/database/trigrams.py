@@ -0,0 +1,453 @@
+"""
+Character-trigram candidate index over normalized entity names.
+
+Fuzzy entity lookups used to load every entity of the compatible kinds (or
+run a ``LIKE '%x%'`` scan) and score each one in Python. Here each word of
+``Entity.name_norm`` is padded as ``"  word "`` and cut into trigrams
+(``"acme"`` -> ``"  a", " ac", "acm", "cme", "me "``, as pg_trgm does), and a
+lookup ranks entities by how many trigrams they share with the query, so only
+the top K reach the caller's similarity function:
+
+- ``entity_name_trigrams``: SQL side table, one row per trigram and entity,
+  written on every ORM flush that adds, renames or deletes an entity and
+  backfilled by ``ensure_trigram_index`` when the table is created (not on
+  every open), after ``migrate_to_flat`` and by ``garuda-db trigrams-rebuild``
+- ``TrigramIndex``: the same postings in memory, one per store engine
+  (``trigram_index``), loaded on first use and updated on commit; rows
+  written by other processes are picked up by ``created_at`` every
+  ``REFRESH_INTERVAL`` seconds
+- ``trigram_candidates``: top-K entity ids for a name, from the in-memory
+  index, or from the side table while a large index is still loading
+"""
+
+import logging
+import threading
+import time
+import uuid
+import weakref
+from array import array
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import bindparam, delete, event, exists, func, inspect, insert, literal, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .models import Entity, entity_name_trigrams
+from .names import normalize_entity_name
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_K = 20
+# Entities past which the in-memory index loads in a background thread
+# (lookups meanwhile use the side table)
+SYNC_LOAD_LIMIT = 50_000
+# Postings read per lookup: trigrams are read rarest first, and once this
+# many ids are counted the remaining (more common) ones are skipped
+SCAN_BUDGET = 10_000
+REFRESH_INTERVAL = 5.0
+# Rows committed late by other processes can carry an older created_at
+REFRESH_OVERLAP = timedelta(minutes=1)
+
+_PENDING = "trigram_changes"
+_REMOVED = "trigram_removed"
+
+
+def name_trigrams(name_norm: Optional[str]) -> Set[str]:
+    """Trigrams of normalized name *name_norm* (each word padded ``"  word "``)."""
+    grams = set()
+    for word in (name_norm or "").split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _uuid(value) -> uuid.UUID:
+    # Entities may be created with str ids; the index keys by UUID
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def _rows(entity_id, name_norm: Optional[str]) -> List[dict]:
+    return [{"trigram": g, "entity_id": entity_id} for g in name_trigrams(name_norm)]
+
+
+@event.listens_for(Session, "before_flush")
+def _old_names(session: Session, flush_context, instances) -> None:
+    """Remember the names of entities this flush deletes or renames, whose trigram rows go."""
+    removed = []
+    for obj in session.deleted:
+        if isinstance(obj, Entity):
+            removed.append((obj.id, obj.name_norm))
+    for obj in session.dirty:
+        if isinstance(obj, Entity):
+            removed += [(obj.id, old) for old in inspect(obj).attrs.name_norm.history.deleted]
+    if removed:
+        session.info.setdefault(_REMOVED, []).extend(removed)
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_side_table(session: Session, flush_context) -> None:
+    """Write the trigram rows of entities added, renamed or deleted in this flush, in two statements."""
+    added, changes = [], []
+    for obj in session.new:
+        if isinstance(obj, Entity):
+            added.append(obj)
+    for obj in session.dirty:
+        if not isinstance(obj, Entity):
+            continue
+        attrs = inspect(obj).attrs
+        if attrs.name_norm.history.has_changes():
+            added.append(obj)
+        elif attrs.kind.history.has_changes():
+            changes.append(("add", _uuid(obj.id), obj.name_norm, obj.kind))
+    for obj in session.deleted:
+        if isinstance(obj, Entity):
+            changes.append(("remove", _uuid(obj.id), None, None))
+    removed = [
+        row
+        for entity_id, name_norm in session.info.pop(_REMOVED, ())
+        for row in _rows(entity_id, name_norm)
+    ]
+    if removed:
+        table = entity_name_trigrams
+        session.connection().execute(
+            delete(table).where(
+                table.c.trigram == bindparam("old_trigram"),
+                table.c.entity_id == bindparam("old_id"),
+            ),
+            [{"old_trigram": r["trigram"], "old_id": r["entity_id"]} for r in removed],
+        )
+    rows = [row for obj in added for row in _rows(obj.id, obj.name_norm)]
+    if rows:
+        session.connection().execute(insert(entity_name_trigrams), rows)
+    changes += [("add", _uuid(obj.id), obj.name_norm, obj.kind) for obj in added]
+    if changes:
+        session.info.setdefault(_PENDING, []).extend(changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_to_cache(session: Session) -> None:
+    changes = session.info.pop(_PENDING, None)
+    if not changes:
+        return
+    index = _indexes.get(session.bind) if session.bind is not None else None
+    if index is not None:
+        index.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+    session.info.pop(_REMOVED, None)
+
+
+class TrigramIndex:
+    """
+    In-memory trigram postings of the entity names of one database.
+
+    Entities are numbered in load order; a posting list is an ``array`` of
+    those numbers (ascending, no repeats), read by lookups as a numpy view
+    without copying. Each trigram has one list over all entities and one per
+    entity kind. Renamed and deleted entities leave dead numbers behind
+    (kind code 0), dropped at the next ``load``.
+    """
+
+    def __init__(self, engine: Engine, scan_budget: int = SCAN_BUDGET):
+        self.engine = engine
+        self.scan_budget = scan_budget
+        self.ready = False
+        self._loading = False
+        self._lock = threading.RLock()
+        self._backlog: List[tuple] = []
+        self._postings: Dict[str, array] = {}
+        # The same split by kind code, read by lookups filtered by kind
+        self._kind_postings: Dict[Tuple[int, str], array] = {}
+        self._ids: list = []
+        self._sizes = array("H")
+        self._kind_codes = array("H")
+        self._codes: Dict[Optional[str], int] = {}
+        self._ordinals: dict = {}
+        self._watermark = None
+        self._checked = time.monotonic()
+        # Per-entity counters of a lookup, zeroed again before it returns
+        self._scratch = np.zeros(0, dtype=np.uint16)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def _add(self, entity_id, name_norm: Optional[str], kind: Optional[str]) -> None:
+        self._remove(entity_id)
+        grams = name_trigrams(name_norm)
+        if not grams:
+            return
+        ordinal = len(self._ids)
+        self._ids.append(entity_id)
+        self._sizes.append(min(len(grams), 0xFFFF))
+        code = self._codes.setdefault(kind, len(self._codes) + 1)
+        self._kind_codes.append(code)
+        self._ordinals[entity_id] = ordinal
+        for gram in grams:
+            for index, key in ((self._postings, gram), (self._kind_postings, (code, gram))):
+                postings = index.get(key)
+                if postings is None:
+                    index[key] = array("I", (ordinal,))
+                else:
+                    postings.append(ordinal)
+
+    def _remove(self, entity_id) -> None:
+        ordinal = self._ordinals.pop(entity_id, None)
+        if ordinal is not None:
+            self._ids[ordinal] = None
+            self._kind_codes[ordinal] = 0
+
+    def _query(self, since=None):
+        stmt = select(Entity.id, Entity.name_norm, Entity.kind, Entity.created_at)
+        if since is not None:
+            stmt = stmt.where(Entity.created_at >= since - REFRESH_OVERLAP)
+        return stmt
+
+    def load(self) -> None:
+        """(Re)build the index from ``entities``; lookups keep using the old one meanwhile."""
+        with self._lock:
+            self._loading = True
+            self._backlog = []
+        try:
+            fresh = TrigramIndex(self.engine, self.scan_budget)
+            with self.engine.connect() as conn:
+                for entity_id, name_norm, kind, created_at in conn.execute(self._query()):
+                    fresh._add(entity_id, name_norm, kind)
+                    if created_at is not None and (
+                        fresh._watermark is None or created_at > fresh._watermark
+                    ):
+                        fresh._watermark = created_at
+            with self._lock:
+                for attr in (
+                    "_postings",
+                    "_kind_postings",
+                    "_ids",
+                    "_sizes",
+                    "_kind_codes",
+                    "_codes",
+                    "_ordinals",
+                    "_watermark",
+                ):
+                    setattr(self, attr, getattr(fresh, attr))
+                self._checked = time.monotonic()
+                # Commits made while reading
+                self._apply(self._backlog)
+                self.ready = True
+        finally:
+            with self._lock:
+                self._loading = False
+                self._backlog = []
+
+    def start_loading(self) -> None:
+        """Load now if the database is small, else in a background thread."""
+        if self.ready or self._loading:
+            return
+        with self.engine.connect() as conn:
+            count = conn.execute(select(func.count()).select_from(Entity.__table__)).scalar()
+        if count <= SYNC_LOAD_LIMIT:
+            self.load()
+            return
+        with self._lock:
+            if self._loading:
+                return
+            self._loading = True
+
+        def run():
+            try:
+                self.load()
+            except Exception as e:
+                logger.warning(f"Loading the trigram index failed: {e}")
+
+        logger.info(f"Loading the trigram index of {count} entities in the background")
+        threading.Thread(target=run, name="trigram-index", daemon=True).start()
+
+    def refresh(self, force: bool = False) -> int:
+        """Add entities created by other processes since the last load or refresh; returns how many."""
+        if not self.ready or not (force or time.monotonic() - self._checked >= REFRESH_INTERVAL):
+            return 0
+        self._checked = time.monotonic()
+        with self.engine.connect() as conn:
+            rows = conn.execute(self._query(self._watermark)).all()
+        added = 0
+        with self._lock:
+            for entity_id, name_norm, kind, created_at in rows:
+                if entity_id not in self._ordinals:
+                    self._add(entity_id, name_norm, kind)
+                    added += 1
+                if created_at is not None and (
+                    self._watermark is None or created_at > self._watermark
+                ):
+                    self._watermark = created_at
+        return added
+
+    def apply(self, changes: Iterable[tuple]) -> None:
+        """Apply committed ``("add" | "remove", id, name_norm, kind)`` changes."""
+        with self._lock:
+            if self._loading:
+                self._backlog.extend(changes)
+            if self.ready:
+                self._apply(changes)
+
+    def _apply(self, changes: Iterable[tuple]) -> None:
+        for op, entity_id, name_norm, kind in changes:
+            if op == "add":
+                self._add(entity_id, name_norm, kind)
+            else:
+                self._remove(entity_id)
+
+    def candidates(
+        self, name: str, k: int = DEFAULT_K, kinds: Optional[Iterable[str]] = None
+    ) -> List[Tuple[object, float]]:
+        """
+        Up to *k* ``(entity_id, score)`` sharing the most trigrams with
+        *name*, best first: the entities with the largest overlap, ranked by
+        the Jaccard similarity of the trigram sets (counting only the
+        trigrams read within ``scan_budget``).
+        """
+        grams = name_trigrams(normalize_entity_name(name))
+        if not grams:
+            return []
+        with self._lock:
+            if kinds:
+                codes = [self._codes[kind] for kind in set(kinds) if kind in self._codes]
+                keys = [(code, g) for code in codes for g in grams]
+                lists = [self._kind_postings[key] for key in keys if key in self._kind_postings]
+            else:
+                lists = [self._postings[g] for g in grams if g in self._postings]
+            if not lists:
+                return []
+            lists.sort(key=len)
+            if len(self._scratch) < len(self._ids):
+                self._scratch = np.zeros(
+                    max(len(self._ids), 2 * len(self._scratch)), dtype=np.uint16
+                )
+            scratch = self._scratch
+            chosen, scanned = [], 0
+            for postings in lists:
+                if chosen and scanned + len(postings) > self.scan_budget:
+                    break
+                # No repeats within one list, so fancy-index += counts correctly
+                ordinals = np.frombuffer(postings, dtype=np.uint32)
+                scratch[ordinals] += 1
+                chosen.append(ordinals)
+                scanned += len(ordinals)
+            touched = np.concatenate(chosen)
+            overlap = scratch[touched]
+            scratch[touched] = 0
+            overlap[np.frombuffer(self._kind_codes, dtype=np.uint16)[touched] == 0] = 0  # dead
+            # An entity occurs at most once per list read, so the top
+            # k * lists occurrences hold at least k distinct entities
+            pool = k * len(chosen)
+            if len(touched) > pool:
+                top = np.argpartition(overlap, len(touched) - pool)[-pool:]
+                touched, overlap = touched[top], overlap[top]
+            touched, first = np.unique(touched, return_index=True)
+            overlap = overlap[first].astype(np.float64)
+            score = overlap / (
+                len(grams) + np.frombuffer(self._sizes, dtype=np.uint16)[touched] - overlap
+            )
+            top = np.argsort(-score, kind="stable")[:k]
+            return [(self._ids[touched[i]], float(score[i])) for i in top if score[i] > 0]
+
+
+_indexes: "weakref.WeakKeyDictionary[Engine, TrigramIndex]" = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def trigram_index(engine: Engine) -> TrigramIndex:
+    """The in-memory index of *engine*'s database (created empty, see ``start_loading``)."""
+    with _indexes_lock:
+        index = _indexes.get(engine)
+        if index is None:
+            index = _indexes[engine] = TrigramIndex(engine)
+        return index
+
+
+def sql_candidates(
+    session: Session, name: str, k: int = DEFAULT_K, kinds: Optional[Iterable[str]] = None
+) -> list:
+    """Up to *k* entity ids with the most trigrams in common with *name*, from the side table."""
+    grams = sorted(name_trigrams(normalize_entity_name(name)))
+    if not grams:
+        return []
+    table, entities = entity_name_trigrams, Entity.__table__
+    # Grouped before the join, so the planner starts from the trigram rows
+    # rather than from every entity of the kind
+    ranked = (
+        select(table.c.entity_id, func.count().label("overlap"))
+        .where(table.c.trigram.in_(grams))
+        .group_by(table.c.entity_id)
+        .subquery()
+    )
+    stmt = (
+        select(ranked.c.entity_id)
+        .join(entities, entities.c.id == ranked.c.entity_id)
+        .order_by(ranked.c.overlap.desc())
+        .limit(k)
+    )
+    if kinds:
+        stmt = stmt.where(entities.c.kind.in_(list(kinds)))
+    return list(session.execute(stmt).scalars())
+
+
+def trigram_candidates(
+    session: Session,
+    name: str,
+    k: int = DEFAULT_K,
+    kinds: Optional[Iterable[str]] = None,
+    engine: Optional[Engine] = None,
+) -> list:
+    """
+    Up to *k* ids of entities whose names share the most trigrams with
+    *name*, best first, to be scored by the caller. Uses the in-memory index
+    of *engine* (default: the session's), loading it on first use; pass the
+    engine that writes, whose commits keep the index current.
+    """
+    index = trigram_index(engine if engine is not None else session.get_bind())
+    if not index.ready:
+        index.start_loading()
+    if not index.ready:
+        return sql_candidates(session, name, k, kinds)
+    index.refresh()
+    return [entity_id for entity_id, _ in index.candidates(name, k, kinds)]
+
+
+def ensure_trigram_index(engine: Engine, batch_size: int = 1000) -> int:
+    """
+    Write the side-table trigrams of entities that have none (databases
+    created before it existed, rows copied by ``migrate_to_flat`` or written
+    outside the ORM). Returns the number of entities indexed.
+    """
+    table, entities = entity_name_trigrams, Entity.__table__
+    missing = (
+        select(entities.c.id, entities.c.name_norm)
+        .where(entities.c.name_norm.is_not(None), entities.c.name_norm != "")
+        # Probe of the name's first trigram ("  " + first letter), by primary key
+        .where(
+            ~exists().where(
+                table.c.trigram == literal("  ") + func.substr(entities.c.name_norm, 1, 1),
+                table.c.entity_id == entities.c.id,
+            )
+        )
+        .order_by(entities.c.id)
+        .limit(batch_size)
+    )
+    indexed, last_id = 0, None
+    while True:
+        with engine.begin() as conn:
+            query = missing if last_id is None else missing.where(entities.c.id > last_id)
+            batch = conn.execute(query).all()
+            if not batch:
+                break
+            rows = [row for entity_id, name_norm in batch for row in _rows(entity_id, name_norm)]
+            if rows:
+                conn.execute(insert(table), rows)
+        indexed += len(batch)
+        last_id = batch[-1].id
+    if indexed:
+        logger.info(f"Indexed the name trigrams of {indexed} entities")
+    return indexed
@@ -0,0 +1,264 @@
+"""
+Group-commit write queue for ``SQLAlchemyStore``.
+
+Every store write opens its own session and commits, so a crawled page
+costs a dozen small transactions (page, entities, relationships, intel,
+links, snippets, timing) and, on SQLite, as many fsyncs. ``QueuedStore``
+wraps a store with a single writer thread: write intents from any thread
+are queued, coalesced into one transaction per batch (bounded by
+``max_batch`` intents and an optional ``max_delay`` linger) and their
+futures resolved with the methods' return values (generated IDs) once the
+batch has committed.
+
+The store methods run unchanged: in the writer thread ``store.Session``
+(a ``BatchSessionFactory``) hands out a view of the batch session whose
+``commit()`` only flushes. If any intent in a batch fails, the batch is
+rolled back and its intents are re-run one by one in their own
+transactions, so a bad intent only fails its own future.
+
+Ordering: intents commit in submission order, and a thread reading
+through the ``QueuedStore`` first waits for its own queued writes, so a
+page's later reads see its earlier writes.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session, sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Store methods routed through the queue when called on a QueuedStore
+QUEUED_METHODS = frozenset(
+    {
+        "save_page",
+        "save_entities",
+        "save_relationship",
+        "save_intelligence",
+        "save_links",
+        "save_fingerprint",
+        "save_page_simhash",
+        "save_page_timing",
+        "save_patterns",
+        "save_domains",
+    }
+)
+
+_STOP = object()
+
+
+class BatchRollback(RuntimeError):
+    """A store method asked to roll back while running inside a batch."""
+
+
+class _BatchSession:
+    """View of the shared batch session for one store call."""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def __enter__(self) -> "_BatchSession":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def commit(self) -> None:
+        # The batch commits once; a store method's commit only flushes
+        self._session.flush()
+
+    def rollback(self) -> None:
+        raise BatchRollback("rollback requested inside a group commit")
+
+    def close(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+
+class BatchSessionFactory:
+    """
+    ``sessionmaker`` stand-in that can be bound to a batch session.
+
+    Outside ``bind()`` (and in every other thread) it returns ordinary
+    sessions; other attributes are those of the wrapped ``sessionmaker``.
+    """
+
+    def __init__(self, maker: sessionmaker):
+        self.maker = maker
+        self._local = threading.local()
+
+    def __call__(self, **kw: Any):
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            return _BatchSession(session)
+        return self.maker(**kw)
+
+    @contextmanager
+    def bind(self, session: Session):
+        """Route this thread's ``Session()`` calls to *session*."""
+        self._local.session = session
+        try:
+            yield session
+        finally:
+            self._local.session = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.maker, name)
+
+
+class _Intent:
+    __slots__ = ("fn", "future")
+
+    def __init__(self, fn: Callable[[Any], Any]):
+        self.fn = fn
+        self.future: Future = Future()
+
+
+class QueuedStore:
+    """
+    Store facade that group-commits writes on a single writer thread.
+
+    ``save_*`` methods in ``QUEUED_METHODS`` block until their batch has
+    committed and return the store's result; ``defer()`` queues a write
+    without waiting and ``submit()`` queues any ``fn(store)``. Everything
+    else is delegated to the wrapped store after the calling thread's
+    queued writes have committed.
+    """
+
+    def __init__(self, store: Any, max_batch: int = 200, max_delay: float = 0.0):
+        if not isinstance(getattr(store, "Session", None), BatchSessionFactory):
+            raise TypeError("QueuedStore needs a store whose Session is a BatchSessionFactory")
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "max_batch", max(1, int(max_batch)))
+        object.__setattr__(self, "max_delay", max(0.0, float(max_delay)))
+        object.__setattr__(self, "_queue", queue.Queue())
+        object.__setattr__(self, "_local", threading.local())
+        object.__setattr__(
+            self, "_stats", {"intents": 0, "batches": 0, "commits": 0, "fallbacks": 0}
+        )
+        object.__setattr__(self, "_closed", False)
+        thread = threading.Thread(target=self._run, name="garuda-group-commit", daemon=True)
+        object.__setattr__(self, "_thread", thread)
+        thread.start()
+
+    # -- Submitting ------------------------------------------------------
+
+    def submit(self, fn: Callable[[Any], Any]) -> Future:
+        """Queue ``fn(store)``; the future resolves after its batch commits."""
+        if self._closed:
+            raise RuntimeError("QueuedStore is closed")
+        intent = _Intent(fn)
+        self._local.last = intent.future
+        self._queue.put(intent)
+        return intent.future
+
+    def defer(self, method: str, *args: Any, **kwargs: Any) -> Future:
+        """Queue ``store.<method>(*args, **kwargs)`` without waiting; failures are logged."""
+        future = self.submit(lambda store: getattr(store, method)(*args, **kwargs))
+        future.add_done_callback(
+            lambda f: f.exception() and logger.debug(f"Deferred {method} failed: {f.exception()}")
+        )
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until everything queued so far has been committed."""
+        self.submit(lambda store: None).result(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def close(self) -> None:
+        """Commit what is queued and stop the writer thread."""
+        if self._closed:
+            return
+        object.__setattr__(self, "_closed", True)
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def __enter__(self) -> "QueuedStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- Delegation ------------------------------------------------------
+
+    def _wait_own_writes(self) -> None:
+        last = getattr(self._local, "last", None)
+        if last is not None and not last.done():
+            try:
+                last.result()
+            except Exception:
+                pass
+
+    def __getattr__(self, name: str) -> Any:
+        store = object.__getattribute__(self, "_store")
+        if name in QUEUED_METHODS:
+
+            def queued(*args: Any, **kwargs: Any) -> Any:
+                return self.submit(lambda s: getattr(s, name)(*args, **kwargs)).result()
+
+            queued.__name__ = name
+            return queued
+        self._wait_own_writes()
+        return getattr(store, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._store, name, value)
+
+    # -- Writer thread ---------------------------------------------------
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    wait = deadline - time.monotonic()
+                    item = self._queue.get(timeout=wait) if wait > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: List[_Intent]) -> None:
+        factory: BatchSessionFactory = self._store.Session
+        self._stats["intents"] += len(batch)
+        self._stats["batches"] += 1
+        results = []
+        session = factory.maker()
+        try:
+            with factory.bind(session):
+                for intent in batch:
+                    results.append(intent.fn(self._store))
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            session.close()
+            if len(batch) == 1:
+                batch[0].future.set_exception(e)
+                return
+            # Isolate the failing intent: re-run each in its own transaction
+            self._stats["fallbacks"] += 1
+            logger.debug(f"Group commit of {len(batch)} writes failed ({e}); retrying one by one")
+            for intent in batch:
+                self._commit_batch([intent])
+            return
+        session.close()
+        self._stats["commits"] += 1
+        for intent, result in zip(batch, results):
+            intent.future.set_result(result)
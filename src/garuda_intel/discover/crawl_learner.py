@@ -3,6 +3,14 @@ Crawl Learning and Adaptation System.
 
 This module tracks successful crawl patterns to improve future discovery strategies.
 It learns from domain reliability, page types, and extraction success to optimize crawling.
+
+Statistics are persisted to dedicated tables (``crawl_domain_stats`` and
+``crawl_page_type_stats``), loaded once into an in-memory index, and updated
+incrementally: each flush merges the observations made since the previous
+one into the stored rows, inside the write transaction, so learners in
+several workers add to the same counters instead of overwriting each other.
+Counters decay exponentially (half-life ``decay_days``) so stale domains lose
+weight without a batch job.
 """
 
 import logging
@@ -29,12 +37,20 @@ class CrawlOutcome:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+def _decay_factor(since: float, now: float, half_life_days: float) -> float:
+    """Multiplier that halves counts every *half_life_days* since *since*."""
+    if half_life_days <= 0 or now <= since:
+        return 1.0
+    return 0.5 ** ((now - since) / 86400 / half_life_days)
+
+
 @dataclass
 class DomainStats:
-    """Aggregated statistics for a domain."""
+    """Aggregated statistics for a domain (counts are decayed, hence floats)."""
     domain: str
-    total_crawls: int = 0
-    successful_crawls: int = 0
+    total_crawls: float = 0.0
+    successful_crawls: float = 0.0
+    intel_yield: float = 0.0
     avg_intel_quality: float = 0.0
     page_type_distribution: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
     entity_type_distribution: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
@@ -56,17 +72,43 @@ class DomainStats:
         # Combined score: success rate (40%) + quality (40%) + recency (20%)
         return (success_rate * 0.4 + quality_score * 0.4) * (0.8 + decay_factor * 0.2)
 
+    @property
+    def yield_per_page(self) -> float:
+        """Intel items extracted per fetched page."""
+        if self.total_crawls <= 0:
+            return 0.0
+        return self.intel_yield / self.total_crawls
+
+    def decay(self, now: float, half_life_days: float) -> None:
+        """Age counters and distributions from ``last_seen`` to *now*."""
+        factor = _decay_factor(self.last_seen, now, half_life_days)
+        if factor == 1.0:
+            return
+        self.total_crawls *= factor
+        self.successful_crawls *= factor
+        self.intel_yield *= factor
+        for dist in (self.page_type_distribution, self.entity_type_distribution):
+            for key in dist:
+                dist[key] *= factor
+
 
 @dataclass
 class PageTypePattern:
     """Pattern learned for a specific page type."""
     page_type: str
     entity_type: str
-    success_count: int = 0
-    total_count: int = 0
+    success_count: float = 0.0
+    total_count: float = 0.0
     avg_quality: float = 0.0
     extraction_hints: List[str] = field(default_factory=list)
     confidence: float = 0.0
+    last_seen: float = field(default_factory=time.time)
+
+    def decay(self, now: float, half_life_days: float) -> None:
+        """Age counters from ``last_seen`` to *now*."""
+        factor = _decay_factor(self.last_seen, now, half_life_days)
+        self.success_count *= factor
+        self.total_count *= factor
     
     def update_confidence(self):
         """Update confidence based on sample size and success rate."""
@@ -80,6 +122,41 @@ class PageTypePattern:
         self.confidence = success_rate * sample_factor
 
 
+@dataclass
+class PendingUpdate:
+    """Observations of one domain or page pattern since the last flush.
+
+    The quality moving average is kept as ``quality_keep`` (the weight left
+    on the prior average) and ``quality_add`` (the new observations'
+    contribution), so it can be applied on top of whatever is stored.
+    """
+    count: float = 0.0
+    successes: float = 0.0
+    intel_yield: float = 0.0
+    quality_keep: float = 1.0
+    quality_add: float = 0.0
+    page_types: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    entity_types: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    extraction_hints: List[str] = field(default_factory=list)
+    first_seen: float = float("inf")
+    last_seen: float = 0.0
+
+    def add(self, outcome: CrawlOutcome, alpha: float) -> None:
+        self.count += 1
+        if outcome.extraction_success:
+            self.successes += 1
+            for hint in outcome.metadata.get("extraction_hints", []):
+                if hint not in self.extraction_hints:
+                    self.extraction_hints.append(hint)
+        self.intel_yield += outcome.metadata.get("intel_count", 0)
+        self.quality_keep *= 1 - alpha
+        self.quality_add = (1 - alpha) * self.quality_add + alpha * outcome.intel_quality
+        self.page_types[outcome.page_type] += 1
+        self.entity_types[outcome.entity_type] += 1
+        self.first_seen = min(self.first_seen, outcome.timestamp)
+        self.last_seen = max(self.last_seen, outcome.timestamp)
+
+
 class CrawlLearner:
     """
     Learns from successful crawls to improve future strategies.
@@ -98,7 +175,8 @@ class CrawlLearner:
         Args:
             store: Persistence store for saving/loading learned patterns
             learning_rate: How quickly to adapt to new information (0-1)
-            decay_days: Days after which old patterns start to decay
+            decay_days: Days after which old patterns start to decay; also the
+                half-life applied to persisted counters
         """
         self.store = store
         self.learning_rate = learning_rate
@@ -114,6 +192,11 @@ class CrawlLearner:
         self._entity_patterns: Dict[str, Dict[str, Any]] = defaultdict(dict)
         self._recent_outcomes: List[CrawlOutcome] = []
         self._max_recent = 1000
+        # Observations since the last flush, per key (incremental persistence)
+        self._pending_domains: Dict[str, PendingUpdate] = {}
+        self._pending_patterns: Dict[str, PendingUpdate] = {}
+        self._unsaved = 0
+        self._save_every = 50
         
         # Load existing patterns from database
         if self.store:
@@ -126,7 +209,8 @@ class CrawlLearner:
         intel_quality: float,
         extraction_success: bool,
         entity_type: str = "",
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        intel_count: int = 0,
     ) -> None:
         """
         Record the outcome of a crawl for learning.
@@ -138,6 +222,7 @@ class CrawlLearner:
             extraction_success: Whether extraction succeeded
             entity_type: Type of entity being researched
             metadata: Additional context about the crawl
+            intel_count: Intel items extracted from the page (yield per fetch)
         """
         from urllib.parse import urlparse
         
@@ -152,6 +237,7 @@ class CrawlLearner:
             extraction_success=extraction_success,
             metadata=metadata or {}
         )
+        outcome.metadata.setdefault("intel_count", intel_count)
         
         # Update domain statistics
         self._update_domain_stats(outcome)
@@ -167,8 +253,9 @@ class CrawlLearner:
         if len(self._recent_outcomes) > self._max_recent:
             self._recent_outcomes.pop(0)
         
-        # Periodically persist patterns
-        if self.store and len(self._recent_outcomes) % 50 == 0:
+        # Periodically persist the entries touched since the last save
+        self._unsaved += 1
+        if self.store and self._unsaved >= self._save_every:
             self._save_patterns()
         
         self.logger.debug(
@@ -301,6 +388,11 @@ class CrawlLearner:
         elif reliability < 0.3:
             adjustment -= 15.0  # Penalize unreliable domains
         
+        # Yield boost: domains that historically produce intel per fetch
+        stats = self._domain_stats.get(domain)
+        if stats and stats.total_crawls >= 3:
+            adjustment += min(stats.yield_per_page, 3.0) * 10.0
+
         # Page type pattern boost
         if page_type and entity_type:
             pattern_key = f"{entity_type}:{page_type}"
@@ -319,13 +411,15 @@ class CrawlLearner:
         stats = self._domain_stats.get(outcome.domain)
         
         if not stats:
-            stats = DomainStats(domain=outcome.domain)
+            stats = DomainStats(domain=outcome.domain, first_seen=outcome.timestamp)
             self._domain_stats[outcome.domain] = stats
         
         # Update counts
+        stats.decay(outcome.timestamp, self.decay_days)
         stats.total_crawls += 1
         if outcome.extraction_success:
             stats.successful_crawls += 1
+        stats.intel_yield += outcome.metadata.get("intel_count", 0)
         
         # Update running average of quality (exponential moving average)
         alpha = self.learning_rate
@@ -336,7 +430,8 @@ class CrawlLearner:
         # Update distributions
         stats.page_type_distribution[outcome.page_type] += 1
         stats.entity_type_distribution[outcome.entity_type] += 1
-        stats.last_seen = outcome.timestamp
+        stats.last_seen = max(stats.last_seen, outcome.timestamp)
+        self._pending_domains.setdefault(outcome.domain, PendingUpdate()).add(outcome, alpha)
     
     def _update_page_type_patterns(self, outcome: CrawlOutcome) -> None:
         """Update page type patterns with new outcome."""
@@ -354,12 +449,15 @@ class CrawlLearner:
             self._page_type_patterns[pattern_key] = pattern
         
         # Update counts
+        pattern.decay(outcome.timestamp, self.decay_days)
         pattern.total_count += 1
         if outcome.extraction_success:
             pattern.success_count += 1
+        pattern.last_seen = max(pattern.last_seen, outcome.timestamp)
         
         # Update quality (exponential moving average)
         alpha = self.learning_rate
+        self._pending_patterns.setdefault(pattern_key, PendingUpdate()).add(outcome, alpha)
         pattern.avg_quality = (
             alpha * outcome.intel_quality + (1 - alpha) * pattern.avg_quality
         )
@@ -389,33 +487,170 @@ class CrawlLearner:
             entity_data["successful_domains"][outcome.domain] += 1
     
     def _load_patterns(self) -> None:
-        """Load learned patterns from database."""
+        """Load persisted statistics into the in-memory index."""
         try:
-            # Try to load patterns from a dedicated patterns table
-            # For now, use a simple approach - this can be enhanced later
-            self.logger.info("Loading learned patterns from database...")
-            
-            # Load patterns using the store (if available)
-            # This is a placeholder - actual implementation would query a dedicated table
-            
+            data = self.store.load_crawl_learning() or {}
+            for row in data.get("domains", []):
+                self._domain_stats[row["domain"]] = self._domain_from_row(row)
+            for row in data.get("page_types", []):
+                self._page_type_patterns[row["pattern_key"]] = self._pattern_from_row(row)
+            if self._domain_stats or self._page_type_patterns:
+                self.logger.info(
+                    f"Loaded learned patterns: {len(self._domain_stats)} domains, "
+                    f"{len(self._page_type_patterns)} page patterns"
+                )
         except Exception as e:
             self.logger.warning(f"Could not load patterns: {e}")
     
+    @staticmethod
+    def _domain_from_row(row: Dict[str, Any]) -> DomainStats:
+        stats = DomainStats(
+            domain=row["domain"],
+            total_crawls=row.get("total_crawls") or 0.0,
+            successful_crawls=row.get("successful_crawls") or 0.0,
+            intel_yield=row.get("intel_yield") or 0.0,
+            avg_intel_quality=row.get("avg_intel_quality") or 0.0,
+            first_seen=row.get("first_seen") or time.time(),
+            last_seen=row.get("last_seen") or time.time(),
+        )
+        stats.page_type_distribution.update(row.get("page_type_distribution") or {})
+        stats.entity_type_distribution.update(row.get("entity_type_distribution") or {})
+        return stats
+
+    @staticmethod
+    def _domain_row(d: DomainStats) -> Dict[str, Any]:
+        return {
+            "domain": d.domain,
+            "total_crawls": d.total_crawls,
+            "successful_crawls": d.successful_crawls,
+            "intel_yield": d.intel_yield,
+            "avg_intel_quality": d.avg_intel_quality,
+            "page_type_distribution": dict(d.page_type_distribution),
+            "entity_type_distribution": dict(d.entity_type_distribution),
+            "first_seen": d.first_seen,
+            "last_seen": d.last_seen,
+        }
+
+    @staticmethod
+    def _pattern_from_row(row: Dict[str, Any]) -> PageTypePattern:
+        return PageTypePattern(
+            page_type=row["page_type"],
+            entity_type=row["entity_type"],
+            success_count=row.get("success_count") or 0.0,
+            total_count=row.get("total_count") or 0.0,
+            avg_quality=row.get("avg_quality") or 0.0,
+            extraction_hints=list(row.get("extraction_hints") or []),
+            confidence=row.get("confidence") or 0.0,
+            last_seen=row.get("last_seen") or time.time(),
+        )
+
+    @staticmethod
+    def _pattern_row(key: str, p: PageTypePattern) -> Dict[str, Any]:
+        return {
+            "pattern_key": key,
+            "entity_type": p.entity_type,
+            "page_type": p.page_type,
+            "total_count": p.total_count,
+            "success_count": p.success_count,
+            "avg_quality": p.avg_quality,
+            "confidence": p.confidence,
+            "extraction_hints": list(p.extraction_hints),
+            "last_seen": p.last_seen,
+        }
+
+    def _merge_pending(
+        self, kind: str, stored: Optional[Dict[str, Any]], row: Dict[str, Any], merged: Dict
+    ) -> Dict[str, Any]:
+        """Apply a pending update to the stored row (decayed to the update's time)."""
+        update = row["pending"]
+        if kind == "domain":
+            stats = (
+                self._domain_from_row(stored)
+                if stored
+                else DomainStats(
+                    domain=row["domain"], first_seen=update.first_seen, last_seen=update.first_seen
+                )
+            )
+            stats.decay(update.last_seen, self.decay_days)
+            stats.total_crawls += update.count
+            stats.successful_crawls += update.successes
+            stats.intel_yield += update.intel_yield
+            stats.avg_intel_quality = (
+                update.quality_keep * stats.avg_intel_quality + update.quality_add
+            )
+            for key, n in update.page_types.items():
+                stats.page_type_distribution[key] += n
+            for key, n in update.entity_types.items():
+                stats.entity_type_distribution[key] += n
+            stats.first_seen = min(stats.first_seen, update.first_seen)
+            stats.last_seen = max(stats.last_seen, update.last_seen)
+            merged["domains"][stats.domain] = stats
+            return self._domain_row(stats)
+
+        key = row["pattern_key"]
+        pattern = (
+            self._pattern_from_row(stored)
+            if stored
+            else PageTypePattern(
+                page_type=row["page_type"],
+                entity_type=row["entity_type"],
+                last_seen=update.first_seen,
+            )
+        )
+        pattern.decay(update.last_seen, self.decay_days)
+        pattern.total_count += update.count
+        pattern.success_count += update.successes
+        pattern.avg_quality = update.quality_keep * pattern.avg_quality + update.quality_add
+        pattern.last_seen = max(pattern.last_seen, update.last_seen)
+        for hint in update.extraction_hints:
+            if hint not in pattern.extraction_hints:
+                pattern.extraction_hints.append(hint)
+        pattern.update_confidence()
+        merged["page_types"][key] = pattern
+        return self._pattern_row(key, pattern)
+
     def _save_patterns(self) -> None:
-        """Save learned patterns to database."""
+        """Merge the observations made since the last save into the stored rows."""
+        if not (self._pending_domains or self._pending_patterns):
+            self._unsaved = 0
+            return
+        domains = [
+            {"domain": key, "pending": update} for key, update in self._pending_domains.items()
+        ]
+        page_types = [
+            {
+                "pattern_key": key,
+                "entity_type": self._page_type_patterns[key].entity_type,
+                "page_type": self._page_type_patterns[key].page_type,
+                "pending": update,
+            }
+            for key, update in self._pending_patterns.items()
+        ]
+        merged: Dict[str, Dict] = {"domains": {}, "page_types": {}}
         try:
-            # Serialize and save patterns
-            # This is a placeholder for actual persistence
-            # In production, this would save to dedicated learning tables
-            
-            self.logger.debug(
-                f"Patterns snapshot: {len(self._domain_stats)} domains, "
-                f"{len(self._page_type_patterns)} page patterns"
-            )
-            
+            if self.store.save_crawl_learning(
+                domains,
+                page_types,
+                merge=lambda kind, stored, row: self._merge_pending(kind, stored, row, merged),
+            ):
+                # Adopt the merged rows: they include other learners' observations
+                self._domain_stats.update(merged["domains"])
+                self._page_type_patterns.update(merged["page_types"])
+                self._pending_domains.clear()
+                self._pending_patterns.clear()
+                self._unsaved = 0
+                self.logger.debug(
+                    f"Saved learned patterns: {len(domains)} domains, "
+                    f"{len(page_types)} page patterns"
+                )
         except Exception as e:
             self.logger.warning(f"Could not save patterns: {e}")
-    
+
+    def flush(self) -> None:
+        """Persist pending updates (call at the end of a crawl)."""
+        if self.store:
+            self._save_patterns()
+
     def get_learning_stats(self) -> Dict[str, Any]:
         """Get summary statistics about learned patterns."""
         return {
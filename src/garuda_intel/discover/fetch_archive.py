@@ -0,0 +1,397 @@
+"""
+WARC-style archive of raw fetch responses, plus offline replay.
+
+Every response (status line, headers, body and fetch timing) is written as a
+WARC/1.1 record into append-only segment files. Each record is its own
+compressed frame (zstd when ``zstandard`` is installed, gzip otherwise), so
+a record can be read back from its offset without touching the rest of the
+segment.
+
+Bodies are content-addressed by SHA-256: a body already in the archive is
+written once, and later fetches of identical content become small
+``revisit`` records pointing at the stored payload digest.
+
+A SQLite index (``index.sqlite`` next to the segments) maps canonical URLs
+to their latest record, and payload digests to payload records. Replay
+(``IntelligentExplorer(..., fetch_archive=archive, replay=True)``,
+``RefreshRunner(..., fetch_archive=archive, replay=True)``) serves fetches
+from the archive with no network, so the whole pipeline can be re-run at
+disk speed.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.client import responses as HTTP_REASONS
+from typing import Dict, Iterator, Optional, Tuple
+
+from .url_canonical import canonicalize_url
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+SEGMENT_SUFFIX = {"zstd": ".warc.zst", "gzip": ".warc.gz"}
+
+
+@dataclass
+class ArchivedResponse:
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    fetched_at: str
+    elapsed_ms: float
+    digest: str
+    record_type: str = "response"
+    extra: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def encoding(self) -> str:
+        content_type = self.headers.get("Content-Type") or self.headers.get("content-type") or ""
+        for part in content_type.split(";"):
+            part = part.strip()
+            if part.lower().startswith("charset="):
+                return part.split("=", 1)[1].strip("\"' ") or "utf-8"
+        return "utf-8"
+
+    @property
+    def text(self) -> str:
+        try:
+            return self.body.decode(self.encoding, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+def payload_digest(body: bytes) -> str:
+    return "sha256:" + hashlib.sha256(body).hexdigest()
+
+
+class FetchArchive:
+    """
+    Append-only, content-addressed archive of fetch responses.
+
+    Thread-safe: the explorer records from its parallel fetch workers.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        codec: Optional[str] = None,
+        max_segment_bytes: int = 256 * 1024 * 1024,
+        compression_level: int = 3,
+    ):
+        """
+        Args:
+            root: Archive directory (created if missing)
+            codec: "zstd" or "gzip"; defaults to zstd when available
+            max_segment_bytes: Size at which a new segment file is started
+            compression_level: Per-record compression level
+        """
+        if codec is None:
+            codec = "zstd" if zstandard is not None else "gzip"
+        if codec not in SEGMENT_SUFFIX:
+            raise ValueError(f"Unknown archive codec: {codec}")
+        if codec == "zstd" and zstandard is None:
+            raise ImportError("zstd archives require the 'zstandard' package")
+        self.root = root
+        self.codec = codec
+        self.max_segment_bytes = max_segment_bytes
+        self.compression_level = compression_level
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.stats = {
+            "archive_records": 0,
+            "archive_revisits": 0,
+            "archive_bytes_written": 0,
+            "archive_hits": 0,
+            "archive_misses": 0,
+        }
+        os.makedirs(root, exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(root, "index.sqlite"), check_same_thread=False)
+        self._init_index()
+        self._segment_name, self._segment_size = self._current_segment()
+        self._compressor = (
+            zstandard.ZstdCompressor(level=compression_level) if codec == "zstd" else None
+        )
+
+    def _init_index(self) -> None:
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                url_norm TEXT NOT NULL,
+                record_type TEXT NOT NULL,
+                status INTEGER,
+                digest TEXT NOT NULL,
+                segment TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                fetched_at TEXT NOT NULL,
+                elapsed_ms REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_url_norm ON records(url_norm, id);
+            CREATE TABLE IF NOT EXISTS payloads (
+                digest TEXT PRIMARY KEY,
+                segment TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            );
+        """)
+        self._db.commit()
+
+    def _current_segment(self) -> Tuple[str, int]:
+        suffix = SEGMENT_SUFFIX[self.codec]
+        segments = sorted(
+            name
+            for name in os.listdir(self.root)
+            if name.startswith("segment-") and name.endswith(suffix)
+        )
+        if segments:
+            name = segments[-1]
+            return name, os.path.getsize(os.path.join(self.root, name))
+        return f"segment-00001{suffix}", 0
+
+    def _rotate_if_full(self, incoming: int) -> None:
+        if self._segment_size and self._segment_size + incoming > self.max_segment_bytes:
+            number = int(self._segment_name.split("-")[1].split(".")[0]) + 1
+            self._segment_name = f"segment-{number:05d}{SEGMENT_SUFFIX[self.codec]}"
+            self._segment_size = 0
+
+    # ---------- Codec ----------
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._compressor is not None:
+            return self._compressor.compress(data)
+        return gzip.compress(data, compresslevel=min(9, max(1, self.compression_level)))
+
+    @staticmethod
+    def _decompress(segment: str, data: bytes) -> bytes:
+        if segment.endswith(SEGMENT_SUFFIX["zstd"]):
+            if zstandard is None:
+                raise ImportError("Reading zstd segments requires the 'zstandard' package")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    # ---------- Writing ----------
+
+    def record(
+        self,
+        url: str,
+        status: int,
+        headers: Optional[Dict[str, str]],
+        body: bytes,
+        elapsed: float = 0.0,
+        extra: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Archive one response; returns the payload digest."""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        headers = dict(headers or {})
+        digest = payload_digest(body)
+        fetched_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        elapsed_ms = round(elapsed * 1000.0, 3)
+
+        with self._lock:
+            known = self._db.execute(
+                "SELECT 1 FROM payloads WHERE digest = ?", (digest,)
+            ).fetchone()
+            record_type = "revisit" if known else "response"
+            block = self._http_block(status, headers, b"" if known else body)
+            warc_headers = {
+                "WARC-Type": record_type,
+                "WARC-Target-URI": url,
+                "WARC-Date": fetched_at,
+                "WARC-Record-ID": f"<urn:uuid:{uuid.uuid4()}>",
+                "WARC-Payload-Digest": digest,
+                "Content-Type": "application/http;msgtype=response",
+                "Content-Length": str(len(block)),
+                "X-Garuda-Elapsed-Ms": str(elapsed_ms),
+            }
+            if known:
+                warc_headers["WARC-Profile"] = (
+                    "http://netpreserve.org/warc/1.1/revisit/identical-payload-digest"
+                )
+            for key, value in (extra or {}).items():
+                warc_headers[f"X-Garuda-{key}"] = str(value)
+            raw = (
+                b"WARC/1.1\r\n"
+                + "".join(f"{k}: {v}\r\n" for k, v in warc_headers.items()).encode("utf-8")
+                + b"\r\n"
+                + block
+                + b"\r\n\r\n"
+            )
+            frame = self._compress(raw)
+            self._rotate_if_full(len(frame))
+            offset = self._segment_size
+            with open(os.path.join(self.root, self._segment_name), "ab") as fh:
+                fh.write(frame)
+            self._segment_size += len(frame)
+
+            self._db.execute(
+                "INSERT INTO records (url, url_norm, record_type, status, digest, segment, "
+                "offset, length, fetched_at, elapsed_ms) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    canonicalize_url(url),
+                    record_type,
+                    status,
+                    digest,
+                    self._segment_name,
+                    offset,
+                    len(frame),
+                    fetched_at,
+                    elapsed_ms,
+                ),
+            )
+            if not known:
+                self._db.execute(
+                    "INSERT INTO payloads (digest, segment, offset, length, size) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (digest, self._segment_name, offset, len(frame), len(body)),
+                )
+            self._db.commit()
+            self.stats["archive_records"] += 1
+            self.stats["archive_revisits"] += int(bool(known))
+            self.stats["archive_bytes_written"] += len(frame)
+        return digest
+
+    @staticmethod
+    def _http_block(status: int, headers: Dict[str, str], body: bytes) -> bytes:
+        reason = HTTP_REASONS.get(int(status or 0), "")
+        head = f"HTTP/1.1 {int(status or 0)} {reason}\r\n".encode("utf-8")
+        head += "".join(
+            f"{k}: {v}\r\n"
+            for k, v in headers.items()
+            if k.lower() not in ("content-encoding", "transfer-encoding")
+        ).encode("utf-8", errors="replace")
+        return head + b"\r\n" + body
+
+    # ---------- Reading ----------
+
+    def _read_frame(self, segment: str, offset: int, length: int) -> bytes:
+        with open(os.path.join(self.root, segment), "rb") as fh:
+            fh.seek(offset)
+            return self._decompress(segment, fh.read(length))
+
+    @staticmethod
+    def _parse_record(raw: bytes) -> Tuple[Dict[str, str], int, Dict[str, str], bytes]:
+        warc_head, _, rest = raw.partition(b"\r\n\r\n")
+        warc_headers = {}
+        for line in warc_head.decode("utf-8").split("\r\n")[1:]:
+            key, _, value = line.partition(": ")
+            warc_headers[key] = value
+        block = rest[: int(warc_headers.get("Content-Length", len(rest)))]
+        http_head, _, body = block.partition(b"\r\n\r\n")
+        lines = http_head.decode("utf-8", errors="replace").split("\r\n")
+        status = int(lines[0].split(" ")[1]) if lines and lines[0] else 0
+        headers = {}
+        for line in lines[1:]:
+            key, _, value = line.partition(": ")
+            if key:
+                headers[key] = value
+        return warc_headers, status, headers, body
+
+    def _load(self, row) -> ArchivedResponse:
+        url, record_type, digest, segment, offset, length = row
+        warc_headers, status, headers, body = self._parse_record(
+            self._read_frame(segment, offset, length)
+        )
+        if record_type == "revisit":
+            payload = self._db.execute(
+                "SELECT segment, offset, length FROM payloads WHERE digest = ?", (digest,)
+            ).fetchone()
+            if payload:
+                body = self._parse_record(self._read_frame(*payload))[3]
+        extra = {
+            k[len("X-Garuda-") :]: v
+            for k, v in warc_headers.items()
+            if k.startswith("X-Garuda-") and k != "X-Garuda-Elapsed-Ms"
+        }
+        return ArchivedResponse(
+            url=url,
+            status=status,
+            headers=headers,
+            body=body,
+            fetched_at=warc_headers.get("WARC-Date", ""),
+            elapsed_ms=float(warc_headers.get("X-Garuda-Elapsed-Ms") or 0),
+            digest=digest,
+            record_type=record_type,
+            extra=extra,
+        )
+
+    def lookup(self, url: str) -> Optional[ArchivedResponse]:
+        """Latest archived response for *url* (matched canonically)."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, record_type, digest, segment, offset, length FROM records "
+                "WHERE url_norm = ? ORDER BY id DESC LIMIT 1",
+                (canonicalize_url(url),),
+            ).fetchone()
+            if row is None:
+                self.stats["archive_misses"] += 1
+                return None
+            self.stats["archive_hits"] += 1
+            return self._load(row)
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return (
+                self._db.execute(
+                    "SELECT 1 FROM records WHERE url_norm = ? LIMIT 1", (canonicalize_url(url),)
+                ).fetchone()
+                is not None
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def iter_records(self) -> Iterator[ArchivedResponse]:
+        """All records in write order."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT url, record_type, digest, segment, offset, length FROM records ORDER BY id"
+            ).fetchall()
+        for row in rows:
+            with self._lock:
+                response = self._load(row)
+            yield response
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            records, urls = self._db.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT url_norm) FROM records"
+            ).fetchone()
+            payloads, payload_bytes = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM payloads"
+            ).fetchone()
+        segments = [name for name in os.listdir(self.root) if name.startswith("segment-")]
+        disk = sum(os.path.getsize(os.path.join(self.root, n)) for n in segments)
+        return {
+            "records": records,
+            "urls": urls,
+            "payloads": payloads,
+            "payload_bytes": payload_bytes,
+            "segments": len(segments),
+            "segment_bytes": disk,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
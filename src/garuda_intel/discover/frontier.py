@@ -1,5 +1,7 @@
 import heapq
-from typing import List, Tuple
+import logging
+import uuid
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 
 class Frontier:
@@ -20,3 +22,150 @@ class Frontier:
 
     def __len__(self):
         return len(self.heap)
+
+
+class DurableFrontier(Frontier):
+    """
+    Frontier persisted to the store's frontier table, with the in-memory heap
+    acting as a write-back cache.
+
+    Pushes land in the heap and a write buffer that is flushed in batches.
+    URLs are marked ``done``/``skipped`` by the explorer once handled, so a
+    crawl restarted with the same session key reloads the still-queued URLs
+    and the visited set instead of starting again from seeds. When the heap
+    grows beyond ``max_in_memory`` the lowest-priority half is evicted (it
+    stays queued in the table) and refilled by leasing rows when the heap
+    runs dry.
+
+    A frontier is the only consumer of its session, so leases left behind
+    by a crashed run are released on open rather than waiting for them to
+    expire.
+    """
+
+    def __init__(
+        self,
+        store,
+        session_key: str,
+        normalize: Optional[Callable[[str], str]] = None,
+        params: Optional[Dict] = None,
+        flush_every: int = 200,
+        max_in_memory: int = 10000,
+        lease_seconds: int = 600,
+    ):
+        super().__init__()
+        self.store = store
+        self.session_key = session_key
+        self.normalize = normalize or (lambda u: u)
+        self.flush_every = flush_every
+        self.max_in_memory = max_in_memory
+        self.lease_seconds = lease_seconds
+        self.owner = uuid.uuid4().hex
+        self.logger = logging.getLogger(__name__)
+
+        self._pending_push: List[Dict] = []
+        self._pending_state: Dict[str, List[str]] = {}
+        self._db_has_more = False
+
+        session = store.open_crawl_session(session_key, params)
+        if session is None:
+            raise ValueError("Store does not support durable crawl frontiers")
+        self.session_id: str = session["id"]
+        self.checkpoint_state: Dict = session
+        self.resumed = False
+
+        visited = store.frontier_urls_in_state(self.session_id, ["done", "skipped"])
+        self.visited: Set[str] = set(visited)
+        released = store.frontier_release_leases(self.session_id)
+        if released:
+            self.logger.info(f"Frontier reclaimed {released} URLs leased by an earlier run")
+        self._refill()
+        self.resumed = bool(visited) or bool(self.heap)
+
+    def push(self, score: float, depth: int, url: str, text: str):
+        super().push(score, depth, url, text)
+        self._pending_push.append({
+            "url": url,
+            "url_norm": self.normalize(url),
+            "score": score,
+            "depth": depth,
+            "link_text": text,
+        })
+        if len(self._pending_push) >= self.flush_every:
+            self.flush()
+        if len(self.heap) > self.max_in_memory:
+            self._evict()
+
+    def pop(self):
+        if not self.heap and self._db_has_more:
+            self.flush()
+            self._refill()
+        return super().pop()
+
+    def __len__(self):
+        if self.heap or not self._db_has_more:
+            return len(self.heap)
+        # Count evicted rows in the store without leasing them (pop()
+        # refills); rows marked since the last flush are no longer queued
+        marked = [norm for norms in self._pending_state.values() for norm in norms]
+        return self.store.frontier_count_in_state(self.session_id, ["queued"], exclude=marked)
+
+    def mark_done(self, url: str):
+        self._mark(url, "done")
+
+    def mark_skipped(self, url: str):
+        self._mark(url, "skipped")
+
+    def flush(self):
+        """Write buffered pushes and state changes to the store."""
+        if self._pending_push:
+            self.store.frontier_push_batch(self.session_id, self._pending_push)
+            self._pending_push = []
+        for state, norms in self._pending_state.items():
+            self.store.frontier_set_state(self.session_id, norms, state)
+        self._pending_state = {}
+
+    def checkpoint(
+        self,
+        pages_explored: int,
+        domain_counts: Dict[str, int],
+        stats: Optional[Dict] = None,
+        status: str = "running",
+    ):
+        """Flush the write buffer and persist the explorer counters."""
+        self.flush()
+        self.store.save_crawl_checkpoint(
+            self.session_id, pages_explored, domain_counts, stats, status
+        )
+
+    def _mark(self, url: str, state: str):
+        norm = self.normalize(url)
+        self.visited.add(norm)
+        self._pending_state.setdefault(state, []).append(norm)
+
+    def _evict(self):
+        self.flush()
+        keep = heapq.nsmallest(self.max_in_memory // 2, self.heap)
+        evicted = len(self.heap) - len(keep)
+        self.heap = keep
+        heapq.heapify(self.heap)
+        self._db_has_more = True
+        self.logger.debug(f"Frontier evicted {evicted} low-priority URLs to the store")
+
+    def _refill(self):
+        limit = max(1, self.max_in_memory // 2)
+        rows = self.store.frontier_lease_batch(
+            self.session_id,
+            limit,
+            self.owner,
+            self.lease_seconds,
+        )
+        # Evicted rows are still queued in the store; drop any the heap
+        # already holds so they are not popped twice
+        in_heap = {self.normalize(url) for _, _, url, _ in self.heap}
+        for r in rows:
+            if r["url_norm"] in self.visited or r["url_norm"] in in_heap:
+                continue
+            heapq.heappush(
+                self.heap, (-r["score"], r["depth"], r["url"], r.get("link_text") or "")
+            )
+        self._db_has_more = len(rows) >= limit
@@ -0,0 +1,168 @@
+"""
+Marginal information gain per crawled page.
+
+Each processed page is scored by what it adds to the crawl session: entities
+not seen before, fields filled for the first time (weighted higher when they
+close a known gap), and new relationships. When the recent gain of the whole
+crawl drops below a threshold the crawl can stop early; when only one seed's
+subtree stops paying off, its remaining URLs are skipped so the page budget
+goes to the other seeds.
+"""
+
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, List, Optional
+
+# Relative value of each kind of novelty
+DEFAULT_GAIN_WEIGHTS = {
+    "entity": 1.0,
+    "field": 0.5,
+    "gap_field": 2.0,
+    "relationship": 1.0,
+}
+
+# Sections of a finding that are lists of records rather than key/value fields
+LIST_SECTIONS = ("persons", "locations", "financials", "products", "events")
+
+
+def _norm(value: Any) -> str:
+    return " ".join(str(value or "").casefold().split())
+
+
+class InformationGainTracker:
+    def __init__(
+        self,
+        min_gain: float = 1.0,
+        window: int = 5,
+        min_pages: int = 5,
+        seed_window: int = 3,
+        gap_fields: Optional[Iterable[str]] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            min_gain: Mean gain per page below which the crawl (or a seed) is exhausted
+            window: Recent pages averaged for the crawl-wide decision
+            min_pages: Pages processed before the crawl may stop
+            seed_window: Recent pages of one seed averaged for the per-seed decision
+            gap_fields: Fields the crawl is meant to fill (e.g. gap-analysis output)
+            weights: Overrides for ``DEFAULT_GAIN_WEIGHTS``
+        """
+        self.min_gain = min_gain
+        self.window = max(1, window)
+        self.min_pages = max(self.window, min_pages)
+        self.seed_window = max(1, seed_window)
+        self.gap_fields = {_norm(f) for f in gap_fields or [] if f}
+        self.weights = {**DEFAULT_GAIN_WEIGHTS, **(weights or {})}
+        self.reset()
+
+    def reset(self) -> None:
+        self._entities: set = set()
+        self._fields: set = set()
+        self._relationships: set = set()
+        self._recent: deque = deque(maxlen=self.window)
+        self._seed_recent: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.seed_window))
+        self.stats = {
+            "gain_pages": 0,
+            "gain_new_entities": 0,
+            "gain_new_fields": 0,
+            "gain_gap_fields_filled": 0,
+            "gain_new_relationships": 0,
+            "gain_total": 0.0,
+        }
+
+    @property
+    def gap_fields_remaining(self) -> List[str]:
+        return sorted(self.gap_fields - self._fields)
+
+    def observe(self, page_record: Dict, seed: Optional[str] = None) -> float:
+        """Record one processed page; returns its weighted gain."""
+        new_entities = 0
+        for entity in page_record.get("extracted") or []:
+            if not isinstance(entity, dict) or not entity.get("name"):
+                continue
+            key = (_norm(entity["name"]), _norm(entity.get("kind")))
+            if key not in self._entities:
+                self._entities.add(key)
+                new_entities += 1
+
+        new_fields = gap_filled = new_relationships = 0
+        for finding in page_record.get("extracted_intel") or []:
+            if not isinstance(finding, dict):
+                continue
+            for field in self._fields_of(finding):
+                if field in self._fields:
+                    continue
+                self._fields.add(field)
+                if field in self.gap_fields:
+                    gap_filled += 1
+                else:
+                    new_fields += 1
+            for rel in finding.get("relationships") or []:
+                if not isinstance(rel, dict):
+                    continue
+                key = (
+                    _norm(rel.get("source")),
+                    _norm(rel.get("relation_type") or "related"),
+                    _norm(rel.get("target")),
+                )
+                if key[0] and key[2] and key not in self._relationships:
+                    self._relationships.add(key)
+                    new_relationships += 1
+
+        gain = (
+            new_entities * self.weights["entity"]
+            + new_fields * self.weights["field"]
+            + gap_filled * self.weights["gap_field"]
+            + new_relationships * self.weights["relationship"]
+        )
+        self._recent.append(gain)
+        if seed:
+            self._seed_recent[seed].append(gain)
+        self.stats["gain_pages"] += 1
+        self.stats["gain_new_entities"] += new_entities
+        self.stats["gain_new_fields"] += new_fields
+        self.stats["gain_gap_fields_filled"] += gap_filled
+        self.stats["gain_new_relationships"] += new_relationships
+        self.stats["gain_total"] += gain
+        return gain
+
+    def _fields_of(self, finding: Dict) -> Iterable[str]:
+        """Names of fields a finding fills: basic_info keys and non-empty list sections."""
+        basic_info = finding.get("basic_info") or {}
+        if isinstance(basic_info, dict):
+            for key, value in basic_info.items():
+                if value and key not in ("official_name", "additional_attributes"):
+                    yield _norm(key)
+            for key, value in (basic_info.get("additional_attributes") or {}).items():
+                if value:
+                    yield _norm(key)
+        for section in LIST_SECTIONS:
+            if finding.get(section):
+                yield section
+
+    def recent_gain(self) -> float:
+        return sum(self._recent) / len(self._recent) if self._recent else 0.0
+
+    def should_stop(self) -> bool:
+        """True once the crawl's recent mean gain falls below ``min_gain``."""
+        if self.gap_fields and not self.gap_fields_remaining:
+            return True  # Every targeted gap is filled
+        return (
+            self.stats["gain_pages"] >= self.min_pages
+            and len(self._recent) == self.window
+            and self.recent_gain() < self.min_gain
+        )
+
+    def seed_exhausted(self, seed: Optional[str]) -> bool:
+        """True when *seed*'s last ``seed_window`` pages gained too little."""
+        recent = self._seed_recent.get(seed) if seed else None
+        if not recent or len(recent) < self.seed_window:
+            return False
+        return sum(recent) / len(recent) < self.min_gain
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "gain_recent": self.recent_gain(),
+            "gain_gap_fields_remaining": len(self.gap_fields_remaining),
+        }
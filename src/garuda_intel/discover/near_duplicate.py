@@ -0,0 +1,203 @@
+"""
+Near-duplicate page detection using SimHash fingerprints.
+
+Syndicated articles, mirror sites, print versions and URL-parameter variants
+produce pages whose cleaned text is almost identical. Running the full LLM
+pipeline on each copy wastes extraction, reflection, summarization and
+embedding calls. This module computes a 64-bit SimHash over word shingles of
+the cleaned page text right after fetch and compares it against pages seen
+earlier (in this crawl and, when a store is available, in the database).
+
+Candidate lookup uses the pigeonhole principle: the fingerprint is split into
+``NUM_BANDS`` 16-bit bands, and any two fingerprints within
+``NUM_BANDS - 1`` bits of each other must share at least one band exactly.
+Bands are indexed columns, so the database lookup is an indexed equality
+query followed by an exact Hamming distance check in Python.
+"""
+
+import hashlib
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from ..database.store import PersistenceStore
+
+SIMHASH_BITS = 64
+NUM_BANDS = 4
+BAND_BITS = SIMHASH_BITS // NUM_BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+# Default maximum Hamming distance for two pages to be considered
+# near-duplicates (3 of 64 bits is roughly >95% shingle overlap).
+DEFAULT_MAX_DISTANCE = 3
+# Number of consecutive words per shingle
+DEFAULT_SHINGLE_SIZE = 4
+# Pages with fewer words than this are not fingerprinted (too noisy)
+MIN_WORDS_FOR_FINGERPRINT = 30
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _shingles(text: str, size: int) -> List[str]:
+    words = _WORD_RE.findall((text or "").lower())
+    if len(words) < size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str, shingle_size: int = DEFAULT_SHINGLE_SIZE) -> Optional[int]:
+    """
+    Compute a 64-bit SimHash fingerprint of *text*.
+
+    Returns None when the text is too short to produce a stable fingerprint.
+    """
+    if len(_WORD_RE.findall(text or "")) < MIN_WORDS_FOR_FINGERPRINT:
+        return None
+
+    # Count shingle multiplicity once, then fold weighted hashes into bit votes
+    counts: Dict[int, int] = defaultdict(int)
+    for shingle in _shingles(text, shingle_size):
+        counts[_hash64(shingle)] += 1
+
+    votes = [0] * SIMHASH_BITS
+    for h, weight in counts.items():
+        for bit in range(SIMHASH_BITS):
+            if (h >> bit) & 1:
+                votes[bit] += weight
+            else:
+                votes[bit] -= weight
+
+    fingerprint = 0
+    for bit, vote in enumerate(votes):
+        if vote > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return bin(a ^ b).count("1")
+
+
+def simhash_bands(fingerprint: int) -> List[int]:
+    """Split a fingerprint into ``NUM_BANDS`` integer bands for indexed lookup."""
+    return [(fingerprint >> (i * BAND_BITS)) & BAND_MASK for i in range(NUM_BANDS)]
+
+
+def simhash_to_hex(fingerprint: int) -> str:
+    return f"{fingerprint:016x}"
+
+
+def simhash_from_hex(value: str) -> int:
+    return int(value, 16)
+
+
+@dataclass
+class DuplicateMatch:
+    """A previously seen page that a new page duplicates."""
+
+    url: str
+    page_id: Optional[str]
+    distance: int
+
+
+class NearDuplicateDetector:
+    """
+    Detects near-duplicate pages by SimHash.
+
+    Keeps an in-memory band index of pages fingerprinted during this process
+    and falls back to the store's indexed ``page_simhashes`` table so that
+    duplicates of pages from earlier crawls are also caught.
+    """
+
+    def __init__(
+        self,
+        store: Optional[PersistenceStore] = None,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    ):
+        if max_distance >= NUM_BANDS:
+            raise ValueError(f"max_distance must be < {NUM_BANDS} for band-based candidate lookup")
+        self.store = store
+        self.max_distance = max_distance
+        self.shingle_size = shingle_size
+        self.logger = logging.getLogger(__name__)
+        self._band_index: Dict[Tuple[int, int], List[Tuple[int, str, Optional[str]]]] = defaultdict(
+            list
+        )
+
+    def fingerprint(self, text: str) -> Optional[int]:
+        return simhash(text, self.shingle_size)
+
+    def find_duplicate(self, fingerprint: Optional[int], url: str) -> Optional[DuplicateMatch]:
+        """
+        Return the closest previously seen page within ``max_distance`` bits,
+        ignoring entries for *url* itself (re-fetches are not duplicates).
+        """
+        if fingerprint is None:
+            return None
+
+        best: Optional[DuplicateMatch] = None
+        for candidate_fp, cand_url, cand_page_id in self._memory_candidates(fingerprint):
+            if cand_url == url:
+                continue
+            distance = hamming_distance(fingerprint, candidate_fp)
+            if distance <= self.max_distance and (best is None or distance < best.distance):
+                best = DuplicateMatch(url=cand_url, page_id=cand_page_id, distance=distance)
+
+        if best is None and self.store:
+            try:
+                rows = self.store.find_simhash_candidates(simhash_bands(fingerprint), url=url)
+            except Exception as e:
+                self.logger.debug(f"SimHash candidate lookup failed: {e}")
+                rows = []
+            for row in rows:
+                distance = hamming_distance(fingerprint, simhash_from_hex(row["simhash"]))
+                if distance <= self.max_distance and (best is None or distance < best.distance):
+                    best = DuplicateMatch(
+                        url=row["url"], page_id=row.get("page_id"), distance=distance
+                    )
+        return best
+
+    def register(
+        self,
+        fingerprint: Optional[int],
+        url: str,
+        page_id: Optional[str] = None,
+        canonical: Optional[DuplicateMatch] = None,
+    ) -> None:
+        """
+        Record a fingerprint. Canonical pages join the in-memory index;
+        duplicates are only persisted (with a link to their canonical page).
+        """
+        if fingerprint is None:
+            return
+        if canonical is None:
+            for band_no, band in enumerate(simhash_bands(fingerprint)):
+                self._band_index[(band_no, band)].append((fingerprint, url, page_id))
+        if self.store and page_id:
+            try:
+                self.store.save_page_simhash(
+                    page_id=page_id,
+                    url=url,
+                    simhash=simhash_to_hex(fingerprint),
+                    bands=simhash_bands(fingerprint),
+                    canonical_page_id=canonical.page_id if canonical else None,
+                    distance=canonical.distance if canonical else None,
+                )
+            except Exception as e:
+                self.logger.debug(f"Failed to persist SimHash for {url}: {e}")
+
+    def _memory_candidates(self, fingerprint: int):
+        seen = set()
+        for band_no, band in enumerate(simhash_bands(fingerprint)):
+            for entry in self._band_index.get((band_no, band), ()):
+                if entry[1] not in seen:
+                    seen.add(entry[1])
+                    yield entry
@@ -0,0 +1,413 @@
+"""
+Per-host politeness scheduling for the crawl frontier.
+
+The ``Frontier`` orders URLs purely by score, so a fetch batch can easily
+contain many URLs from the same host. ``PolitenessScheduler`` sits between
+the frontier and the fetcher:
+
+- URLs are held in per-host priority queues and dispatched round-robin,
+  at most one URL per host per batch.
+- Each host has a next-allowed fetch time derived from the robots.txt
+  ``Crawl-delay``, a minimum delay and the observed response latency.
+- HTTP 429/503 responses trigger exponential backoff (honouring
+  ``Retry-After``) and a bounded number of re-queues.
+- robots.txt is fetched on a background thread when a host is first
+  queued; the host is not dispatched until its rules arrive, and URLs they
+  disallow are dropped at dispatch (see ``take_blocked``).
+
+``RobotsCache`` fetches and caches robots.txt per host with a TTL.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+THROTTLE_STATUS_CODES = {429, 503}
+# How often a host waiting for its robots.txt is checked again
+ROBOTS_POLL_SECONDS = 0.05
+
+
+def host_key(url: str) -> str:
+    """Scheduling key for a URL (scheme-less, lowercase netloc)."""
+    try:
+        return urlparse(url).netloc.lower()
+    except Exception:
+        return ""
+
+
+class RobotsCache:
+    """
+    Thread-safe robots.txt cache with TTL.
+
+    Missing or unreachable robots.txt files are treated as allow-all, matching
+    common crawler behaviour; the negative result is cached too so a dead host
+    is not probed for every URL.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = "*",
+        ttl_seconds: int = 86400,
+        timeout: float = 5.0,
+        fetch_workers: int = 4,
+    ):
+        self.user_agent = user_agent
+        self.ttl_seconds = ttl_seconds
+        self.timeout = timeout
+        self.fetch_workers = fetch_workers
+        self.logger = logging.getLogger(__name__)
+        self._entries: Dict[str, Tuple[Optional[RobotFileParser], float]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _fetch(self, scheme: str, netloc: str) -> Optional[RobotFileParser]:
+        robots_url = f"{scheme}://{netloc}/robots.txt"
+        try:
+            r = requests.get(
+                robots_url, timeout=self.timeout, headers={"User-Agent": "Mozilla/5.0"}
+            )
+        except Exception as e:
+            self.logger.debug(f"robots.txt fetch failed for {netloc}: {e}")
+            return None
+        if r.status_code != 200:
+            # 4xx/5xx: no usable rules
+            return None
+        parser = RobotFileParser()
+        parser.parse(r.text.splitlines())
+        return parser
+
+    def _get(self, url: str) -> Optional[RobotFileParser]:
+        parsed = urlparse(url)
+        netloc = parsed.netloc.lower()
+        if not netloc:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(netloc)
+            if entry and entry[1] > now:
+                return entry[0]
+        parser = self._fetch(parsed.scheme or "https", netloc)
+        with self._lock:
+            self._entries[netloc] = (parser, now + self.ttl_seconds)
+        return parser
+
+    def _load(self, scheme: str, netloc: str) -> None:
+        try:
+            parser = self._fetch(scheme, netloc)
+        finally:
+            with self._lock:
+                self._inflight.pop(netloc, None)
+        with self._lock:
+            self._entries[netloc] = (parser, time.time() + self.ttl_seconds)
+
+    def prefetch(self, url: str) -> bool:
+        """
+        True if the robots.txt of *url*'s host is cached. Otherwise starts
+        fetching it on a background thread and returns False without waiting.
+        """
+        parsed = urlparse(url)
+        netloc = parsed.netloc.lower()
+        if not netloc:
+            return True
+        with self._lock:
+            entry = self._entries.get(netloc)
+            if entry and entry[1] > time.time():
+                return True
+            if netloc not in self._inflight:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.fetch_workers, thread_name_prefix="robots"
+                    )
+                self._inflight[netloc] = self._pool.submit(
+                    self._load, parsed.scheme or "https", netloc
+                )
+        return False
+
+    def close(self) -> None:
+        """Stop the background fetch threads; a later ``prefetch`` starts new ones."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            # Cancelled loads never clear their entry
+            self._inflight.clear()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def can_fetch(self, url: str) -> bool:
+        parser = self._get(url)
+        if parser is None:
+            return True
+        try:
+            return parser.can_fetch(self.user_agent, url)
+        except Exception:
+            return True
+
+    def crawl_delay(self, url: str) -> Optional[float]:
+        parser = self._get(url)
+        if parser is None:
+            return None
+        try:
+            delay = parser.crawl_delay(self.user_agent)
+        except Exception:
+            return None
+        return float(delay) if delay is not None else None
+
+    def set_rules(self, netloc: str, robots_txt: str) -> None:
+        """Seed the cache with known rules (used by tests and replay)."""
+        parser = RobotFileParser()
+        parser.parse(robots_txt.splitlines())
+        with self._lock:
+            self._entries[netloc.lower()] = (parser, time.time() + self.ttl_seconds)
+
+
+@dataclass
+class HostState:
+    """Rate-limit bookkeeping for a single host."""
+
+    next_allowed: float = 0.0
+    delay: float = 0.0
+    latency_ema: Optional[float] = None
+    consecutive_throttles: int = 0
+    robots_ready: bool = True
+    queue: List[Tuple[float, int, int, str, str]] = field(default_factory=list)
+
+
+class PolitenessScheduler:
+    """
+    Per-host round-robin scheduler with crawl-delay, latency-based rate
+    limits and 429/503 backoff.
+
+    Items are ``(score, depth, url, link_text)`` tuples, the same shape
+    ``Frontier.pop`` returns.
+    """
+
+    def __init__(
+        self,
+        robots: Optional[RobotsCache] = None,
+        min_delay: float = 0.5,
+        max_delay: float = 30.0,
+        latency_factor: float = 1.0,
+        backoff_base: float = 5.0,
+        max_backoff: float = 120.0,
+        max_retries: int = 2,
+    ):
+        self.robots = robots
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.latency_factor = latency_factor
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.max_retries = max_retries
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop queued URLs and per-crawl counters (robots cache is kept)."""
+        with self._lock:
+            self._hosts: Dict[str, HostState] = {}
+            self._rr: List[str] = []
+            self._rr_pos = 0
+            self._attempts: Dict[str, int] = {}
+            self._throttled: set = set()
+            self._blocked: List[str] = []
+            self.stats = {"robots_blocked": 0, "throttled": 0, "retried": 0, "dropped": 0}
+
+    def close(self) -> None:
+        """Release the robots cache's fetch threads (cached rules are kept)."""
+        if self.robots is not None:
+            self.robots.close()
+
+    # -- Admission ----------------------------------------------------------
+
+    def allowed(self, url: str) -> bool:
+        """
+        Blocking robots.txt check; blocked URLs are counted in ``stats``.
+        URLs passed to ``add`` are checked at dispatch instead.
+        """
+        if self.robots is None or self.robots.can_fetch(url):
+            return True
+        with self._lock:
+            self.stats["robots_blocked"] += 1
+        return False
+
+    def add(self, score: float, depth: int, url: str, link_text: str = "") -> None:
+        host = host_key(url)
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = HostState(delay=self.min_delay, robots_ready=self.robots is None)
+                self._hosts[host] = state
+                self._rr.append(host)
+            self._check_robots(state, url)
+            heapq.heappush(state.queue, (-score, depth, next(self._counter), url, link_text))
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(len(s.queue) for s in self._hosts.values())
+
+    # -- Dispatch -----------------------------------------------------------
+
+    def next_batch(
+        self, max_items: int, now: Optional[float] = None
+    ) -> List[Tuple[float, int, str, str]]:
+        """
+        Pop up to *max_items* URLs, at most one per host, from hosts whose
+        rate limit allows a fetch now and whose robots.txt has been fetched.
+        Hosts are visited round-robin; URLs robots.txt disallows are dropped.
+        """
+        now = time.monotonic() if now is None else now
+        batch = []
+        with self._lock:
+            n = len(self._rr)
+            for i in range(n):
+                if len(batch) >= max_items:
+                    break
+                host = self._rr[(self._rr_pos + i) % n]
+                state = self._hosts[host]
+                if not state.queue or state.next_allowed > now:
+                    continue
+                if not self._check_robots(state, state.queue[0][3]):
+                    continue
+                item = self._pop_allowed(state)
+                if item is None:
+                    continue
+                state.next_allowed = now + state.delay
+                batch.append(item)
+            if n:
+                self._rr_pos = (self._rr_pos + 1) % n
+        return batch
+
+    def seconds_until_ready(self, now: Optional[float] = None) -> Optional[float]:
+        """Time until some host with queued URLs may be fetched, or None if idle."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            waits = [
+                max(0.0 if s.robots_ready else ROBOTS_POLL_SECONDS, s.next_allowed - now)
+                for s in self._hosts.values()
+                if s.queue
+            ]
+        return min(waits) if waits else None
+
+    def take_blocked(self) -> List[str]:
+        """URLs dropped at dispatch because robots.txt disallows them, since the last call."""
+        with self._lock:
+            blocked, self._blocked = self._blocked, []
+        return blocked
+
+    def _check_robots(self, state: HostState, url: str) -> bool:
+        """Whether the host's robots.txt is in; applies its Crawl-delay when it arrives."""
+        if not state.robots_ready and self.robots.prefetch(url):
+            state.robots_ready = True
+            state.delay = self._host_delay(state, url)
+        return state.robots_ready
+
+    def _pop_allowed(self, state: HostState) -> Optional[Tuple[float, int, str, str]]:
+        while state.queue:
+            neg_score, depth, _, url, text = heapq.heappop(state.queue)
+            if self.robots is None or self.robots.can_fetch(url):
+                return (-neg_score, depth, url, text)
+            self.stats["robots_blocked"] += 1
+            self._blocked.append(url)
+        return None
+
+    # -- Feedback -----------------------------------------------------------
+
+    def record_response(
+        self,
+        url: str,
+        status_code: Optional[int],
+        latency: Optional[float] = None,
+        retry_after: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """Adapt the host's delay from latency and status; back off on 429/503."""
+        now = time.monotonic() if now is None else now
+        host = host_key(url)
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = HostState(delay=self.min_delay, robots_ready=self.robots is None)
+                self._hosts[host] = state
+                self._rr.append(host)
+
+            if latency is not None:
+                state.latency_ema = (
+                    latency
+                    if state.latency_ema is None
+                    else 0.7 * state.latency_ema + 0.3 * latency
+                )
+                state.delay = self._host_delay(state, url)
+
+            if status_code in THROTTLE_STATUS_CODES:
+                state.consecutive_throttles += 1
+                backoff = _parse_retry_after(retry_after)
+                if backoff is None:
+                    backoff = self.backoff_base * (2 ** (state.consecutive_throttles - 1))
+                backoff = min(self.max_backoff, backoff)
+                state.next_allowed = max(state.next_allowed, now + backoff)
+                self._throttled.add(url)
+                self.stats["throttled"] += 1
+                self.logger.info(
+                    f"Host {host} throttled ({status_code}); backing off {backoff:.1f}s"
+                )
+            elif status_code is not None:
+                state.consecutive_throttles = 0
+
+    def requeue_if_throttled(self, score: float, depth: int, url: str, link_text: str = "") -> bool:
+        """Re-queue a throttled URL unless it has used up its retries."""
+        with self._lock:
+            if url not in self._throttled:
+                return False
+            self._throttled.discard(url)
+            attempts = self._attempts.get(url, 0) + 1
+            self._attempts[url] = attempts
+            if attempts > self.max_retries:
+                self.stats["dropped"] += 1
+                return False
+            self.stats["retried"] += 1
+        self.add(score, depth, url, link_text)
+        return True
+
+    def _host_delay(self, state: HostState, url: str) -> float:
+        """Delay recomputed from its inputs, so it falls again once latency recovers."""
+        # Before robots.txt is in, consulting it would block on the fetch
+        delay = self._base_delay(url) if state.robots_ready else self.min_delay
+        if state.latency_ema is not None:
+            delay = max(delay, state.latency_ema * self.latency_factor)
+        return min(self.max_delay, delay)
+
+    def _base_delay(self, url: str) -> float:
+        delay = self.min_delay
+        if self.robots is not None:
+            crawl_delay = self.robots.crawl_delay(url)
+            if crawl_delay:
+                delay = max(delay, min(crawl_delay, self.max_delay))
+        return delay
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        from datetime import datetime, timezone
+
+        when = parsedate_to_datetime(value)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except Exception:
+        return None
@@ -0,0 +1,223 @@
+"""
+Visited-URL tracking with a Bloom filter tier.
+
+``SeenUrlSet`` is a drop-in for the explorer's ``visited_urls`` set. URLs are
+canonicalized and reduced to 64-bit fingerprints. Membership checks go to a
+Bloom filter first; only positive hits consult the exact tier, which is
+
+- an in-memory set of fingerprints (default), or
+- the store's ``seen_urls`` table when a *store* and *scope* are given, in
+  which case the Bloom filter bits are persisted too and the set survives
+  restarts with a small, fixed memory footprint.
+
+``memory_report()`` gives bytes per URL and projected bytes per million URLs.
+"""
+
+import hashlib
+import logging
+import math
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .url_canonical import canonicalize_url
+
+
+def url_fingerprint(canonical_url: str) -> int:
+    """Signed 64-bit fingerprint of a canonical URL (fits a BIGINT column)."""
+    digest = hashlib.blake2b(canonical_url.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over one blake2b digest."""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and 0 < error_rate < 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = self.optimal_bits(capacity, error_rate)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    @staticmethod
+    def optimal_bits(capacity: int, error_rate: float) -> int:
+        return max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+
+    @classmethod
+    def bytes_for(cls, capacity: int, error_rate: float = 0.01) -> int:
+        return (cls.optimal_bits(capacity, error_rate) + 7) // 8
+
+    def _positions(self, fingerprint: int):
+        digest = hashlib.blake2b(
+            fingerprint.to_bytes(8, "big", signed=True), digest_size=16
+        ).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, fingerprint: int) -> None:
+        for pos in self._positions(fingerprint):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, fingerprint: int) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fingerprint))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+    def to_state(self) -> Dict:
+        return {
+            "num_bits": self.num_bits,
+            "num_hashes": self.num_hashes,
+            "item_count": self.count,
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "bits": bytes(self.bits),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "BloomFilter":
+        bf = cls.__new__(cls)
+        bf.capacity = state.get("capacity") or 1
+        bf.error_rate = state.get("error_rate") or 0.01
+        bf.num_bits = state["num_bits"]
+        bf.num_hashes = state["num_hashes"]
+        bf.bits = bytearray(state["bits"])
+        bf.count = state.get("item_count") or 0
+        return bf
+
+
+class SeenUrlSet:
+    """
+    Set-like visited-URL tracker: ``url in seen``, ``seen.add(url)``,
+    ``seen.update(urls)``, ``len(seen)``, plus ``contains_many(urls)`` for
+    batched checks.
+    """
+
+    def __init__(
+        self,
+        store=None,
+        scope: Optional[str] = None,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.01,
+        flush_every: int = 500,
+    ):
+        self.store = store if scope else None
+        self.scope = scope
+        self.flush_every = flush_every
+        self.logger = logging.getLogger(__name__)
+        self._exact: set = set()
+        self._pending: List[Tuple[int, str]] = []
+        self.stats = {"bloom_negatives": 0, "bloom_positives": 0, "false_positives": 0}
+
+        self.bloom = None
+        if self.store is not None:
+            state = self.store.load_url_filter(self.scope)
+            if state:
+                self.bloom = BloomFilter.from_state(state)
+        if self.bloom is None:
+            self.bloom = BloomFilter(capacity, error_rate)
+
+    def __contains__(self, url: str) -> bool:
+        return self._contains_fp(url_fingerprint(canonicalize_url(url)))
+
+    def _contains_fp(self, fp: int) -> bool:
+        if fp not in self.bloom:
+            self.stats["bloom_negatives"] += 1
+            return False
+        self.stats["bloom_positives"] += 1
+        if self.store is None:
+            hit = fp in self._exact
+        else:
+            hit = fp in self._exact or bool(self.store.seen_urls_exist(self.scope, [fp]))
+        if not hit:
+            self.stats["false_positives"] += 1
+        return hit
+
+    def contains_many(self, urls: Iterable[str]) -> List[bool]:
+        """
+        Membership of each URL in *urls*, e.g. a page's links. Bloom hits
+        missing from memory are confirmed with one store query for the batch
+        instead of one per URL.
+        """
+        fps = [url_fingerprint(canonicalize_url(url)) for url in urls]
+        positives = [fp in self.bloom for fp in fps]
+        confirmed: set = set()
+        if self.store is not None:
+            unconfirmed = {
+                fp for fp, positive in zip(fps, positives) if positive and fp not in self._exact
+            }
+            if unconfirmed:
+                confirmed = set(self.store.seen_urls_exist(self.scope, list(unconfirmed)))
+        result = []
+        for fp, positive in zip(fps, positives):
+            if not positive:
+                self.stats["bloom_negatives"] += 1
+                result.append(False)
+                continue
+            self.stats["bloom_positives"] += 1
+            hit = fp in self._exact or fp in confirmed
+            if not hit:
+                self.stats["false_positives"] += 1
+            result.append(hit)
+        return result
+
+    def add(self, url: str) -> None:
+        canonical = canonicalize_url(url)
+        fp = url_fingerprint(canonical)
+        if fp in self._exact or (self.store is not None and self._contains_fp(fp)):
+            return
+        self.bloom.add(fp)
+        self._exact.add(fp)
+        if self.store is not None:
+            self._pending.append((fp, canonical))
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+
+    def update(self, urls: Iterable[str]) -> None:
+        for url in urls:
+            self.add(url)
+
+    def __len__(self) -> int:
+        return self.bloom.count
+
+    def flush(self) -> None:
+        """Persist pending URLs and the filter bits (store-backed mode)."""
+        if self.store is None:
+            return
+        persisted = True
+        if self._pending:
+            persisted = self.store.save_seen_urls(self.scope, self._pending)
+            self._pending = []
+        if persisted:
+            self.store.save_url_filter(self.scope, self.bloom.to_state())
+            # Exact membership now lives in the table
+            self._exact.clear()
+        else:
+            # Store cannot hold seen URLs; keep the in-memory exact tier
+            self.store = None
+
+    def memory_report(self) -> Dict[str, float]:
+        """Current footprint and projected bytes per million URLs."""
+        items = max(len(self), 1)
+        # Fingerprint ints are 32 bytes each on CPython, plus the set table
+        exact_bytes = sys.getsizeof(self._exact) + 32 * len(self._exact)
+        bloom_per_million = BloomFilter.bytes_for(1_000_000, self.bloom.error_rate)
+        if self.store is not None:
+            exact_per_million = 0
+        elif self._exact:
+            exact_per_million = exact_bytes / len(self._exact) * 1_000_000
+        else:
+            exact_per_million = sys.getsizeof(set(range(1024))) / 1024 * 1_000_000 + 32 * 1_000_000
+        return {
+            "items": len(self),
+            "bloom_bytes": self.bloom.memory_bytes,
+            "exact_bytes": exact_bytes,
+            "bytes_per_url": (self.bloom.memory_bytes + exact_bytes) / items,
+            "bytes_per_million": int(bloom_per_million + exact_per_million),
+        }
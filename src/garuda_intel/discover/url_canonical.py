@@ -0,0 +1,127 @@
+"""
+URL canonicalization shared by the explorer, link persistence and seed
+discovery.
+
+Canonical form:
+- lowercase scheme and host, default ports (80/443) removed
+- dot segments resolved, ``;jsessionid=``-style path parameters removed
+- percent-escapes of unreserved characters decoded, others upper-cased
+- tracking parameters (``utm_*``, ``gclid``, ``fbclid``, ...) dropped and the
+  remaining query parameters sorted
+- fragment removed, trailing path slash stripped (matching the previous
+  ``_normalize_url`` form, so ``https://a.com/`` -> ``https://a.com``)
+"""
+
+import posixpath
+import re
+from typing import FrozenSet, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+TRACKING_PARAMS: FrozenSet[str] = frozenset(
+    {
+        "gclid",
+        "gclsrc",
+        "dclid",
+        "fbclid",
+        "msclkid",
+        "yclid",
+        "twclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "_hsenc",
+        "_hsmi",
+        "mkt_tok",
+        "ref_src",
+        "ref_url",
+        "spm",
+        "vero_id",
+        "oly_anon_id",
+        "oly_enc_id",
+        "wickedid",
+        "srsltid",
+        "si",
+    }
+)
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_", "matomo_")
+SESSION_PARAMS: FrozenSet[str] = frozenset(
+    {
+        "jsessionid",
+        "phpsessid",
+        "sid",
+        "sessionid",
+        "aspsessionid",
+        "cfid",
+        "cftoken",
+    }
+)
+
+_PATH_PARAM_RE = re.compile(r";(?:jsessionid|phpsessid|sessionid)=[^/?#]*", re.IGNORECASE)
+_PCT_RE = re.compile(r"%([0-9A-Fa-f]{2})")
+_UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+
+
+def _normalize_escapes(value: str) -> str:
+    def repl(m):
+        ch = chr(int(m.group(1), 16))
+        return ch if ch in _UNRESERVED else "%" + m.group(1).upper()
+
+    return _PCT_RE.sub(repl, value)
+
+
+def is_tracking_param(name: str, extra: Optional[Iterable[str]] = None) -> bool:
+    key = name.lower()
+    if key in TRACKING_PARAMS or key in SESSION_PARAMS:
+        return True
+    if key.startswith(TRACKING_PREFIXES):
+        return True
+    return bool(extra) and key in extra
+
+
+def canonicalize_url(url: str, extra_tracking_params: Optional[Iterable[str]] = None) -> str:
+    """Return the canonical form of *url*; unparseable input is returned stripped."""
+    if not url:
+        return url
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if not parts.scheme or not parts.netloc:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = f"[{host}]" if ":" in host else host
+    if parts.username:
+        userinfo = parts.username + (f":{parts.password}" if parts.password else "")
+        netloc = f"{userinfo}@{netloc}"
+    if port and DEFAULT_PORTS.get(scheme) != port:
+        netloc = f"{netloc}:{port}"
+
+    path = _PATH_PARAM_RE.sub("", parts.path)
+    path = _normalize_escapes(path)
+    if path:
+        path = posixpath.normpath(path)
+        if path.startswith("//"):
+            path = "/" + path.lstrip("/")
+        path = "" if path == "." else path.rstrip("/")
+
+    extra = {p.lower() for p in extra_tracking_params} if extra_tracking_params else None
+    params = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_tracking_param(k, extra)
+    ]
+    params.sort()
+    query = urlencode(params, doseq=True)
+
+    return urlunsplit((scheme, netloc, path, query, ""))
@@ -0,0 +1,483 @@
+"""
+Distributed crawling over a shared, database-backed frontier.
+
+``CrawlCoordinator`` seeds a crawl session and starts N worker processes.
+Each ``CrawlWorker`` wraps an ``IntelligentExplorer`` and repeatedly:
+
+1. leases a batch of frontier rows (time-limited, so a dead worker's URLs
+   become claimable again once the lease expires),
+2. claims per-domain and total page budgets with atomic conditional
+   increments in the store, so limits hold across processes and hosts,
+3. fetches the batch in parallel through the explorer's politeness
+   scheduler (per-host spacing and backoff within the worker) and runs the
+   intelligence pipeline,
+4. returns discovered links to the frontier in one batched push and marks
+   the batch done,
+5. writes its counters to a heartbeat row, which the coordinator merges into
+   the session stats.
+
+Workers only need the database URL and session key, so additional workers
+can be started on other hosts with ``run_worker`` against the same database.
+"""
+
+import logging
+import multiprocessing
+import os
+import socket
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Set
+
+from ..discover.frontier import Frontier
+from ..types.entity import EntityProfile, EntityType
+from .engine import IntelligentExplorer
+from .scorer import URLScorer
+
+TOTAL_BUDGET_KEY = "__total__"
+DOMAIN_BUDGET_PREFIX = "domain:"
+
+
+class CrawlWorker:
+    """
+    Runs one share of a crawl session using an explorer's fetch and
+    intelligence pipeline. The explorer's store must support the durable
+    frontier (``open_crawl_session`` et al.).
+    """
+
+    def __init__(
+        self,
+        explorer: IntelligentExplorer,
+        session_key: str,
+        worker_id: Optional[str] = None,
+        lease_size: Optional[int] = None,
+        lease_seconds: int = 300,
+        poll_interval: float = 0.5,
+    ):
+        if explorer.store is None:
+            raise ValueError("CrawlWorker requires an explorer with persistence")
+        self.explorer = explorer
+        self.store = explorer.store
+        self.session_key = session_key
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.lease_size = lease_size or explorer.max_fetch_workers
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._lost: Set[str] = set()
+        self.logger = logging.getLogger(__name__)
+
+        session = self.store.open_crawl_session(session_key)
+        if session is None:
+            raise ValueError("Store does not support durable crawl frontiers")
+        self.session_id = session["id"]
+
+    def run(self) -> Dict[str, Any]:
+        """Process leased batches until the frontier drains or the budget is spent."""
+        explorer = self.explorer
+        explorer.crawl_stats = explorer._new_crawl_stats()
+        stats = explorer.crawl_stats
+        stats.update({"batches": 0, "links_pushed": 0, "budget_skipped": 0, "lease_lost": 0})
+        if explorer.politeness_scheduler:
+            explorer.politeness_scheduler.reset()
+        status = "failed"
+        try:
+            while True:
+                rows = self.store.frontier_lease_batch(
+                    self.session_id, self.lease_size, self.worker_id, self.lease_seconds
+                )
+                if not rows:
+                    # Other workers may still push links from leased pages
+                    if self.store.frontier_counts(self.session_id).get("leased", 0) == 0:
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                batch, exhausted = self._admit(rows)
+                if batch:
+                    self._process(batch)
+                    stats["batches"] += 1
+                    self._heartbeat("running")
+                if exhausted:
+                    self.logger.info(f"Worker {self.worker_id}: total page budget spent")
+                    break
+            status = "completed"
+        finally:
+            try:
+                explorer.visited_urls.flush()
+            except Exception as e:
+                self.logger.warning(f"Visited-URL flush failed: {e}")
+            if explorer.crawl_learner:
+                explorer.crawl_learner.flush()
+            if explorer.politeness_scheduler:
+                explorer.politeness_scheduler.close()
+            self._heartbeat(status)
+        return dict(stats)
+
+    def _admit(self, rows: List[Dict]):
+        """Apply depth, robots and shared budget checks to leased rows."""
+        explorer = self.explorer
+        scheduler = explorer.politeness_scheduler
+        batch, skipped, requeue = [], [], []
+        exhausted = False
+        for r in rows:
+            url = r["url"]
+            if exhausted:
+                requeue.append(r["url_norm"])
+                continue
+            if r["depth"] > explorer.max_depth or (scheduler and not scheduler.allowed(url)):
+                skipped.append(r["url_norm"])
+                continue
+
+            domain_key = DOMAIN_BUDGET_PREFIX + explorer._get_domain_key(url)
+            if not self.store.claim_crawl_budget(
+                self.session_id, domain_key, explorer.max_pages_per_domain
+            ):
+                explorer.crawl_stats["budget_skipped"] += 1
+                skipped.append(r["url_norm"])
+                continue
+            if not self.store.claim_crawl_budget(
+                self.session_id, TOTAL_BUDGET_KEY, explorer.max_total_pages
+            ):
+                self.store.release_crawl_budget(self.session_id, domain_key)
+                requeue.append(r["url_norm"])
+                exhausted = True
+                continue
+            explorer.visited_urls.add(explorer._normalize_url(url))
+            batch.append(r)
+
+        self.store.frontier_set_state(self.session_id, skipped, "skipped", owner=self.worker_id)
+        # Left queued so a later run with a larger budget can continue
+        self.store.frontier_set_state(self.session_id, requeue, "queued", owner=self.worker_id)
+        return batch, exhausted
+
+    def _renew(self, rows: List[Dict]) -> List[Dict]:
+        """Extend the leases on *rows*; returns the rows this worker still holds."""
+        if not rows:
+            return []
+        held = set(
+            self.store.frontier_renew_leases(
+                self.session_id, [r["url_norm"] for r in rows], self.worker_id, self.lease_seconds
+            )
+        )
+        self._lose([r for r in rows if r["url_norm"] not in held])
+        return [r for r in rows if r["url_norm"] in held]
+
+    def _finish(self, row: Dict) -> bool:
+        """Mark *row* done if this worker still holds its lease."""
+        if self.store.frontier_set_state(
+            self.session_id, [row["url_norm"]], "done", owner=self.worker_id
+        ):
+            return True
+        self._lose([row])
+        return False
+
+    def _lose(self, rows: List[Dict]):
+        """
+        Drop rows whose lease expired and was taken over: the new holder
+        claims its own budget for them, so this worker's claims go back.
+        """
+        explorer = self.explorer
+        for r in rows:
+            self.logger.warning(f"Worker {self.worker_id}: lease lost for {r['url']}")
+            self.store.release_crawl_budget(
+                self.session_id, DOMAIN_BUDGET_PREFIX + explorer._get_domain_key(r["url"])
+            )
+            self.store.release_crawl_budget(self.session_id, TOTAL_BUDGET_KEY)
+            self._lost.add(r["url_norm"])
+            explorer.crawl_stats["lease_lost"] += 1
+
+    def _fetch(self, rows: List[Dict]) -> Dict[str, tuple]:
+        """Fetch *rows* in parallel; returns ``{url: (html, links, row)}``."""
+        explorer = self.explorer
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=min(len(rows), explorer.max_fetch_workers)) as pool:
+            futures = {
+                pool.submit(explorer._fetch_page_and_links, r["url"], r["depth"], None): r
+                for r in rows
+            }
+            for future in as_completed(futures):
+                r = futures[future]
+                try:
+                    html, links = future.result()
+                    if html:
+                        fetched[r["url"]] = (html, links, r)
+                except Exception as e:
+                    self.logger.warning(f"Fetch failed for {r['url']}: {e}")
+        return fetched
+
+    def _fetch_politely(self, batch: List[Dict]) -> Dict[str, tuple]:
+        """
+        Fetch a leased batch through the explorer's politeness scheduler:
+        at most one URL per host at a time, spaced by the host's delay, and
+        throttled (429/503) URLs retried after their backoff.
+        """
+        scheduler = self.explorer.politeness_scheduler
+        if scheduler is None:
+            return self._fetch(self._renew(batch))
+        rows = {r["url"]: r for r in batch}
+        for r in batch:
+            scheduler.add(r["score"], r["depth"], r["url"], r.get("link_text") or "")
+        fetched = {}
+        while scheduler.pending():
+            ready = scheduler.next_batch(self.explorer.max_fetch_workers)
+            if not ready:
+                wait = scheduler.seconds_until_ready()
+                if wait is None:
+                    break
+                time.sleep(min(wait, scheduler.max_delay))
+                continue
+            # Rows were checked against robots.txt when admitted
+            scheduler.take_blocked()
+            held = self._renew([rows[url] for _, _, url, _ in ready])
+            if not held:
+                continue
+            results = self._fetch(held)
+            fetched.update(results)
+            held_urls = {r["url"] for r in held}
+            for score, depth, url, text in ready:
+                if url in held_urls and url not in results:
+                    scheduler.requeue_if_throttled(score, depth, url, text)
+        return fetched
+
+    def _process(self, batch: List[Dict]):
+        explorer = self.explorer
+        self._lost = set()
+        fetched = self._fetch_politely(batch)
+        explorer.crawl_stats["pages_fetched"] += len(fetched)
+        finished = set()
+        for url, (html, links, r) in fetched.items():
+            # Fence each page: skip it if the lease expired while fetching
+            if not self._renew([r]):
+                continue
+            finished.add(r["url_norm"])
+            try:
+                record = explorer._run_intelligence_pipeline(url, html, r["depth"], r["score"])
+            except Exception as e:
+                self.logger.warning(f"Pipeline failed for {url}: {e}")
+                record = None
+            discovered = Frontier()
+            if record:
+                explorer.explored_data[url] = record
+                if not record.get("near_duplicate_of"):
+                    explorer._learn_from_page(url, record)
+                    if record.get("has_high_confidence_intel"):
+                        explorer._boost_domain_priority(url)
+                    explorer._enqueue_new_links(
+                        discovered, url, html, links, r["depth"], record.get("text_content", "")
+                    )
+            if self._finish(r):
+                self._push_links(discovered)
+
+        for r in batch:
+            if r["url_norm"] not in finished and r["url_norm"] not in self._lost:
+                self._finish(r)
+
+    def _push_links(self, discovered: Frontier):
+        explorer = self.explorer
+        entries = []
+        while len(discovered):
+            score, depth, url, text = discovered.pop()
+            entries.append(
+                {
+                    "url": url,
+                    "url_norm": explorer._normalize_url(url),
+                    "score": score,
+                    "depth": depth,
+                    "link_text": text,
+                }
+            )
+        if entries:
+            self.store.frontier_push_batch(self.session_id, entries)
+            explorer.crawl_stats["links_pushed"] += len(entries)
+
+    def _heartbeat(self, status: str):
+        try:
+            self.store.save_crawl_worker(
+                self.session_id,
+                self.worker_id,
+                status,
+                self.explorer.crawl_stats,
+                hostname=socket.gethostname(),
+                pid=os.getpid(),
+            )
+        except Exception as e:
+            self.logger.debug(f"Worker heartbeat failed: {e}")
+
+
+def build_worker_explorer(config: Dict[str, Any]) -> IntelligentExplorer:
+    """Construct the explorer a worker process runs, from a picklable config."""
+    from ..database.engine import SQLAlchemyStore
+
+    store = SQLAlchemyStore(config["db_url"])
+    llm = None
+    if config.get("ollama_url"):
+        from ..extractor.llm import LLMIntelExtractor
+
+        llm = LLMIntelExtractor(
+            config["ollama_url"],
+            config.get("model"),
+            embedding_model=config.get("embedding_model"),
+        )
+    profile = EntityProfile(
+        name=config["entity_name"],
+        entity_type=EntityType(config.get("entity_type", "company")),
+        official_domains=list(config.get("official_domains") or []),
+    )
+    return IntelligentExplorer(
+        profile=profile,
+        use_selenium=False,
+        persistence=store,
+        llm_extractor=llm,
+        max_pages_per_domain=config.get("max_pages_per_domain", 5),
+        max_total_pages=config.get("max_total_pages", 25),
+        max_depth=config.get("max_depth", 3),
+        score_threshold=config.get("score_threshold", 20.0),
+        **(config.get("explorer_options") or {}),
+    )
+
+
+def run_worker(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker entry point. Can be called in a child process or on another host
+    with the same ``db_url`` and ``session_key`` to join a running crawl.
+    """
+    logging.basicConfig(level=config.get("log_level", logging.INFO))
+    explorer = build_worker_explorer(config)
+    worker = CrawlWorker(
+        explorer,
+        config["session_key"],
+        lease_size=config.get("lease_size"),
+        lease_seconds=config.get("lease_seconds", 300),
+    )
+    return worker.run()
+
+
+class CrawlCoordinator:
+    """
+    Seeds a crawl session and splits it across worker processes that share
+    the frontier through the database.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        session_key: str,
+        entity_name: str,
+        entity_type: str = "company",
+        num_workers: int = 2,
+        max_total_pages: int = 25,
+        max_pages_per_domain: int = 5,
+        max_depth: int = 3,
+        score_threshold: float = 20.0,
+        official_domains: Optional[List[str]] = None,
+        llm_config: Optional[Dict[str, Any]] = None,
+        explorer_options: Optional[Dict[str, Any]] = None,
+        lease_size: Optional[int] = None,
+        lease_seconds: int = 300,
+    ):
+        if db_url.startswith("sqlite") and ":memory:" in db_url:
+            raise ValueError("Worker processes cannot share an in-memory database")
+        from ..database.engine import SQLAlchemyStore
+
+        self.store = SQLAlchemyStore(db_url)
+        self.num_workers = num_workers
+        self.session_key = session_key
+        self.logger = logging.getLogger(__name__)
+        self.config: Dict[str, Any] = {
+            "db_url": db_url,
+            "session_key": session_key,
+            "entity_name": entity_name,
+            "entity_type": entity_type,
+            "official_domains": list(official_domains or []),
+            "max_total_pages": max_total_pages,
+            "max_pages_per_domain": max_pages_per_domain,
+            "max_depth": max_depth,
+            "score_threshold": score_threshold,
+            "explorer_options": dict(explorer_options or {}),
+            "lease_size": lease_size,
+            "lease_seconds": lease_seconds,
+            **(llm_config or {}),
+        }
+        session = self.store.open_crawl_session(
+            session_key,
+            params={
+                "entity": entity_name,
+                "workers": num_workers,
+            },
+        )
+        self.session_id = session["id"]
+
+    def seed(self, start_urls: List[str]) -> int:
+        """Push scored seed URLs into the shared frontier."""
+        scorer = URLScorer(self.config["entity_name"], EntityType(self.config["entity_type"]))
+        if self.config["official_domains"]:
+            scorer.set_official_domains(self.config["official_domains"])
+        entries = []
+        for url in start_urls:
+            score, _ = scorer.score_url(url, "", 0)
+            entries.append(
+                {
+                    "url": url,
+                    "url_norm": IntelligentExplorer._normalize_url(url),
+                    "score": score,
+                    "depth": 0,
+                    "link_text": "Seed URL",
+                }
+            )
+        return self.store.frontier_push_batch(self.session_id, entries)
+
+    def run(self, start_urls: List[str], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Seed, run the workers to completion and return the merged session stats."""
+        self.seed(start_urls)
+        ctx = multiprocessing.get_context("spawn")
+        procs = [
+            ctx.Process(target=run_worker, args=(self.config,), daemon=True)
+            for _ in range(self.num_workers)
+        ]
+        for p in procs:
+            p.start()
+        deadline = time.monotonic() + timeout if timeout else None
+        for p in procs:
+            p.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        status = "completed"
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+                p.join()
+                status = "interrupted"
+            elif p.exitcode != 0:
+                status = "interrupted"
+
+        summary = self.merged_stats()
+        self.store.save_crawl_checkpoint(
+            self.session_id,
+            summary["pages_explored"],
+            summary["domain_counts"],
+            summary["stats"],
+            status=status,
+        )
+        summary["status"] = status
+        return summary
+
+    def merged_stats(self) -> Dict[str, Any]:
+        """Sum worker counters and shared budgets into one session view."""
+        workers = self.store.get_crawl_workers(self.session_id)
+        totals: Dict[str, Any] = {}
+        for w in workers:
+            for key, value in (w.get("stats") or {}).items():
+                if isinstance(value, (int, float)):
+                    totals[key] = totals.get(key, 0) + value
+        budgets = self.store.get_crawl_budgets(self.session_id)
+        domain_counts = {
+            key[len(DOMAIN_BUDGET_PREFIX) :]: used
+            for key, used in budgets.items()
+            if key.startswith(DOMAIN_BUDGET_PREFIX)
+        }
+        return {
+            "session_key": self.session_key,
+            "workers": workers,
+            "pages_explored": totals.get("pages_fetched", 0),
+            "domain_counts": domain_counts,
+            "frontier": self.store.frontier_counts(self.session_id),
+            "stats": totals,
+        }
@@ -1,21 +1,33 @@
 import logging
+import time
 import requests
 
 from collections import defaultdict
-from typing import List, Dict, Optional, Set, Tuple, Any
-from urllib.parse import urlparse, urljoin
-from uuid import uuid5, NAMESPACE_URL
+from typing import List, Dict, Optional, Tuple, Any, Union
+from urllib.parse import urlparse
+from uuid import uuid4, uuid5, NAMESPACE_URL
 from bs4 import BeautifulSoup
 
 from ..browser.selenium import SeleniumBrowser
+from ..browser.pool import BrowserPool
 from ..extractor.engine import ContentExtractor
+from ..extractor.parse_pool import HTMLParsePool, PendingParse
 from .scorer import URLScorer
-from ..discover.frontier import Frontier
+from .link_ranker import TieredLinkRanker
+from .pipeline_timing import PageTiming, StageTimingAggregate, estimate_tokens
+from ..discover.frontier import Frontier, DurableFrontier
 from ..discover.crawl_learner import CrawlLearner
+from ..discover.near_duplicate import NearDuplicateDetector, DEFAULT_MAX_DISTANCE
+from ..discover.politeness import PolitenessScheduler, RobotsCache
+from ..discover.seen_urls import SeenUrlSet
+from ..discover.fetch_archive import FetchArchive
+from ..discover.information_gain import InformationGainTracker
+from ..discover.url_canonical import canonicalize_url
 from ..discover.post_crawl_processor import PostCrawlProcessor
 from ..types.entity import EntityProfile
 from ..database.store import PersistenceStore
 from ..database.relationship_manager import RelationshipManager
+from ..database.write_queue import QueuedStore
 from ..vector.engine import VectorStore
 from ..extractor.llm import LLMIntelExtractor
 from ..extractor.iterative_refiner import IterativeRefiner
@@ -27,6 +39,12 @@ from ..extractor.strategy_selector import StrategySelector
 MAX_RELATIONSHIP_INFERENCE_CONTEXT = 8000
 # Confidence score assigned to inferred relationships (lower than LLM-extracted relationships)
 INFERRED_RELATIONSHIP_CONFIDENCE = 60.0
+# Minimum LLM calls a fully processed page costs (extraction + summary);
+# used to report calls saved by skipping near-duplicate pages
+LLM_CALLS_PER_PAGE_BASELINE = 2
+# URLs admitted from the frontier into per-host queues per fetch slot, so a
+# batch can be filled from distinct hosts instead of the top-scored one
+POLITENESS_WINDOW_FACTOR = 4
 
 
 def _uuid5_url(url: str) -> str:
@@ -59,16 +77,50 @@ class IntelligentExplorer:
         scorer_patterns: List[Dict] = None,
         scorer_domains: List[Dict] = None,
         enable_llm_link_rank: bool = True,
+        llm_link_rank_top_n: int = 10,
+        llm_link_rank_budget: Optional[int] = 200,
         media_extractor = None,
         max_fetch_workers: int = 5,
+        enable_near_duplicate_detection: bool = True,
+        near_duplicate_max_distance: int = DEFAULT_MAX_DISTANCE,
+        enable_politeness: bool = True,
+        respect_robots_txt: bool = True,
+        politeness_min_delay: float = 0.5,
+        robots_cache: Optional[RobotsCache] = None,
+        frontier_session: Optional[str] = None,
+        browser_pool_size: int = 3,
+        block_browser_resources: bool = True,
+        fetch_archive: Optional[FetchArchive] = None,
+        replay: bool = False,
+        min_marginal_gain: Optional[float] = None,
+        marginal_gain_window: int = 5,
+        gap_fields: Optional[List[str]] = None,
+        parse_workers: int = 0,
     ):
+        if replay and fetch_archive is None:
+            raise ValueError("replay=True requires a fetch_archive")
         self.profile = profile
+        # Raw responses are archived; in replay they are served from it
+        # (no network, no browser, no politeness delays)
+        self.fetch_archive = fetch_archive
+        self.replay = replay
+        if replay:
+            use_selenium = False
+            enable_politeness = False
         self.use_selenium = use_selenium
         self.max_pages_per_domain = max_pages_per_domain
         self.max_total_pages = max_total_pages
         self.max_depth = max_depth
         self.score_threshold = score_threshold
         self.max_fetch_workers = max_fetch_workers
+        # Worker processes parsing fetched HTML (0 = parse in the main process)
+        self.parse_workers = parse_workers
+        self.parse_pool: Optional[HTMLParsePool] = None
+        # Selenium drivers started when explore() has to create its own pool
+        self.browser_pool_size = browser_pool_size
+        self.block_browser_resources = block_browser_resources
+        # Session key for a durable, resumable frontier (requires persistence)
+        self.frontier_session = frontier_session
 
         # Core Components
         self.content_extractor = ContentExtractor()
@@ -105,27 +157,105 @@ class IntelligentExplorer:
                 vector_store=vector_store
             )
 
+        # Near-duplicate detection (SimHash over cleaned page text)
+        self.near_duplicate_detector = None
+        if enable_near_duplicate_detection:
+            self.near_duplicate_detector = NearDuplicateDetector(
+                store=persistence, max_distance=near_duplicate_max_distance
+            )
+
+        # Per-host politeness (round-robin dispatch, crawl-delay, backoff)
+        self.politeness_scheduler = None
+        if enable_politeness:
+            if respect_robots_txt and robots_cache is None:
+                robots_cache = RobotsCache()
+            self.politeness_scheduler = PolitenessScheduler(
+                robots=robots_cache if respect_robots_txt else None,
+                min_delay=politeness_min_delay,
+            )
+
         # URL Scoring Logic
         self.url_scorer = URLScorer(profile.name, profile.entity_type, patterns=scorer_patterns, domains=scorer_domains)
         if profile.official_domains:
             self.url_scorer.set_official_domains(profile.official_domains)
 
         # State Management
-        self.visited_urls: Set[str] = set()
+        # Bloom-filtered visited set; persisted per crawl session when durable
+        self.visited_urls = (
+            SeenUrlSet(persistence, scope=f"crawl:{frontier_session}")
+            if persistence and frontier_session
+            else SeenUrlSet(capacity=100_000)
+        )
         self.explored_data: Dict[str, dict] = {}
         self.domain_counts = defaultdict(int)
         self.logger = logging.getLogger(__name__)
         self.enable_llm_link_rank = enable_llm_link_rank
+        # Heuristic pre-filter, cached rankings and a per-crawl LLM budget
+        self.link_ranker = None
+        if enable_llm_link_rank and llm_extractor:
+            self.link_ranker = TieredLinkRanker(
+                llm_extractor.rank_links,
+                profile,
+                top_n=llm_link_rank_top_n,
+                llm_budget=llm_link_rank_budget,
+            )
+        # Stop early / skip exhausted seeds once pages stop adding entities,
+        # gap fields or relationships (needs an extractor to measure gain)
+        self.gain_tracker = None
+        if min_marginal_gain is not None and llm_extractor:
+            self.gain_tracker = InformationGainTracker(
+                min_gain=min_marginal_gain,
+                window=marginal_gain_window,
+                gap_fields=gap_fields,
+            )
+        # Normalized URL -> seed URL it was discovered from
+        self._url_seed: Dict[str, str] = {}
+        # Per-stage pipeline timing: fetch durations measured in the worker
+        # threads wait here until the page reaches the pipeline
+        self.crawl_id: Optional[str] = None
+        self.stage_timings = StageTimingAggregate()
+        self._fetch_ms: Dict[str, float] = {}
+        self.crawl_stats: Dict[str, int] = self._new_crawl_stats()
+        self.browser_pool: Optional[BrowserPool] = None
 
     def explore(self, start_urls: List[str], 
-                browser: Optional[SeleniumBrowser] = None) -> Dict[str, dict]:
-        """Main loop with parallel HTTP fetching and sequential LLM."""
+                browser: Optional[Union[SeleniumBrowser, BrowserPool]] = None) -> Dict[str, dict]:
+        """
+        Main loop with parallel fetching and sequential LLM.
+
+        With Selenium, a ``BrowserPool`` (passed in or created with
+        ``browser_pool_size`` drivers) renders a batch concurrently; a single
+        ``SeleniumBrowser`` fetches sequentially.
+        """
         from concurrent.futures import ThreadPoolExecutor, as_completed
         
-        frontier = Frontier()
+        frontier = self._new_frontier(start_urls)
+        durable = isinstance(frontier, DurableFrontier)
+        resumed = durable and frontier.resumed
         seed_ids = []  # Track seed IDs to create relationships later
+        self.crawl_stats = self._new_crawl_stats()
+        if self.link_ranker:
+            self.link_ranker.reset()
+        if self.gain_tracker:
+            self.gain_tracker.reset()
+        self._url_seed = {self._normalize_url(url): url for url in start_urls}
+        self.crawl_id = uuid4().hex
+        self.stage_timings.reset()
+        self._fetch_ms = {}
+        pages_explored = 0
+
+        if resumed:
+            # Continue from the last checkpoint instead of the seeds
+            checkpoint = frontier.checkpoint_state
+            self.visited_urls.update(frontier.visited)
+            self.domain_counts.update(checkpoint.get("domain_counts") or {})
+            pages_explored = int(checkpoint.get("pages_explored") or 0)
+            self.logger.info(
+                f"Resuming crawl session {frontier.session_key}: "
+                f"{pages_explored} pages explored, {len(frontier)} URLs queued"
+            )
         
-        if self.store:
+        if self.store and not resumed:
             for url in start_urls:
                 try:
                     seed_id = self.store.save_seed(
@@ -137,21 +267,29 @@ class IntelligentExplorer:
                 except Exception as e:
                     self.logger.debug(f"Failed to save seed: {e}")
 
-        for url in start_urls:
-            score, _ = self.url_scorer.score_url(url, "", 0)
-            frontier.push(score, 0, url, "Seed URL")
+        if not resumed:
+            for url in start_urls:
+                score, _ = self.url_scorer.score_url(url, "", 0)
+                frontier.push(score, 0, url, "Seed URL")
 
-        pages_explored = 0
         own_browser = False
+        completed = False
 
         if self.use_selenium and browser is None:
             try:
-                browser = SeleniumBrowser(headless=True)
-                browser._init_driver()
+                browser = BrowserPool(
+                    size=self.browser_pool_size,
+                    block_resources=self.block_browser_resources,
+                ).start()
                 own_browser = True
             except Exception as e:
                 self.logger.warning(f"Selenium fallback to requests: {e}")
                 self.use_selenium = False
+        pooled = self.use_selenium and isinstance(browser, BrowserPool)
+        self.browser_pool = browser if pooled else None
+        # Workers come from a fork server, not from this threaded process
+        if self.parse_workers > 0:
+            self.parse_pool = HTMLParsePool(self.parse_workers)
 
         try:
             # Track seed-to-url mapping for relationship creation
@@ -162,15 +300,33 @@ class IntelligentExplorer:
                 self.max_fetch_workers, self.max_total_pages
             )
             
-            while len(frontier) and pages_explored < self.max_total_pages:
+            scheduler = self.politeness_scheduler
+            if scheduler:
+                scheduler.reset()
+            # Normalized URLs waiting in the scheduler's host queues, and
+            # throttled URLs re-queued there (already counted when first sent)
+            scheduled, retrying = set(), set()
+
+            while ((len(frontier) or (scheduler and scheduler.pending()))
+                   and pages_explored < self.max_total_pages):
                 # Phase 1: Collect batch of URLs to fetch
                 batch = []
-                # Selenium uses sequential fetching (batch of 1)
-                # Requests library uses parallel fetching
-                batch_size = (1 if self.use_selenium else fetch_workers)
+                # A single Selenium browser fetches sequentially (batch of 1);
+                # a browser pool and the requests library fetch in parallel
+                if pooled:
+                    batch_size = browser.size
+                else:
+                    batch_size = (1 if self.use_selenium else fetch_workers)
+                # With politeness enabled, admit a window of URLs from the
+                # frontier into per-host queues and dispatch round-robin
+                admit_limit = (
+                    batch_size * POLITENESS_WINDOW_FACTOR if scheduler
+                    else batch_size
+                )
+                admitted = scheduler.pending() if scheduler else 0
                 
-                while (len(frontier) and len(batch) < batch_size 
-                       and pages_explored + len(batch) < self.max_total_pages):
+                while (len(frontier) and admitted < admit_limit 
+                       and pages_explored + admitted < self.max_total_pages):
                     current = frontier.pop()
                     if not current:
                         break
@@ -179,15 +335,68 @@ class IntelligentExplorer:
                     url_norm = self._normalize_url(url)
 
                     # Guard Clauses
-                    if (url_norm in self.visited_urls
-                        or depth > self.max_depth
+                    if url_norm in self.visited_urls or url_norm in scheduled:
+                        continue
+                    if (depth > self.max_depth
                         or self.domain_counts[self._get_domain_key(url)] 
                            >= self.max_pages_per_domain):
+                        if durable:
+                            frontier.mark_skipped(url)
                         continue
+                    # Budget shifts away from seeds that stopped paying off
+                    if (self.gain_tracker and self.gain_tracker.seed_exhausted(
+                            self._url_seed.get(url_norm))):
+                        self.crawl_stats["gain_urls_skipped"] += 1
+                        if durable:
+                            frontier.mark_skipped(url)
+                        continue
+
+                    if scheduler:
+                        # Visited and counted once dispatched for fetching
+                        scheduled.add(url_norm)
+                        scheduler.add(score, depth, url, link_text)
+                    else:
+                        self.visited_urls.add(url_norm)
+                        self.domain_counts[self._get_domain_key(url)] += 1
+                        batch.append((score, depth, url, link_text))
+                    admitted += 1
 
-                    self.visited_urls.add(url_norm)
-                    self.domain_counts[self._get_domain_key(url)] += 1
-                    batch.append((score, depth, url, link_text))
+                if scheduler:
+                    dispatched = scheduler.next_batch(
+                        min(batch_size, self.max_total_pages - pages_explored)
+                    )
+                    # robots.txt (fetched in the background) disallowed these
+                    for url in scheduler.take_blocked():
+                        scheduled.discard(self._normalize_url(url))
+                        self.logger.debug(f"robots.txt disallows {url}")
+                        if durable:
+                            frontier.mark_skipped(url)
+                    for item in dispatched:
+                        url = item[2]
+                        url_norm = self._normalize_url(url)
+                        scheduled.discard(url_norm)
+                        if url in retrying:
+                            retrying.discard(url)
+                        elif (url_norm in self.visited_urls
+                              or self.domain_counts[self._get_domain_key(url)]
+                                 >= self.max_pages_per_domain):
+                            if durable:
+                                frontier.mark_skipped(url)
+                            continue
+                        else:
+                            self.visited_urls.add(url_norm)
+                            self.domain_counts[self._get_domain_key(url)] += 1
+                        batch.append(item)
+                    if not dispatched:
+                        wait = scheduler.seconds_until_ready()
+                        if wait is None:
+                            if len(frontier):
+                                continue
+                            break
+                        time.sleep(min(wait, scheduler.max_delay))
+                        continue
+                    if not batch:
+                        continue
                 
                 if not batch:
                     break
@@ -195,7 +404,7 @@ class IntelligentExplorer:
                 # Phase 2: Parallel HTTP fetch (if not using Selenium)
                 fetch_results = {}
                 
-                if self.use_selenium:
+                if self.use_selenium and not pooled:
                     # Sequential fetch with Selenium (shared browser)
                     for score, depth, url, link_text in batch:
                         try:
@@ -209,15 +418,15 @@ class IntelligentExplorer:
                                 f"Fetch failed for {url}: {e}"
                             )
                 else:
-                    # Parallel fetch with requests
+                    # Parallel fetch with requests or the browser pool
                     with ThreadPoolExecutor(
-                        max_workers=min(len(batch), fetch_workers)
+                        max_workers=min(len(batch), batch_size)
                     ) as fetch_pool:
                         future_to_url = {}
                         for score, depth, url, link_text in batch:
                             future = fetch_pool.submit(
                                 self._fetch_page_and_links, 
-                                url, depth, None
+                                url, depth, browser if pooled else None
                             )
                             future_to_url[future] = (
                                 score, depth, url, link_text
@@ -238,13 +447,38 @@ class IntelligentExplorer:
                                     f"Parallel fetch failed for {url}: {e}"
                                 )
                 
+                # Throttled (429/503) URLs go back to their host queue
+                for score, depth, url, link_text in batch:
+                    if (scheduler and url not in fetch_results
+                            and scheduler.requeue_if_throttled(
+                                score, depth, url, link_text
+                            )):
+                        retrying.add(url)
+                        scheduled.add(self._normalize_url(url))
+                        continue
+                    if durable:
+                        frontier.mark_done(url)
+
+                # Phase 2b: Parse the whole batch in worker processes while
+                # the main process works through the pipeline page by page
+                parsed = {}
+                if self.parse_pool and self.parse_pool.active:
+                    for url, (html, links, score, depth) in fetch_results.items():
+                        parsed[url] = self.parse_pool.submit(url, html, depth)
+
                 # Phase 3: Sequential LLM processing
+                self.crawl_stats["pages_fetched"] += len(fetch_results)
                 for url, (html, links, score, depth) in fetch_results.items():
                     # THE INTELLIGENCE WORKSTATION 
                     # (Extraction, Reflection, Summarization)
-                    page_record = self._run_intelligence_pipeline(
-                        url, html, depth, score
-                    )
+                    if url in parsed:
+                        page_record = self._run_intelligence_pipeline(
+                            url, html, depth, score, parsed=parsed.pop(url)
+                        )
+                    else:
+                        page_record = self._run_intelligence_pipeline(
+                            url, html, depth, score
+                        )
                     if not page_record:
                         continue  # Skipped due to semantic redundancy
 
@@ -265,20 +499,91 @@ class IntelligentExplorer:
 
                     self.explored_data[url] = page_record
                     pages_explored += 1
+                    if self.gain_tracker:
+                        self.gain_tracker.observe(
+                            page_record, seed=self._url_seed.get(self._normalize_url(url))
+                        )
+
+                    # Near-duplicates contribute no new links or learning
+                    if page_record.get("near_duplicate_of"):
+                        continue
+
+                    # Learn per fetched page so later links benefit this crawl
+                    self._learn_from_page(url, page_record)
 
                     # DYNAMIC EVOLUTION
                     if page_record.get("has_high_confidence_intel"):
                         self._boost_domain_priority(url)
 
                     # SEMANTIC LINK PRIORITIZATION
+                    # (links are None when a parse worker extracted them)
                     self._enqueue_new_links(
-                        frontier, url, html, links, depth, 
-                        page_record.get("text_content", "")
+                        frontier, url, html,
+                        links if links is not None else page_record.get("links") or [],
+                        depth, page_record.get("text_content", "")
+                    )
+
+                if durable:
+                    frontier.checkpoint(
+                        pages_explored, self.domain_counts, self.crawl_stats
+                    )
+
+                if self.gain_tracker and self.gain_tracker.should_stop():
+                    self.crawl_stats["gain_stopped_early"] = 1
+                    self.logger.info(
+                        f"Stopping after {pages_explored} pages: marginal gain "
+                        f"{self.gain_tracker.recent_gain():.2f} below "
+                        f"{self.gain_tracker.min_gain:.2f}"
                     )
+                    break
+
+            completed = True
 
         finally:
             if own_browser and browser:
                 browser.close()
+
+            if self.parse_pool:
+                self.parse_pool.close()
+                self.parse_pool = None
+
+            if self.politeness_scheduler:
+                self.politeness_scheduler.close()
+
+            try:
+                self.visited_urls.flush()
+            except Exception as e:
+                self.logger.warning(f"Visited-URL flush failed: {e}")
+
+            if durable:
+                try:
+                    frontier.checkpoint(
+                        pages_explored, self.domain_counts, self.crawl_stats,
+                        status="completed" if completed else "interrupted",
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Frontier checkpoint failed: {e}")
+
+            if isinstance(self.store, QueuedStore):
+                try:
+                    self.store.flush()
+                except Exception as e:
+                    self.logger.warning(f"Flushing queued writes failed: {e}")
+
+            if self.gain_tracker:
+                self._report_gain_savings(frontier, pages_explored)
+
+            self._save_stage_timings()
+
+            stats = self.get_crawl_stats()
+            if stats["pages_fetched"]:
+                self.logger.info(
+                    f"Crawl stats: {stats['pages_fetched']} fetched, "
+                    f"{stats['near_duplicates']} near-duplicates "
+                    f"({stats['near_duplicate_rate']:.1%}), "
+                    f"~{stats['llm_calls_saved']} LLM calls saved, "
+                    f"visited set ~{stats['visited_bytes_per_million'] / 1e6:.1f} MB per 1M URLs"
+                )
             
             # Comprehensive post-crawl processing
             if self.post_crawl_processor and pages_explored > 0:
@@ -296,62 +601,165 @@ class IntelligentExplorer:
                     )
             
             # Crawl learning (improving future crawls)
-            if self.crawl_learner and pages_explored > 0:
-                try:
-                    self.logger.info(
-                        "Recording crawl results for learning..."
-                    )
-                    for url, page_data in self.explored_data.items():
-                        intel_quality = page_data.get("avg_confidence", 0.5)
-                        page_type = page_data.get("page_type", "general")
-                        extraction_success = page_data.get(
-                            "has_high_confidence_intel", False
-                        )
-                        
-                        self.crawl_learner.record_crawl_result(
-                            url=url,
-                            page_type=page_type,
-                            intel_quality=intel_quality,
-                            extraction_success=extraction_success
-                        )
-                    
-                    # Update URL scorer with learned patterns
-                    if self.url_scorer and self.explored_data:
-                        domain_key = self._get_domain_key(
-                            list(self.explored_data.keys())[0]
-                        )
-                        reliability = (
-                            self.crawl_learner.get_domain_reliability(
-                                domain_key
-                            )
-                        )
-                        if reliability > 0:
-                            self.logger.info(
-                                f"Domain {domain_key} reliability: "
-                                f"{reliability:.2f}"
-                            )
-                except Exception as e:
-                    self.logger.warning(
-                        f"Crawl learning recording failed: {e}"
-                    )
+            if self.crawl_learner:
+                self.crawl_learner.flush()
 
         return self.explored_data
 
-    def _run_intelligence_pipeline(self, url: str, html: str, depth: int, score: float) -> Optional[Dict]:
+    def _new_frontier(self, start_urls: List[str]) -> Frontier:
+        """In-memory frontier, or a durable one when a session key is set."""
+        if not (self.frontier_session and self.store):
+            return Frontier()
+        try:
+            return DurableFrontier(
+                self.store,
+                self.frontier_session,
+                normalize=self._normalize_url,
+                params={"entity": self.profile.name, "seeds": list(start_urls)},
+            )
+        except Exception as e:
+            self.logger.warning(f"Durable frontier unavailable, using in-memory: {e}")
+            return Frontier()
+
+    def _new_crawl_stats(self) -> Dict[str, int]:
+        stats = {
+            "pages_fetched": 0,
+            "pages_processed": 0,
+            "near_duplicates": 0,
+            "llm_calls_saved": 0,
+        }
+        if self.gain_tracker:
+            stats.update(
+                gain_urls_skipped=0,
+                gain_stopped_early=0,
+                gain_fetches_saved=0,
+                gain_llm_calls_saved=0,
+            )
+        return stats
+
+    def _report_gain_savings(self, frontier, pages_explored: int) -> None:
+        """
+        Fetches and LLM calls avoided versus a fixed budget, which would have
+        kept crawling the queued and skipped URLs up to ``max_total_pages``.
+        An estimate: pages those URLs would have led to are not counted, and
+        queued URLs may include some the fixed crawl would have deduplicated.
+        """
+        queued = len(frontier) + self.crawl_stats["gain_urls_skipped"]
+        if self.politeness_scheduler:
+            queued += self.politeness_scheduler.pending()
+        baseline = min(self.max_total_pages, pages_explored + queued)
+        saved = max(0, baseline - pages_explored)
+        self.crawl_stats["gain_fetches_saved"] = saved
+        self.crawl_stats["gain_llm_calls_saved"] = saved * LLM_CALLS_PER_PAGE_BASELINE
+        if saved:
+            self.logger.info(
+                f"Marginal-gain stopping saved ~{saved} fetches and "
+                f"~{saved * LLM_CALLS_PER_PAGE_BASELINE} LLM calls "
+                f"versus the {self.max_total_pages}-page budget"
+            )
+
+    def get_crawl_stats(self) -> Dict[str, Any]:
+        """Per-crawl counters plus derived rates for the last explore() run."""
+        stats: Dict[str, Any] = dict(self.crawl_stats)
+        fetched = stats.get("pages_fetched", 0)
+        stats["near_duplicate_rate"] = (
+            stats.get("near_duplicates", 0) / fetched if fetched else 0.0
+        )
+        if self.politeness_scheduler:
+            stats.update(self.politeness_scheduler.stats)
+        if self.browser_pool:
+            stats.update(self.browser_pool.stats)
+        if self.fetch_archive is not None:
+            stats.update(self.fetch_archive.stats)
+        if self.link_ranker:
+            stats.update(self.link_ranker.stats)
+            stats["link_rank_budget_remaining"] = self.link_ranker.budget_remaining
+        if self.gain_tracker:
+            stats.update(self.gain_tracker.summary())
+        memory = self.visited_urls.memory_report()
+        stats["visited_urls"] = memory["items"]
+        stats["visited_bytes_per_million"] = memory["bytes_per_million"]
+        return stats
+
+    def get_stage_timings(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage p50/p95 (ms) and counters over the last explore() run."""
+        return self.stage_timings.summary()
+
+    def _save_stage_timings(self) -> None:
+        if not self.stage_timings.pages:
+            return
+        summary = self.stage_timings.summary()
+        self.logger.info(
+            "Stage timings (p50/p95 ms): " + ", ".join(
+                f"{stage} {s['p50_ms']:.0f}/{s['p95_ms']:.0f}" for stage, s in summary.items()
+            )
+        )
+        if self.store:
+            try:
+                self.store.save_stage_timings(
+                    self.crawl_id, summary, entity_name=self.profile.name
+                )
+            except Exception as e:
+                self.logger.warning(f"Saving stage timings failed: {e}")
+
+    def _finish_page_timing(self, timing: PageTiming, page_record: Dict) -> None:
+        """Attach the page's timing to its record, its stored metadata and the crawl aggregate."""
+        summary = timing.to_dict()
+        page_record["timing"] = summary
+        self.stage_timings.add(summary)
+        if self.store and page_record.get("id"):
+            try:
+                self._store_write("save_page_timing", page_record["id"], summary)
+            except Exception as e:
+                self.logger.debug(f"Saving page timing failed for {page_record['url']}: {e}")
+
+    def _run_intelligence_pipeline(self, url: str, html: str, depth: int, score: float,
+                                   parsed: Optional[PendingParse] = None) -> Optional[Dict]:
         """
         The full extraction and reflection process:
-        - Extract text, metadata, links
+        - Extract text, metadata, links (or take them from a parse worker)
         - Run LLM extraction + reflection
         - Persist page, links, entities, intel
         - Persist embeddings
         """
+        timing = PageTiming()
+        fetch_ms = self._fetch_ms.pop(url, None)
+        if fetch_ms is not None:
+            timing.add("fetch", fetch_ms)
+
         # 1) Extract content and links
-        text_content = self.content_extractor.html_to_text(html)
-        metadata = self.content_extractor.extract_metadata(html)
+        parsed_page = parsed.result() if parsed is not None else None
+        if parsed_page is not None:
+            text_content = parsed_page.text
+            metadata = parsed_page.metadata
+            links = parsed_page.links
+        else:
+            text_content = self.content_extractor.html_to_text(html)
+            metadata = self.content_extractor.extract_metadata(html)
+            links = None
         page_type = self.content_extractor.detect_page_type(
             url, html, metadata, self.profile.entity_type
         )
-        links = self._extract_links(url, html, metadata, depth)
+        if links is None:
+            links = self._extract_links(url, html, metadata, depth)
+
+        # 1b) Near-duplicate check before any LLM work
+        fingerprint = None
+        if self.near_duplicate_detector:
+            fingerprint = self.near_duplicate_detector.fingerprint(text_content)
+            match = self.near_duplicate_detector.find_duplicate(fingerprint, url)
+            if match:
+                timing.lap("parse")
+                page_record = self._record_near_duplicate(
+                    url, text_content, metadata, page_type, links, depth, score,
+                    fingerprint, match,
+                )
+                timing.lap("save_page", db_rows=1 if page_record.get("id") else 0)
+                self._finish_page_timing(timing, page_record)
+                return page_record
+        timing.lap("parse")
+
+        self.crawl_stats["pages_processed"] += 1
         extracted_entities: List[Dict] = []
         verified_findings: List[Dict] = []
         verified_findings_with_scores: List[Tuple[Dict, float]] = []
@@ -367,11 +775,13 @@ class IntelligentExplorer:
                 url=url,
                 existing_intel=None,
             )
+            timing.lap("extract", llm_calls=1, llm_tokens=estimate_tokens(text_content))
             if raw_intel:
                 for finding in _as_list(raw_intel):
                     is_verified, conf_score = self.llm_extractor.reflect_and_verify(
                         self.profile, finding
                     )
+                    timing.lap("reflect", llm_calls=1, llm_tokens=estimate_tokens(str(finding)))
                     if is_verified:
                         finding.setdefault("basic_info", {})["official_name"] = self.profile.name
                         verified_findings.append(finding)
@@ -380,6 +790,7 @@ class IntelligentExplorer:
                         finding_entities = self.llm_extractor.extract_entities_from_finding(finding)
                         finding_to_entities[id(finding)] = finding_entities  # Use id() to create unique key
                         extracted_entities.extend(finding_entities)
+                        timing.lap("extract")
 
             if not verified_findings and raw_intel:
                 extracted_entities.extend(
@@ -409,12 +820,15 @@ class IntelligentExplorer:
                         }
                         verified_findings.append(inferred_finding)
                         verified_findings_with_scores.append((inferred_finding, INFERRED_RELATIONSHIP_CONFIDENCE))
+            timing.lap("extract")
 
         summary = (
             self.llm_extractor.summarize_page(text_content)
             if self.llm_extractor
             else ""
         )
+        if self.llm_extractor:
+            timing.lap("summarize", llm_calls=1, llm_tokens=estimate_tokens(text_content))
         text_length = len(text_content or "")
 
         page_record = {
@@ -429,6 +843,11 @@ class IntelligentExplorer:
             "has_high_confidence_intel": any(
                 cs >= 70 for _, cs in verified_findings_with_scores
             ),
+            "avg_confidence": (
+                sum(cs for _, cs in verified_findings_with_scores)
+                / len(verified_findings_with_scores) / 100.0
+                if verified_findings_with_scores else 0.0
+            ),
             "text_content": text_content,
             "text_length": text_length,
             "entity_type": getattr(self.profile.entity_type, "value", str(self.profile.entity_type)),
@@ -440,6 +859,7 @@ class IntelligentExplorer:
         entity_id_map: Dict[tuple, str] = {}
         primary_entity_id: Optional[str] = None
         page_uuid: Optional[str] = None
+        db_rows = 0
 
         # 3) Persist page, entities, links, intel
         if self.store:
@@ -455,9 +875,13 @@ class IntelligentExplorer:
                         page_uuid_obj = uuid.UUID(page_uuid)
                     else:
                         page_uuid_obj = page_uuid
-                    self.media_extractor.extract_media_from_page(page_uuid_obj, url, html)
+                    self.media_extractor.extract_media_from_page(
+                        page_uuid_obj, url, html,
+                        candidates=parsed_page.media if parsed_page else None,
+                    )
                 except Exception as e:
                     logging.getLogger(__name__).warning(f"Media extraction failed for {url}: {e}")
+            timing.lap("save_page", db_rows=1)
 
             if extracted_entities:
                 # Add page_id context to all entities to create Page→Entity relationships
@@ -466,6 +890,7 @@ class IntelligentExplorer:
                         entity["page_id"] = page_uuid
                 
                 entity_id_map = self.store.save_entities(extracted_entities) or {}
+                db_rows += len(entity_id_map)
 
             # Save relationships from findings
             # Build lowercase name lookup for efficient entity matching
@@ -534,6 +959,7 @@ class IntelligentExplorer:
                 try:
                     missing_entities_to_create = list(missing_entities_dict.values())
                     new_entity_map = self.store.save_entities(missing_entities_to_create) or {}
+                    db_rows += len(new_entity_map)
                     # Update entity_id_map and entity_name_to_id with newly created entities
                     entity_id_map.update(new_entity_map)
                     for (ent_name, ent_kind), ent_id in new_entity_map.items():
@@ -569,12 +995,14 @@ class IntelligentExplorer:
                                     if page_uuid:
                                         rel_meta["page_id"] = page_uuid
                                     
-                                    self.store.save_relationship(
+                                    self._store_write(
+                                        "save_relationship",
                                         from_id=source_id,
                                         to_id=target_id,
                                         relation_type=relation_type,
                                         meta=rel_meta
                                     )
+                                    db_rows += 1
                                 except Exception as e:
                                     self.logger.debug(f"save_relationship failed: {e}")
                             else:
@@ -586,7 +1014,8 @@ class IntelligentExplorer:
 
             if links:
                 try:
-                    self.store.save_links(url, links)
+                    self._store_write("save_links", url, links)
+                    db_rows += len(links)
                 except Exception as e:
                     self.logger.debug(f"save_links failed: {e}")
 
@@ -645,14 +1074,18 @@ class IntelligentExplorer:
                                     rel_meta["relationship_context"] = "creator_or_contributor"
                             
                             # Primary entity is related to other entities on the same page
-                            self.store.save_relationship(
+                            self._store_write(
+                                "save_relationship",
                                 from_id=primary_entity_id,
                                 to_id=ent_id,
                                 relation_type=relation_type,
                                 meta=rel_meta
                             )
+                            db_rows += 1
                         except Exception as e:
                             self.logger.debug(f"Failed to create entity-entity relationship: {e}")
+            timing.lap("save_entities", db_rows=db_rows)
+            db_rows = 0
 
         for finding, conf_score in verified_findings_with_scores:
             intel_id = None
@@ -665,6 +1098,8 @@ class IntelligentExplorer:
                     entity_name=self.profile.name,
                     entity_type=getattr(self.profile.entity_type, "value", str(self.profile.entity_type)),
                 )
+                if intel_id:
+                    db_rows += 1
                 
                 # Link Intelligence to all extracted sub-entities (persons, products, locations, events)
                 # This ensures that each sub-entity maintains provenance to the intel that mentioned it
@@ -680,7 +1115,8 @@ class IntelligentExplorer:
                             if sub_entity_id:
                                 try:
                                     # Create Intel→Entity relationship to track which entities are mentioned in this intel
-                                    self.store.save_relationship(
+                                    self._store_write(
+                                        "save_relationship",
                                         from_id=intel_id,
                                         to_id=sub_entity_id,
                                         relation_type="mentions_entity",
@@ -690,10 +1126,17 @@ class IntelligentExplorer:
                                             "entity_type": sub_entity_kind,
                                         }
                                     )
+                                    db_rows += 1
                                 except Exception as e:
                                     self.logger.debug(f"Failed to create Intel→Entity relationship: {e}")
             
             finding_ids.append((finding, intel_id, primary_entity_id))
+        if verified_findings_with_scores:
+            timing.lap("save_intel", db_rows=db_rows)
+
+        # Register as canonical so later copies of this page are skipped
+        if self.near_duplicate_detector:
+            self.near_duplicate_detector.register(fingerprint, url, page_uuid)
 
         # 4) Persist embeddings (page + entities + findings + semantic snippets)
         if self.vector_store and self.llm_extractor:
@@ -720,6 +1163,7 @@ class IntelligentExplorer:
                             page_uuid=page_uuid,
                         )
                     )
+                timing.lap("embed", embeddings=len(entries))
 
                 # 4b) Generate fine-grained semantic snippets (1-3 sentences)
                 snippet_entries = self._generate_and_store_snippets(
@@ -729,8 +1173,10 @@ class IntelligentExplorer:
                     page_uuid=page_uuid,
                     primary_entity_id=primary_entity_id,
                     extracted_entities=extracted_entities,
+                    snippets=parsed_page.snippets(url) if parsed_page else None,
                 )
                 entries.extend(snippet_entries)
+                timing.lap("snippets", embeddings=len(snippet_entries))
                 
                 self.logger.info(f"Upserting {len(entries)} embeddings to Qdrant for page: {url}")
                 for entry in entries:
@@ -740,6 +1186,7 @@ class IntelligentExplorer:
                         payload=entry["payload"],
                     )
                 self.logger.info(f"Successfully stored {len(entries)} embeddings in Qdrant")
+                timing.lap("embed")
             except Exception as e:
                 self.logger.error(f"Failed to persist embeddings for {url}: {e}", exc_info=True)
         elif not self.vector_store:
@@ -747,6 +1194,70 @@ class IntelligentExplorer:
         elif not self.llm_extractor:
             self.logger.warning(f"LLM extractor not available - skipping embedding generation for {url}")
 
+        self._finish_page_timing(timing, page_record)
+        return page_record
+
+    def _record_near_duplicate(
+        self,
+        url: str,
+        text_content: str,
+        metadata: Dict,
+        page_type: str,
+        links: List[Dict],
+        depth: int,
+        score: float,
+        fingerprint: int,
+        match,
+    ) -> Dict:
+        """Persist a near-duplicate page linked to its canonical page and
+        skip extraction, summarization and embedding."""
+        self.crawl_stats["near_duplicates"] += 1
+        saved = LLM_CALLS_PER_PAGE_BASELINE
+        if (self.link_ranker and depth < self.max_depth
+                and self.link_ranker.budget_remaining != 0):
+            saved += 1
+        if self.llm_extractor:
+            self.crawl_stats["llm_calls_saved"] += saved
+        self.logger.info(
+            f"Near-duplicate: {url} ~ {match.url} (distance={match.distance}); "
+            f"skipping extraction"
+        )
+
+        page_record = {
+            "url": url,
+            "page_type": page_type,
+            "score": score,
+            "summary": "",
+            "extracted_intel": [],
+            "metadata": {**(metadata or {}), "near_duplicate_of": match.url},
+            "extracted": [],
+            "links": links,
+            "has_high_confidence_intel": False,
+            "text_content": text_content,
+            "text_length": len(text_content or ""),
+            "entity_type": getattr(self.profile.entity_type, "value", str(self.profile.entity_type)),
+            "domain_key": self._get_domain_key(url),
+            "depth": depth,
+            "last_status": "near_duplicate",
+            "near_duplicate_of": match.url,
+            "near_duplicate_distance": match.distance,
+        }
+        if self.store:
+            try:
+                page_uuid = self.store.save_page(page_record)
+                page_record["id"] = page_uuid
+                if match.page_id:
+                    self.store.save_relationship(
+                        from_id=page_uuid,
+                        to_id=match.page_id,
+                        relation_type="near_duplicate_of",
+                        meta={"distance": match.distance},
+                    )
+                self.near_duplicate_detector.register(
+                    fingerprint, url, page_uuid, canonical=match
+                )
+            except Exception as e:
+                self.logger.debug(f"Failed to persist near-duplicate page {url}: {e}")
         return page_record
 
     # ------------------------------------------------------------------
@@ -761,17 +1272,19 @@ class IntelligentExplorer:
         page_uuid: Optional[str],
         primary_entity_id: Optional[str],
         extracted_entities: List[Dict],
+        snippets: Optional[List] = None,
     ) -> List[Dict[str, Any]]:
-        """Create 1-3 sentence semantic snippets, persist to DB, return
-        embedding entries for the vector store."""
+        """Create 1-3 sentence semantic snippets (unless already split by a
+        parse worker), persist to DB, return embedding entries for the
+        vector store."""
         from ..extractor.semantic_chunker import SemanticChunker
 
-        chunker = SemanticChunker()
-        snippets = chunker.chunk_into_snippets(
-            text_content or "",
-            source_url=url,
-            max_sentences=3,
-        )
+        if snippets is None:
+            snippets = SemanticChunker().chunk_into_snippets(
+                text_content or "",
+                source_url=url,
+                max_sentences=3,
+            )
         if not snippets:
             return []
 
@@ -784,7 +1297,13 @@ class IntelligentExplorer:
             snippet.entity_refs = refs if refs else None
 
         # Persist snippets to SQL (best-effort)
-        if self.store:
+        if isinstance(self.store, QueuedStore):
+            self.store.submit(
+                lambda store: self._persist_snippets_to_db(
+                    snippets, page_uuid, primary_entity_id, store=store,
+                )
+            ).add_done_callback(self._log_snippet_write)
+        elif self.store:
             try:
                 self._persist_snippets_to_db(
                     snippets, page_uuid, primary_entity_id,
@@ -811,12 +1330,13 @@ class IntelligentExplorer:
         snippets,
         page_uuid: Optional[str],
         entity_id: Optional[str],
+        store=None,
     ):
-        """Store semantic snippets in the SQL database."""
+        """Store semantic snippets in the SQL database (*store* defaults to ours)."""
         import uuid as _uuid
         from ..database.models import SemanticSnippet
 
-        session_maker = getattr(self.store, "Session", None)
+        session_maker = getattr(store or self.store, "Session", None)
         if not session_maker:
             return
 
@@ -845,57 +1365,155 @@ class IntelligentExplorer:
                 session.add(row)
             session.commit()
 
+    def _log_snippet_write(self, future) -> None:
+        if future.exception():
+            self.logger.warning(f"Failed to persist semantic snippets to DB: {future.exception()}")
+
+    def _store_write(self, method: str, *args, **kwargs) -> None:
+        """Store write whose result is not needed; queued without waiting on a QueuedStore."""
+        if isinstance(self.store, QueuedStore):
+            self.store.defer(method, *args, **kwargs)
+        else:
+            getattr(self.store, method)(*args, **kwargs)
+
+    def _learn_from_page(self, url: str, page_record: Dict) -> None:
+        """
+        Feed one page's extraction outcome to the crawl learner, whose
+        ``adapt_frontier_scoring`` then weighs the domain's links; without
+        one, to the scorer's own domain learning. Never both, so a domain's
+        track record is counted once.
+        """
+        if not self.llm_extractor:
+            return  # Nothing was extracted, so the outcome says nothing
+        quality = page_record.get("avg_confidence", 0.0)
+        success = bool(page_record.get("has_high_confidence_intel"))
+        if not self.crawl_learner:
+            self.url_scorer.learn_domain_pattern(self._get_domain_key(url), success, quality)
+            return
+        try:
+            self.crawl_learner.record_crawl_result(
+                url=url,
+                page_type=page_record.get("page_type") or "general",
+                intel_quality=quality,
+                extraction_success=success,
+                entity_type=page_record.get("entity_type", ""),
+                intel_count=len(page_record.get("extracted_intel") or []),
+            )
+        except Exception as e:
+            self.logger.warning(f"Crawl learning recording failed: {e}")
+
     def _enqueue_new_links(self, frontier, base_url, html, links, depth, page_text):
         if depth >= self.max_depth:
             return
 
-        if self.enable_llm_link_rank and self.llm_extractor and links:
-            links = self.llm_extractor.rank_links(self.profile, base_url, page_text[:3000], links)
-
-        for link in links:
-            href = link.get("href")
+        links = [link for link in links if link.get("href")]
+        # One exact-tier lookup for the page's Bloom hits, not one per link
+        visited = self.visited_urls.contains_many(
+            self._normalize_url(link["href"]) for link in links
+        )
+        candidates = [link for link, seen in zip(links, visited) if not seen]
+        # Links inherit their page's seed for per-seed gain tracking
+        seed = (
+            self._url_seed.get(self._normalize_url(base_url))
+            if self.gain_tracker else None
+        )
+        scores = self.url_scorer.score_links(candidates, depth + 1)
+        entity_type = getattr(self.profile.entity_type, "value", str(self.profile.entity_type))
+        if self.link_ranker and candidates:
+            self.link_ranker.rank(
+                base_url, page_text or "", candidates, scores, self.score_threshold
+            )
+        for link, (h_score, reason) in zip(candidates, scores):
+            href = link["href"]
             text = link.get("text", "")
-            if not href or self._normalize_url(href) in self.visited_urls:
-                continue
-
-            h_score, reason = self.url_scorer.score_url(href, text, depth + 1)
             llm_score = float(link.get("llm_score", 0) or 0)
 
             final_score = max(h_score, llm_score)
+            if self.crawl_learner and final_score > 0:
+                final_score = self.crawl_learner.adapt_frontier_scoring(
+                    final_score, href, {"entity_type": entity_type}
+                )
             if final_score >= self.score_threshold:
                 frontier.push(final_score, depth + 1, href, text)
+                if seed:
+                    self._url_seed.setdefault(self._normalize_url(href), seed)
 
-    def _fetch_page_and_links(self, url: str, depth: int, browser: Optional[SeleniumBrowser]) -> Tuple[str, List[Dict]]:
-        if self.use_selenium and browser:
-            html = browser.get_page(url)
-            links = browser.find_links(url) if depth < self.max_depth else []
-            return html, links
-        else:
-            html = self._fetch_with_requests(url)
-            links = self._extract_links(url, html, {}, depth) if depth < self.max_depth else []
-            return html, links
+    def _fetch_page_and_links(self, url: str, depth: int,
+                              browser: Optional[Union[SeleniumBrowser, BrowserPool]]) -> Tuple[str, Optional[List[Dict]]]:
+        fetch_started = time.perf_counter()
+        try:
+            if self.use_selenium and browser:
+                started = time.monotonic()
+                if isinstance(browser, BrowserPool):
+                    html, links = browser.fetch(url, with_links=depth < self.max_depth)
+                else:
+                    html = browser.get_page(url)
+                    links = None
+                elapsed = time.monotonic() - started
+                if self.politeness_scheduler:
+                    self.politeness_scheduler.record_response(url, None, latency=elapsed)
+                if self.fetch_archive is not None and html:
+                    self._archive_response(
+                        url, 200, {"Content-Type": "text/html; charset=utf-8"},
+                        html.encode("utf-8"), elapsed, Renderer="selenium",
+                    )
+                if links is None:
+                    links = browser.find_links(url) if depth < self.max_depth else []
+                return html, links
+            else:
+                html = self._fetch_with_requests(url)
+                if self.parse_pool and self.parse_pool.active:
+                    # Parsed (links included) in a worker process after the batch
+                    return html, None
+                links = self._extract_links(url, html, {}, depth) if depth < self.max_depth else []
+                return html, links
+        finally:
+            # Picked up by the pipeline as the page's "fetch" stage
+            self._fetch_ms[url] = (time.perf_counter() - fetch_started) * 1000.0
 
     def _boost_domain_priority(self, url: str):
         domain = urlparse(url).netloc.lower()
         self.url_scorer.boost_domain(domain, amount=25)
         self.logger.info(f"Learning: Domain {domain} identified as high-value.")
 
-    def _normalize_url(self, url: str) -> str:
-        try:
-            p = urlparse(url)
-            return f"{p.scheme}://{p.netloc}{p.path}".rstrip("/")
-        except Exception:
-            return url
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        return canonicalize_url(url)
 
     def _get_domain_key(self, url: str) -> str:
         return urlparse(url).netloc.lower().replace("www.", "")
 
     def _fetch_with_requests(self, url: str) -> str:
+        if self.replay:
+            hit = self.fetch_archive.lookup(url)
+            if hit is None:
+                self.logger.debug(f"Replay miss: {url}")
+                return ""
+            return hit.text if hit.status == 200 else ""
+        started = time.monotonic()
         try:
             r = requests.get(url, timeout=10, headers={"User-Agent": "Mozilla/5.0"})
-            return r.text if r.status_code == 200 else ""
         except Exception:
             return ""
+        if self.fetch_archive is not None:
+            self._archive_response(
+                url, r.status_code, dict(r.headers), r.content, time.monotonic() - started
+            )
+        if self.politeness_scheduler:
+            self.politeness_scheduler.record_response(
+                url,
+                r.status_code,
+                latency=time.monotonic() - started,
+                retry_after=r.headers.get("Retry-After"),
+            )
+        return r.text if r.status_code == 200 else ""
+
+    def _archive_response(self, url: str, status: int, headers: Dict[str, str],
+                          body: bytes, elapsed: float, **extra) -> None:
+        try:
+            self.fetch_archive.record(url, status, headers, body, elapsed, extra=extra)
+        except Exception as e:
+            self.logger.warning(f"Archiving {url} failed: {e}")
 
     def _extract_links(
         self,
@@ -907,26 +1525,14 @@ class IntelligentExplorer:
         """
         Parse outgoing links from the page. Metadata/depth are accepted for compatibility.
         """
-        links: List[Dict] = []
         if not html:
-            return links
+            return []
         try:
             soup = BeautifulSoup(html, "html.parser")
-            for a in soup.find_all("a", href=True):
-                href = a.get("href")
-                text = a.get_text(strip=True)[:500] if a.get_text() else ""
-                links.append(
-                    {
-                        "href": urljoin(url, href),
-                        "text": text,
-                        "depth": depth + 1,
-                        "reason": "page_link",
-                        "score": 0,
-                    }
-                )
+            return self.content_extractor.links_from_soup(soup, url, depth)
         except Exception as e:
             self.logger.debug(f"_extract_links failed: {e}")
-        return links
+        return []
 
     def _collect_prior_intel_context(self, text_content: str) -> List[Dict]:
         context = []
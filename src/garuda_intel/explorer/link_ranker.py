@@ -0,0 +1,159 @@
+"""
+Tiered link ranking: heuristics first, the LLM only where it can help.
+
+The heuristic ``URLScorer`` settles most links on its own. Links it scores
+confidently (blacklisted/non-HTTP, or at least ``confident_score``) never
+reach the LLM. Of the remaining *ambiguous* links, the ones whose
+heuristic score sits closest to the crawl threshold are sent to the LLM,
+at most ``top_n`` per page.
+
+LLM scores are cached per (profile, canonical link URL, anchor text), so
+navigation links repeated site-wide are ranked once. A per-crawl budget
+caps the number of links sent to the LLM; once it is spent only cached
+scores and heuristics apply.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..discover.url_canonical import canonicalize_url
+from ..types.entity import EntityProfile
+
+# rank_fn(profile, page_url, page_text, links) -> links annotated with
+# "llm_score" (LLMIntelExtractor.rank_links)
+RankFn = Callable[[EntityProfile, str, str, List[Dict]], List[Dict]]
+
+
+class TieredLinkRanker:
+    """Annotates links with cached or freshly ranked ``llm_score`` values."""
+
+    def __init__(
+        self,
+        rank_fn: RankFn,
+        profile: EntityProfile,
+        top_n: int = 10,
+        llm_budget: Optional[int] = 200,
+        confident_score: float = 100.0,
+        cache_size: int = 50_000,
+        page_text_chars: int = 3000,
+    ):
+        """
+        Args:
+            rank_fn: LLM ranking call, usually ``llm_extractor.rank_links``
+            profile: Entity being researched (part of the cache key)
+            top_n: Maximum links per page sent to the LLM
+            llm_budget: Maximum links sent to the LLM per crawl (None = unlimited)
+            confident_score: Heuristic score at or above which a link skips the LLM
+            cache_size: Maximum cached (profile, url, anchor) rankings
+            page_text_chars: Page text passed to the LLM as context
+        """
+        self.rank_fn = rank_fn
+        self.profile = profile
+        self.top_n = top_n
+        self.llm_budget = llm_budget
+        self.confident_score = confident_score
+        self.cache_size = cache_size
+        self.page_text_chars = page_text_chars
+        self.logger = logging.getLogger(__name__)
+        self._cache: "OrderedDict[Tuple[str, str, str], float]" = OrderedDict()
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new crawl: restore the budget and zero the counters.
+        Cached rankings are kept."""
+        self.budget_used = 0
+        self.stats = {
+            "link_rank_llm_pages": 0,
+            "link_rank_llm_links": 0,
+            "link_rank_cache_hits": 0,
+            "link_rank_heuristic_only": 0,
+        }
+
+    @property
+    def budget_remaining(self) -> Optional[int]:
+        if self.llm_budget is None:
+            return None
+        return max(0, self.llm_budget - self.budget_used)
+
+    def _key(self, link: Dict) -> Tuple[str, str, str]:
+        profile_key = f"{self.profile.entity_type.value}:{self.profile.name.strip().lower()}"
+        anchor = " ".join((link.get("text") or "").split()).lower()
+        return (profile_key, canonicalize_url(link.get("href") or ""), anchor)
+
+    def _cache_put(self, key: Tuple[str, str, str], score: float) -> None:
+        self._cache[key] = score
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def rank(
+        self,
+        page_url: str,
+        page_text: str,
+        links: List[Dict],
+        heuristic_scores: List[Tuple[float, str]],
+        threshold: float,
+    ) -> List[Dict]:
+        """
+        Set ``llm_score`` on links that have a cached or new LLM ranking.
+
+        ``heuristic_scores`` are the ``URLScorer.score_links`` results for
+        *links*, in the same order. Links without an LLM ranking are left
+        untouched and fall back to their heuristic score.
+        """
+        ambiguous: Dict[Tuple[str, str, str], List[Tuple[Dict, float]]] = {}
+        for link, (h_score, _reason) in zip(links, heuristic_scores):
+            if h_score <= 0:
+                continue  # blacklisted or non-HTTP
+            key = self._key(link)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                link["llm_score"] = cached
+                self.stats["link_rank_cache_hits"] += 1
+            elif h_score >= self.confident_score:
+                self.stats["link_rank_heuristic_only"] += 1
+            else:
+                ambiguous.setdefault(key, []).append((link, h_score))
+
+        if not ambiguous:
+            return links
+
+        limit = self.top_n
+        if self.budget_remaining is not None:
+            limit = min(limit, self.budget_remaining)
+        # Closest to the threshold first: these are the links a ranking can flip
+        ordered = sorted(ambiguous.items(), key=lambda item: abs(item[1][0][1] - threshold))
+        selected = ordered[:limit]
+        for _, group in ordered[limit:]:
+            self.stats["link_rank_heuristic_only"] += len(group)
+        if not selected:
+            return links
+
+        batch = [dict(group[0][0]) for _, group in selected]
+        try:
+            ranked = (
+                self.rank_fn(self.profile, page_url, page_text[: self.page_text_chars], batch)
+                or batch
+            )
+        except Exception as e:
+            self.logger.debug(f"LLM link ranking failed for {page_url}: {e}")
+            return links
+        finally:
+            self.budget_used += len(batch)
+            self.stats["link_rank_llm_pages"] += 1
+            self.stats["link_rank_llm_links"] += len(batch)
+
+        # rank_fn may return new, re-ordered dicts
+        by_link = {(r.get("href"), r.get("text")): r for r in ranked}
+        for (key, group), sent in zip(selected, batch):
+            result = by_link.get((sent.get("href"), sent.get("text")), sent)
+            try:
+                score = float(result.get("llm_score", 0) or 0)
+            except (TypeError, ValueError):
+                score = 0.0
+            self._cache_put(key, score)
+            for link, _ in group:
+                link["llm_score"] = score
+        return links
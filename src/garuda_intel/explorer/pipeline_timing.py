@@ -0,0 +1,117 @@
+"""
+Per-page stage timing for the intelligence pipeline.
+
+``PageTiming`` is a lap timer: each ``lap(stage, **counts)`` charges the time
+since the previous lap to ``stage`` together with work counters (LLM calls,
+estimated tokens, embeddings, DB rows). Laps accumulate, so a stage entered
+several times (e.g. reflection per finding) sums up. ``StageTimingAggregate``
+collects the pages of one crawl and reports p50 / p95 per stage.
+"""
+
+import math
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+# Pipeline stages in execution order (reports list them in this order)
+PIPELINE_STAGES = (
+    "fetch",
+    "parse",
+    "extract",
+    "reflect",
+    "summarize",
+    "save_page",
+    "save_entities",
+    "save_intel",
+    "embed",
+    "snippets",
+)
+
+# Rough characters-per-token ratio used for LLM token estimates
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    return len(text or "") // CHARS_PER_TOKEN
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of *values* (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class PageTiming:
+    """Stage durations (ms) and work counters for one page."""
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._started = self._last = time.perf_counter()
+
+    def add(self, stage: str, ms: float, **counts: int) -> None:
+        """Charge *ms* (measured elsewhere, e.g. in a fetch worker) to *stage*."""
+        entry = self.stages.setdefault(stage, {"ms": 0.0})
+        entry["ms"] += ms
+        for key, value in counts.items():
+            if value:
+                entry[key] = entry.get(key, 0) + value
+
+    def lap(self, stage: str, **counts: int) -> None:
+        """Charge the time since the previous lap to *stage*."""
+        now = time.perf_counter()
+        self.add(stage, (now - self._last) * 1000.0, **counts)
+        self._last = now
+
+    def to_dict(self) -> Dict[str, Any]:
+        totals: Dict[str, int] = defaultdict(int)
+        for entry in self.stages.values():
+            for key, value in entry.items():
+                if key != "ms":
+                    totals[key] += value
+        return {
+            "total_ms": round(sum(e["ms"] for e in self.stages.values()), 3),
+            "stages": {
+                stage: {k: round(v, 3) if k == "ms" else v for k, v in entry.items()}
+                for stage, entry in self.stages.items()
+            },
+            "counts": dict(totals),
+        }
+
+
+class StageTimingAggregate:
+    """Per-stage distribution over the pages of one crawl."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.pages = 0
+        self._ms: Dict[str, List[float]] = defaultdict(list)
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def add(self, page_timing: Dict[str, Any]) -> None:
+        """Add one page's ``PageTiming.to_dict()``."""
+        self.pages += 1
+        for stage, entry in (page_timing.get("stages") or {}).items():
+            self._ms[stage].append(float(entry.get("ms", 0.0)))
+            for key, value in entry.items():
+                if key != "ms":
+                    self._counts[stage][key] += value
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        ordered = [s for s in PIPELINE_STAGES if s in self._ms]
+        ordered += sorted(s for s in self._ms if s not in PIPELINE_STAGES)
+        return {
+            stage: {
+                "pages": len(self._ms[stage]),
+                "total_ms": round(sum(self._ms[stage]), 3),
+                "p50_ms": round(percentile(self._ms[stage], 50), 3),
+                "p95_ms": round(percentile(self._ms[stage], 95), 3),
+                "max_ms": round(max(self._ms[stage]), 3),
+                "counts": dict(self._counts[stage]),
+            }
+            for stage in ordered
+        }
@@ -3,6 +3,15 @@ from typing import List, Tuple, Dict
 from urllib.parse import urlparse
 from ..types.entity.type import EntityType
 
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def _host_suffixes(netloc: str) -> List[str]:
+    """The host of *netloc* and each of its parent domains, longest first."""
+    host = netloc.rpartition("@")[2].split(":")[0]
+    labels = host.split(".")
+    return [".".join(labels[i:]) for i in range(len(labels))]
+
 
 class URLScorer:
     # Restored for compatibility with engine/_build_seed_urls logic
@@ -28,6 +37,14 @@ class URLScorer:
         "firmenwissen.de",
     }
 
+    TOPIC_KEYWORDS = ["wiki", "encyclopedia", "journal", "edu", "theory", "science"]
+    TYPE_KEYWORDS = {
+        EntityType.NEWS: ["news", "headline", "breaking", "latest"],
+        EntityType.PERSON: ["bio", "profile", "interview"],
+        EntityType.COMPANY: ["investor", "annual report", "leadership", "board", "sec"],
+    }
+    DEFAULT_KEYWORDS = ["about", "article", "story"]
+
     def __init__(self, company_name: str, entity_type: EntityType, patterns: List[Dict] = None, domains: List[Dict] = None):
         self.entity_type = entity_type
         self.company_name = company_name.lower()
@@ -38,15 +55,43 @@ class URLScorer:
         self.patterns = patterns or []
         self.domains = domains or []
         self.blacklist_compiled = self._compile_blacklist()
+        self._blacklist_combined = re.compile(
+            "|".join(f"(?:{p.pattern})" for p in self.blacklist_compiled), re.IGNORECASE
+        )
+        self._compiled_patterns_for = None
         self.dynamic_domains = {}  # track learned boosts
         
         # Learning system attributes
         self._domain_learning = {}  # domain -> {success_count, fail_count, avg_quality}
         self._pattern_weights = {}  # pattern -> learned weight adjustment
 
+    @property
+    def domains(self) -> List[Dict]:
+        return self._domains
+
+    @domains.setter
+    def domains(self, domains: List[Dict]):
+        self._domains = domains
+        # domain -> (list position, entry); the first entry for a domain wins, as in the list scan
+        self._domain_index = {}
+        for pos, d in enumerate(domains):
+            self._domain_index.setdefault(d["domain"], (pos, d))
+
+    @property
+    def dynamic_domains(self) -> Dict[str, float]:
+        return self._dynamic_domains
+
+    @dynamic_domains.setter
+    def dynamic_domains(self, boosts: Dict[str, float]):
+        self._dynamic_domains = dict(boosts)
+        # domain -> insertion rank, so reasons keep the dict's order
+        self._dynamic_rank = {dom: rank for rank, dom in enumerate(self._dynamic_domains)}
+
     def boost_domain(self, domain: str, amount: float = 25.0):
         """Allows the explorer to 'learn' which domains are useful."""
-        self.dynamic_domains[domain] = self.dynamic_domains.get(domain, 0) + amount
+        if domain not in self._dynamic_domains:
+            self._dynamic_rank[domain] = len(self._dynamic_rank)
+        self._dynamic_domains[domain] = self._dynamic_domains.get(domain, 0) + amount
 
     def _compile_blacklist(self):
         default = [
@@ -69,12 +114,90 @@ class URLScorer:
         ]
         return [re.compile(p, re.IGNORECASE) for p in default]
 
-    def score_url(self, url: str, link_text: str = "", current_depth: int = 0) -> Tuple[float, str]:
+    def _compiled_patterns(self):
+        """
+        Ordered (pattern, weight, compiled) triples plus one combined
+        alternation used as a fast "no pattern matches" check. The first
+        matching pattern in list order still wins, as in the per-pattern loop.
+        Rebuilt whenever a pattern or weight in ``self.patterns`` changes,
+        including in-place edits of the caller's list.
+        """
+        key = tuple((p.get("pattern"), p.get("weight", 0)) for p in self.patterns)
+        if self._compiled_patterns_for != key:
+            ordered, sources = [], []
+            for p in self.patterns:
+                pat = p.get("pattern")
+                if not pat:
+                    continue
+                try:
+                    compiled = re.compile(pat, re.IGNORECASE)
+                    sources.append(f"(?:{pat})")
+                except re.error:
+                    compiled = None  # re-raised by re.search at score time
+                ordered.append((pat, p.get("weight", 0), compiled))
+            combined = None
+            # Back-references would point at the wrong group once alternated
+            if sources and all(c is not None for _, _, c in ordered) and not any(
+                _BACKREF_RE.search(pat) for pat, _, _ in ordered
+            ):
+                try:
+                    combined = re.compile("|".join(sources), re.IGNORECASE)
+                except re.error:
+                    combined = None  # e.g. inline global flags; fall back to the loop
+            self._patterns_ordered = ordered
+            self._patterns_combined = combined
+            self._compiled_patterns_for = key
+        return self._patterns_ordered, self._patterns_combined
+
+    def _domain_score(self, domain: str) -> Tuple[float, List[str], float, List[str]]:
+        """
+        Domain-only score components, split at the point where URL-dependent
+        components are interleaved so reasons keep their original order:
+        (supplied-domain + exact-name score, reasons, dynamic + learned score, reasons).
+        """
+        head, head_reasons = 0.0, []
+        clean_domain = domain.replace("www.", "")
+        sld = clean_domain.split(".")[0]
+        clean_sld = re.sub(r"[^a-z0-9]", "", sld)
+
+        suffixes = _host_suffixes(domain)
+
+        # Domain boosts from supplied domains/patterns
+        matches = [self._domain_index[s] for s in suffixes if s in self._domain_index]
+        if matches:
+            _, d = min(matches, key=lambda m: m[0])
+            head += d.get("weight", 0)
+            head_reasons.append(f"Domain pattern: {d['domain']}")
+            if d.get("is_official"):
+                self.official_domains.add(d["domain"])
+                head += 150
+                head_reasons.append("Official domain")
+
+        # Exact company name match in domain
+        if self.clean_company_name and clean_sld == self.clean_company_name:
+            head += 40
+            head_reasons.append("Exact company name match in domain")
+
+        tail, tail_reasons = 0.0, []
+        # Dynamic boosts
+        for dom in sorted(
+            (s for s in suffixes if s in self._dynamic_domains), key=self._dynamic_rank.get
+        ):
+            tail += self._dynamic_domains[dom]
+            tail_reasons.append(f"Learned boost: {dom}")
+
+        # Apply learned domain boost
+        learned_boost = self.get_learned_boost(domain)
+        if abs(learned_boost) > 0.1:
+            tail += learned_boost
+            tail_reasons.append(f"Domain learning: {learned_boost:+.1f}")
+        return head, head_reasons, tail, tail_reasons
+
+    def _score_one(self, url: str, link_text: str, current_depth: int, domain_cache: Dict) -> Tuple[float, str]:
         url_lower = url.lower()
         text_lower = link_text.lower()
-        for pattern in self.blacklist_compiled:
-            if pattern.search(url_lower):
-                return (0.0, "Blacklisted pattern")
+        if self._blacklist_combined.search(url_lower):
+            return (0.0, "Blacklisted pattern")
         if not url_lower.startswith(("http://", "https://")):
             return (0.0, "Non-HTTP URL")
 
@@ -83,88 +206,76 @@ class URLScorer:
 
         # Topic-specific boost
         if self.entity_type == EntityType.TOPIC:
-            topic_keywords = ["wiki", "encyclopedia", "journal", "edu", "theory", "science"]
-            for kw in topic_keywords:
+            for kw in self.TOPIC_KEYWORDS:
                 if kw in url_lower:
                     score += 30
                     reasons.append(f"Topic-relevant domain: {kw}")
 
         # Strong name matches
-        for word in self.company_words:
-            if len(word) > 3 and (word in url_lower or word in text_lower):
-                score += 50
-                reasons.append(f"Match: {word}")
-
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        clean_domain = domain.replace("www.", "")
-        sld = clean_domain.split(".")[0]
-        clean_sld = re.sub(r"[^a-z0-9]", "", sld)
-
-        # Domain boosts from supplied domains/patterns
-        for d in self.domains:
-            if d["domain"] in domain:
-                score += d.get("weight", 0)
-                reasons.append(f"Domain pattern: {d['domain']}")
-                if d.get("is_official"):
-                    self.official_domains.add(d["domain"])
-                    score += 150
-                    reasons.append("Official domain")
-                break
+        name_hits = [
+            word for word in self.company_words
+            if len(word) > 3 and (word in url_lower or word in text_lower)
+        ]
+        for word in name_hits:
+            score += 50
+            reasons.append(f"Match: {word}")
 
-        # Exact company name match in domain
-        if self.clean_company_name and clean_sld == self.clean_company_name:
-            score += 40
-            reasons.append("Exact company name match in domain")
+        domain = urlparse(url).netloc.lower()
+        parts = domain_cache.get(domain)
+        if parts is None:
+            parts = domain_cache[domain] = self._domain_score(domain)
+        head, head_reasons, tail, tail_reasons = parts
+        score += head
+        reasons.extend(head_reasons)
 
         # Regex patterns
-        for p in self.patterns:
-            pat = p.get("pattern")
-            w = p.get("weight", 0)
-            if pat and re.search(pat, url_lower, re.IGNORECASE):
-                score += w
-                reasons.append(f"Pattern match: {pat}")
-                break
+        ordered, combined = self._compiled_patterns()
+        if ordered and (combined is None or combined.search(url_lower)):
+            for pat, w, compiled in ordered:
+                matched = (
+                    compiled.search(url_lower) if compiled is not None
+                    else re.search(pat, url_lower, re.IGNORECASE)
+                )
+                if matched:
+                    score += w
+                    reasons.append(f"Pattern match: {pat}")
+                    break
 
         # Entity-type keywords
-        keywords = []
-        if self.entity_type == EntityType.NEWS:
-            keywords = ["news", "headline", "breaking", "latest"]
-        elif self.entity_type == EntityType.PERSON:
-            keywords = ["bio", "profile", "interview"]
-        elif self.entity_type == EntityType.COMPANY:
-            keywords = ["investor", "annual report", "leadership", "board", "sec"]
-        else:
-            keywords = ["about", "article", "story"]
-
-        for kw in keywords:
+        for kw in self.TYPE_KEYWORDS.get(self.entity_type, self.DEFAULT_KEYWORDS):
             if kw in url_lower or kw in text_lower:
                 score += 20
                 reasons.append(f"Keyword: {kw}")
 
         # Company/person name in URL/text
-        for word in self.company_words:
-            if len(word) > 3 and (word in url_lower or word in text_lower):
-                score += 15
-                reasons.append("Name match")
+        for _ in name_hits:
+            score += 15
+            reasons.append("Name match")
 
-        # Dynamic boosts
-        for dom, boost in self.dynamic_domains.items():
-            if dom in domain:
-                score += boost
-                reasons.append(f"Learned boost: {dom}")
-        
-        # Apply learned domain boost
-        learned_boost = self.get_learned_boost(domain)
-        if abs(learned_boost) > 0.1:
-            score += learned_boost
-            reasons.append(f"Domain learning: {learned_boost:+.1f}")
+        score += tail
+        reasons.extend(tail_reasons)
 
         # Depth penalty
         score -= current_depth * 5
         score = max(0, min(score, 150))
         return score, "; ".join(reasons) if reasons else "Base score only"
 
+    def score_url(self, url: str, link_text: str = "", current_depth: int = 0) -> Tuple[float, str]:
+        return self._score_one(url, link_text, current_depth, {})
+
+    def score_links(self, links: List[Dict], current_depth: int = 0) -> List[Tuple[float, str]]:
+        """
+        Score many links from one page. Each link is a dict with ``href`` and
+        optional ``text``; results are in input order and identical to
+        calling ``score_url`` per link. Domain-dependent components are
+        computed once per distinct host.
+        """
+        domain_cache: Dict = {}
+        return [
+            self._score_one(link.get("href") or "", link.get("text") or "", current_depth, domain_cache)
+            for link in links
+        ]
+
     def should_explore(self, url: str, link_text: str = "", current_depth: int = 0, threshold: float = 25.0) -> bool:
         score, _ = self.score_url(url, link_text, current_depth)
         return score >= threshold
@@ -3,12 +3,16 @@ import re
 import json
 import logging
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin
 
 from .filter import SemanticFilter
 from ..types.entity.type import EntityType
 from ..types.page.fingerprint import PageFingerprint
 
+# Page chrome dropped before extracting visible text
+NON_CONTENT_TAGS = ["script", "style", "nav", "footer", "header", "aside", "form", "iframe", "noscript"]
+
 
 class ContentExtractor:
     """Extracts structured content from HTML pages with entity-aware heuristics."""
@@ -40,16 +44,48 @@ class ContentExtractor:
     def html_to_text(self, html: str, max_length: int = 15000) -> str:
         if not html:
             return ""
-        soup = BeautifulSoup(html, "html.parser")
-        for element in soup(
-            ["script", "style", "nav", "footer", "header", "aside", "form", "iframe", "noscript"]
-        ):
+        return self.text_from_soup(BeautifulSoup(html, "html.parser"), max_length)
+
+    def text_from_soup(self, soup: BeautifulSoup, max_length: int = 15000) -> str:
+        """Visible text of an already parsed page (removes non-content tags from *soup*)."""
+        for element in soup(NON_CONTENT_TAGS):
             element.decompose()
         text = soup.get_text(separator=" ", strip=True)
         text = re.sub(r"\s+", " ", text)
         text = self._strip_prompty_lines(text)
         return text[:max_length]
 
+    def links_from_soup(self, soup: BeautifulSoup, base_url: str, depth: int = 0) -> List[Dict]:
+        """Outgoing ``<a href>`` links as frontier candidates one level deeper."""
+        links: List[Dict] = []
+        for a in soup.find_all("a", href=True):
+            text = a.get_text(strip=True)[:500] if a.get_text() else ""
+            links.append(
+                {
+                    "href": urljoin(base_url, a.get("href")),
+                    "text": text,
+                    "depth": depth + 1,
+                    "reason": "page_link",
+                    "score": 0,
+                }
+            )
+        return links
+
+    def media_candidates_from_soup(self, soup: BeautifulSoup, base_url: str) -> List[Tuple[str, str]]:
+        """``(media_type, absolute_url)`` for images and HTML5 video/audio sources."""
+        candidates: List[Tuple[str, str]] = []
+        for img in soup.find_all("img"):
+            src = img.get("src")
+            if src and not src.startswith("data:"):
+                candidates.append(("image", urljoin(base_url, src)))
+        for media_type in ("video", "audio"):
+            for element in soup.find_all(media_type):
+                for source in element.find_all("source"):
+                    src = source.get("src")
+                    if src:
+                        candidates.append((media_type, urljoin(base_url, src)))
+        return candidates
+
     def extract_images(self, html: str, base_url: str) -> List[Dict]:
         """
         Specific extraction for better visual data selection.
@@ -70,10 +106,12 @@ class ContentExtractor:
         return images
 
     def extract_metadata(self, html: str) -> dict:
-        metadata = {}
         if not html:
-            return metadata
-        soup = BeautifulSoup(html, "html.parser")
+            return {}
+        return self.metadata_from_soup(BeautifulSoup(html, "html.parser"))
+
+    def metadata_from_soup(self, soup: BeautifulSoup) -> dict:
+        metadata = {}
         title_tag = soup.find("title")
         if title_tag:
             metadata["title"] = title_tag.get_text(strip=True)
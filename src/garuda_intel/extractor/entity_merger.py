@@ -13,10 +13,12 @@ import uuid
 from datetime import datetime, timezone
 from typing import List, Dict, Optional, Any, Tuple
 
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from sqlalchemy import select, or_
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.orm.attributes import flag_modified
 
+from ..database.names import name_match, name_prefix_match, name_word_match, normalize_entity_name
+from ..database.trigrams import trigram_candidates
 from ..database.models import (
     Entity,
     Relationship,
@@ -36,6 +38,10 @@ EQUIVALENT_TYPES = {
     "location": ["address"],
 }
 
+# Names sharing the most trigrams with the query scored per semantic
+# duplicate lookup (see database.trigrams)
+TRIGRAM_CANDIDATES = 50
+
 
 def _get_registry() -> EntityKindRegistry:
     """Get the global EntityKindRegistry instance."""
@@ -215,7 +221,8 @@ class EntityMerger:
         Find an existing entity by name, optionally with fuzzy matching.
         
         Searches for entities that:
-        1. Have exactly the same name (case-insensitive)
+        1. Have the same normalized name or alias (case, punctuation and
+           legal suffix ignored, see ``database.names``)
         2. Have a similar name if fuzzy_match is True
         3. Optionally filters by entity kind/type
         
@@ -234,17 +241,15 @@ class EntityMerger:
         name_normalized = name.strip().lower()
         
         with self.Session() as session:
-            # 1. Try exact match first
-            stmt = select(Entity).where(func.lower(Entity.name) == name_normalized)
-            if kind:
-                # Allow matching parent or child types
-                matching_kinds = self._get_compatible_kinds(kind)
-                stmt = stmt.where(Entity.kind.in_(matching_kinds))
-            stmt = stmt.order_by(Entity.created_at)
+            # Allow matching parent or child types. Kinds are checked on the
+            # few name matches: in SQL the planner may scan the kind index
+            matching_kinds = set(self._get_compatible_kinds(kind)) if kind else None
             
-            entity = session.execute(stmt).scalars().first()
-            if entity:
-                return self._entity_to_dict(entity)
+            # 1. Try exact match first
+            stmt = select(Entity).where(name_match([name])).order_by(Entity.created_at)
+            for entity in session.execute(stmt).scalars():
+                if matching_kinds is None or entity.kind in matching_kinds:
+                    return self._entity_to_dict(entity)
             
             # 2. Try vector/semantic search if available
             if self.vector_store and self.llm:
@@ -260,7 +265,7 @@ class EntityMerger:
                                 # Found a semantic match - look up the actual entity
                                 vec_entity = session.execute(
                                     select(Entity).where(
-                                        func.lower(Entity.name) == entity_name.lower()
+                                        name_match([entity_name])
                                     ).order_by(Entity.created_at)
                                 ).scalars().first()
                                 if vec_entity:
@@ -268,19 +273,25 @@ class EntityMerger:
                 except Exception as e:
                     self.logger.debug(f"Vector entity lookup failed: {e}")
             
-            # 3. Try fuzzy match if enabled
+            # 3. Try fuzzy match if enabled: names or aliases starting with
+            # the normalized name and the names sharing the most trigrams
+            # with it, compared in normalized form
             if fuzzy_match:
-                stmt = select(Entity).where(
-                    func.lower(Entity.name).like(f"%{name_normalized}%")
-                )
-                if kind:
-                    matching_kinds = self._get_compatible_kinds(kind)
-                    stmt = stmt.where(Entity.kind.in_(matching_kinds))
-                
-                candidates = session.execute(stmt).scalars().all()
+                similar_ids = trigram_candidates(session, name, kinds=matching_kinds)
+                candidates = session.execute(
+                    select(Entity)
+                    .where(or_(name_prefix_match(name), Entity.id.in_(similar_ids)))
+                    .options(selectinload(Entity.aliases))
+                ).scalars().all()
                 
+                key = normalize_entity_name(name)
                 for candidate in candidates:
-                    similarity = self._calculate_name_similarity(name_normalized, candidate.name.lower())
+                    if matching_kinds is not None and candidate.kind not in matching_kinds:
+                        continue
+                    similarity = max(
+                        self._calculate_name_similarity(key, n)
+                        for n in [candidate.name_norm or "", *(a.alias_norm for a in candidate.aliases)]
+                    )
                     if similarity >= threshold:
                         return self._entity_to_dict(candidate)
             
@@ -565,26 +576,9 @@ class EntityMerger:
     def _find_entity_in_session(
         self, session: Session, name: str, kind: Optional[str]
     ) -> Optional[Entity]:
-        """Find entity within an existing session."""
-        name_normalized = name.strip().lower()
-        
-        # Try exact name match
-        stmt = select(Entity).where(func.lower(Entity.name) == name_normalized).order_by(Entity.created_at)
-        entity = session.execute(stmt).scalars().first()
-        
-        if entity:
-            return entity
-        
-        # Try with compatible kinds
-        if kind:
-            matching_kinds = self._get_compatible_kinds(kind)
-            stmt = select(Entity).where(
-                func.lower(Entity.name) == name_normalized,
-                Entity.kind.in_(matching_kinds)
-            )
-            return session.execute(stmt).scalar_one_or_none()
-        
-        return None
+        """Find entity within an existing session (normalized name or alias match)."""
+        stmt = select(Entity).where(name_match([name])).order_by(Entity.created_at)
+        return session.execute(stmt).scalars().first()
     
     def _update_existing_entity(
         self,
@@ -989,16 +983,19 @@ class SemanticEntityDeduplicator:
         results = []
         
         with self.Session() as session:
-            # Get all entities of the same kind (or all if no kind specified)
-            stmt = select(Entity)
-            if kind:
-                # Also include compatible kinds
-                compatible_kinds = self._get_compatible_kinds(kind)
-                stmt = stmt.where(Entity.kind.in_(compatible_kinds))
-            
-            entities = session.execute(stmt).scalars().all()
+            # Candidates: same normalized name or alias, and the names sharing
+            # the most trigrams with it, of the same kind (or compatible kinds)
+            compatible_kinds = set(self._get_compatible_kinds(kind)) if kind else None
+            similar_ids = trigram_candidates(
+                session, name, k=max(TRIGRAM_CANDIDATES, max_results * 5), kinds=compatible_kinds
+            )
+            stmt = select(Entity).where(or_(name_match([name]), Entity.id.in_(similar_ids)))
+            entities = [
+                e for e in session.execute(stmt).scalars()
+                if compatible_kinds is None or e.kind in compatible_kinds
+            ]
             
-            # Calculate similarity for each entity
+            # Calculate similarity for each candidate
             for entity in entities:
                 if entity.name.lower() == name.lower():
                     # Exact match
@@ -1618,10 +1615,8 @@ class GraphSearchEngine:
         seen_ids = set()
         
         with self.Session() as session:
-            # 1. SQL exact matches (name contains query)
-            stmt = select(Entity).where(
-                func.lower(Entity.name).like(f"%{query.lower()}%")
-            )
+            # 1. SQL matches (a word of the name or an alias starts with query)
+            stmt = select(Entity).where(name_word_match(session, query))
             if kind:
                 stmt = stmt.where(Entity.kind == kind)
             
@@ -52,6 +52,7 @@ class LLMIntelExtractor:
         max_window_embeddings: int = 200,
         max_total_embeddings: int = 1200,
         min_text_length_for_embedding: int = 10,
+        embedder=None,
         # Timeouts / retries (default 15 minutes for long operations)
         summarize_timeout: int = 900,
         summarize_retries: int = 3,
@@ -88,6 +89,7 @@ class LLMIntelExtractor:
             max_window_embeddings=max_window_embeddings,
             max_total_embeddings=max_total_embeddings,
             min_text_length_for_embedding=min_text_length_for_embedding,
+            embedder=embedder,
         )
         
         self.intel_extractor = IntelExtractor(
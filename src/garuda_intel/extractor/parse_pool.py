@@ -0,0 +1,259 @@
+"""
+Process-pool offload for CPU-bound HTML processing.
+
+``parse_html`` turns one page into a ``ParsedPage`` with a single
+BeautifulSoup parse: metadata, outgoing links and media candidates are read
+first, then page chrome is removed for the visible text, which is finally
+split into 1-3 sentence snippet texts.
+
+``HTMLParsePool`` runs ``parse_html`` in worker processes so a crawl's
+parsing scales across cores while the main process orchestrates LLM and DB
+work. Pages go to the workers as UTF-8 bytes and come back as plain tuples
+(links as ``(href, text)``, media as ``(type, url)``, snippets as strings);
+the per-link dict fields and snippet context are rebuilt in the main
+process. With ``workers <= 0``, or when a worker fails, pages are parsed
+in-process instead.
+"""
+
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup
+
+from .engine import ContentExtractor
+from .semantic_chunker import SemanticChunker, TextChunk
+
+logger = logging.getLogger(__name__)
+
+# Same limits the explorer applies when parsing in-process
+DEFAULT_MAX_TEXT_LENGTH = 15000
+SNIPPET_MAX_SENTENCES = 3
+
+
+@dataclass
+class ParsedPage:
+    """Everything the intelligence pipeline needs from a page's HTML."""
+
+    text: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    links: List[Dict] = field(default_factory=list)
+    media: List[Tuple[str, str]] = field(default_factory=list)
+    snippet_texts: List[str] = field(default_factory=list)
+    parse_ms: float = 0.0
+
+    def snippets(self, source_url: Optional[str] = None) -> List[TextChunk]:
+        """Snippet texts as ``TextChunk`` objects with offsets and context."""
+        return SemanticChunker().snippets_from_texts(self.snippet_texts, source_url=source_url)
+
+    def to_wire(self) -> tuple:
+        """Compact tuple form sent back from a worker process."""
+        return (
+            self.text,
+            self.metadata,
+            [(link["href"], link["text"]) for link in self.links],
+            self.media,
+            self.snippet_texts,
+            self.parse_ms,
+        )
+
+    @classmethod
+    def from_wire(cls, wire: tuple, depth: int = 0) -> "ParsedPage":
+        text, metadata, links, media, snippet_texts, parse_ms = wire
+        return cls(
+            text=text,
+            metadata=metadata,
+            links=[
+                {
+                    "href": href,
+                    "text": link_text,
+                    "depth": depth + 1,
+                    "reason": "page_link",
+                    "score": 0,
+                }
+                for href, link_text in links
+            ],
+            media=[tuple(m) for m in media],
+            snippet_texts=snippet_texts,
+            parse_ms=parse_ms,
+        )
+
+
+def parse_html(
+    url: str,
+    html: Union[str, bytes],
+    depth: int = 0,
+    max_text_length: int = DEFAULT_MAX_TEXT_LENGTH,
+    extractor: Optional[ContentExtractor] = None,
+    chunker: Optional[SemanticChunker] = None,
+) -> ParsedPage:
+    """Parse *html* once into text, metadata, links, media and snippet texts."""
+    started = time.perf_counter()
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
+    if not html:
+        return ParsedPage()
+    extractor = extractor or ContentExtractor()
+    chunker = chunker or SemanticChunker()
+
+    soup = BeautifulSoup(html, "html.parser")
+    metadata = extractor.metadata_from_soup(soup)
+    links = extractor.links_from_soup(soup, url, depth)
+    media = extractor.media_candidates_from_soup(soup, url)
+    # Removes page chrome from the soup, so it runs after the reads above
+    text = extractor.text_from_soup(soup, max_text_length)
+    snippet_texts = [
+        s.text for s in chunker.chunk_into_snippets(text, max_sentences=SNIPPET_MAX_SENTENCES)
+    ]
+    return ParsedPage(
+        text=text,
+        metadata=metadata,
+        links=links,
+        media=media,
+        snippet_texts=snippet_texts,
+        parse_ms=(time.perf_counter() - started) * 1000.0,
+    )
+
+
+# Per-process helpers, built once by the worker initializer
+_worker_extractor: Optional[ContentExtractor] = None
+_worker_chunker: Optional[SemanticChunker] = None
+
+
+def _init_worker() -> None:
+    global _worker_extractor, _worker_chunker
+    _worker_extractor = ContentExtractor()
+    _worker_chunker = SemanticChunker()
+
+
+def _parse_in_worker(url: str, body: bytes, depth: int, max_text_length: int) -> tuple:
+    return parse_html(
+        url,
+        body,
+        depth,
+        max_text_length,
+        extractor=_worker_extractor,
+        chunker=_worker_chunker,
+    ).to_wire()
+
+
+def _noop() -> None:
+    return None
+
+
+class PendingParse:
+    """Handle for a submitted page; ``result()`` blocks until it is parsed."""
+
+    def __init__(
+        self,
+        pool: "HTMLParsePool",
+        url: str,
+        html: Union[str, bytes],
+        depth: int,
+        future: Optional[Future] = None,
+    ):
+        self._pool = pool
+        self.url = url
+        self._html = html
+        self.depth = depth
+        self._future = future
+        self._result: Optional[ParsedPage] = None
+
+    def result(self) -> ParsedPage:
+        if self._result is None:
+            self._result = self._pool._resolve(self)
+            self._html = None
+        return self._result
+
+
+class HTMLParsePool:
+    """
+    Parses pages in ``workers`` processes (in-process when ``workers <= 0``).
+
+    Workers are started with ``forkserver`` where available (``spawn``
+    elsewhere), never by forking the crawling process, whose fetch and
+    background threads may hold locks a forked child would inherit held.
+    The fork server imports this module once and forks each worker from
+    that clean, single-threaded process, so workers do not each re-import
+    the extractor modules.
+    """
+
+    def __init__(self, workers: int = 0, max_text_length: int = DEFAULT_MAX_TEXT_LENGTH):
+        self.max_text_length = max_text_length
+        self.workers = max(0, int(workers or 0))
+        self._extractor = ContentExtractor()
+        self._chunker = SemanticChunker()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        if self.workers:
+            try:
+                if "forkserver" in multiprocessing.get_all_start_methods():
+                    context = multiprocessing.get_context("forkserver")
+                    context.set_forkserver_preload([__name__])
+                else:
+                    context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                )
+                self._executor.submit(_noop).result()
+            except Exception as e:
+                logger.warning(f"HTML parse pool unavailable, parsing in-process: {e}")
+                self._shutdown()
+
+    @property
+    def active(self) -> bool:
+        """True while pages are parsed in worker processes."""
+        return self._executor is not None
+
+    def submit(self, url: str, html: Union[str, bytes], depth: int = 0) -> PendingParse:
+        """Queue *html* for parsing; in-process pages are parsed on ``result()``."""
+        future = None
+        if self._executor is not None and html:
+            body = html.encode("utf-8") if isinstance(html, str) else html
+            try:
+                future = self._executor.submit(
+                    _parse_in_worker, url, body, depth, self.max_text_length
+                )
+            except Exception as e:
+                logger.warning(f"HTML parse pool failed, parsing in-process: {e}")
+                self._shutdown()
+        return PendingParse(self, url, html, depth, future)
+
+    def parse(self, url: str, html: Union[str, bytes], depth: int = 0) -> ParsedPage:
+        """Parse one page in the calling process."""
+        return parse_html(
+            url,
+            html,
+            depth,
+            self.max_text_length,
+            extractor=self._extractor,
+            chunker=self._chunker,
+        )
+
+    def _resolve(self, pending: PendingParse) -> ParsedPage:
+        if pending._future is not None:
+            try:
+                return ParsedPage.from_wire(pending._future.result(), pending.depth)
+            except Exception as e:
+                logger.warning(f"Parse worker failed for {pending.url}, parsing in-process: {e}")
+        return self.parse(pending.url, pending._html, pending.depth)
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "HTMLParsePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -601,12 +601,34 @@ class SemanticChunker:
         if not sentences:
             return []
 
+        snippets = self.snippets_from_texts(
+            [
+                " ".join(sentences[i : i + max_sentences])
+                for i in range(0, len(sentences), max_sentences)
+            ],
+            source_url=source_url,
+        )
+
+        self.logger.debug(
+            f"Created {len(snippets)} semantic snippets from {len(sentences)} sentences"
+        )
+        return snippets
+
+    def snippets_from_texts(
+        self,
+        texts: List[str],
+        source_url: Optional[str] = None,
+    ) -> List[TextChunk]:
+        """Build snippets (offsets, index, prev/next context) from their texts.
+
+        ``chunk_into_snippets`` without the sentence split, so snippet texts
+        split elsewhere (e.g. in a parse worker) can be turned back into
+        :class:`TextChunk` objects.
+        """
         snippets: List[TextChunk] = []
         offset = 0
 
-        for i in range(0, len(sentences), max_sentences):
-            group = sentences[i : i + max_sentences]
-            snippet_text = " ".join(group)
+        for snippet_text in texts:
             start_idx = offset
             end_idx = offset + len(snippet_text)
             offset = end_idx + 1  # account for split whitespace
@@ -630,7 +652,4 @@ class SemanticChunker:
                 next_text = snippets[idx + 1].text
                 snippet.next_context = next_text[: self.SNIPPET_CONTEXT_CHARS]
 
-        self.logger.debug(
-            f"Created {len(snippets)} semantic snippets from {len(sentences)} sentences"
-        )
         return snippets
@@ -28,6 +28,7 @@ class SemanticEngine:
         max_total_embeddings: int = 1200,
         min_text_length_for_embedding: int = 10,
         cache_manager: Optional[CacheManager] = None,
+        embedder: Any = None,
     ):
         self.logger = logging.getLogger(__name__)
         self.embedding_model_name = embedding_model
@@ -41,7 +42,10 @@ class SemanticEngine:
         self.text_processor = TextProcessor()
         self.cache_manager = cache_manager
 
-        if SentenceTransformer:
+        if embedder is not None:
+            # Pre-built encoder (e.g. a deterministic benchmark embedder)
+            self._embedder = embedder
+        elif SentenceTransformer:
             try:
                 self._embedder = SentenceTransformer(embedding_model)
                 self.logger.info(f"Loaded embedding model: {embedding_model}")
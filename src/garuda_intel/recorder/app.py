@@ -20,8 +20,20 @@ logger = logging.getLogger("mark_server")
 logger.setLevel(logging.INFO)
 received_pages = queue.Queue()
 
-store = SQLAlchemyStore(DB_PATH)
-ingestor = RecorderIngestor(store)
+# Opened on first use so importing the app never creates a database file
+_store = None
+_ingestor = None
+
+def get_store():
+    global _store, _ingestor
+    if _store is None:
+        _store = SQLAlchemyStore(DB_PATH)
+        _ingestor = RecorderIngestor(_store)
+    return _store
+
+def get_ingestor():
+    get_store()
+    return _ingestor
 
 def api_key_required(f):
     @wraps(f)
@@ -47,7 +59,7 @@ def mark_page():
     url = (data.get('url', '') or '')[:80]
     logger.info(f"[mark_server] ({session_id}) {client_addr} → Received {mode} mark event for {url}")
     received_pages.put(data)
-    ingestor.ingest_marked_page(data)
+    get_ingestor().ingest_marked_page(data)
     return jsonify({"status": "received"})
 
 @app.route('/queue_info', methods=['GET'])
@@ -80,7 +92,7 @@ def search_intel():
     page_type = request.args.get("page_type")
     if not q:
         return jsonify({"error": "Missing search keyword"}), 400
-    results = store.search_intel(q, limit=limit, entity_type=entity_type, page_type=page_type)
+    results = get_store().search_intel(q, limit=limit, entity_type=entity_type, page_type=page_type)
     return jsonify({"results": results})
 
 # --- NEW: BASIC VIEW ENDPOINT
@@ -91,13 +103,14 @@ def view_page():
     url = request.args.get("url", "")
     if not url:
         return jsonify({"error": "url required"}), 400
+    store = get_store()
     with store.Session() as session:
         pc = session.get(store.PageContent, url)
         pg = session.get(store.Page, url)
         return jsonify({
             "url": url,
             "metadata": pc.metadata_json if pc else None,
-            "html": pc.html if pc else None,
+            "html": pc.load_html() if pc else None,
             "text": pc.text if pc else None,
             "page_info": pg.to_dict() if pg else None,
         })
@@ -16,7 +16,13 @@ from .handlers import (
     interactive_chat,
 )
 from .run_crawl_api import run_crawl_api
-from .seed_discovery import collect_candidates_simple
+from .seed_discovery import (
+    SearchService,
+    collect_candidates_simple,
+    configure_search,
+    get_search_service,
+)
+from .providers import FixtureSearchProvider, SearchProvider, SearchRateLimited
 
 # Export all public API
 __all__ = [
@@ -33,4 +39,11 @@ __all__ = [
     "run_crawl_api",
     # Helper functions
     "collect_candidates_simple",
+    # Search providers and shared search service
+    "SearchService",
+    "SearchProvider",
+    "SearchRateLimited",
+    "FixtureSearchProvider",
+    "configure_search",
+    "get_search_service",
 ]
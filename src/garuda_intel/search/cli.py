@@ -96,6 +96,17 @@ def parse_args() -> argparse.Namespace:
     run_parser.add_argument("--search-entity-type", default="", help="Filter search by entity_type")
     run_parser.add_argument("--search-page-type", default="", help="Filter search by page_type")
     run_parser.add_argument("--enable-llm-link-rank", action="store_true", help="Use LLM to rank sublinks before scoring")
+    run_parser.add_argument("--browser-pool-size", type=int, default=3, help="Headless Selenium drivers rendering pages concurrently (with --use-selenium)")
+    run_parser.add_argument("--archive-dir", default="", help="Write every raw fetch response to a WARC-style archive in this directory")
+    run_parser.add_argument("--replay", action="store_true", help="Serve fetches from --archive-dir instead of the network")
+    run_parser.add_argument("--search-cache", default="", help="SQLite file caching search results (24h TTL) across runs")
+    run_parser.add_argument("--search-fixtures", default="", help="JSON {query: [results]} served instead of live web search")
+    run_parser.add_argument("--llm-link-top-n", type=int, default=10, help="Max ambiguous links per page sent to the LLM ranker")
+    run_parser.add_argument("--llm-link-budget", type=int, default=200, help="Max links sent to the LLM ranker per crawl (0 = heuristics only)")
+    run_parser.add_argument("--min-marginal-gain", type=float, default=None, help="Stop (or drop a seed) once recent pages average less new entities/fields/relationships than this")
+    run_parser.add_argument("--parse-workers", type=int, default=0, help="Worker processes parsing fetched HTML (0 = parse in the main process)")
+    run_parser.add_argument("--group-commit", action="store_true", help="Coalesce the crawl's DB writes into batched transactions on one writer thread")
+    run_parser.add_argument("--crawl-session", default="", help="Persist the frontier under this key; rerun with the same key to resume (requires DB)")
 
     intel_parser = subparsers.add_parser("intel", help="Search and export gathered intelligence")
     add_common_logging(intel_parser)
@@ -8,21 +8,30 @@ from urllib.parse import urlparse
 import pandas as pd
 
 from ..database.engine import SQLAlchemyStore
+from ..database.write_queue import QueuedStore
 from ..database.models import Intelligence, Entity
 from ..extractor.llm import LLMIntelExtractor
 from ..vector.engine import QdrantVectorStore
 from ..types.entity import EntityProfile, EntityType
 from ..explorer.engine import IntelligentExplorer
-from ..browser.selenium import SeleniumBrowser
+from ..browser.pool import BrowserPool, get_shared_pool
 from ..discover.seeds import generate_seeds
-from ..discover.refresh import RefreshRunner
+from ..database.refresh import RefreshRunner
+from ..discover.fetch_archive import FetchArchive
 from ..explorer.scorer import URLScorer
 
 from .utils import normalize_db_url, init_vector_store
 from .filtering import _kind_filter, _filter_by_entity_name
 from .deduplication import _dedupe_payload_hits, _aggregate_entities, _extract_entity_fields
 from .hydration import _hydrate_intel, _hydrate_entities
-from .seed_discovery import collect_candidates, collect_candidates_simple, load_seeds_from_db
+from .seed_discovery import (
+    collect_candidates,
+    collect_candidates_simple,
+    configure_search,
+    load_seeds_from_db,
+)
+from .providers import FixtureSearchProvider
+from ..cache.search_cache import SearchCache
 from .active_mode import run_active_session
 from .formatters import fetch_text
 
@@ -229,14 +238,10 @@ def interactive_chat(args):
             
             browser = None
             if args.use_selenium:
-                browser = SeleniumBrowser(headless=True)
-                browser._init_driver()
+                # Reused by later questions in this chat session
+                browser = get_shared_pool(size=getattr(args, "browser_pool_size", 3))
             
-            try:
-                explorer.explore(live_urls, browser)
-            finally:
-                if browser:
-                    browser.close()
+            explorer.explore(live_urls, browser)
 
             print("[*] Re-evaluating with fresh intelligence...")
             answer = perform_rag_search(query, store, v_store, llm)
@@ -249,12 +254,34 @@ def interactive_chat(args):
             logger.error(f"Chat Loop Error: {e}")
 
 
+def _open_fetch_archive(args):
+    """FetchArchive for --archive-dir (None when unset); --replay requires it."""
+    archive_dir = getattr(args, "archive_dir", "") or ""
+    if getattr(args, "replay", False) and not archive_dir:
+        raise ValueError("--replay requires --archive-dir")
+    return FetchArchive(archive_dir) if archive_dir else None
+
+
+def _configure_search(args):
+    """Route SERP queries through --search-fixtures and/or --search-cache when given."""
+    fixtures = getattr(args, "search_fixtures", "") or ""
+    cache_path = getattr(args, "search_cache", "") or ""
+    if fixtures or cache_path:
+        configure_search(
+            provider=FixtureSearchProvider.from_file(fixtures) if fixtures else None,
+            cache=SearchCache(cache_path) if cache_path else None,
+        )
+
+
 def handle_run(args, return_result: bool = False):
     persistence_enabled = args.use_sqlite or bool(args.db_url)
     db_url = normalize_db_url(args.db_url, args.sqlite_path) if persistence_enabled else ""
     store = SQLAlchemyStore(db_url) if persistence_enabled else None
     vector_store = init_vector_store(args)
     llm = LLMIntelExtractor(args.ollama_url, args.model, embedding_model=args.embedding_model)
+    fetch_archive = _open_fetch_archive(args)
+    replay = bool(getattr(args, "replay", False))
+    _configure_search(args)
 
     if args.active_mode and not return_result:
         run_active_session(store)
@@ -359,7 +386,10 @@ def handle_run(args, return_result: bool = False):
                     return {"fetch_text": args.fetch_text, "status": "ok"}
                 return
             logging.info("Text not found; refetching page...")
-            rr = RefreshRunner(store=store, use_selenium=args.use_selenium, vector_store=vector_store, llm_extractor=llm)  # type: ignore
+            rr = RefreshRunner(
+                store=store, use_selenium=args.use_selenium, vector_store=vector_store, llm_extractor=llm,
+                fetch_archive=fetch_archive, replay=replay,
+            )
             rr.run(batch=1)
             found = fetch_text(store, args.fetch_text)
             if not found:
@@ -369,7 +399,10 @@ def handle_run(args, return_result: bool = False):
                 logging.error(msg)
             return
         if args.refresh:
-            rr = RefreshRunner(store=store, use_selenium=args.use_selenium, vector_store=vector_store, llm_extractor=llm)  # type: ignore
+            rr = RefreshRunner(
+                store=store, use_selenium=args.use_selenium, vector_store=vector_store, llm_extractor=llm,
+                fetch_archive=fetch_archive, replay=replay,
+            )
             rr.run(batch=args.refresh_batch)
             if return_result:
                 return {"refresh": "ok", "batch": args.refresh_batch}
@@ -444,6 +477,10 @@ def handle_run(args, return_result: bool = False):
                 except Exception:
                     continue
     profile.official_domains = official_domains
+    # One writer thread coalescing the crawl's writes into batched transactions
+    persistence = (
+        QueuedStore(store) if store and getattr(args, "group_commit", False) else store
+    )
     explorer = IntelligentExplorer(
         profile=profile,
         use_selenium=args.use_selenium,
@@ -451,16 +488,25 @@ def handle_run(args, return_result: bool = False):
         max_total_pages=args.total_pages or args.max_pages * 20,
         max_depth=args.max_depth,
         score_threshold=args.score_threshold,
-        persistence=store,
+        persistence=persistence,
         vector_store=vector_store,
         llm_extractor=llm,
         enable_llm_link_rank=args.enable_llm_link_rank,
+        llm_link_rank_top_n=getattr(args, "llm_link_top_n", 10),
+        llm_link_rank_budget=getattr(args, "llm_link_budget", 200),
+        frontier_session=getattr(args, "crawl_session", "") or None,
+        browser_pool_size=getattr(args, "browser_pool_size", 3),
+        fetch_archive=fetch_archive,
+        replay=replay,
+        min_marginal_gain=getattr(args, "min_marginal_gain", None),
+        parse_workers=getattr(args, "parse_workers", 0),
     )
     browser = None
-    if args.use_selenium:
+    if args.use_selenium and not replay:
         try:
-            browser = SeleniumBrowser(headless=True, timeout=8)
-            browser._init_driver()
+            browser = BrowserPool(
+                size=getattr(args, "browser_pool_size", 3), page_load_timeout=8
+            ).start()
         except Exception as e:
             logging.warning(f"Could not init Selenium: {e}")
             browser = None
@@ -470,6 +516,8 @@ def handle_run(args, return_result: bool = False):
     finally:
         if browser:
             browser.close()
+        if persistence is not store:
+            persistence.close()
     result = {
         "entity": entity_name,
         "entity_type": args.type,
@@ -477,7 +525,11 @@ def handle_run(args, return_result: bool = False):
         "seed_query": args.seed_query if args.seed_query else "",
         "seeds": seed_urls,
         "official_domains": official_domains,
+        "crawl_session": getattr(args, "crawl_session", "") or None,
         "pages_explored": len(explored),
+        "crawl_stats": explorer.get_crawl_stats(),
+        "crawl_id": explorer.crawl_id,
+        "stage_timings": explorer.get_stage_timings(),
         "explored_data": explored,
     }
     if args.output:
@@ -0,0 +1,59 @@
+"""
+Pluggable web search providers for seed discovery.
+
+A provider turns a query into raw result dicts (``href``, ``title``,
+``body``). ``FixtureSearchProvider`` serves canned results from a JSON file
+so crawls and benchmarks run without the network.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from ..cache.search_cache import normalize_query
+
+
+class SearchRateLimited(RuntimeError):
+    """The provider refused the query because of rate limiting (HTTP 429 etc.)."""
+
+
+class SearchProvider(ABC):
+    """Interface for search backends used by ``SearchService``."""
+
+    #: Stable identifier, part of the search cache key
+    name: str = "provider"
+
+    @abstractmethod
+    def search(self, query: str, max_results: int) -> List[Dict]:
+        """
+        Run one query.
+
+        Raises:
+            SearchRateLimited: when the backend throttles; the caller backs off
+        """
+
+
+class FixtureSearchProvider(SearchProvider):
+    """
+    Serves results from a ``{query: [result, ...]}`` mapping.
+
+    Queries are matched after normalization; the optional ``"*"`` entry is
+    returned for unknown queries. Every served query is recorded in
+    ``queries`` for assertions.
+    """
+
+    name = "fixture"
+
+    def __init__(self, results: Dict[str, List], default: Optional[List] = None):
+        self.results = {normalize_query(q): list(r) for q, r in results.items() if q != "*"}
+        self.default = list(default if default is not None else results.get("*", []))
+        self.queries: List[str] = []
+
+    @classmethod
+    def from_file(cls, path: str) -> "FixtureSearchProvider":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def search(self, query: str, max_results: int) -> List[Dict]:
+        self.queries.append(query)
+        return self.results.get(normalize_query(query), self.default)[:max_results]
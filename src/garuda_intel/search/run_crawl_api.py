@@ -1,8 +1,32 @@
 """API entry point for web application crawl requests."""
 
 import argparse
+import os
+import re
+
 from .handlers import handle_run
 
+_ARCHIVE_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+def _archive_dir(name: str, root) -> str:
+    """
+    Directory of the fetch archive *name* under the configured archive root.
+    API callers pick an archive by name only; paths, ``..`` and names that
+    resolve outside the root are rejected.
+    """
+    if not name:
+        return ""
+    if not root:
+        raise ValueError("fetch archives are disabled (GARUDA_FETCH_ARCHIVE_ROOT is not set)")
+    if not _ARCHIVE_NAME_RE.match(name) or ".." in name:
+        raise ValueError(f"invalid archive name: {name!r}")
+    root = os.path.realpath(root)
+    path = os.path.realpath(os.path.join(root, name))
+    if os.path.dirname(path) != root:
+        raise ValueError(f"invalid archive name: {name!r}")
+    return path
+
 
 def run_crawl_api(payload: dict) -> dict:
     """
@@ -35,6 +59,7 @@ def run_crawl_api(payload: dict) -> dict:
         score_threshold=float(payload.get("score_threshold", 35.0)),
         seed_limit=int(payload.get("seed_limit", 25)),
         use_selenium=bool(payload.get("use_selenium", False)),
+        browser_pool_size=int(payload.get("browser_pool_size", 3)),
         active_mode=bool(payload.get("active_mode", False)),
         output=payload.get("output", ""),
         list_pages=bool(payload.get("list_pages", False)),
@@ -53,6 +78,17 @@ def run_crawl_api(payload: dict) -> dict:
         search_entity_type=payload.get("search_entity_type", ""),
         search_page_type=payload.get("search_page_type", ""),
         enable_llm_link_rank=bool(payload.get("enable_llm_link_rank", False)),
+        llm_link_top_n=int(payload.get("llm_link_top_n", 10)),
+        llm_link_budget=int(payload.get("llm_link_budget", 200)),
+        min_marginal_gain=(
+            float(payload["min_marginal_gain"])
+            if payload.get("min_marginal_gain") is not None else None
+        ),
+        parse_workers=int(payload.get("parse_workers", 0) or 0),
+        group_commit=bool(payload.get("group_commit", False)),
+        crawl_session=payload.get("crawl_session", ""),
+        archive_dir=_archive_dir(payload.get("archive", ""), settings.fetch_archive_root),
+        replay=bool(payload.get("replay", False)),
         # semantic/hybrid (not used by current UI but kept)
         semantic_search=payload.get("semantic_search", ""),
         hybrid_search=payload.get("hybrid_search", ""),
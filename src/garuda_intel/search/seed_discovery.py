@@ -1,58 +1,297 @@
 """Seed collection and discovery functions."""
 
 import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 from sqlalchemy import select
 from ddgs import DDGS
+from ddgs.exceptions import RatelimitException
+from ..cache.search_cache import SearchCache, normalize_query
 from ..database.engine import SQLAlchemyStore
 from ..database.models import Link, Page
+from ..discover.url_canonical import canonicalize_url
+from .providers import FixtureSearchProvider, SearchProvider, SearchRateLimited
 
 
-# Maximum concurrent search queries
+# Upper bound on concurrent search queries; the live limit adapts below it
 MAX_CONCURRENT_SEARCHES = 5
 
 
-def collect_candidates(queries, seed_limit) -> list:
+class DuckDuckGoProvider(SearchProvider):
+    """DuckDuckGo text search via ``ddgs`` (one session per query)."""
+
+    name = "duckduckgo"
+
+    def search(self, query: str, max_results: int) -> List[Dict]:
+        try:
+            with DDGS() as ddgs:
+                return list(ddgs.text(query, max_results=max_results))
+        except RatelimitException as e:
+            raise SearchRateLimited(str(e)) from e
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on in-flight provider calls: halved when the provider rate
+    limits, raised by one after ``increase_after`` consecutive successes.
+    """
+
+    def __init__(self, max_limit: int = MAX_CONCURRENT_SEARCHES, min_limit: int = 1,
+                 increase_after: int = 5):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.increase_after = increase_after
+        self.limit = self.max_limit
+        self._active = 0
+        self._streak = 0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def on_success(self) -> None:
+        with self._cond:
+            self._streak += 1
+            if self._streak >= self.increase_after and self.limit < self.max_limit:
+                self.limit += 1
+                self._streak = 0
+                self._cond.notify_all()
+
+    def on_rate_limited(self) -> None:
+        with self._cond:
+            self.limit = max(self.min_limit, self.limit // 2)
+            self._streak = 0
+
+
+class SearchService:
+    """
+    Search front-end shared by seed discovery callers.
+
+    Results are read from / written to an optional ``SearchCache``; identical
+    queries issued concurrently share one provider call; provider calls run
+    under an ``AdaptiveConcurrencyLimiter`` and are retried with backoff when
+    rate limited.
+    """
+
+    def __init__(
+        self,
+        provider: Optional[SearchProvider] = None,
+        cache: Optional[SearchCache] = None,
+        max_concurrency: int = MAX_CONCURRENT_SEARCHES,
+        max_retries: int = 2,
+        retry_delay: float = 2.0,
+    ):
+        """
+        Args:
+            provider: Search backend (defaults to DuckDuckGo)
+            cache: Persistent result cache; None disables caching
+            max_concurrency: Ceiling for concurrent provider calls
+            max_retries: Retries per query after a rate-limit response
+            retry_delay: Base backoff in seconds (doubled per retry)
+        """
+        self.provider = provider or DuckDuckGoProvider()
+        self.cache = cache
+        self.limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._inflight: Dict[tuple, Future] = {}
+        self.stats = {
+            "search_requests": 0,
+            "search_cache_hits": 0,
+            "search_coalesced": 0,
+            "search_provider_calls": 0,
+            "search_rate_limited": 0,
+        }
+
+    @property
+    def max_concurrency(self) -> int:
+        return self.limiter.max_limit
+
+    def get_stats(self) -> Dict[str, int]:
+        return {**self.stats, "search_concurrency": self.limiter.limit}
+
+    def search(self, query: str, max_results: int = 5) -> List[Dict]:
+        """
+        Results for *query* as dicts with at least an ``href``.
+
+        Raises whatever the provider raised (after retries); concurrent
+        callers coalesced onto the failed call see the same error.
+        """
+        key = (normalize_query(query), max_results)
+        with self._lock:
+            self.stats["search_requests"] += 1
+        if self.cache is not None:
+            cached = self.cache.get(self.provider.name, query, max_results)
+            if cached is not None:
+                with self._lock:
+                    self.stats["search_cache_hits"] += 1
+                return list(cached)
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+            else:
+                self.stats["search_coalesced"] += 1
+        if not owner:
+            return list(future.result())
+
+        try:
+            results = self._clean_results(self._call_provider(query, max_results))
+            if self.cache is not None:
+                self.cache.put(self.provider.name, query, max_results, results)
+            future.set_result(results)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return list(results)
+
+    def _call_provider(self, query: str, max_results: int) -> list:
+        attempt = 0
+        while True:
+            with self.limiter.slot():
+                with self._lock:
+                    self.stats["search_provider_calls"] += 1
+                try:
+                    raw = self.provider.search(query, max_results)
+                except SearchRateLimited:
+                    self.limiter.on_rate_limited()
+                    with self._lock:
+                        self.stats["search_rate_limited"] += 1
+                    if attempt >= self.max_retries:
+                        raise
+                else:
+                    self.limiter.on_success()
+                    return raw
+            delay = self.retry_delay * (2 ** attempt)
+            attempt += 1
+            self.logger.info(
+                f"Search rate limited for '{query}'; retry {attempt} in {delay:.1f}s "
+                f"(concurrency now {self.limiter.limit})"
+            )
+            time.sleep(delay)
+
+    def _clean_results(self, raw) -> List[Dict]:
+        """Keep dict results with an ``href``; wrap bare URL strings."""
+        results = []
+        for r in raw or []:
+            if isinstance(r, dict) and "href" in r:
+                results.append(r)
+            elif isinstance(r, str):
+                # Handle case where result is a string (URL)
+                results.append({"href": r})
+            else:
+                self.logger.debug(f"Skipping non-dict, non-string result: {type(r)}")
+        return results
+
+
+_default_service: Optional[SearchService] = None
+_service_lock = threading.Lock()
+
+
+def configure_search(
+    provider: Optional[SearchProvider] = None,
+    cache: Optional[SearchCache] = None,
+    max_concurrency: int = MAX_CONCURRENT_SEARCHES,
+) -> SearchService:
+    """Replace the process-wide search service (e.g. with a cache or fixtures)."""
+    global _default_service
+    with _service_lock:
+        _default_service = SearchService(provider, cache, max_concurrency)
+        return _default_service
+
+
+def get_search_service() -> SearchService:
+    """
+    Process-wide search service, created on first use.
+
+    ``GARUDA_SEARCH_FIXTURES`` (JSON file) selects the fixture provider and
+    ``GARUDA_SEARCH_CACHE_PATH`` enables the persistent result cache.
+    """
+    global _default_service
+    with _service_lock:
+        if _default_service is None:
+            fixtures = os.environ.get("GARUDA_SEARCH_FIXTURES")
+            cache_path = os.environ.get("GARUDA_SEARCH_CACHE_PATH")
+            _default_service = SearchService(
+                provider=FixtureSearchProvider.from_file(fixtures) if fixtures else None,
+                cache=SearchCache(
+                    cache_path,
+                    ttl_seconds=int(os.environ.get("GARUDA_SEARCH_CACHE_TTL", "86400")),
+                ) if cache_path else None,
+            )
+        return _default_service
+
+
+def _dedupe_candidates(candidates: List[Dict]) -> List[Dict]:
+    """Deduplicate by canonical href, keeping first occurrence."""
+    seen = set()
+    deduped = []
+    for c in candidates:
+        href = c.get("href")
+        key = canonicalize_url(href) if href else None
+        if key and key not in seen:
+            seen.add(key)
+            deduped.append(c)
+    return deduped
+
+
+def collect_candidates(queries, seed_limit, service: Optional[SearchService] = None) -> list:
     """
-    Fetch candidate URLs from DuckDuckGo with parallel queries.
+    Fetch candidate URLs for *queries* in parallel via the search service.
     
     Returns:
         List of dicts with 'href' key and optional 'title'/'body' keys.
     """
     from concurrent.futures import ThreadPoolExecutor, as_completed
     
+    service = service or get_search_service()
     candidates = []
+    if not queries:
+        return candidates
     
     def _search_query(query):
         try:
-            with DDGS() as ddgs:
-                return list(ddgs.text(query, max_results=seed_limit))
+            return service.search(query, seed_limit)
         except Exception as e:
             logging.warning(f"Search error for '{query}': {e}")
             return []
     
-    # Parallelize searches
+    # Parallelize searches; the service caps in-flight provider calls
     with ThreadPoolExecutor(
-        max_workers=min(len(queries), MAX_CONCURRENT_SEARCHES)
+        max_workers=min(len(queries), service.max_concurrency)
     ) as pool:
         futures = {pool.submit(_search_query, q): q for q in queries}
         for future in as_completed(futures):
             candidates.extend(future.result())
     
-    # Deduplicate by href
-    seen = set()
-    deduped = []
-    for c in candidates:
-        href = c.get("href")
-        if href and href not in seen:
-            seen.add(href)
-            deduped.append(c)
-    return deduped
+    return _dedupe_candidates(candidates)
 
 
-def collect_candidates_simple(queries, limit=5) -> list:
+def collect_candidates_simple(queries, limit=5, service: Optional[SearchService] = None) -> list:
     """
-    Fetch candidate URLs from DuckDuckGo with parallel queries.
+    Fetch candidate URLs for *queries* in parallel via the search service.
     
     Returns:
         List of dicts with 'href' key and optional 'title'/'body' keys.
@@ -60,47 +299,27 @@ def collect_candidates_simple(queries, limit=5) -> list:
     from concurrent.futures import ThreadPoolExecutor, as_completed
     
     logger = logging.getLogger(__name__)
+    service = service or get_search_service()
     candidates = []
+    if not queries:
+        return candidates
     
     def _search_query(q):
         try:
-            with DDGS() as ddgs:
-                results = list(ddgs.text(q, max_results=2))
-                # Return full result dicts, not just hrefs
-                query_results = []
-                for r in results:
-                    if isinstance(r, dict) and "href" in r:
-                        query_results.append(r)
-                    elif isinstance(r, str):
-                        # Handle case where result is a string (URL)
-                        query_results.append({"href": r})
-                    else:
-                        logger.debug(
-                            f"Skipping non-dict, non-string result: {type(r)}"
-                        )
-                return query_results
+            return service.search(q, 2)
         except Exception as e:
             logger.warning(f"Search failed for query '{q}': {e}")
             return []
     
-    # Parallelize searches
+    # Parallelize searches; the service caps in-flight provider calls
     with ThreadPoolExecutor(
-        max_workers=min(len(queries), MAX_CONCURRENT_SEARCHES)
+        max_workers=min(len(queries), service.max_concurrency)
     ) as pool:
         futures = {pool.submit(_search_query, q): q for q in queries}
         for future in as_completed(futures):
             candidates.extend(future.result())
     
-    # Deduplicate by href
-    seen = set()
-    deduped = []
-    for c in candidates:
-        href = c.get("href")
-        if href and href not in seen:
-            seen.add(href)
-            deduped.append(c)
-    
-    return deduped[:limit]
+    return _dedupe_candidates(candidates)[:limit]
 
 
 def load_seeds_from_db(store: SQLAlchemyStore, from_links: bool, from_pages: bool, domains, patterns, min_score, limit):
@@ -146,7 +365,8 @@ def load_seeds_from_db(store: SQLAlchemyStore, from_links: bool, from_pages: boo
     seen = set()
     uniq = []
     for u in filtered:
-        if u not in seen:
-            seen.add(u)
+        key = canonicalize_url(u)
+        if key not in seen:
+            seen.add(key)
             uniq.append(u)
     return uniq[:limit]
@@ -26,6 +26,10 @@ REGISTRY_DOMAINS = [
     'instagram.com', 'reddit.com'
 ]
 
+# Mean weighted gain per page (new entities, gap fields, relationships)
+# below which a crawl stops early or a seed's subtree is dropped
+MIN_MARGINAL_GAIN = 0.5
+
 
 class AdaptiveCrawlerService:
     """
@@ -87,7 +91,7 @@ class AdaptiveCrawlerService:
             Crawl results with statistics
         """
         from ..search import collect_candidates_simple
-        from ..search.seed_discovery import MAX_CONCURRENT_SEARCHES
+        from ..search.seed_discovery import MAX_CONCURRENT_SEARCHES, get_search_service
         from ..explorer.engine import IntelligentExplorer
         from ..types.entity.profile import EntityProfile, EntityType
         
@@ -185,11 +189,11 @@ class AdaptiveCrawlerService:
                         )
                         return []
                 
-                # Parallel seed collection
+                # Parallel seed collection (cached, rate-limit aware searches)
                 with ThreadPoolExecutor(
                     max_workers=min(
                         len(queries), 
-                        MAX_CONCURRENT_SEARCHES
+                        get_search_service().max_concurrency
                     )
                 ) as pool:
                     futures = {
@@ -260,7 +264,10 @@ class AdaptiveCrawlerService:
                 persistence=self.store,
                 vector_store=self.vector_store,  # Use the vector store for embeddings
                 llm_extractor=self.llm,
-                enable_llm_link_rank=False  # Disable for speed
+                enable_llm_link_rank=False,  # Disable for speed
+                # Stop once pages stop adding entities, gap fields or relationships
+                min_marginal_gain=MIN_MARGINAL_GAIN,
+                gap_fields=results.get('target_gaps'),
             )
             
             # Execute exploration
@@ -268,6 +275,14 @@ class AdaptiveCrawlerService:
             explored_data = explorer.explore(seed_urls[:max_pages], browser=None)
             
             results['pages_discovered'] = len(explored_data)
+            crawl_stats = explorer.get_crawl_stats()
+            results['crawl_savings'] = {
+                'stopped_early': bool(crawl_stats.get('gain_stopped_early')),
+                'urls_skipped': crawl_stats.get('gain_urls_skipped', 0),
+                'fetches_saved': crawl_stats.get('gain_fetches_saved', 0),
+                'llm_calls_saved': crawl_stats.get('gain_llm_calls_saved', 0),
+                'page_budget': max_pages,
+            }
             results['explored_data_summary'] = {
                 'total_pages': len(explored_data),
                 'domains': list(set(urlparse(url).netloc for url in explored_data.keys()))
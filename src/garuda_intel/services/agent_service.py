@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 from sqlalchemy import select, func, desc, and_, or_
 from sqlalchemy.orm import Session
 
+from ..database.names import name_word_match, normalize_entity_name
 from ..database.store import PersistenceStore
 from ..database.models import Entity, Relationship, Intelligence, Page, EntityFieldValue, MediaItem, FieldDiscoveryLog
 from ..extractor.llm import LLMIntelExtractor
@@ -172,12 +173,8 @@ class AgentService:
         # Get all entities or filter by target
         stmt = select(Entity)
         if target_entities:
-            # Match any of the target names (case-insensitive partial match)
-            conditions = [
-                func.lower(Entity.name).like(f"%{name.lower()}%")
-                for name in target_entities
-            ]
-            stmt = stmt.where(or_(*conditions))
+            # Match any of the target names (a word of the name, or alias, starting with it)
+            stmt = stmt.where(or_(*[name_word_match(session, name) for name in target_entities]))
         
         entities = session.execute(stmt).scalars().all()
         
@@ -233,31 +230,8 @@ class AgentService:
         return duplicate_groups
     
     def _normalize_entity_name(self, name: str) -> str:
-        """Normalize entity name for duplicate detection."""
-        if not name:
-            return ""
-        
-        # Common company suffixes to remove
-        suffixes = [
-            "corporation", "corp", "inc", "incorporated", "llc", "ltd",
-            "limited", "co", "company", "plc", "ag", "gmbh", "sa"
-        ]
-        
-        normalized = name.lower().strip()
-        
-        # Remove common suffixes
-        for suffix in suffixes:
-            if normalized.endswith(f" {suffix}"):
-                normalized = normalized[:-len(suffix) - 1]
-            if normalized.endswith(f" {suffix}."):
-                normalized = normalized[:-len(suffix) - 2]
-        
-        # Remove punctuation and extra whitespace
-        import re
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
-        return normalized
+        """Normalize entity name for duplicate detection (``Entity.name_norm``)."""
+        return normalize_entity_name(name)
     
     def _find_semantic_duplicates(
         self,
@@ -513,11 +487,7 @@ class AgentService:
         # Get entities to validate
         stmt = select(Entity)
         if target_entities:
-            conditions = [
-                func.lower(Entity.name).like(f"%{name.lower()}%")
-                for name in target_entities
-            ]
-            stmt = stmt.where(or_(*conditions))
+            stmt = stmt.where(or_(*[name_word_match(session, name) for name in target_entities]))
         
         entities = session.execute(stmt).scalars().all()
         
@@ -634,9 +604,7 @@ class AgentService:
                 
                 for name in root_entities:
                     entity = session.execute(
-                        select(Entity).where(
-                            func.lower(Entity.name).like(f"%{name.lower()}%")
-                        )
+                        select(Entity).where(name_word_match(session, name))
                     ).scalar()
                     
                     if entity:
@@ -921,9 +889,7 @@ class AgentService:
                 for word in query_words:
                     if len(word) > 2:  # Skip short words
                         entities = session.execute(
-                            select(Entity).where(
-                                func.lower(Entity.name).like(f"%{word}%")
-                            ).limit(5)
+                            select(Entity).where(name_word_match(session, word)).limit(5)
                         ).scalars().all()
                         matching_entities.extend(entities)
                 
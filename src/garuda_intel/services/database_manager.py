@@ -1,7 +1,9 @@
 """
 Database Manager for Garuda Intel Multi-Database Support.
 
-Handles multiple SQLite databases and their associated Qdrant vector collections:
+Handles multiple databases and their associated Qdrant vector collections:
+- SQLite: one database file per registered database
+- PostgreSQL: one schema per registered database on a shared server
 - Database registry management (JSON-backed)
 - Switching between databases
 - Merging databases (SQL + Qdrant)
@@ -17,12 +19,15 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Tuple
 
-from sqlalchemy import select, inspect as sa_inspect
+from sqlalchemy import create_engine, select, text, inspect as sa_inspect
+from sqlalchemy.engine import make_url
 
+from ..database.blob_store import default_blob_path
 from ..database.engine import SQLAlchemyStore
+from ..database.names import name_word_match
+from ..database.postgres import schema_url
 from ..database.models import (
     Base,
-    BasicDataEntry,
     Entity,
     Relationship,
     Page,
@@ -48,17 +53,33 @@ class DatabaseManager:
     DEFAULT_DB_NAME = "default"
     DEFAULT_DB_FILE = "crawler.db"
     DEFAULT_COLLECTION = "pages"
+    SCHEMA_PREFIX = "garuda_"
 
     def __init__(
         self,
         data_dir: str = "/app/data",
         qdrant_url: Optional[str] = None,
         vector_size: int = 384,
+        database_url: Optional[str] = None,
     ):
+        """
+        Args:
+            data_dir: Directory for the registry (and SQLite database files)
+            qdrant_url: Qdrant server for per-database vector collections
+            vector_size: Vector size of new collections
+            database_url: PostgreSQL server URL; new databases become schemas
+                on it instead of SQLite files (the default database is the
+                URL itself)
+        """
         self.data_dir = data_dir
         self.qdrant_url = qdrant_url
         self.vector_size = vector_size
         self.registry_path = os.path.join(data_dir, self.REGISTRY_FILE)
+        self.server_url = (
+            database_url
+            if database_url and make_url(database_url).get_backend_name() == "postgresql"
+            else None
+        )
 
         os.makedirs(data_dir, exist_ok=True)
         self._initialize_registry()
@@ -80,18 +101,18 @@ class DatabaseManager:
         if os.path.exists(self.registry_path):
             logger.info("Loaded database registry from %s", self.registry_path)
             return
-        default_db_path = os.path.join(self.data_dir, self.DEFAULT_DB_FILE)
+        default_info: Dict[str, Any] = {
+            "name": self.DEFAULT_DB_NAME,
+            "db_path": None if self.server_url else os.path.join(self.data_dir, self.DEFAULT_DB_FILE),
+            "qdrant_collection": self.DEFAULT_COLLECTION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "description": "Default database",
+        }
+        if self.server_url:
+            default_info["db_url"] = self.server_url
         registry = {
             "active": self.DEFAULT_DB_NAME,
-            "databases": {
-                self.DEFAULT_DB_NAME: {
-                    "name": self.DEFAULT_DB_NAME,
-                    "db_path": default_db_path,
-                    "qdrant_collection": self.DEFAULT_COLLECTION,
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                    "description": "Default database",
-                }
-            },
+            "databases": {self.DEFAULT_DB_NAME: default_info},
         }
         self._save_registry(registry)
         logger.info("Created database registry at %s", self.registry_path)
@@ -110,6 +131,19 @@ class DatabaseManager:
         sanitized = re.sub(r"_+", "_", sanitized).strip("_").lower()
         return sanitized or f"db_{uuid.uuid4().hex[:8]}"
 
+    @staticmethod
+    def _store_url(info: Dict[str, Any]) -> str:
+        """SQLAlchemy URL of a registry entry (PostgreSQL schema URL or SQLite file)."""
+        return info.get("db_url") or f"sqlite:///{info['db_path']}"
+
+    def _run_on_server(self, statement: str) -> None:
+        engine = create_engine(self.server_url, future=True)
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(statement))
+        finally:
+            engine.dispose()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -140,19 +174,31 @@ class DatabaseManager:
         description: str = "",
         set_active: bool = False,
     ) -> Dict[str, Any]:
-        """Create a new SQLite database (and Qdrant collection) and register it."""
+        """Create a new database (and Qdrant collection) and register it.
+
+        On PostgreSQL the database is a new schema on the server, otherwise
+        a SQLite file in ``data_dir``.
+        """
         sname = self._sanitize_name(name)
         registry = self._load_registry()
         if sname in registry["databases"]:
             raise ValueError(f"Database '{sname}' already exists")
 
-        db_path = os.path.join(self.data_dir, f"{sname}.db")
         qdrant_collection = f"garuda_{sname}"
-
-        # Create SQLite db (tables auto-created by SQLAlchemyStore)
-        db_url = f"sqlite:///{db_path}"
+        db_path: Optional[str] = None
+        schema: Optional[str] = None
+
+        if self.server_url:
+            schema = f"{self.SCHEMA_PREFIX}{sname}"
+            self._run_on_server(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
+            db_url = schema_url(self.server_url, schema)
+        else:
+            db_path = os.path.join(self.data_dir, f"{sname}.db")
+            db_url = f"sqlite:///{db_path}"
+
+        # Tables (and search indexes) are created by SQLAlchemyStore
         SQLAlchemyStore(url=db_url)
-        logger.info("Created SQLite database at %s", db_path)
+        logger.info("Created database at %s", schema or db_path)
 
         # Create Qdrant collection
         if self.qdrant_client:
@@ -176,6 +222,9 @@ class DatabaseManager:
             "created_at": datetime.now(timezone.utc).isoformat(),
             "description": description,
         }
+        if schema:
+            db_info["db_url"] = db_url
+            db_info["schema"] = schema
         registry["databases"][sname] = db_info
         if set_active:
             registry["active"] = sname
@@ -190,7 +239,7 @@ class DatabaseManager:
         if sname not in registry["databases"]:
             raise ValueError(f"Database '{sname}' not found")
         info = registry["databases"][sname]
-        store = SQLAlchemyStore(url=f"sqlite:///{info['db_path']}")
+        store = SQLAlchemyStore(url=self._store_url(info))
         registry["active"] = sname
         self._save_registry(registry)
         logger.info("Switched to database '%s'", sname)
@@ -209,13 +258,22 @@ class DatabaseManager:
 
         info = registry["databases"][sname]
         if delete_files:
-            path = info["db_path"]
-            if os.path.exists(path):
+            path = info.get("db_path")
+            if info.get("schema") and self.server_url:
                 try:
-                    os.remove(path)
-                    logger.info("Deleted database file: %s", path)
-                except OSError as exc:
-                    logger.error("Failed to delete file: %s", exc)
+                    self._run_on_server(f'DROP SCHEMA IF EXISTS "{info["schema"]}" CASCADE')
+                    logger.info("Dropped database schema: %s", info["schema"])
+                except Exception as exc:
+                    logger.error("Failed to drop schema: %s", exc)
+            elif path:
+                for file_path in (path, default_blob_path(path)):
+                    if not os.path.exists(file_path):
+                        continue
+                    try:
+                        os.remove(file_path)
+                        logger.info("Deleted database file: %s", file_path)
+                    except OSError as exc:
+                        logger.error("Failed to delete file: %s", exc)
             if self.qdrant_client:
                 try:
                     self.qdrant_client.delete_collection(info["qdrant_collection"])
@@ -248,8 +306,8 @@ class DatabaseManager:
         src_info = registry["databases"][src]
         tgt_info = registry["databases"][tgt]
 
-        src_store = SQLAlchemyStore(url=f"sqlite:///{src_info['db_path']}")
-        tgt_store = SQLAlchemyStore(url=f"sqlite:///{tgt_info['db_path']}")
+        src_store = SQLAlchemyStore(url=self._store_url(src_info))
+        tgt_store = SQLAlchemyStore(url=self._store_url(tgt_info))
 
         stats: Dict[str, int] = {}
 
@@ -272,13 +330,15 @@ class DatabaseManager:
                     with tgt_store.Session() as tgt_s:
                         count = 0
                         for row in rows:
-                            # Collect column values from both the child and parent mapper
+                            # The mapper's columns include the inherited entries columns
                             col_vals: Dict[str, Any] = {}
                             for col in sa_inspect(model_cls).columns:
                                 col_vals[col.key] = getattr(row, col.key)
-                            for col in sa_inspect(BasicDataEntry).columns:
-                                if col.key not in col_vals:
-                                    col_vals[col.key] = getattr(row, col.key)
+                            if model_cls is PageContent and row.html_digest:
+                                # The body is in the source's blob store
+                                col_vals["html"], col_vals["html_digest"] = (
+                                    tgt_store.stash_html(row.load_html())
+                                )
                             tgt_s.merge(model_cls(**col_vals))
                             count += 1
                         tgt_s.commit()
@@ -345,13 +405,13 @@ class DatabaseManager:
         for db_name, db_info in registry["databases"].items():
             hits: List[Dict[str, Any]] = []
             try:
-                store = SQLAlchemyStore(url=f"sqlite:///{db_info['db_path']}")
+                store = SQLAlchemyStore(url=self._store_url(db_info))
                 with store.Session() as session:
                     if search_entities:
                         rows = (
                             session.execute(
                                 select(Entity)
-                                .where(Entity.name.ilike(f"%{query}%"))
+                                .where(name_word_match(session, query))
                                 .limit(limit_per_db)
                             )
                             .scalars()
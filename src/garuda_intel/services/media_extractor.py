@@ -1,8 +1,7 @@
 """Media extraction service for crawled pages."""
 
 import logging
-from typing import List, Dict, Optional
-from urllib.parse import urljoin
+from typing import List, Dict, Optional, Tuple
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -23,105 +22,56 @@ class MediaExtractor:
         self.media_processor = media_processor
         self.auto_process = auto_process
 
-    def extract_media_from_page(self, page_id: uuid.UUID, page_url: str, html: str) -> Dict[str, int]:
+    def extract_media_from_page(self, page_id: uuid.UUID, page_url: str, html: str,
+                                candidates: Optional[List[Tuple[str, str]]] = None) -> Dict[str, int]:
         """Extract media items from a page's HTML and store them.
         
         Args:
             page_id: UUID of the page
             page_url: URL of the page (for resolving relative URLs)
             html: HTML content of the page
+            candidates: ``(media_type, absolute_url)`` pairs already found
+                in the HTML (e.g. by a parse worker); parsed from *html* when omitted
             
         Returns:
             Dict with counts of extracted media by type
         """
-        from bs4 import BeautifulSoup
         from ..database.models import MediaItem
         
-        soup = BeautifulSoup(html, "html.parser")
+        if candidates is None:
+            from bs4 import BeautifulSoup
+            from ..extractor.engine import ContentExtractor
+            soup = BeautifulSoup(html, "html.parser")
+            candidates = ContentExtractor().media_candidates_from_soup(soup, page_url)
+
         stats = {"images": 0, "videos": 0, "audio": 0}
+        stat_keys = {"image": "images", "video": "videos", "audio": "audio"}
         
         with self.store.get_session() as session:
-            # Extract images
-            for img in soup.find_all("img"):
-                src = img.get("src")
-                if src and not src.startswith("data:"):
-                    # Resolve relative URL
-                    absolute_url = urljoin(page_url, src)
-                    
-                    # Check if media item already exists
-                    existing = session.query(MediaItem).filter(MediaItem.url == absolute_url).first()
-                    if existing:
-                        # Update page association if not set
-                        if not existing.source_page_id:
-                            existing.source_page_id = page_id
-                        continue
-                    
-                    # Create new media item
-                    media_item = MediaItem(
-                        id=uuid.uuid4(),
-                        url=absolute_url,
-                        media_type="image",
-                        source_page_id=page_id,
-                        processed=False
-                    )
-                    session.add(media_item)
-                    stats["images"] += 1
-                    
-                    # Process immediately if auto_process enabled
-                    if self.auto_process:
-                        self._process_media_item(media_item)
-            
-            # Extract videos (HTML5 video tags and common embed patterns)
-            for video in soup.find_all("video"):
-                for source in video.find_all("source"):
-                    src = source.get("src")
-                    if src:
-                        absolute_url = urljoin(page_url, src)
-                        
-                        existing = session.query(MediaItem).filter(MediaItem.url == absolute_url).first()
-                        if existing:
-                            if not existing.source_page_id:
-                                existing.source_page_id = page_id
-                            continue
-                        
-                        media_item = MediaItem(
-                            id=uuid.uuid4(),
-                            url=absolute_url,
-                            media_type="video",
-                            source_page_id=page_id,
-                            processed=False
-                        )
-                        session.add(media_item)
-                        stats["videos"] += 1
-                        
-                        if self.auto_process:
-                            self._process_media_item(media_item)
-            
-            # Extract audio (HTML5 audio tags)
-            for audio in soup.find_all("audio"):
-                for source in audio.find_all("source"):
-                    src = source.get("src")
-                    if src:
-                        absolute_url = urljoin(page_url, src)
-                        
-                        existing = session.query(MediaItem).filter(MediaItem.url == absolute_url).first()
-                        if existing:
-                            if not existing.source_page_id:
-                                existing.source_page_id = page_id
-                            continue
-                        
-                        media_item = MediaItem(
-                            id=uuid.uuid4(),
-                            url=absolute_url,
-                            media_type="audio",
-                            source_page_id=page_id,
-                            processed=False
-                        )
-                        session.add(media_item)
-                        stats["audio"] += 1
-                        
-                        if self.auto_process:
-                            self._process_media_item(media_item)
+            # Images, HTML5 video and audio sources
+            for media_type, absolute_url in candidates:
+                # Check if media item already exists
+                existing = session.query(MediaItem).filter(MediaItem.url == absolute_url).first()
+                if existing:
+                    # Update page association if not set
+                    if not existing.source_page_id:
+                        existing.source_page_id = page_id
+                    continue
+                
+                # Create new media item
+                media_item = MediaItem(
+                    id=uuid.uuid4(),
+                    url=absolute_url,
+                    media_type=media_type,
+                    source_page_id=page_id,
+                    processed=False
+                )
+                session.add(media_item)
+                stats[stat_keys[media_type]] += 1
+                
+                # Process immediately if auto_process enabled
+                if self.auto_process:
+                    self._process_media_item(media_item)
             
             session.commit()
         
@@ -348,11 +348,8 @@ class TaskQueueService:
             if task.status in (self.STATUS_PENDING, self.STATUS_RUNNING):
                 return {"error": "Cannot delete active task, cancel it first"}
             
-            # Also delete from entries table (parent)
-            from ..database.models import BasicDataEntry
-            entry = session.get(BasicDataEntry, task_uuid)
-            if entry:
-                session.delete(entry)
+            # Deleting through the mapper also removes the joined ``entries`` row
+            session.delete(task)
             session.commit()
 
         return {"success": True, "task_id": task_id}
@@ -28,13 +28,15 @@ from ..services.entity_gap_analyzer import EntityGapAnalyzer
 from ..services.adaptive_crawler import AdaptiveCrawlerService
 from ..services.media_processor import MediaProcessor
 from ..services.task_queue import TaskQueueService
+from ..cache.search_cache import SearchCache
+from ..search.seed_discovery import configure_search
 from .services.event_system import init_event_logging
 from .utils.shutdown import ShutdownManager
 
 # Import route blueprints
 from .routes import static, recorder, search, crawling, entities, relationships
 from .routes import entity_gaps, entity_deduplication, entity_relations, media
-from .routes import graph_search, relationship_confidence, schema, agent
+from .routes import graph_search, relationship_confidence, schema, agent, listing
 from .routes import tasks as tasks_routes
 from .routes import local_data as local_data_routes
 from .routes import databases as databases_routes
@@ -64,10 +66,13 @@ store = _StoreProxy(_real_store)
 
 # Multi-database manager
 from ..services.database_manager import DatabaseManager as _DatabaseManager
-_db_data_dir = os.path.dirname(settings.db_url.replace("sqlite:///", "")) or "/app/data"
+from ..database.engine_factory import sqlite_file_path as _sqlite_file_path
+_db_file = _sqlite_file_path(settings.db_url)
+_db_data_dir = (os.path.dirname(_db_file) if _db_file else "") or "/app/data"
 db_manager = _DatabaseManager(
     data_dir=_db_data_dir,
     qdrant_url=settings.qdrant_url,
+    database_url=settings.db_url,
 )
 llm = LLMIntelExtractor(
     ollama_url=settings.ollama_url,
@@ -95,6 +100,16 @@ entity_crawler = EntityAwareCrawler(store, llm)
 crawl_learner = CrawlLearner(store)
 gap_analyzer = EntityGapAnalyzer(store)
 adaptive_crawler = AdaptiveCrawlerService(store, llm, crawl_learner, vector_store)
+
+# Shared web search: persistent result cache and rate-limit aware concurrency
+# for gap-filling, agent runs and chat cycles
+search_cache = None
+if settings.cache_enabled:
+    try:
+        search_cache = SearchCache(settings.search_cache_path, settings.search_cache_ttl_seconds)
+    except Exception as e:
+        logger.warning(f"Search cache unavailable, searching uncached: {e}")
+configure_search(cache=search_cache, max_concurrency=settings.search_max_concurrency)
 media_processor = MediaProcessor(
     llm, 
     enable_processing=settings.media_processing_enabled,
@@ -891,6 +906,10 @@ app.register_blueprint(
     graph_search.init_graph_routes(api_key_required, store, llm)
 )
 
+app.register_blueprint(
+    listing.init_listing_routes(api_key_required, store)
+)
+
 app.register_blueprint(
     relationship_confidence.init_relationship_confidence_routes(api_key_required, store)
 )
@@ -5,7 +5,6 @@ import itertools
 import uuid as uuid_module
 from collections import Counter
 from flask import Blueprint, jsonify, request
-from sqlalchemy.orm import joinedload
 from ..services.event_system import emit_event
 from ..utils.request_helpers import safe_int, safe_float
 from ..services.graph_builder import (
@@ -16,6 +15,11 @@ from ..services.graph_builder import (
     _qdrant_semantic_page_hits,
     _qdrant_semantic_entity_hints,
     _add_relationship_edges,
+    _graph_source_queries,
+    _encode_graph_cursor,
+    _decode_graph_cursor,
+    _entity_names_in_json,
+    _stored_entities,
 )
 from ..utils.helpers import (
     _canonical,
@@ -29,12 +33,16 @@ from ..utils.helpers import (
     _entity_uuid_from_canonical,
 )
 from ...database import models as db_models
+from ...database.pagination import MAX_PAGE_SIZE, keyset_page, listing_keys
 from ...search import EntityProfile, EntityType, CrawlMode
 
 
 bp = Blueprint('entities', __name__, url_prefix='/api/entities')
 logger = logging.getLogger(__name__)
 
+# Rows of each source read per graph request, as a multiple of the node limit
+GRAPH_WINDOW_FACTOR = 4
+
 
 def init_routes(api_key_required, settings, store, llm, vector_store, entity_crawler, gap_analyzer, adaptive_crawler):
     """Initialize routes with required dependencies."""
@@ -49,6 +57,10 @@ def init_routes(api_key_required, settings, store, llm, vector_store, entity_cra
         limit = min(safe_int(request.args.get("limit"), 100), 500)
         depth_limit = safe_int(request.args.get("depth"), 1)
         include_meta = (request.args.get("include_meta") or "1").strip() != "0"
+        try:
+            cursors = _decode_graph_cursor(request.args.get("cursor"))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         node_type_filters = _parse_list_param(
             request.args.get("node_types"),
@@ -164,22 +176,15 @@ def init_routes(api_key_required, settings, store, llm, vector_store, entity_cra
                 return node_id
 
             entry_type_map: dict[str, str] = {}
-            with store.Session() as session:
-                # UNIQUENESS GUARANTEE: The graph ensures only unique entities through:
-                # 1. Canonical name normalization (_canonical function)
-                # 2. UUID-based deduplication (entity_ids dict maps canonical -> UUID)
-                # 3. Variant tracking (multiple spellings map to same canonical entity)
-                # This guarantees the graph displays only unique entities with full relations.
-                
-                # Note: Loading entities in bulk (limit 20000) maintains original behavior.
-                # TODO: For very large datasets (>20K entities), implement pagination:
-                #       - Process entities in batches of 1000-5000
-                #       - Use offset-based or cursor-based pagination
-                for row in session.query(db_models.Entity).limit(20000).all():
+
+            def register_entities(rows):
+                for row in rows:
                     # Skip entities that have been soft-merged into another entity
                     if row.metadata_json and row.metadata_json.get("merged_into"):
                         continue
                     canon = _canonical(row.name)
+                    if not canon or canon in entity_ids:
+                        continue  # the most recently created entity of a name wins
                     ent_uuid = str(row.id)
                     norm_kind = _norm_kind(row.kind)  # Calculate once
                     entity_ids[canon] = ent_uuid
@@ -188,6 +193,42 @@ def init_routes(api_key_required, settings, store, llm, vector_store, entity_cra
                         canonical_type[canon] = norm_kind
                     entry_type_map[ent_uuid] = "entity"
 
+            # One keyset window per source, filtered in SQL; the cursor of
+            # the next window is returned rather than reading every row
+            window = min(limit * GRAPH_WINDOW_FACTOR, MAX_PAGE_SIZE)
+            next_cursors: dict[str, str] = {}
+            source_rows: dict[str, list] = {}
+            with store.ReadSession() as session:
+                # UNIQUENESS GUARANTEE: The graph ensures only unique entities through:
+                # 1. Canonical name normalization (_canonical function)
+                # 2. UUID-based deduplication (entity_ids dict maps canonical -> UUID)
+                # 3. Variant tracking (multiple spellings map to same canonical entity)
+                # This guarantees the graph displays only unique entities with full relations.
+                for listing, stmt in _graph_source_queries(q, type_filter).items():
+                    if cursors is not None and not cursors.get(listing):
+                        continue  # exhausted in an earlier window
+                    order = "created" if listing == "entities" else "score"
+                    rows, next_cursor = keyset_page(
+                        session, stmt, listing_keys(listing, order), (cursors or {}).get(listing), window
+                    )
+                    source_rows[listing] = rows
+                    if next_cursor:
+                        next_cursors[listing] = next_cursor
+                entity_rows = source_rows.get("entities", [])
+                intel_rows = source_rows.get("intelligence", [])
+                page_rows = source_rows.get("pages", [])
+
+                # Stored entities named in this window, looked up by normalized
+                # name so their nodes carry the entity id
+                names = [row.entity_name for row in intel_rows if row.entity_name]
+                for row in intel_rows:
+                    names += _entity_names_in_json(row.data or {})
+                for row in page_rows:
+                    if row.content and isinstance(row.content.extracted_json, dict):
+                        names += _entity_names_in_json(row.content.extracted_json.get("entities") or [])
+                register_entities(entity_rows)
+                register_entities(_stored_entities(session, names))
+
                 # When query is a UUID, ensure that specific entity is loaded as a
                 # node so it can serve as a graph root regardless of whether it
                 # appears in intelligence / page data.
@@ -195,10 +236,16 @@ def init_routes(api_key_required, settings, store, llm, vector_store, entity_cra
                     uuid_row = session.query(db_models.Entity).filter_by(id=q).first()
                     if uuid_row:
                         upsert_entity(uuid_row.name, uuid_row.kind, 1.0)
+                # Entities matching a text query are graph roots even when no
+                # intelligence or page of this window mentions them
+                elif q:
+                    for row in entity_rows:
+                        if not (row.metadata_json and row.metadata_json.get("merged_into")):
+                            upsert_entity(row.name, row.kind, None)
 
                 semantic_entity_hints = _qdrant_semantic_entity_hints(q, vector_store, llm) if q else set()
 
-                for row in session.query(db_models.Intelligence).limit(5000).all():
+                for row in intel_rows:
                     intel_data = row.data or {}
                     intel_id_str = str(row.id)
                     
@@ -315,7 +362,7 @@ def init_routes(api_key_required, settings, store, llm, vector_store, entity_cra
                         if other_id:
                             add_edge(intel_id_str, other_id, kind="intel-mentions", weight=1)
 
-                for row in session.query(db_models.Page).options(joinedload(db_models.Page.content)).limit(3000).all():
+                for row in page_rows:
                     page_id = _page_id_from_row(row)
                     page_id_to_url[page_id] = row.url
                     page_ents: list[str] = []
@@ -499,7 +546,11 @@ def init_routes(api_key_required, settings, store, llm, vector_store, entity_cra
                 },
             )
 
-            return jsonify({"nodes": final_nodes, "links": final_links})
+            return jsonify({
+                "nodes": final_nodes,
+                "links": final_links,
+                "next_cursor": _encode_graph_cursor(next_cursors),
+            })
 
         except Exception as e:
             emit_event("entities_graph", f"failed: {e}", level="error")
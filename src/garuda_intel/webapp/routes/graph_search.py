@@ -11,7 +11,6 @@ from flask import Blueprint, jsonify, request
 
 from ..services.event_system import emit_event
 from ...extractor.entity_merger import GraphSearchEngine, SemanticEntityDeduplicator
-from ...database import models as db_models
 
 bp_graph = Blueprint('graph_search', __name__, url_prefix='/api/graph')
 logger = logging.getLogger(__name__)
@@ -34,27 +33,24 @@ def init_graph_routes(api_key_required, store, semantic_engine=None):
         """Create a SemanticEntityDeduplicator bound to the *current* store.Session."""
         return SemanticEntityDeduplicator(store.Session, semantic_engine, logger)
 
-    def _list_all_entities(kind=None, limit=20):
-        """Return all entities (optionally filtered by kind), without a query."""
-        with store.Session() as session:
-            stmt = session.query(db_models.Entity)
-            if kind:
-                stmt = stmt.filter(db_models.Entity.kind == kind)
-            rows = stmt.limit(limit).all()
-            results = []
-            for entity in rows:
-                results.append({
-                    "entity": {
-                        "id": str(entity.id),
-                        "name": entity.name,
-                        "kind": entity.kind,
-                        "data": entity.data or {},
-                        "metadata": entity.metadata_json or {},
-                    },
-                    "match_type": "all",
-                    "score": 1.0,
-                })
-            return results
+    def _list_all_entities(kind=None, limit=20, cursor=None):
+        """Return one keyset page of all entities (optionally filtered by kind) and the next cursor."""
+        page = store.list_page("entities", cursor=cursor, limit=limit, kind=kind)
+        results = [
+            {
+                "entity": {
+                    "id": item["id"],
+                    "name": item["name"],
+                    "kind": item["kind"],
+                    "data": item["data"] or {},
+                    "metadata": item["meta"] or {},
+                },
+                "match_type": "all",
+                "score": 1.0,
+            }
+            for item in page["items"]
+        ]
+        return results, page["next_cursor"]
     
     @bp_graph.get("/search")
     @api_key_required
@@ -67,14 +63,18 @@ def init_graph_routes(api_key_required, store, semantic_engine=None):
             kind: Optional entity kind filter
             threshold: Semantic similarity threshold (default: 0.7)
             limit: Maximum results (default: 20)
+            cursor: With an empty query, next_cursor of the previous page
         
         Returns:
-            List of matching entities with match type and scores
+            List of matching entities with match type and scores; with an
+            empty query also next_cursor (null after the last page)
         """
         query = request.args.get("query", "").strip()
         kind = request.args.get("kind")
         threshold = float(request.args.get("threshold", 0.7))
         limit = min(int(request.args.get("limit", 20)), 100)
+        cursor = request.args.get("cursor")
+        next_cursor = None
         
         emit_event("graph_search", "start", payload={
             "query": query,
@@ -86,7 +86,7 @@ def init_graph_routes(api_key_required, store, semantic_engine=None):
         try:
             if not query:
                 # Empty query → return all entities (paginated)
-                results = _list_all_entities(kind=kind, limit=limit)
+                results, next_cursor = _list_all_entities(kind=kind, limit=limit, cursor=cursor)
             else:
                 results = _graph_engine().search_entities(
                     query=query,
@@ -101,7 +101,10 @@ def init_graph_routes(api_key_required, store, semantic_engine=None):
                 "query": query,
                 "total": len(results),
                 "results": results,
+                "next_cursor": next_cursor,
             })
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         except Exception as e:
             emit_event("graph_search", f"failed: {e}", level="error")
             logger.exception("Graph search failed")
@@ -0,0 +1,92 @@
+"""
+Keyset-paginated listing API routes.
+
+Provides endpoints for:
+- GET /api/list/<listing> - One page of entities, pages, intelligence or relationships
+- GET /api/list/<listing>/stream - Every row of a listing as NDJSON
+
+Pages continue from an opaque cursor (see ``database.pagination``), so deep
+pages cost the same as the first and rows written meanwhile do not shift them.
+"""
+
+import json
+import logging
+from flask import Blueprint, Response, jsonify, request
+
+from ...database.pagination import DEFAULT_PAGE_SIZE, LISTING_FILTERS, listing_model
+
+logger = logging.getLogger(__name__)
+
+STREAM_BATCH_SIZE = 500
+
+
+def init_listing_routes(api_key_required, store):
+    """Initialize keyset listing routes."""
+    bp = Blueprint("listing", __name__, url_prefix="/api/list")
+
+    def _filters(listing):
+        listing_model(listing)  # ValueError for unknown listings
+        return {name: request.args.get(name) for name in LISTING_FILTERS[listing]}
+
+    @bp.get("/<listing>")
+    @api_key_required
+    def api_list(listing):
+        """
+        One page of a listing, newest first.
+
+        Query params:
+            cursor: next_cursor of the previous page (omit for the first page)
+            limit: Page size (default: 100, max: 1000)
+            order: "created" (default) or "score" (pages, intelligence)
+            Filters of the listing, e.g. kind / name_like for entities
+
+        Returns:
+            {"items": [...], "next_cursor": str or null}
+        """
+        try:
+            page = store.list_page(
+                listing,
+                cursor=request.args.get("cursor"),
+                limit=request.args.get("limit", DEFAULT_PAGE_SIZE, type=int),
+                order=request.args.get("order", "created"),
+                **_filters(listing),
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify(page)
+
+    @bp.get("/<listing>/stream")
+    @api_key_required
+    def api_list_stream(listing):
+        """
+        Every row of a listing as newline-delimited JSON, read in keyset
+        batches so memory stays flat however large the listing is.
+
+        Query params: order and the listing's filters, as for /api/list/<listing>
+        """
+        try:
+            rows = store.iter_listing(
+                listing,
+                order=request.args.get("order", "created"),
+                batch_size=STREAM_BATCH_SIZE,
+                **_filters(listing),
+            )
+            # Run the first query now so bad parameters still get a 400
+            first = next(rows, None)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        def generate():
+            if first is None:
+                return
+            yield json.dumps(first, default=str) + "\n"
+            for row in rows:
+                yield json.dumps(row, default=str) + "\n"
+
+        return Response(
+            generate(),
+            mimetype="application/x-ndjson",
+            headers={"X-Accel-Buffering": "no"},
+        )
+
+    return bp
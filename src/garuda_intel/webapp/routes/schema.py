@@ -243,7 +243,7 @@ def init_schema_routes(api_key_required, store):
         """Get all user settings."""
         from ...database.models import UserSetting
         try:
-            with store.Session() as session:
+            with store.ReadSession() as session:
                 rows = session.query(UserSetting).all()
                 return jsonify({
                     "settings": {r.key: r.to_dict() for r in rows},
@@ -258,7 +258,7 @@ def init_schema_routes(api_key_required, store):
         """Get a single user setting by key."""
         from ...database.models import UserSetting
         try:
-            with store.Session() as session:
+            with store.ReadSession() as session:
                 row = session.query(UserSetting).filter_by(key=key).first()
                 if not row:
                     return jsonify({"error": "Setting not found"}), 404
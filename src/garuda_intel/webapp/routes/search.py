@@ -9,7 +9,7 @@ from flask import Blueprint, jsonify, request, current_app
 from ..services.event_system import emit_event
 from ..utils.request_helpers import safe_int, safe_float
 from ...search import IntelligentExplorer, EntityProfile, EntityType, collect_candidates_simple
-from ...browser.selenium import SeleniumBrowser
+from ...browser.pool import get_shared_pool
 
 
 bp = Blueprint('search', __name__, url_prefix='/api')
@@ -554,8 +554,12 @@ def init_routes(api_key_required, settings, store, llm, vector_store):
             browser = None
             try:
                 if getattr(settings, "chat_use_selenium", False):
-                    browser = SeleniumBrowser(headless=True)
-                    browser._init_driver()
+                    # Warm drivers shared across chat requests; not closed here
+                    browser = get_shared_pool(
+                        size=getattr(settings, "browser_pool_size", 3),
+                        recycle_after=getattr(settings, "browser_recycle_after", 50),
+                        block_resources=getattr(settings, "browser_block_resources", True),
+                    )
                 
                 # Execute crawl - this triggers the full pipeline:
                 # 1. Fetch pages
@@ -572,12 +576,6 @@ def init_routes(api_key_required, settings, store, llm, vector_store):
                 logger.warning(f"Cycle {cycle_num} crawl failed: {e}")
                 emit_event("chat", f"Cycle {cycle_num} crawl failed: {e}", level="warning")
                 return new_urls, False
-            finally:
-                if browser:
-                    try:
-                        browser.close()
-                    except Exception:
-                        pass
     
         # Phase 1: Initial RAG lookup with prioritization
         emit_event("chat", "Phase 1: Initial RAG lookup", payload={"question": question})
@@ -39,6 +39,12 @@ def init_routes(api_key_required, settings, store, llm, vector_store):
                 vector_store.client.get_collection(vector_store.collection)  # type: ignore[attr-defined]
             except Exception:
                 qdrant_ok = False
+        stage_timings = []
+        if db_ok:
+            try:
+                stage_timings = store.get_stage_timings(limit=1)
+            except Exception:
+                stage_timings = []
         return jsonify(
             {
                 "db_ok": db_ok,
@@ -48,6 +54,7 @@ def init_routes(api_key_required, settings, store, llm, vector_store):
                 "qdrant_collection": settings.qdrant_collection,
                 "ollama_url": settings.ollama_url,
                 "model": settings.ollama_model,
+                "stage_timings": stage_timings[0] if stage_timings else None,
             }
         )
     
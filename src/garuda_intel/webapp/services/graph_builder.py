@@ -1,12 +1,36 @@
 """Graph building utilities for entities and relationships."""
 
+import base64
+import json
 import logging
-from ..utils.helpers import _canonical, _as_list
+import uuid
+from datetime import datetime
+
+from sqlalchemy import String, cast, func, or_, select
+from sqlalchemy.orm import joinedload
+
+from ..utils.helpers import _canonical, _as_list, _looks_like_uuid, ORG_KINDS
 from ...database import models as db_models
+from ...database.names import name_match
 
 
 logger = logging.getLogger(__name__)
 
+# Listings the entity graph reads a window of per request, in cursor order
+GRAPH_SOURCES = ("entities", "intelligence", "pages")
+# Ids per IN (...) list when looking up entities and relationships
+ID_CHUNK_SIZE = 500
+# Graph node types built from one source only; other types are entity kinds
+_NODE_TYPE_SOURCES = {
+    "page": ("pages",),
+    "image": ("pages",),
+    "link": ("pages",),
+    "intel": ("intelligence",),
+    "media": (),
+    "seed": (),
+    "semantic-snippet": (),
+}
+
 
 def _collect_entities_from_json(obj, path="root"):
     """Extract entities from JSON structure."""
@@ -154,6 +178,123 @@ def _qdrant_semantic_entity_hints(query: str, vector_store, llm, top_k: int = 20
     return hints
 
 
+def _kind_condition(column, kind: str):
+    """SQL condition: *column* holds an entity kind that ``_norm_kind`` maps to *kind*."""
+    if kind == "org":
+        return func.lower(column).in_(sorted(ORG_KINDS))
+    return func.lower(column) == kind
+
+
+def _graph_source_queries(q: str, type_filter: str) -> dict:
+    """
+    ``select()`` per graph source listing, narrowed in SQL to the rows that
+    can produce nodes matching query *q* and node type *type_filter*:
+
+    - a UUID query selects that entry and the intelligence and pages of it
+    - a text query matches entity names, intelligence entity names and JSON,
+      and page titles, URLs and extracted JSON (case-insensitive substring)
+    - an entity kind filter matches ``Entity.kind`` and the ``entity_type`` of
+      intelligence and pages; node types of a single source skip the others
+
+    Stored entities are only a source for a query: without one, entity nodes
+    come from intelligence, pages and relationships.
+    """
+    sources = _NODE_TYPE_SOURCES.get(type_filter, GRAPH_SOURCES) if type_filter else GRAPH_SOURCES
+    kind = type_filter if type_filter and type_filter not in _NODE_TYPE_SOURCES else ""
+    Entity, Intelligence, Page = db_models.Entity, db_models.Intelligence, db_models.Page
+    content = joinedload(Page.content).load_only(
+        db_models.PageContent.extracted_json, db_models.PageContent.metadata_json
+    )
+    queries = {
+        "entities": select(Entity),
+        "intelligence": select(Intelligence),
+        # Only the JSON columns of the content are needed; skip the text/HTML
+        "pages": select(Page).options(content),
+    }
+    if not q:
+        queries.pop("entities")
+    elif _looks_like_uuid(q):
+        entry_id = uuid.UUID(q)
+        queries["entities"] = queries["entities"].where(Entity.id == entry_id)
+        queries["intelligence"] = queries["intelligence"].where(or_(
+            Intelligence.id == entry_id, Intelligence.entity_id == entry_id, Intelligence.page_id == entry_id,
+        ))
+        queries["pages"] = queries["pages"].where(or_(
+            Page.id == entry_id,
+            Page.id.in_(select(Intelligence.page_id).where(Intelligence.entity_id == entry_id)),
+        ))
+    else:
+        queries["entities"] = queries["entities"].where(Entity.name.icontains(q, autoescape=True))
+        queries["intelligence"] = queries["intelligence"].where(or_(
+            Intelligence.entity_name.icontains(q, autoescape=True),
+            cast(Intelligence.data, String).icontains(q, autoescape=True),
+        ))
+        page_json = select(db_models.PageContent.page_id).where(
+            cast(db_models.PageContent.extracted_json, String).icontains(q, autoescape=True)
+        )
+        queries["pages"] = queries["pages"].where(or_(
+            Page.title.icontains(q, autoescape=True),
+            Page.url.icontains(q, autoescape=True),
+            Page.id.in_(page_json),
+        ))
+    if kind:
+        for listing, column in (
+            ("entities", Entity.kind), ("intelligence", Intelligence.entity_type), ("pages", Page.entity_type),
+        ):
+            if listing in queries:
+                queries[listing] = queries[listing].where(_kind_condition(column, kind))
+    return {listing: stmt for listing, stmt in queries.items() if listing in sources}
+
+
+def _encode_graph_cursor(cursors: dict) -> str | None:
+    """Opaque cursor of the next graph window: the keyset cursor of each source with more rows."""
+    if not cursors:
+        return None
+    raw = json.dumps(cursors, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_graph_cursor(cursor: str | None) -> dict | None:
+    """Source cursors in *cursor* (None without one); ValueError if it is not a graph cursor."""
+    if not cursor:
+        return None
+    try:
+        cursors = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor {cursor!r}") from e
+    if not isinstance(cursors, dict) or not set(cursors) <= set(GRAPH_SOURCES):
+        raise ValueError(f"Invalid cursor {cursor!r}")
+    return cursors
+
+
+def _entity_names_in_json(data) -> list[str]:
+    """Names the graph may turn into entity nodes from intelligence or page JSON."""
+    names = [e["name"] for e in _collect_entities_from_json(data)]
+    names += [n for rel in _collect_relationships_from_json(data) for n in (rel["source"], rel["target"])]
+    if isinstance(data, dict):
+        for key, fields in (("locations", ("address", "city", "country")), ("events", ("title",))):
+            items = data.get(key)
+            for item in items if isinstance(items, list) else []:
+                if isinstance(item, dict):
+                    names += [item.get(f) for f in fields]
+    return [n for n in names if isinstance(n, str) and n]
+
+
+def _stored_entities(session, names) -> list:
+    """
+    Stored entities named (or aliased) by any of *names*, newest first, so
+    graph nodes of those names carry the entity's id; one query per
+    ``ID_CHUNK_SIZE`` names instead of reading the whole table.
+    """
+    names = sorted(set(names))
+    rows = {}
+    for i in range(0, len(names), ID_CHUNK_SIZE):
+        stmt = select(db_models.Entity).where(name_match(names[i:i + ID_CHUNK_SIZE]))
+        for row in session.execute(stmt).scalars():
+            rows[row.id] = row
+    return sorted(rows.values(), key=lambda r: r.created_at or datetime.min, reverse=True)
+
+
 def _add_relationship_edges(session, ensure_node, add_edge, entry_type_map: dict[str, str]):
     """
     Include explicit Entity->Entity (or other Entry) relationships as edges with metadata.
@@ -162,11 +303,8 @@ def _add_relationship_edges(session, ensure_node, add_edge, entry_type_map: dict
     Uses "relationship" as the edge kind for filtering, while preserving the specific
     relation_type in metadata for display.
     
-    Note: Currently loads relationships in bulk (limit 20000) to maintain original behavior.
-    TODO: For very large datasets (>20K relationships), implement pagination:
-          - Process relationships in batches of 1000-5000
-          - Use offset-based or cursor-based pagination
-          - This will improve memory usage and prevent timeouts
+    Only relationships with an end among the entries of *entry_type_map*
+    (the nodes already selected) are read, ``ID_CHUNK_SIZE`` ids per query.
     """
     seen_edges = set()  # Track (source, target, relation_type) to avoid duplicates
     
@@ -174,7 +312,15 @@ def _add_relationship_edges(session, ensure_node, add_edge, entry_type_map: dict
     # Build lookup maps for getting proper labels
     node_labels = {}
     
-    for rel in session.query(db_models.Relationship).limit(20000).all():
+    Relationship = db_models.Relationship
+    ids = [uuid.UUID(entry_id) for entry_id in entry_type_map if _looks_like_uuid(entry_id)]
+    relationships = []
+    for i in range(0, len(ids), ID_CHUNK_SIZE):
+        chunk = ids[i:i + ID_CHUNK_SIZE]
+        relationships += session.execute(
+            select(Relationship).where(or_(Relationship.source_id.in_(chunk), Relationship.target_id.in_(chunk)))
+        ).scalars().all()
+    for rel in relationships:
         sid = str(rel.source_id)
         tid = str(rel.target_id)
         relation_type = rel.relation_type or "related"
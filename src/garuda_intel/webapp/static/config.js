@@ -14,6 +14,7 @@ export const els = {
   saveStatus: document.getElementById('save-status'),
   statusBtn: document.getElementById('refresh-status'),
   statusCards: document.getElementById('status-cards'),
+  statusStageTimings: document.getElementById('status-stage-timings'),
   statusBadges: {
     api: document.getElementById('status-api'),
     db: document.getElementById('status-db'),
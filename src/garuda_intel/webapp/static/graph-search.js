@@ -10,7 +10,7 @@ import { showModal } from './modals.js';
 // ========== Hybrid Entity Search ==========
 
 export async function searchEntitiesSemantic(query, options = {}) {
-  const { kind = '', threshold = 0.7, limit = 20 } = options;
+  const { kind = '', threshold = 0.7, limit = 20, cursor = '' } = options;
   
   try {
     const params = new URLSearchParams({
@@ -19,6 +19,8 @@ export async function searchEntitiesSemantic(query, options = {}) {
       limit: limit.toString(),
     });
     if (kind) params.append('kind', kind);
+    // Empty queries list all entities a page at a time
+    if (cursor) params.append('cursor', cursor);
     
     const response = await fetch(`${API_BASE}/api/graph/search?${params}`, {
       headers: { 'X-API-Key': getApiKey() || '' }
@@ -35,38 +37,72 @@ export async function searchEntitiesSemantic(query, options = {}) {
   }
 }
 
-export function displaySearchResults(results, container) {
+function searchResultRow(r) {
+  const label = r.match_type === 'sql_exact' ? 'Exact' : r.match_type === 'all' ? 'All' : 'Semantic';
+  return `
+    <div class="p-3 border rounded hover:bg-slate-100 dark:hover:bg-slate-800 cursor-pointer"
+         onclick="showEntityDetails('${r.entity.id}')">
+      <div class="flex items-center justify-between">
+        <span class="font-medium">${escapeHtml(r.entity.name)}</span>
+        <span class="text-xs px-2 py-0.5 rounded ${r.match_type === 'sql_exact' ? 'bg-green-100 text-green-800' : 'bg-blue-100 text-blue-800'}">
+          ${label} (${(r.score * 100).toFixed(0)}%)
+        </span>
+      </div>
+      <div class="text-sm text-slate-600 dark:text-slate-400">
+        ${r.entity.kind ? `Type: ${r.entity.kind}` : 'No type'}
+      </div>
+    </div>
+  `;
+}
+
+export function displaySearchResults(results, container, options = {}) {
   if (!container) return;
   
-  const { query, total, results: entities } = results;
+  const { query, total, results: entities, next_cursor: nextCursor } = results;
   
   container.innerHTML = `
     <div class="p-4 border rounded-lg bg-slate-50 dark:bg-slate-900">
       <div class="flex items-center justify-between mb-3">
-        <h3 class="font-semibold">Search Results for "${query}"</h3>
-        <span class="text-sm text-slate-500">${total} found</span>
+        <h3 class="font-semibold">${query ? `Search Results for "${escapeHtml(query)}"` : 'All Entities'}</h3>
+        <span class="text-sm text-slate-500" data-role="count">${total}${nextCursor ? '+' : ''} found</span>
       </div>
       
       ${entities.length > 0 ? `
-        <div class="space-y-2 max-h-96 overflow-y-auto">
-          ${entities.map(r => `
-            <div class="p-3 border rounded hover:bg-slate-100 dark:hover:bg-slate-800 cursor-pointer"
-                 onclick="showEntityDetails('${r.entity.id}')">
-              <div class="flex items-center justify-between">
-                <span class="font-medium">${escapeHtml(r.entity.name)}</span>
-                <span class="text-xs px-2 py-0.5 rounded ${r.match_type === 'sql_exact' ? 'bg-green-100 text-green-800' : 'bg-blue-100 text-blue-800'}">
-                  ${r.match_type === 'sql_exact' ? 'Exact' : 'Semantic'} (${(r.score * 100).toFixed(0)}%)
-                </span>
-              </div>
-              <div class="text-sm text-slate-600 dark:text-slate-400">
-                ${r.entity.kind ? `Type: ${r.entity.kind}` : 'No type'}
-              </div>
-            </div>
-          `).join('')}
+        <div class="space-y-2 max-h-96 overflow-y-auto" data-role="rows">
+          ${entities.map(searchResultRow).join('')}
         </div>
+        ${nextCursor ? `
+          <button type="button" data-role="more" class="mt-3 px-3 py-1 text-sm border rounded hover:bg-slate-100 dark:hover:bg-slate-800">
+            Load more
+          </button>
+        ` : ''}
       ` : '<p class="text-slate-500">No entities found</p>'}
     </div>
   `;
+  
+  // Listing pages continue from the cursor of the last one
+  let cursor = nextCursor;
+  let shown = entities.length;
+  const more = container.querySelector('[data-role="more"]');
+  if (!more) return;
+  more.addEventListener('click', async () => {
+    more.disabled = true;
+    try {
+      const page = await searchEntitiesSemantic(query, { ...options, cursor });
+      container.querySelector('[data-role="rows"]')
+        .insertAdjacentHTML('beforeend', page.results.map(searchResultRow).join(''));
+      shown += page.results.length;
+      cursor = page.next_cursor;
+      container.querySelector('[data-role="count"]').textContent = `${shown}${cursor ? '+' : ''} found`;
+      if (cursor) {
+        more.disabled = false;
+      } else {
+        more.remove();
+      }
+    } catch (error) {
+      more.disabled = false;
+    }
+  });
 }
 
 // ========== Semantic Duplicate Detection ==========
@@ -584,7 +620,7 @@ window.searchEntitiesSemantic = async function(query, options) {
   const results = await searchEntitiesSemantic(query, options);
   const container = document.getElementById('entity-search-results') || document.getElementById('graph-search-results');
   if (container) {
-    displaySearchResults(results, container);
+    displaySearchResults(results, container, options);
   }
   return results;
 };
@@ -70,6 +70,43 @@ export function showHealthPopup() {
   });
 }
 
+export function renderStageTimings(timings) {
+  if (!els.statusStageTimings) return;
+  const stages = Object.entries(timings?.stages || {});
+  if (!stages.length) {
+    els.statusStageTimings.innerHTML = '';
+    return;
+  }
+  const fmt = (ms) => (ms >= 1000 ? `${(ms / 1000).toFixed(2)} s` : `${Math.round(ms)} ms`);
+  const rows = stages.map(([stage, t]) => {
+    const counts = Object.entries(t.counts || {}).map(([k, v]) => `${k}: ${v}`).join(', ');
+    return `
+      <tr class="border-b border-slate-200 dark:border-slate-800">
+        <td class="py-1 pr-3 font-medium">${stage}</td>
+        <td class="py-1 pr-3 text-right">${t.pages}</td>
+        <td class="py-1 pr-3 text-right">${fmt(t.p50_ms)}</td>
+        <td class="py-1 pr-3 text-right">${fmt(t.p95_ms)}</td>
+        <td class="py-1 text-[11px] text-slate-500">${counts}</td>
+      </tr>`;
+  }).join('');
+  els.statusStageTimings.innerHTML = `
+    <div class="pt-2">
+      <div class="text-xs font-semibold uppercase text-slate-500 dark:text-slate-400">
+        Pipeline stages &middot; last crawl ${timings.entity_name ? `(${timings.entity_name})` : ''} &middot; ${timings.pages} pages
+      </div>
+      <table class="w-full text-xs mt-1 text-slate-700 dark:text-slate-200">
+        <thead>
+          <tr class="text-left text-slate-500">
+            <th class="py-1 pr-3">Stage</th><th class="py-1 pr-3 text-right">Pages</th>
+            <th class="py-1 pr-3 text-right">p50</th><th class="py-1 pr-3 text-right">p95</th><th class="py-1">Counts</th>
+          </tr>
+        </thead>
+        <tbody>${rows}</tbody>
+      </table>
+    </div>
+  `;
+}
+
 export function renderStatus(data) {
   setLastStatusData(data || null);
 
@@ -107,6 +144,8 @@ export function renderStatus(data) {
     `;
     els.statusCards.appendChild(div);
   });
+
+  renderStageTimings(data.stage_timings);
 }
 
 export async function refreshStatus() {
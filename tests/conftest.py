@@ -0,0 +1,91 @@
+"""
+Shared test fixtures:
+- store: SQLAlchemyStore on a temporary SQLite file
+- local_site: synthetic HTML site served on 127.0.0.1 for crawl tests
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Tuple
+
+import pytest
+
+from garuda_intel.database.engine import SQLAlchemyStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = SQLAlchemyStore(f"sqlite:///{tmp_path / 'crawler.db'}")
+    yield s
+    s.engine.dispose()
+    s.read_engine.dispose()
+    if s.blobs is not None:
+        s.blobs.close()
+
+
+class LocalSite:
+    """
+    HTML site served on 127.0.0.1 from a background thread.
+
+    *render* maps a request path (``"/"``, or without its trailing slash)
+    to the page's HTML; robots.txt is always missing. Every request is
+    logged in ``requests`` as ``(time.monotonic(), path)``.
+    """
+
+    def __init__(self, render: Callable[[str], str]):
+        self.render = render
+        self.requests: List[Tuple[float, str]] = []
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.rstrip("/") or "/"
+                site.requests.append((time.monotonic(), path))
+                if path == "/robots.txt":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = site.render(path).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._running = True
+
+    @property
+    def hits(self) -> int:
+        return len(self.requests)
+
+    def page_times(self) -> List[float]:
+        """Arrival times of page requests (robots.txt excluded)."""
+        return [t for t, path in self.requests if path != "/robots.txt"]
+
+    def stop(self) -> None:
+        if self._running:
+            self._running = False
+            self.server.shutdown()
+            self.server.server_close()
+
+
+@pytest.fixture
+def local_site():
+    """``local_site(render)`` starts a ``LocalSite``; all are stopped after the test."""
+    sites: List[LocalSite] = []
+
+    def start(render: Callable[[str], str]) -> LocalSite:
+        site = LocalSite(render)
+        sites.append(site)
+        return site
+
+    yield start
+    for site in sites:
+        site.stop()
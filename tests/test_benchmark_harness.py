@@ -0,0 +1,100 @@
+"""
+Tests for the crawl benchmark harness:
+- Deterministic synthetic site graph and local server
+- Stub Ollama responses per prompt kind
+- End-to-end run metrics, JSON round trip and comparison
+"""
+
+import json
+
+import requests
+
+from garuda_intel.benchmark import (
+    HashingEmbedder,
+    StubOllamaServer,
+    SyntheticSiteServer,
+    SyntheticSiteSpec,
+    build_site,
+    compare_results,
+    load_results,
+    run_benchmark,
+    save_results,
+)
+from garuda_intel.benchmark.stub_ollama import stub_response
+
+SMALL = SyntheticSiteSpec(
+    entity_pages=6, hub_pages=2, duplicate_pages=2, large_pages=1,
+    large_page_kb=16, slow_pages=1, slow_delay=0.05,
+)
+
+
+class TestSyntheticSite:
+    def test_graph_is_deterministic_and_complete(self):
+        pages = build_site(SMALL)
+        assert len(pages) == SMALL.total_pages == 13
+        assert build_site(SMALL)["/team/3"].html == pages["/team/3"].html
+        assert pages["/mirror/0"].html == pages["/team/0"].html
+        assert len(pages["/report/0"].html) > 16 * 1024
+        assert pages["/archive/0"].delay == 0.05
+        # Every non-home page is reachable from some page
+        linked = {p for page in pages.values() for p in pages if f'href="{p}"' in page.html}
+        assert linked >= set(pages) - {"/"}
+
+    def test_server_serves_pages(self):
+        with SyntheticSiteServer(SMALL) as site:
+            assert "is the" in requests.get(site.url + "/team/1", timeout=5).text
+            assert requests.get(site.url + "/missing", timeout=5).status_code == 404
+
+
+class TestStubOllama:
+    def test_extraction_reads_only_analysed_text(self):
+        prompt = (
+            'Example: "Satya Nadella is the CEO of Microsoft."\n'
+            "=== TEXT TO ANALYZE ===\nAda Brandt is the Head of Research of Acme Robotics.\n"
+            "CRITICAL RULES: ..."
+        )
+        kind, text = stub_response(prompt)
+        result = json.loads(text)
+        assert kind == "extract"
+        assert [p["name"] for p in result["persons"]] == ["Ada Brandt"]
+        assert result["relationships"][0]["target"] == "Acme Robotics"
+
+    def test_server_counts_calls_by_kind(self):
+        with StubOllamaServer() as ollama:
+            resp = requests.post(ollama.url, json={"prompt": "You are a strict QA auditor."}, timeout=5)
+            requests.post(ollama.url, json={"prompt": "Summarize this"}, timeout=5)
+        assert json.loads(resp.json()["response"])["is_verified"] is True
+        assert ollama.calls == {"reflect": 1, "generate": 1}
+
+    def test_hashing_embedder_is_deterministic_unit_vector(self):
+        embedder = HashingEmbedder(dim=64)
+        a = embedder.encode("acme robotics team")
+        assert (a == embedder.encode("acme robotics team")).all()
+        assert abs(float((a ** 2).sum()) - 1.0) < 1e-5
+        assert embedder.calls == 2
+
+
+class TestRunner:
+    def test_run_reports_metrics_and_round_trips(self, tmp_path):
+        results = run_benchmark(SMALL, label="small")
+
+        assert results["pages"] == SMALL.total_pages
+        assert results["pages_per_second"] > 0
+        assert results["llm_calls_by_kind"]["extract"] > 0
+        assert results["llm_calls_per_page"] > 0
+        assert results["embeddings_per_page"] > 0
+        assert results["db_writes_per_page"] > 0
+        assert results["crawl_stats"]["near_duplicates"] >= 1
+        for stage in ("fetch", "pipeline", "llm_extract", "persist", "embed"):
+            assert results["stages"][stage]["calls"] > 0
+
+        path = tmp_path / "runs" / "small.json"
+        save_results(results, str(path))
+        loaded = load_results(str(path))
+        assert loaded["spec"]["entity_pages"] == 6
+
+        faster = dict(loaded, pages_per_second=loaded["pages_per_second"] * 2)
+        comparison = compare_results(loaded, faster)
+        assert comparison["pages_per_second"]["change_pct"] == 100.0
+        assert comparison["pages_per_second"]["improved"] is True
+        assert comparison["stage:fetch"]["change_pct"] == 0.0
@@ -0,0 +1,163 @@
+"""
+Tests for the page HTML blob store:
+- Content-addressed, compressed, deduplicated bodies (zstd and gzip)
+- save_page / get_page_content / to_dict load the HTML lazily
+- Migration of inline rows from databases created before the store
+- Merge between databases carries the bodies along
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import joinedload, sessionmaker
+
+from garuda_intel.benchmark.storage import run_blob_benchmark
+from garuda_intel.database.blob_store import (
+    BlobStore,
+    blob_digest,
+    default_blob_path,
+    referenced_digests,
+)
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.database.models import Base, Page, PageContent
+from garuda_intel.database.repositories.page_repository import PageRepository
+from garuda_intel.services.database_manager import DatabaseManager
+
+BIG_HTML = "<html><body>" + "<p>Acme rockets and Jane Doe.</p>" * 100 + "</body></html>"
+
+
+def _raw_content(store, url):
+    with store.Session() as s:
+        return s.execute(
+            select(PageContent.html, PageContent.html_digest)
+            .join(Page, Page.id == PageContent.page_id).where(Page.url == url)
+        ).one()
+
+
+class TestBlobStore:
+    @pytest.mark.parametrize("codec", ["zstd", "gzip"])
+    def test_roundtrip_and_dedupe(self, tmp_path, codec):
+        if codec == "zstd":
+            pytest.importorskip("zstandard")
+        with BlobStore(str(tmp_path / "b.db"), codec=codec) as blobs:
+            digest = blobs.put(BIG_HTML)
+            assert digest == blob_digest(BIG_HTML.encode())
+            assert blobs.put(BIG_HTML) == digest
+            assert blobs.get(digest) == BIG_HTML
+            assert len(blobs) == 1 and digest in blobs
+            assert blobs.stats["blobs_deduplicated"] == 1
+            summary = blobs.summary()
+            assert summary["stored_bytes"] < summary["bytes"] / 5
+            assert blobs.get("sha256:missing") is None
+
+    def test_prune(self, tmp_path):
+        with BlobStore(str(tmp_path / "b.db")) as blobs:
+            keep = blobs.put(BIG_HTML)
+            blobs.put(BIG_HTML + "<!-- other -->")
+            assert blobs.prune({keep}) == 1
+            assert blobs.summary()["blobs"] == 1
+
+    def test_default_path(self):
+        assert default_blob_path("/data/crawler.db") == "/data/crawler.blobs.db"
+
+    def test_unknown_codec(self, tmp_path):
+        with pytest.raises(ValueError):
+            BlobStore(str(tmp_path / "b.db"), codec="lz4")
+
+
+class TestStorePages:
+    def test_large_html_moves_to_blobs(self, store, tmp_path):
+        assert store.blobs.path == str(tmp_path / "crawler.blobs.db")
+        store.save_page({"url": "https://acme.com/", "html": BIG_HTML, "text_content": "Acme"})
+        store.save_page({"url": "https://acme.com/copy", "html": BIG_HTML})
+        store.save_page({"url": "https://acme.com/small", "html": "<p>hi</p>"})
+
+        html, digest = _raw_content(store, "https://acme.com/")
+        assert html is None and digest == blob_digest(BIG_HTML.encode())
+        assert _raw_content(store, "https://acme.com/copy")[1] == digest
+        assert _raw_content(store, "https://acme.com/small") == ("<p>hi</p>", None)
+        assert len(store.blobs) == 1
+
+        assert store.get_page_content("https://acme.com/")["html"] == BIG_HTML
+        assert store.get_page_content("https://acme.com/")["text"] == "Acme"
+        with store.ReadSession() as s:
+            pc = s.execute(select(PageContent).where(PageContent.html_digest == digest)).scalars().first()
+            assert pc.to_dict()["html"] == BIG_HTML
+
+    def test_update_replaces_reference(self, store):
+        store.save_page({"url": "https://acme.com/", "html": BIG_HTML})
+        store.save_page({"url": "https://acme.com/", "html": "<p>short now</p>"})
+        assert _raw_content(store, "https://acme.com/") == ("<p>short now</p>", None)
+
+    def test_graph_query_skips_bodies(self, store):
+        store.save_page({"url": "https://acme.com/", "html": BIG_HTML, "extracted": {"entities": []}})
+        with store.ReadSession() as s:
+            row = s.query(Page).options(
+                joinedload(Page.content).load_only(PageContent.extracted_json, PageContent.metadata_json)
+            ).one()
+            assert row.content.extracted_json == {"entities": []}
+        assert store.blobs.stats["blob_reads"] == 0
+
+    def test_inline_when_disabled(self, tmp_path):
+        s = SQLAlchemyStore(f"sqlite:///{tmp_path / 'inline.db'}", blob_path=None)
+        s.save_page({"url": "https://acme.com/", "html": BIG_HTML})
+        assert s.blobs is None
+        assert _raw_content(s, "https://acme.com/") == (BIG_HTML, None)
+        assert not os.path.exists(tmp_path / "inline.blobs.db")
+        s.engine.dispose()
+        s.read_engine.dispose()
+
+    def test_in_memory_keeps_html_inline(self):
+        assert SQLAlchemyStore("sqlite:///:memory:").blobs is None
+
+
+class TestMigration:
+    def test_existing_rows_moved(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'old.db'}"
+        # Database from before html_digest existed, HTML inline
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        PageRepository(sessionmaker(engine)).save_page(
+            {"url": "https://acme.com/", "html": BIG_HTML, "text_content": "legacy rockets page"}
+        )
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_page_content_html_digest"))
+            conn.execute(text("ALTER TABLE page_content DROP COLUMN html_digest"))
+        engine.dispose()
+
+        store = SQLAlchemyStore(url)
+        assert store.get_page_content("https://acme.com/")["html"] == BIG_HTML
+        assert store.migrate_page_html() == {"rows": 1, "bytes": len(BIG_HTML)}
+        assert store.migrate_page_html()["rows"] == 0
+        assert _raw_content(store, "https://acme.com/")[0] is None
+        assert store.get_page_content("https://acme.com/")["html"] == BIG_HTML
+        assert referenced_digests(store.engine) == {blob_digest(BIG_HTML.encode())}
+        # Text (and its search index) untouched
+        assert [h["url"] for h in store.search_intel("rockets")] == ["https://acme.com/"]
+        store.engine.dispose()
+        store.read_engine.dispose()
+        store.blobs.close()
+
+
+def test_merge_copies_bodies(tmp_path):
+    mgr = DatabaseManager(data_dir=str(tmp_path))
+    mgr.create_database("src")
+    mgr.create_database("dst")
+    src, _ = mgr.switch_database("src")
+    src.save_page({"url": "https://acme.com/", "html": BIG_HTML})
+    mgr.merge_databases("src", "dst")
+    dst, _ = mgr.switch_database("dst")
+    assert dst.get_page_content("https://acme.com/")["html"] == BIG_HTML
+    assert len(dst.blobs) == 1
+
+    mgr.switch_database("default")
+    src_path = src.blobs.path
+    mgr.delete_database("src", delete_files=True)
+    assert not os.path.exists(src_path)
+
+
+def test_benchmark_shrinks_database():
+    results = run_blob_benchmark(pages=20, html_kb=8, repeats=1)
+    assert results["blobs"]["db_bytes"] < results["inline"]["db_bytes"]
+    assert results["blobs"]["blobs"] < 20 and results["inline"]["blobs"] == 0
@@ -0,0 +1,170 @@
+"""
+Tests for the Selenium browser pool:
+- Lazy driver start up to the pool size, blocking when exhausted
+- Health checks on suspect/idle drivers and recycling after K pages
+- Concurrent Selenium batches in the explorer
+- Shared process-wide pool
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from garuda_intel.browser import pool as pool_module
+from garuda_intel.browser.pool import BrowserPool, BrowserPoolTimeout, get_shared_pool
+
+
+class FakeBrowser:
+    """Stands in for SeleniumBrowser without starting Chrome."""
+
+    instances = []
+
+    def __init__(self, pages=None, delay=0.0):
+        self.pages = pages or {}
+        self.delay = delay
+        self.pages_loaded = 0
+        self.started = False
+        self.closed = False
+        self.healthy = True
+        FakeBrowser.instances.append(self)
+
+    def _init_driver(self):
+        self.started = True
+
+    def is_healthy(self):
+        return self.healthy and not self.closed
+
+    def get_page(self, url, wait_for_selector=None):
+        self.pages_loaded += 1
+        time.sleep(self.delay)
+        return self.pages.get(url, "")
+
+    def find_links(self, base_url):
+        return [{"href": base_url + "/child", "text": "child"}]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _reset_instances():
+    FakeBrowser.instances = []
+    yield
+
+
+def _pool(size=2, **kwargs):
+    pages = kwargs.pop("pages", {"https://a.com": "<html>a</html>"})
+    delay = kwargs.pop("delay", 0.0)
+    return BrowserPool(size=size, browser_factory=lambda: FakeBrowser(pages, delay), **kwargs)
+
+
+class TestPoolLifecycle:
+    def test_drivers_start_lazily_and_are_reused(self):
+        pool = _pool(size=3)
+        for _ in range(5):
+            html, links = pool.fetch("https://a.com")
+        assert html == "<html>a</html>"
+        assert links == [{"href": "https://a.com/child", "text": "child"}]
+        assert len(FakeBrowser.instances) == 1
+        assert pool.stats["browser_pages"] == 5
+
+    def test_acquire_blocks_when_exhausted(self):
+        pool = _pool(size=1)
+        held = pool.acquire()
+        with pytest.raises(BrowserPoolTimeout):
+            pool.acquire(timeout=0.05)
+        threading.Timer(0.05, pool.release, args=(held,)).start()
+        assert pool.acquire(timeout=2) is held
+
+    def test_recycle_after_k_pages(self):
+        pool = _pool(size=1, recycle_after=3)
+        for _ in range(7):
+            pool.fetch("https://a.com")
+        assert pool.stats["browsers_recycled"] == 2
+        assert [b.closed for b in FakeBrowser.instances] == [True, True, False]
+
+    def test_failed_fetch_triggers_health_check(self):
+        pool = _pool(size=1)
+        pool.fetch("https://missing.example")  # empty html -> suspect
+        FakeBrowser.instances[0].healthy = False
+        html, _ = pool.fetch("https://a.com")
+        assert html
+        assert pool.stats["browsers_unhealthy"] == 1
+        assert len(FakeBrowser.instances) == 2
+        assert FakeBrowser.instances[0].closed
+
+    def test_idle_drivers_are_checked(self):
+        pool = _pool(size=1, health_check_interval=0.0)
+        pool.fetch("https://a.com")
+        FakeBrowser.instances[0].healthy = False
+        pool.fetch("https://a.com")
+        assert pool.stats["browsers_unhealthy"] == 1
+
+    def test_failed_start_frees_the_slot(self):
+        calls = {"n": 0}
+
+        def factory():
+            calls["n"] += 1
+            browser = FakeBrowser()
+            if calls["n"] == 1:
+                browser._init_driver = MagicMock(side_effect=RuntimeError("no chrome"))
+            return browser
+
+        pool = BrowserPool(size=1, browser_factory=factory)
+        with pytest.raises(RuntimeError):
+            pool.start()
+        assert pool.acquire(timeout=0.1) is FakeBrowser.instances[1]
+
+    def test_close_quits_idle_drivers(self):
+        pool = _pool(size=2)
+        a, b = pool.acquire(), pool.acquire()
+        pool.release(a)
+        pool.close()
+        assert a.closed and not b.closed
+        pool.release(b)
+        assert b.closed
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+
+class TestExplorerIntegration:
+    def test_selenium_batches_fetch_concurrently(self):
+        from garuda_intel.explorer.engine import IntelligentExplorer
+        from garuda_intel.types.entity import EntityProfile, EntityType
+
+        urls = [f"https://site{i}.com/page" for i in range(6)]
+        pages = {u: f"<html><body>Acme {u}</body></html>" for u in urls}
+        pool = _pool(size=3, pages=pages, delay=0.2)
+        explorer = IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=True,
+            max_total_pages=6,
+            max_depth=0,
+            score_threshold=-1000.0,
+            enable_politeness=False,
+            enable_near_duplicate_detection=False,
+        )
+        started = time.monotonic()
+        explored = explorer.explore(urls, pool)
+        elapsed = time.monotonic() - started
+
+        assert sorted(explored) == sorted(urls)
+        assert len(FakeBrowser.instances) == 3
+        # Two rounds of three concurrent 0.2s renders, not six sequential ones
+        assert elapsed < 1.0
+        stats = explorer.get_crawl_stats()
+        assert stats["browser_pages"] == 6
+        # Caller-owned pool stays open
+        assert not any(b.closed for b in FakeBrowser.instances)
+
+
+class TestSharedPool:
+    def test_shared_pool_is_reused(self, monkeypatch):
+        monkeypatch.setattr(pool_module, "_shared_pool", None)
+        first = get_shared_pool(size=2, browser_factory=FakeBrowser)
+        assert get_shared_pool(size=5) is first
+        first.close()
+        assert get_shared_pool(size=1, browser_factory=FakeBrowser) is not first
+        pool_module.close_shared_pool()
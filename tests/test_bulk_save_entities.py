@@ -0,0 +1,110 @@
+"""
+Tests for the set-based save_entities:
+- One candidate query and batched writes per call, regardless of batch size
+- Same resolution as entity-by-entity: exact match, case-insensitive merge,
+  kind upgrades, entities repeated within one batch
+- mentions_entity / related_entity / suggested relationships and their types
+"""
+
+import uuid
+
+from sqlalchemy import select
+
+from garuda_intel.benchmark.runner import WriteCounter
+from garuda_intel.benchmark.storage import run_entity_benchmark
+from garuda_intel.database.models import Entity, Relationship
+
+
+def _entities(store):
+    with store.Session() as s:
+        return {(e.name, e.kind): e for e in s.execute(select(Entity)).scalars()}
+
+
+def _relationships(store):
+    with store.Session() as s:
+        return sorted(
+            (str(r.source_id), str(r.target_id), r.relation_type, r.source_type, r.target_type)
+            for r in s.execute(select(Relationship)).scalars()
+        )
+
+
+def test_statements_do_not_grow_with_batch(store):
+    page_id = store.save_page({"url": "https://acme.com/", "text_content": "Acme"})
+    counter = WriteCounter(store.engine)
+    for size in (5, 60):
+        store.save_entities([{"name": f"Seed {size}-{i}", "kind": "person"} for i in range(size)])
+        counter.reset()
+        store.save_entities([
+            {"name": f"seed {size}-{i}" if i % 2 else f"New {size}-{i}", "kind": "person", "page_id": page_id}
+            for i in range(size)
+        ])
+        statements = counter.statements
+        assert statements <= 12, (size, statements)
+    counter.close()
+
+
+def test_resolution(store):
+    first = store.save_entities([
+        {"name": "Acme Corp", "kind": "company", "data": {"industry": "Aerospace"}},
+        {"name": "Jane Doe", "kind": "person"},
+    ])
+    acme = first[("Acme Corp", "company")]
+    mapping = store.save_entities([
+        # Exact match merges data, keeps existing values
+        {"name": "Acme Corp", "kind": "company", "data": {"industry": "Other", "hq": "Paris"}},
+        # Name-only match, case-insensitive, upgrades the kind
+        {"name": "JANE DOE", "kind": "ceo", "meta": {"source": "team page"}},
+        # New, then matched again within the same batch
+        {"name": "Globex", "kind": "company", "parent_type": "organization"},
+        {"name": "globex", "kind": "general", "data": {"country": "US"}},
+    ])
+    assert str(mapping[("Acme Corp", "company")]) == str(acme)
+    assert str(mapping[("JANE DOE", "ceo")]) == str(first[("Jane Doe", "person")])
+    assert str(mapping[("globex", "general")]) == str(mapping[("Globex", "company")])
+
+    stored = _entities(store)
+    assert stored[("Acme Corp", "company")].data == {"industry": "Aerospace", "hq": "Paris"}
+    jane = stored[("Jane Doe", "ceo")]
+    assert jane.metadata_json["source"] == "team page"
+    assert [(h["from"], h["to"]) for h in jane.metadata_json["type_history"]] == [("person", "ceo")]
+    globex = stored[("Globex", "company")]
+    assert globex.data == {"country": "US"} and globex.metadata_json == {"parent_type": "organization"}
+    assert len(stored) == 3
+
+
+def test_relationships(store):
+    page_id = store.save_page({"url": "https://acme.com/team", "text_content": "team"})
+    acme = str(store.save_entities([{"name": "Acme Corp", "kind": "company"}])[("Acme Corp", "company")])
+    missing = str(uuid.uuid4())
+    mapping = store.save_entities([
+        {"name": "Jane Doe", "kind": "person", "page_id": page_id, "primary_entity_id": acme,
+         "suggested_relationship": {"target": "acme corp", "relation_type": "works_at"}},
+        {"name": "Bob Roe", "kind": "person", "primary_entity_id": acme, "relation_type": "board_member"},
+        # Target created earlier in the batch; unknown parent id keeps its type unset
+        {"name": "Acme Labs", "kind": "company", "parent_entity_id": missing,
+         "suggested_relationship": {"target": "JANE DOE"}},
+        {"name": "Nobody", "kind": "person", "suggested_relationship": {"target": "Not Stored"}},
+    ])
+    jane, bob, labs = (str(mapping[k]) for k in [
+        ("Jane Doe", "person"), ("Bob Roe", "person"), ("Acme Labs", "company"),
+    ])
+    assert _relationships(store) == sorted([
+        (page_id, jane, "mentions_entity", "page", "entity"),
+        (acme, jane, "related_entity", "entity", "entity"),
+        (jane, acme, "works_at", "entity", "entity"),
+        (acme, bob, "board_member", "entity", "entity"),
+        (missing, labs, "related_entity", None, "entity"),
+        (labs, jane, "related", "entity", "entity"),
+    ])
+
+
+def test_empty_and_nameless(store):
+    assert store.save_entities([]) == {}
+    assert store.save_entities([{"name": "", "kind": "person"}, {"kind": "company"}]) == {}
+    assert _entities(store) == {}
+
+
+def test_benchmark_counts_statements():
+    r = run_entity_benchmark(pages=3, entities_per_page=20)
+    assert r["entities"] > 0 and r["relationships"] > r["entities"]
+    assert r["statements_per_page"] < 20
@@ -0,0 +1,253 @@
+"""
+Tests for multi-worker crawling over the shared database frontier:
+- Conditional leases and atomic budget claims
+- Several workers draining one session without refetching
+- Global per-domain / total budgets and merged stats
+- Leased URLs go through the politeness scheduler's per-host spacing
+- Workers feed the crawl learner and flush it, merging into shared counts
+- Coordinator with real worker processes against a fixture HTTP server
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.database.models import FrontierEntry
+from garuda_intel.explorer.coordinator import (
+    TOTAL_BUDGET_KEY,
+    CrawlCoordinator,
+    CrawlWorker,
+)
+
+
+def _page(path):
+    """Synthetic site: / links to /p0..p7, each /pN links to two leaves."""
+    if path == "/":
+        links = [f"/p{i}" for i in range(8)]
+    elif path.startswith("/p"):
+        links = [f"{path}/a", f"{path}/b"]
+    else:
+        links = []
+    anchors = "".join(f'<a href="{href}">Acme {href}</a>' for href in links)
+    return (
+        f"<html><head><title>Acme {path}</title></head><body>"
+        f"<p>Acme page {path} with some text content.</p>{anchors}</body></html>"
+    )
+
+
+@pytest.fixture
+def site(local_site):
+    return local_site(_page)
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'crawl.db'}"
+
+
+def _worker(db_url, session_key, **kwargs):
+    from garuda_intel.explorer.coordinator import build_worker_explorer
+
+    config = {
+        "db_url": db_url,
+        "session_key": session_key,
+        "entity_name": "Acme",
+        "score_threshold": -1000.0,
+        "explorer_options": {"enable_near_duplicate_detection": False},
+        **kwargs,
+    }
+    return CrawlWorker(build_worker_explorer(config), session_key, lease_size=3)
+
+
+class TestSharedState:
+    def test_budget_claims_are_bounded(self, db_url):
+        store = SQLAlchemyStore(db_url)
+        sid = store.open_crawl_session("s")["id"]
+        results = [store.claim_crawl_budget(sid, TOTAL_BUDGET_KEY, 3) for _ in range(5)]
+        assert results == [True, True, True, False, False]
+        store.release_crawl_budget(sid, TOTAL_BUDGET_KEY)
+        assert store.claim_crawl_budget(sid, TOTAL_BUDGET_KEY, 3)
+        assert store.get_crawl_budgets(sid) == {TOTAL_BUDGET_KEY: 3}
+
+    def test_concurrent_leases_do_not_overlap(self, db_url):
+        store = SQLAlchemyStore(db_url)
+        sid = store.open_crawl_session("s")["id"]
+        store.frontier_push_batch(sid, [
+            {"url": f"u{i}", "url_norm": f"u{i}", "score": i, "depth": 0} for i in range(40)
+        ])
+        claimed = []
+
+        def lease(owner):
+            other = SQLAlchemyStore(db_url)
+            while True:
+                rows = other.frontier_lease_batch(sid, 3, owner)
+                if not rows:
+                    return
+                claimed.extend(r["url_norm"] for r in rows)
+
+        threads = [threading.Thread(target=lease, args=(f"w{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(claimed) == sorted(f"u{i}" for i in range(40))
+        assert store.frontier_counts(sid) == {"leased": 40}
+
+
+class TestCrawlWorkers:
+    def test_workers_share_frontier_without_refetching(self, site, db_url):
+        coordinator = CrawlCoordinator(
+            db_url, "acme", "Acme", max_total_pages=100, max_pages_per_domain=100,
+            max_depth=2, score_threshold=-1000.0,
+        )
+        coordinator.seed([site.url + "/"])
+
+        workers = [
+            _worker(db_url, "acme", max_total_pages=100, max_pages_per_domain=100, max_depth=2)
+            for _ in range(3)
+        ]
+        threads = [threading.Thread(target=w.run) for w in workers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=120)
+
+        fetched = [url for w in workers for url in w.explorer.explored_data]
+        # 1 root + 8 section pages + 16 leaves, each fetched exactly once
+        assert len(fetched) == 25
+        assert len(set(fetched)) == 25
+
+        summary = coordinator.merged_stats()
+        assert summary["pages_explored"] == 25
+        assert summary["frontier"].get("queued", 0) == 0
+        assert summary["frontier"].get("leased", 0) == 0
+        assert len(summary["workers"]) == 3
+        assert all(w["status"] == "completed" for w in summary["workers"])
+
+    def test_global_budgets_hold_across_workers(self, site, db_url):
+        coordinator = CrawlCoordinator(
+            db_url, "acme", "Acme", max_total_pages=7, score_threshold=-1000.0,
+        )
+        coordinator.seed([site.url + "/"])
+        workers = [
+            _worker(db_url, "acme", max_total_pages=7, max_pages_per_domain=100, max_depth=2)
+            for _ in range(2)
+        ]
+        threads = [threading.Thread(target=w.run) for w in workers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=120)
+
+        summary = coordinator.merged_stats()
+        assert summary["pages_explored"] == 7
+        assert sum(summary["domain_counts"].values()) == 7
+
+    def test_leased_urls_are_spaced_per_host(self, site, db_url):
+        coordinator = CrawlCoordinator(db_url, "acme", "Acme", score_threshold=-1000.0)
+        coordinator.seed([site.url + "/"])
+        worker = _worker(
+            db_url, "acme", max_total_pages=6, max_pages_per_domain=100, max_depth=2,
+            explorer_options={
+                "enable_near_duplicate_detection": False, "politeness_min_delay": 0.3,
+            },
+        )
+        worker.run()
+
+        times = site.page_times()
+        assert len(times) == 6
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        assert min(gaps) >= 0.25
+
+    def test_lease_lost_mid_batch_is_dropped(self, site, db_url):
+        store = SQLAlchemyStore(db_url)
+        coordinator = CrawlCoordinator(db_url, "acme", "Acme", score_threshold=-1000.0)
+        coordinator.seed([site.url + f"/p{i}" for i in range(3)])
+        sid = coordinator.session_id
+        worker = _worker(
+            db_url, "acme", max_total_pages=100, max_pages_per_domain=100, max_depth=0,
+            explorer_options={
+                "enable_near_duplicate_detection": False, "politeness_min_delay": 0.05,
+            },
+        )
+        fetch, process = worker._fetch, worker._process
+        state = {"stolen": False, "checked": False}
+
+        def fetch_then_expire(rows):
+            result = fetch(rows)
+            if not state["stolen"]:
+                # Lease expires after the first page; another worker takes the rows over
+                state["stolen"] = True
+                table = FrontierEntry.__table__
+                with store.Session() as s:
+                    s.execute(
+                        update(table)
+                        .where(table.c.lease_owner == worker.worker_id)
+                        .values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+                    )
+                    s.commit()
+                assert len(store.frontier_lease_batch(sid, 3, "thief", lease_seconds=1)) == 3
+            return result
+
+        def process_then_check(batch):
+            process(batch)
+            if not state["checked"]:
+                state["checked"] = True
+                with store.Session() as s:
+                    rows = s.execute(select(FrontierEntry)).scalars().all()
+                assert {(r.state, r.lease_owner) for r in rows} == {("leased", "thief")}
+
+        worker._fetch = fetch_then_expire
+        worker._process = process_then_check
+        stats = worker.run()
+
+        assert stats["lease_lost"] == 3
+        counts = store.frontier_counts(sid)
+        assert counts.get("done") == 3 and counts.get("leased", 0) == 0
+        # Budget claimed for the lost leases went back: each page is charged once
+        assert store.get_crawl_budgets(sid)[TOTAL_BUDGET_KEY] == 3
+
+    def test_worker_learns_from_pages_and_flushes(self, site, db_url):
+        coordinator = CrawlCoordinator(db_url, "acme", "Acme", score_threshold=-1000.0)
+        coordinator.seed([site.url + "/"])
+        worker = _worker(db_url, "acme", max_total_pages=5, max_pages_per_domain=100, max_depth=1)
+        explorer = worker.explorer
+        learned = []
+
+        def learn(url, record):
+            learned.append(url)
+            explorer.crawl_learner.record_crawl_result(
+                url=url, page_type="official", intel_quality=0.8,
+                extraction_success=True, entity_type="company", intel_count=1,
+            )
+
+        explorer._learn_from_page = learn
+        worker.run()
+
+        assert len(learned) == 5
+        rows = SQLAlchemyStore(db_url).load_crawl_learning()["domains"]
+        assert [r["total_crawls"] for r in rows] == [pytest.approx(5)]
+        assert not explorer.visited_urls._pending
+
+    def test_in_memory_database_rejected(self):
+        with pytest.raises(ValueError):
+            CrawlCoordinator("sqlite:///:memory:", "s", "Acme")
+
+
+class TestCoordinatorProcesses:
+    def test_worker_processes_merge_into_one_session(self, site, db_url):
+        coordinator = CrawlCoordinator(
+            db_url, "acme-mp", "Acme", num_workers=2, max_total_pages=12,
+            max_pages_per_domain=12, max_depth=2, score_threshold=-1000.0,
+            explorer_options={"enable_politeness": False},
+        )
+        summary = coordinator.run([site.url + "/"], timeout=300)
+
+        assert summary["status"] == "completed"
+        assert summary["pages_explored"] == 12
+        assert len(summary["workers"]) == 2
+        session = coordinator.store.open_crawl_session("acme-mp")
+        assert session["pages_explored"] == 12
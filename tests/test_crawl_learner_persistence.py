@@ -0,0 +1,197 @@
+"""
+Tests for persisted crawl learning:
+- Domain and page-type statistics survive a restart (dedicated tables)
+- Incremental saves write only touched entries, merged into stored counts
+- Exponential decay of counters and yield-per-page tracking
+- Explorer re-scores enqueued links through the learner alone, not also the URL scorer
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from garuda_intel.discover.crawl_learner import CrawlLearner, DomainStats
+from garuda_intel.discover.frontier import Frontier
+from garuda_intel.explorer.engine import IntelligentExplorer
+from garuda_intel.types.entity import EntityProfile, EntityType
+
+
+def _record(learner, url, success=True, quality=0.8, intel_count=2, page_type="official"):
+    learner.record_crawl_result(
+        url=url,
+        page_type=page_type,
+        intel_quality=quality,
+        extraction_success=success,
+        entity_type="company",
+        intel_count=intel_count,
+    )
+
+
+class TestPersistence:
+    def test_round_trip_across_learners(self, store):
+        learner = CrawlLearner(store)
+        for i in range(6):
+            _record(learner, f"https://www.acme.com/{i}", success=i % 3 != 0)
+        learner.flush()
+
+        reloaded = CrawlLearner(store)
+        original = learner._domain_stats["acme.com"]
+        loaded = reloaded._domain_stats["acme.com"]
+        assert loaded.total_crawls == pytest.approx(original.total_crawls)
+        assert loaded.successful_crawls == pytest.approx(original.successful_crawls)
+        assert loaded.yield_per_page == pytest.approx(2.0)
+        assert loaded.page_type_distribution["official"] == pytest.approx(6)
+        assert reloaded.get_domain_reliability("acme.com") == pytest.approx(
+            learner.get_domain_reliability("acme.com")
+        )
+        pattern = reloaded._page_type_patterns["company:official"]
+        assert pattern.total_count == pytest.approx(6)
+        assert pattern.confidence == pytest.approx(
+            learner._page_type_patterns["company:official"].confidence
+        )
+
+    def test_updates_are_incremental(self, store):
+        learner = CrawlLearner(store)
+        _record(learner, "https://a.com/1")
+        _record(learner, "https://b.com/1")
+        learner.flush()
+
+        store.save_crawl_learning = MagicMock(wraps=store.save_crawl_learning)
+        _record(learner, "https://b.com/2")
+        learner.flush()
+        domains, page_types = store.save_crawl_learning.call_args[0]
+        assert [d["domain"] for d in domains] == ["b.com"]
+        assert [p["pattern_key"] for p in page_types] == ["company:official"]
+
+        learner.flush()  # nothing dirty
+        assert store.save_crawl_learning.call_count == 1
+        rows = {d["domain"]: d for d in store.load_crawl_learning()["domains"]}
+        assert rows["b.com"]["total_crawls"] == pytest.approx(2)
+        assert rows["a.com"]["total_crawls"] == pytest.approx(1)
+
+    def test_periodic_save(self, store):
+        learner = CrawlLearner(store)
+        learner._save_every = 3
+        for i in range(3):
+            _record(learner, f"https://a.com/{i}")
+        assert len(store.load_crawl_learning()["domains"]) == 1
+
+    def test_store_without_support_keeps_learning_in_memory(self):
+        learner = CrawlLearner(MagicMock(save_crawl_learning=MagicMock(return_value=False)))
+        _record(learner, "https://a.com/1")
+        learner.flush()
+        assert set(learner._pending_domains) == {"a.com"}
+
+    def test_concurrent_learners_add_up(self, store):
+        first, second = CrawlLearner(store), CrawlLearner(store)
+        for i in range(3):
+            _record(first, f"https://a.com/{i}")
+        for i in range(2):
+            _record(second, f"https://a.com/x{i}", success=False, intel_count=0)
+        first.flush()
+        second.flush()
+
+        rows = {d["domain"]: d for d in store.load_crawl_learning()["domains"]}
+        assert rows["a.com"]["total_crawls"] == pytest.approx(5)
+        assert rows["a.com"]["successful_crawls"] == pytest.approx(3)
+        assert rows["a.com"]["intel_yield"] == pytest.approx(6)
+        pattern = store.load_crawl_learning()["page_types"][0]
+        assert pattern["total_count"] == pytest.approx(5)
+        # The later flush adopts the merged row, including the other learner's pages
+        assert second._domain_stats["a.com"].total_crawls == pytest.approx(5)
+
+    def test_quality_average_merges_across_learners(self, store):
+        first, second = CrawlLearner(store), CrawlLearner(store)
+        _record(first, "https://a.com/1", quality=1.0)
+        first.flush()
+        _record(second, "https://a.com/2", quality=0.5)
+        second.flush()
+        # Same as one learner seeing both pages in order
+        single = CrawlLearner(None)
+        _record(single, "https://a.com/1", quality=1.0)
+        _record(single, "https://a.com/2", quality=0.5)
+        row = store.load_crawl_learning()["domains"][0]
+        assert row["avg_intel_quality"] == pytest.approx(
+            single._domain_stats["a.com"].avg_intel_quality
+        )
+
+
+class TestDecayAndYield:
+    def test_counts_decay_with_half_life(self):
+        learner = CrawlLearner(None, decay_days=10)
+        month_ago = time.time() - 10 * 86400
+        learner._domain_stats["old.com"] = DomainStats(
+            domain="old.com", total_crawls=8, successful_crawls=8,
+            intel_yield=16, first_seen=month_ago, last_seen=month_ago,
+        )
+        _record(learner, "https://old.com/x", success=False, intel_count=0)
+        stats = learner._domain_stats["old.com"]
+        assert stats.total_crawls == pytest.approx(5, rel=1e-3)
+        assert stats.successful_crawls == pytest.approx(4, rel=1e-3)
+        assert stats.intel_yield == pytest.approx(8, rel=1e-3)
+
+    def test_high_yield_domains_score_higher(self):
+        learner = CrawlLearner(None)
+        for i in range(5):
+            _record(learner, f"https://rich.com/{i}", intel_count=4)
+            _record(learner, f"https://poor.com/{i}", intel_count=0)
+        rich = learner.adapt_frontier_scoring(50.0, "https://rich.com/new", {})
+        poor = learner.adapt_frontier_scoring(50.0, "https://poor.com/new", {})
+        assert rich > poor
+
+
+class TestExplorerIntegration:
+    def _explorer(self, store):
+        return IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            persistence=store,
+            llm_extractor=MagicMock(),
+            use_selenium=False,
+            enable_llm_link_rank=False,
+            enable_politeness=False,
+            enable_near_duplicate_detection=False,
+            score_threshold=-1000.0,
+        )
+
+    def test_learning_carries_over_to_next_crawl(self, store):
+        first = self._explorer(store)
+        for i in range(4):
+            first._learn_from_page(f"https://rich.com/{i}", {
+                "page_type": "official", "entity_type": "company",
+                "avg_confidence": 0.9, "has_high_confidence_intel": True,
+                "extracted_intel": [{}, {}, {}],
+            })
+            first._learn_from_page(f"https://poor.com/{i}", {
+                "page_type": "official", "entity_type": "company",
+                "avg_confidence": 0.0, "has_high_confidence_intel": False,
+                "extracted_intel": [],
+            })
+        # Within the crawl the learner already weighs each page; the scorer's
+        # own domain boost stays out of it so the outcome counts once
+        learner = first.crawl_learner
+        assert learner.get_domain_reliability("rich.com") > learner.get_domain_reliability("poor.com")
+        assert first.url_scorer.get_learned_boost("rich.com") == 0.0
+        first.crawl_learner.flush()
+
+        second = self._explorer(store)
+        assert second.url_scorer.get_learned_boost("rich.com") == 0.0
+
+        frontier = Frontier()
+        links = [
+            {"href": "https://rich.com/about", "text": "About"},
+            {"href": "https://poor.com/about", "text": "About"},
+        ]
+        second._enqueue_new_links(frontier, "https://acme.com", "", links, 0, "")
+        pushed = {url: -neg for neg, _, url, _ in frontier.heap}
+        assert pushed["https://rich.com/about"] > pushed["https://poor.com/about"]
+
+    def test_no_learning_without_extractor(self):
+        explorer = IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=False,
+            enable_politeness=False,
+        )
+        for i in range(5):
+            explorer._learn_from_page(f"https://a.com/{i}", {"has_high_confidence_intel": False})
+        assert explorer.url_scorer.get_learned_boost("a.com") == 0.0
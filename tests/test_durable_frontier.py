@@ -0,0 +1,191 @@
+"""
+Tests for the persistent, resumable crawl frontier:
+- Store-level batched push, leasing and state transitions
+- DurableFrontier write-back caching, eviction and refill
+- Explorer checkpoint/resume without refetching visited pages
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.discover.frontier import DurableFrontier, Frontier
+
+
+@pytest.fixture
+def store():
+    return SQLAlchemyStore("sqlite:///:memory:")
+
+
+def _entry(url, score, depth=0):
+    return {"url": url, "url_norm": url, "score": score, "depth": depth, "link_text": ""}
+
+
+class TestStoreFrontier:
+    def test_open_session_is_idempotent(self, store):
+        first = store.open_crawl_session("acme")
+        second = store.open_crawl_session("acme")
+        assert first["id"] == second["id"]
+        assert second["pages_explored"] == 0
+
+    def test_push_batch_dedupes_and_keeps_best_score(self, store):
+        sid = store.open_crawl_session("acme")["id"]
+        assert store.frontier_push_batch(sid, [_entry("u1", 10), _entry("u1", 30)]) == 1
+        assert store.frontier_push_batch(sid, [_entry("u1", 50), _entry("u2", 20)]) == 1
+
+        leased = store.frontier_lease_batch(sid, 10, "w1")
+        assert [(r["url"], r["score"]) for r in leased] == [("u1", 50), ("u2", 20)]
+
+    def test_leased_rows_not_leased_again_until_expired(self, store):
+        sid = store.open_crawl_session("acme")["id"]
+        store.frontier_push_batch(sid, [_entry("u1", 10)])
+        assert len(store.frontier_lease_batch(sid, 10, "w1")) == 1
+        assert store.frontier_lease_batch(sid, 10, "w2") == []
+        # Negative lease duration makes the next claim see it as expired
+        store.frontier_set_state(sid, ["u1"], "queued")
+        store.frontier_lease_batch(sid, 10, "w1", lease_seconds=-1)
+        assert len(store.frontier_lease_batch(sid, 10, "w2")) == 1
+
+    def test_done_rows_are_not_requeued_by_push(self, store):
+        sid = store.open_crawl_session("acme")["id"]
+        store.frontier_push_batch(sid, [_entry("u1", 10)])
+        store.frontier_set_state(sid, ["u1"], "done")
+        store.frontier_push_batch(sid, [_entry("u1", 99)])
+        assert store.frontier_lease_batch(sid, 10, "w1") == []
+        assert store.frontier_urls_in_state(sid, ["done"]) == ["u1"]
+
+    def test_checkpoint_round_trip(self, store):
+        sid = store.open_crawl_session("acme")["id"]
+        store.save_crawl_checkpoint(sid, 7, {"a.com": 3}, {"pages_fetched": 7}, "interrupted")
+        session = store.open_crawl_session("acme")
+        assert session["pages_explored"] == 7
+        assert session["domain_counts"] == {"a.com": 3}
+        assert session["status"] == "running"
+
+
+class TestDurableFrontier:
+    def test_same_order_as_in_memory_frontier(self, store):
+        durable = DurableFrontier(store, "s1")
+        plain = Frontier()
+        for score, depth, url in [(10, 1, "a"), (50, 2, "b"), (50, 1, "c"), (5, 0, "d")]:
+            durable.push(score, depth, url, "")
+            plain.push(score, depth, url, "")
+        assert [durable.pop() for _ in range(4)] == [plain.pop() for _ in range(4)]
+
+    def test_resume_reloads_queued_and_visited(self, store):
+        first = DurableFrontier(store, "s1")
+        assert not first.resumed
+        first.push(90, 0, "https://a.com/1", "")
+        first.push(80, 0, "https://a.com/2", "")
+        first.push(70, 0, "https://a.com/3", "")
+        first.mark_done(first.pop()[2])
+        first.checkpoint(1, {"a.com": 1})
+
+        second = DurableFrontier(store, "s1")
+        assert second.resumed
+        assert second.visited == {"https://a.com/1"}
+        assert second.checkpoint_state["pages_explored"] == 1
+        assert [second.pop()[2] for _ in range(len(second))] == [
+            "https://a.com/2", "https://a.com/3"
+        ]
+
+    def test_eviction_and_refill(self, store):
+        frontier = DurableFrontier(store, "s1", flush_every=1000, max_in_memory=4)
+        for i in range(10):
+            frontier.push(float(i), 0, f"u{i}", "")
+        assert len(frontier.heap) <= 4
+
+        popped = []
+        while len(frontier):
+            item = frontier.pop()
+            popped.append(item[2])
+            frontier.mark_done(item[2])
+        assert sorted(popped) == sorted(f"u{i}" for i in range(10))
+        assert popped[0] == "u9"
+
+    def test_resume_reclaims_leases_of_crashed_run(self, store):
+        crashed = DurableFrontier(store, "s1", max_in_memory=2)
+        for i in range(3):
+            crashed.push(float(i), 0, f"u{i}", "")
+        crashed.flush()
+        # The crashed run held leases that have not expired yet
+        store.frontier_lease_batch(crashed.session_id, 10, crashed.owner)
+
+        resumed = DurableFrontier(store, "s1")
+        assert resumed.resumed
+        assert sorted(resumed.pop()[2] for _ in range(3)) == ["u0", "u1", "u2"]
+
+    def test_len_does_not_lease(self, store):
+        frontier = DurableFrontier(store, "s1", flush_every=1000, max_in_memory=4)
+        for i in range(10):
+            frontier.push(float(i), 0, f"u{i}", "")
+        while frontier.heap:
+            frontier.mark_done(frontier.pop()[2])
+        assert frontier.store.frontier_counts(frontier.session_id).get("leased", 0) == 0
+        store.frontier_urls_in_state = MagicMock(wraps=store.frontier_urls_in_state)
+        assert len(frontier) == 10 - len(frontier.visited)
+        assert frontier.store.frontier_counts(frontier.session_id).get("leased", 0) == 0
+        # Counted in the database, not by loading the queued URLs
+        store.frontier_urls_in_state.assert_not_called()
+
+    def test_store_without_support_raises(self):
+        store = MagicMock()
+        store.open_crawl_session.return_value = None
+        with pytest.raises(ValueError):
+            DurableFrontier(store, "s1")
+
+
+class TestExplorerResume:
+    def _explorer(self, store, **kwargs):
+        from garuda_intel.explorer.engine import IntelligentExplorer
+        from garuda_intel.types.entity import EntityProfile, EntityType
+
+        return IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=False,
+            persistence=store,
+            enable_llm_link_rank=False,
+            enable_politeness=False,
+            score_threshold=0.0,
+            frontier_session="acme-crawl",
+            **kwargs,
+        )
+
+    @staticmethod
+    def _site(url, depth, browser):
+        links = [{"href": f"https://acme.com/p{i}", "text": "Acme"} for i in range(1, 6)]
+        return f"<html><body><p>{url}</p></body></html>", links if url.endswith("acme.com") else []
+
+    def test_resume_skips_already_fetched_pages(self, store):
+        first = self._explorer(store, max_total_pages=3, max_pages_per_domain=10)
+        with patch.object(first, "_fetch_page_and_links", side_effect=self._site) as fetch, \
+             patch.object(first, "_run_intelligence_pipeline", side_effect=lambda u, *a: {"url": u}):
+            first.explore(["https://acme.com"])
+        fetched_first = {c.args[0] for c in fetch.call_args_list}
+        assert len(fetched_first) == 3
+
+        session = store.open_crawl_session("acme-crawl")
+        assert session["pages_explored"] == 3
+
+        second = self._explorer(store, max_total_pages=6, max_pages_per_domain=10)
+        with patch.object(second, "_fetch_page_and_links", side_effect=self._site) as fetch, \
+             patch.object(second, "_run_intelligence_pipeline", side_effect=lambda u, *a: {"url": u}):
+            second.explore(["https://acme.com"])
+        fetched_second = {c.args[0] for c in fetch.call_args_list}
+
+        assert fetched_first.isdisjoint(fetched_second)
+        assert len(fetched_second) == 3
+        assert store.open_crawl_session("acme-crawl")["pages_explored"] == 6
+
+    def test_without_store_uses_in_memory_frontier(self):
+        from garuda_intel.explorer.engine import IntelligentExplorer
+        from garuda_intel.types.entity import EntityProfile, EntityType
+
+        explorer = IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=False,
+            frontier_session="ignored",
+        )
+        frontier = explorer._new_frontier([])
+        assert type(frontier) is Frontier
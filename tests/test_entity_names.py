@@ -0,0 +1,146 @@
+"""
+Tests for normalized entity names and aliases:
+- normalize_entity_name and the name_norm column kept in sync on write
+- Backfill of databases created before name_norm existed
+- Lookups by normalized name and alias (EntityMerger, store) use the index
+- Search matches any word of a name, not only its start
+"""
+
+import pytest
+from sqlalchemy import select, text, update
+
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.database.models import Entity, EntityAlias
+from garuda_intel.database.names import ensure_name_columns, name_match, name_word_match, normalize_entity_name
+from garuda_intel.extractor.entity_merger import EntityMerger, GraphSearchEngine
+
+
+def _norms(store):
+    with store.Session() as s:
+        return dict(s.execute(select(Entity.name, Entity.name_norm)).all())
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Acme Corp.", "acme"),
+    ("  ACME,  Inc ", "acme"),
+    ("Amazon.com Inc.", "amazoncom"),
+    ("Siemens AG", "siemens"),
+    ("Jane  Doe", "jane doe"),
+    ("Inc.", "inc"),
+    ("", ""),
+])
+def test_normalize(name, expected):
+    assert normalize_entity_name(name) == expected
+
+
+def test_name_norm_follows_name(store):
+    ids = store.save_entities([{"name": "Acme Corp.", "kind": "company"}])
+    assert _norms(store) == {"Acme Corp.": "acme"}
+    with store.Session() as s:
+        s.get(Entity, ids[("Acme Corp.", "company")]).name = "Globex Corporation"
+        s.commit()
+    assert _norms(store) == {"Globex Corporation": "globex"}
+
+
+def test_backfill(store, tmp_path):
+    store.save_entities([{"name": "Acme Corp.", "kind": "company"}, {"name": "Jane Doe", "kind": "person"}])
+    with store.engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_entity_name_norm_kind"))
+        conn.execute(text("ALTER TABLE entities DROP COLUMN name_norm"))
+    assert ensure_name_columns(store.engine, batch_size=1) == 2
+    assert _norms(store) == {"Acme Corp.": "acme", "Jane Doe": "jane doe"}
+
+    # Rows written without it (outside the ORM) are picked up on the next start
+    with store.engine.begin() as conn:
+        conn.execute(update(Entity.__table__).values(name_norm=None))
+    reopened = SQLAlchemyStore(str(store.engine.url), blob_path=None)
+    assert _norms(reopened) == {"Acme Corp.": "acme", "Jane Doe": "jane doe"}
+    reopened.engine.dispose()
+    reopened.read_engine.dispose()
+
+
+def test_lookup_uses_index(store):
+    stmt = select(Entity).where(name_match(["Acme"]))
+    sql = str(stmt.compile(store.engine, compile_kwargs={"literal_binds": True}))
+    with store.engine.connect() as conn:
+        plan = " ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+    assert "ix_entity_name_norm_kind" in plan and "ix_entity_aliases_alias_norm" in plan
+    assert "SCAN entities" not in plan
+
+
+def test_merger_matches_normalized_names(store):
+    merger = EntityMerger(store.Session)
+    entity_id, created = merger.get_or_create_entity("Acme Rockets Corp.", "company")
+    assert created
+    assert merger.get_or_create_entity("ACME ROCKETS, Inc", "company") == (entity_id, False)
+    assert merger.find_existing_entity("acme rockets", kind="company")["id"] == entity_id
+    assert merger.find_existing_entity("acme rockets", kind="person") is None
+    # Fuzzy step: normalized prefix candidates, then name similarity
+    europe_id, _ = merger.get_or_create_entity("Globex Europe GmbH", "company")
+    assert merger.find_existing_entity("GLOBEX", threshold=0.5)["id"] == europe_id
+    assert merger.find_existing_entity("GLOBEX", threshold=0.5, fuzzy_match=False) is None
+
+
+def test_aliases(store):
+    ids = store.save_entities([
+        {"name": "International Business Machines", "kind": "company"},
+        {"name": "IBM Corp", "kind": "company"},
+    ])
+    ibm = str(ids[("International Business Machines", "company")])
+    duplicate = str(ids[("IBM Corp", "company")])
+
+    # Merging makes the source's name an alias of the target
+    assert store.merge_entities(duplicate, ibm)
+    with store.Session() as s:
+        aliases = s.execute(select(EntityAlias.alias, EntityAlias.source)).all()
+    assert aliases == [("IBM Corp", "merge")]
+
+    # Resolving records the other names given, found directly from then on
+    assert store.resolve_entity_aliases("International Business Machines", ["Big Blue"]) == ibm
+    merger = EntityMerger(store.Session)
+    assert merger.find_existing_entity("big blue")["id"] == ibm
+    # Known names (also "I.B.M." = "ibm", from the merge) are skipped
+    assert store.add_entity_aliases(ibm, ["Big Blue", "International Business Machines", "I.B.M.", "Armonk"]) == 1
+    assert store.resolve_entity_aliases("ibm", []) in (ibm, duplicate)
+    # Similar by alias
+    assert [e.name for e in store.find_similar_entities("Big Blu")] == ["International Business Machines"]
+
+
+def test_word_match_finds_later_words(store):
+    store.save_entities([
+        {"name": "Satya Nadella", "kind": "person"},
+        {"name": "The Microsoft Corporation", "kind": "company"},
+        {"name": "Microsoftware Ltd", "kind": "company"},
+        {"name": "Nadia Ella", "kind": "person"},
+    ])
+    store.add_entity_aliases(
+        store.resolve_entity_aliases("Satya Nadella", []), ["CEO of MSFT"]
+    )
+
+    def search(query):
+        with store.Session() as s:
+            return sorted(e.name for e in s.execute(select(Entity).where(name_word_match(s, query))).scalars())
+
+    assert search("nadella") == ["Satya Nadella"]
+    assert search("Microsoft") == ["Microsoftware Ltd", "The Microsoft Corporation"]
+    assert search("satya nad") == ["Satya Nadella"]
+    assert search("ceo of") == ["Satya Nadella"]  # alias prefix
+    assert search("osoft") == []  # words are matched from their start
+    assert search("100%") == []
+
+
+def test_hybrid_search_uses_word_and_alias_match(store):
+    store.save_entities([
+        {"name": "Satya Nadella", "kind": "person"},
+        {"name": "The Microsoft Corporation", "kind": "company"},
+    ])
+    store.add_entity_aliases(store.resolve_entity_aliases("Satya Nadella", []), ["CEO of MSFT"])
+    engine = GraphSearchEngine(store.Session)
+
+    def search(query, kind=None):
+        return [r["entity"]["name"] for r in engine.search_entities(query, kind=kind)]
+
+    assert search("nadella") == ["Satya Nadella"]
+    assert search("ceo of") == ["Satya Nadella"]
+    assert search("microsoft", kind="person") == []
+    assert search("osoft") == []
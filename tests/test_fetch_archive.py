@@ -0,0 +1,170 @@
+"""
+Tests for the raw fetch archive and offline replay:
+- WARC-style records with status, headers and timing, zstd and gzip
+- Content addressing (revisit records), segment rotation, reopening
+- Explorer record -> replay with the network gone
+- RefreshRunner replay
+"""
+
+import os
+
+import pytest
+
+from garuda_intel.discover import fetch_archive as fetch_archive_module
+from garuda_intel.discover.fetch_archive import FetchArchive
+from garuda_intel.explorer.engine import IntelligentExplorer
+from garuda_intel.types.entity import EntityProfile, EntityType
+
+
+CODECS = ["gzip"] + (["zstd"] if fetch_archive_module.zstandard is not None else [])
+
+
+def _page(path):
+    """/ links to /a and /b; /b links back to /a."""
+    links = {"/": ["/a", "/b"], "/b": ["/a"]}.get(path, [])
+    anchors = "".join(f'<a href="{href}">Acme {href}</a>' for href in links)
+    return (
+        f"<html><head><title>Acme {path}</title></head><body>"
+        f"<p>Acme page {path} with café text.</p>{anchors}</body></html>"
+    )
+
+
+@pytest.fixture
+def site(local_site):
+    return local_site(_page)
+
+
+class TestArchiveRecords:
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_round_trip(self, tmp_path, codec):
+        archive = FetchArchive(str(tmp_path), codec=codec)
+        body = "<html>café</html>".encode("latin-1")
+        archive.record(
+            "https://Example.com/page?utm_source=x", 200,
+            {"Content-Type": "text/html; charset=latin-1", "ETag": "abc"},
+            body, elapsed=0.25,
+        )
+        hit = archive.lookup("https://example.com/page")
+        assert hit.status == 200
+        assert hit.body == body
+        assert hit.text == "<html>café</html>"
+        assert hit.headers["ETag"] == "abc"
+        assert hit.elapsed_ms == 250.0
+        assert hit.fetched_at.endswith("Z")
+        assert os.listdir(tmp_path)  # segment + index
+        raw = open(tmp_path / f"segment-00001{fetch_archive_module.SEGMENT_SUFFIX[codec]}", "rb").read()
+        assert raw[:4] != b"WARC"  # compressed on disk
+
+    def test_identical_payloads_stored_once(self, tmp_path):
+        archive = FetchArchive(str(tmp_path), codec="gzip")
+        body = b"<html>" + b"x" * 20000 + b"</html>"
+        archive.record("https://a.com/1", 200, {}, body)
+        first = archive.stats["archive_bytes_written"]
+        archive.record("https://a.com/2", 200, {}, body)
+        assert archive.stats["archive_revisits"] == 1
+        assert archive.stats["archive_bytes_written"] - first < first
+        hit = archive.lookup("https://a.com/2")
+        assert hit.record_type == "revisit"
+        assert hit.body == body
+        assert archive.summary()["payloads"] == 1
+
+    def test_latest_record_wins_and_non_200_kept(self, tmp_path):
+        archive = FetchArchive(str(tmp_path), codec="gzip")
+        archive.record("https://a.com/x", 503, {"Retry-After": "5"}, b"busy")
+        assert archive.lookup("https://a.com/x").status == 503
+        archive.record("https://a.com/x", 200, {}, b"ok")
+        assert archive.lookup("https://a.com/x").body == b"ok"
+        assert archive.lookup("https://a.com/missing") is None
+        assert archive.stats["archive_misses"] == 1
+
+    def test_segments_rotate_and_reopen(self, tmp_path):
+        archive = FetchArchive(str(tmp_path), codec="gzip", max_segment_bytes=600)
+        for i in range(10):
+            archive.record(f"https://a.com/{i}", 200, {}, os.urandom(300))
+        archive.close()
+        reopened = FetchArchive(str(tmp_path), codec="gzip", max_segment_bytes=600)
+        reopened.record("https://a.com/new", 200, {}, b"new")
+        summary = reopened.summary()
+        assert summary["segments"] > 1
+        assert summary["records"] == 11
+        assert [r.url for r in reopened.iter_records()][-1] == "https://a.com/new"
+        assert all(reopened.lookup(f"https://a.com/{i}") for i in range(10))
+
+
+class TestReplay:
+    def _explorer(self, archive, replay=False):
+        return IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=False,
+            max_total_pages=10,
+            max_pages_per_domain=10,
+            max_depth=2,
+            score_threshold=-1000.0,
+            enable_near_duplicate_detection=False,
+            politeness_min_delay=0.0,
+            fetch_archive=archive,
+            replay=replay,
+        )
+
+    def test_explorer_replays_crawl_without_network(self, tmp_path, site):
+        base = site.url
+        archive = FetchArchive(str(tmp_path / "archive"))
+        recorded = self._explorer(archive).explore([base + "/"])
+        assert len(recorded) == 3
+        assert archive.stats["archive_records"] >= 3
+        site.stop()
+        hits_before = site.hits
+
+        replayed = self._explorer(archive, replay=True).explore([base + "/"])
+        assert sorted(replayed) == sorted(recorded)
+        for url, page in recorded.items():
+            assert replayed[url]["text_content"] == page["text_content"]
+        assert "café" in next(iter(replayed.values()))["text_content"]
+        assert site.hits == hits_before
+
+    def test_replay_requires_archive(self):
+        with pytest.raises(ValueError):
+            self._explorer(None, replay=True)
+
+    def test_refresh_runner_replay(self, tmp_path):
+        from garuda_intel.database.engine import SQLAlchemyStore
+        from garuda_intel.database.refresh import RefreshRunner
+
+        store = SQLAlchemyStore("sqlite:///:memory:")
+        store.save_page({"url": "https://a.com/p", "text_content": "old", "html": "<p>old</p>"})
+        archive = FetchArchive(str(tmp_path), codec="gzip")
+        archive.record(
+            "https://a.com/p", 200, {"Content-Type": "text/html"},
+            b"<html><body><p>refreshed text</p></body></html>",
+        )
+        RefreshRunner(store, fetch_archive=archive, replay=True).run(batch=5)
+        content = store.get_page_content_by_url("https://a.com/p")
+        assert "refreshed text" in (content.get("text") or content.get("text_content") or "")
+
+
+class TestApiArchiveDir:
+    def test_archive_name_resolves_under_configured_root(self, tmp_path):
+        import importlib
+
+        _archive_dir = importlib.import_module("garuda_intel.search.run_crawl_api")._archive_dir
+
+        root = str(tmp_path)
+        assert _archive_dir("", root) == ""
+        assert _archive_dir("acme-2024.q1", root) == os.path.join(os.path.realpath(root), "acme-2024.q1")
+        for name in ["../etc", "/etc", "a/b", "..", ".hidden", "a\\b"]:
+            with pytest.raises(ValueError):
+                _archive_dir(name, root)
+        with pytest.raises(ValueError):
+            _archive_dir("acme", None)
+
+    def test_payload_cannot_choose_a_path(self, tmp_path, monkeypatch):
+        import importlib
+
+        api = importlib.import_module("garuda_intel.search.run_crawl_api")
+        seen = {}
+        monkeypatch.setattr(api, "handle_run", lambda args, return_result: seen.setdefault("dir", args.archive_dir))
+        monkeypatch.setenv("GARUDA_FETCH_ARCHIVE_ROOT", str(tmp_path))
+        api.run_crawl_api({"entity": "Acme", "archive_dir": "/tmp/elsewhere"})
+        assert seen["dir"] == ""
+        with pytest.raises(ValueError):
+            api.run_crawl_api({"entity": "Acme", "archive": "../elsewhere"})
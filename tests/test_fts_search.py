@@ -0,0 +1,136 @@
+"""
+Tests for the FTS5 keyword-search indexes:
+- Triggers keep page, snippet and intelligence indexes in sync
+- BM25 ranking, snippet/highlight excerpts, prefix phrase queries
+- Backfill of databases created before the indexes existed
+- ILIKE fallback when FTS is unavailable
+"""
+
+import uuid
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine, delete, text
+from sqlalchemy.orm import sessionmaker
+
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.database.fts import (
+    HIGHLIGHT_OPEN,
+    backfill_fts,
+    fts_available,
+    fts_match_query,
+)
+from garuda_intel.database.models import Base, Intelligence, SemanticSnippet
+from garuda_intel.database.repositories.page_repository import PageRepository
+
+
+def _add_snippet(store, text_, page_id=None):
+    with store.Session() as s:
+        s.add(SemanticSnippet(id=uuid.uuid4(), text=text_, chunk_index=0, page_id=page_id))
+        s.commit()
+
+
+class TestMatchQuery:
+    def test_phrase_with_prefix(self):
+        assert fts_match_query("Jane Do") == '"Jane Do"*'
+        assert fts_match_query('acme "corp" OR') == '"acme corp OR"*'
+
+    def test_no_terms(self):
+        assert fts_match_query("...") is None
+        assert fts_match_query("") is None
+
+    def test_non_sqlite_engine(self):
+        engine = MagicMock()
+        engine.dialect.name = "postgresql"
+        assert fts_available(engine) is False
+
+
+class TestPageSearch:
+    def test_ranked_hits_with_excerpts(self, store):
+        store.save_page({"url": "https://acme.com/a", "text_content": "Acme builds rockets.", "score": 90})
+        store.save_page({
+            "url": "https://acme.com/b",
+            "text_content": "Rockets, rockets and more rockets from Acme rocket works.",
+            "score": 10,
+        })
+        store.save_page({"url": "https://acme.com/c", "text_content": "Unrelated widgets.", "score": 50})
+
+        hits = store.search_intel("rockets")
+        assert [h["url"] for h in hits] == ["https://acme.com/b", "https://acme.com/a"]
+        assert hits[0]["rank"] > hits[1]["rank"]
+        assert f"{HIGHLIGHT_OPEN}Rockets" in hits[0]["highlight"]
+        assert HIGHLIGHT_OPEN not in hits[0]["snippet"]
+
+    def test_prefix_and_filters(self, store):
+        store.save_page({
+            "url": "https://acme.com/team", "text_content": "Our CEO is Jane Doe.",
+            "entity_type": "company", "page_type": "team",
+        })
+        assert [h["url"] for h in store.search_intel("jane do")] == ["https://acme.com/team"]
+        assert store.search_intel("jane", page_type="team")
+        assert store.search_intel("jane", entity_type="person") == []
+
+    def test_update_and_delete_resync(self, store):
+        store.save_page({"url": "https://acme.com/", "text_content": "old rockets text"})
+        store.save_page({"url": "https://acme.com/", "text_content": "new submarine text"})
+        assert store.search_intel("rockets") == []
+        assert len(store.search_intel("submarine")) == 1
+
+        with store.Session() as s:
+            s.execute(text("DELETE FROM page_content"))
+            s.commit()
+        assert store.search_intel("submarine") == []
+
+
+class TestSnippetAndIntelSearch:
+    def test_snippets(self, store):
+        _add_snippet(store, "Garuda is an intelligence platform.")
+        _add_snippet(store, "Window expansion ensures context.")
+        hits = store.search_snippets("garuda")
+        assert len(hits) == 1
+        assert hits[0]["text"].startswith("Garuda")
+        assert hits[0]["highlight"].startswith(f"{HIGHLIGHT_OPEN}Garuda")
+        # No indexable terms: falls back to ILIKE
+        assert len(store.search_snippets(".", limit=5)) == 2
+
+    def test_intelligence_json_values(self, store):
+        store.save_intelligence(
+            finding={"basic_info": {"official_name": "Acme Rockets", "industry": "Aerospace"}},
+            confidence=80.0, entity_name="Acme",
+        )
+        hits = store.search_intelligence_data("aerospace")
+        assert len(hits) == 1
+        assert hits[0]["data"]["basic_info"]["industry"] == "Aerospace"
+        # JSON keys are not indexed, only string values
+        assert store.search_intelligence_data("basic_info") == []
+
+        with store.Session() as s:
+            s.execute(delete(Intelligence))
+            s.commit()
+        assert store.search_intelligence_data("aerospace") == []
+
+
+class TestBackfill:
+    def test_existing_rows_indexed_on_open(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'old.db'}"
+        # Rows written before the FTS tables existed
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        PageRepository(sessionmaker(engine)).save_page(
+            {"url": "https://acme.com/", "text_content": "legacy rockets page"}
+        )
+        engine.dispose()
+
+        store = SQLAlchemyStore(url)
+        assert [h["url"] for h in store.search_intel("rockets")] == ["https://acme.com/"]
+        assert backfill_fts(store.engine)["page_content_fts"] == 1
+        assert [h["url"] for h in store.search_intel("rockets")] == ["https://acme.com/"]
+        store.engine.dispose()
+        store.read_engine.dispose()
+
+
+def test_store_without_fts_uses_ilike(store):
+    store.save_page({"url": "https://acme.com/", "text_content": "Acme builds rockets."})
+    store.fts_enabled = False
+    hits = store.search_intel("uilds rock")
+    assert [h["url"] for h in hits] == ["https://acme.com/"]
+    assert "rank" not in hits[0]
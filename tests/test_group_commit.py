@@ -0,0 +1,151 @@
+"""
+Tests for the group-commit write queue:
+- Intents from many threads share transactions; futures carry generated IDs
+- A failing intent only fails its own future
+- Read-your-writes for the submitting thread
+- Explorer crawl persisting through a QueuedStore
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from garuda_intel.benchmark.storage import run_page_write_benchmark
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.database.models import Link, Page, Relationship
+from garuda_intel.database.write_queue import BatchSessionFactory, QueuedStore
+from garuda_intel.explorer.engine import IntelligentExplorer
+from garuda_intel.types.entity import EntityProfile, EntityType
+
+
+def _count(store, model):
+    with store.Session() as s:
+        return s.execute(select(func.count()).select_from(model)).scalar()
+
+
+class TestQueuedStore:
+    def test_threads_share_batches(self, store):
+        queued = QueuedStore(store, max_delay=0.05)
+        ids = {}
+
+        def write(worker):
+            for i in range(10):
+                url = f"https://acme.com/{worker}/{i}"
+                ids[url] = queued.defer("save_page", {"url": url, "text_content": "x"})
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        queued.close()
+
+        assert all(f.result() for f in ids.values())
+        assert _count(store, Page) == 40
+        stats = queued.stats()
+        assert stats["intents"] == 40 and stats["commits"] < 40
+
+    def test_sync_methods_return_ids(self, store):
+        with QueuedStore(store) as queued:
+            page_id = queued.save_page({"url": "https://acme.com/", "text_content": "Acme"})
+            entity_ids = queued.save_entities([{"name": "Acme Corp", "kind": "company", "page_id": page_id}])
+            rel_id = queued.save_relationship(page_id, entity_ids[("Acme Corp", "company")], "mentions")
+        assert rel_id
+        assert store.get_page_by_url("https://acme.com/")["id"] == page_id
+
+    def test_failing_intent_is_isolated(self, store):
+        queued = QueuedStore(store, max_delay=0.2)
+        good = queued.defer("save_page", {"url": "https://acme.com/a"})
+        bad = queued.defer("save_page", {"text_content": "no url"})
+        also_good = queued.defer("save_page", {"url": "https://acme.com/b"})
+        queued.close()
+
+        with pytest.raises(ValueError):
+            bad.result()
+        assert good.result() and also_good.result()
+        assert _count(store, Page) == 2
+        assert queued.stats()["fallbacks"] == 1
+
+    def test_reads_wait_for_own_writes(self, store):
+        queued = QueuedStore(store, max_delay=0.1)
+        page_id = queued.save_page({"url": "https://acme.com/"})
+        queued.defer("save_links", "https://acme.com/", [{"href": "https://acme.com/team", "text": "Team"}])
+        queued.defer("save_relationship", page_id, page_id, "self_link")
+        # Delegated attribute access (Session, readers) waits for queued writes
+        with queued.Session() as s:
+            assert s.execute(select(func.count()).select_from(Link)).scalar() == 1
+            assert s.execute(select(func.count()).select_from(Relationship)).scalar() == 1
+        queued.close()
+
+    def test_session_factory_binding(self, store):
+        assert isinstance(store.Session, BatchSessionFactory)
+        shared = store.Session.maker()
+        with store.Session.bind(shared):
+            view = store.Session()
+            view.commit()  # flush only
+            view.close()
+            assert view._session is shared
+        assert isinstance(store.Session(), Session)
+        shared.close()
+
+        bare = SQLAlchemyStore.__new__(SQLAlchemyStore)
+        bare.Session = sessionmaker(store.engine)
+        with pytest.raises(TypeError):
+            QueuedStore(bare)
+
+    def test_write_benchmark_commits_fewer(self):
+        direct = run_page_write_benchmark(group_commit=False, writers=2, pages_per_writer=5)
+        grouped = run_page_write_benchmark(group_commit=True, writers=2, pages_per_writer=5)
+        assert direct["pages"] == grouped["pages"] == 10
+        assert grouped["commits_per_page"] < direct["commits_per_page"]
+        assert grouped["rows"] > 0
+
+
+def _page(path):
+    links = "".join(f'<a href="/p/{i}">Acme {i}</a>' for i in range(3)) if path == "/" else ""
+    return f"<html><body><p>Acme page {path} with Jane Doe.</p>{links}</body></html>"
+
+
+@pytest.fixture
+def site(local_site):
+    return local_site(_page).url
+
+
+def test_explorer_persists_through_queue(site, store):
+    llm = MagicMock()
+    llm.extract_intelligence.return_value = {
+        "basic_info": {"official_name": "Acme"}, "persons": [{"name": "Jane Doe"}],
+    }
+    llm.reflect_and_verify.return_value = (True, 80)
+    llm.extract_entities_from_finding.return_value = [
+        {"name": "Acme", "kind": "company"}, {"name": "Jane Doe", "kind": "person"},
+    ]
+    llm.infer_relationships_from_entities.return_value = []
+    llm.summarize_page.return_value = "summary"
+
+    queued = QueuedStore(store)
+    explorer = IntelligentExplorer(
+        profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+        use_selenium=False,
+        persistence=queued,
+        llm_extractor=llm,
+        enable_llm_link_rank=False,
+        enable_politeness=False,
+        max_pages_per_domain=10,
+        max_total_pages=10,
+        score_threshold=-1000.0,
+    )
+    explored = explorer.explore([site + "/"])
+    queued.close()
+
+    assert len(explored) == 4
+    assert _count(store, Page) == 4
+    assert _count(store, Link) == 3
+    with store.Session() as s:
+        kinds = set(s.execute(select(Relationship.relation_type)).scalars())
+    assert {"has-person", "has_intel_source"} <= kinds
+    assert queued.stats()["intents"] > queued.stats()["commits"]
+    assert store.get_stage_timings()[0]["crawl_id"] == explorer.crawl_id
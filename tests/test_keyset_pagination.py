@@ -0,0 +1,185 @@
+"""
+Tests for keyset pagination:
+- Pages cover every row exactly once, including rows with equal created_at
+- Score order puts rows without a score last
+- Rows inserted while paging neither repeat nor shift later pages
+- Filters, invalid cursors and unknown listings
+- The /api/list routes, JSON pages and NDJSON stream
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+from flask import Flask
+from sqlalchemy import update
+
+from garuda_intel.database.pagination import listing_keys
+from garuda_intel.webapp.routes.listing import init_listing_routes
+
+
+def _seed_entities(store, n, kind="company"):
+    store.save_entities([{"name": f"{kind} {i:03d}", "kind": kind} for i in range(n)])
+
+
+def _same_created_at(store, listing):
+    column = listing_keys(listing)[0]
+    with store.engine.begin() as conn:
+        conn.execute(update(column.table).values({column.name: datetime(2026, 1, 1)}))
+
+
+def _walk(store, listing, limit, **kwargs):
+    ids, cursor, pages = [], None, 0
+    while True:
+        page = store.list_page(listing, cursor=cursor, limit=limit, **kwargs)
+        ids += [item["id"] for item in page["items"]]
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids, pages
+
+
+def test_pages_cover_every_row_once(store):
+    _seed_entities(store, 25)
+    _same_created_at(store, "entities")
+    ids, pages = _walk(store, "entities", limit=7)
+    assert len(ids) == len(set(ids)) == 25
+    assert pages == 4
+    assert ids == sorted(ids, reverse=True)  # ties broken by id
+
+
+def test_score_order_puts_null_last(store):
+    for i, score in enumerate([0.5, None, 0.9, 0.5, None, 0.1]):
+        store.save_page({"url": f"https://acme.com/{i}", "score": score})
+    ids, _ = _walk(store, "pages", limit=2, order="score")
+    pages = {p["id"]: p for p in store.list_page("pages", limit=100)["items"]}
+    assert len(ids) == len(set(ids)) == 6
+    assert [pages[i]["score"] for i in ids] == [0.9, 0.5, 0.5, 0.1, None, None]
+
+
+def test_inserts_while_paging_do_not_shift_pages(store):
+    _seed_entities(store, 10)
+    first = store.list_page("entities", limit=4)
+    _seed_entities(store, 5, kind="person")  # newer than every listed row
+    rest, cursor = [], first["next_cursor"]
+    while cursor:
+        page = store.list_page("entities", cursor=cursor, limit=4)
+        rest += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+    seen = [item["id"] for item in first["items"]] + rest
+    assert len(seen) == len(set(seen)) == 10
+
+
+def test_filters(store):
+    _seed_entities(store, 3)
+    _seed_entities(store, 2, kind="person")
+    assert len(store.list_page("entities", kind="person")["items"]) == 2
+    assert [e["name"] for e in store.list_page("entities", name_like="COMPANY 001")["items"]] == ["company 001"]
+    assert len(store.list_page("entities", kind="", name_like=None)["items"]) == 5
+
+
+def test_invalid_requests(store):
+    with pytest.raises(ValueError):
+        store.list_page("entities", cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        store.list_page("users")
+    with pytest.raises(ValueError):
+        store.list_page("entities", order="score")
+    with pytest.raises(ValueError):
+        store.list_page("entities", url="x")
+
+
+def test_iter_listing(store):
+    page_id = store.save_page({"url": "https://acme.com/", "text_content": "Acme"})
+    store.save_entities([{"name": f"Person {i}", "kind": "person", "page_id": page_id} for i in range(12)])
+    rows = list(store.iter_listing("relationships", batch_size=5, relation_type="mentions_entity"))
+    assert len(rows) == len({r["id"] for r in rows}) == 12
+    assert all(r["source_id"] == page_id for r in rows)
+
+
+@pytest.fixture
+def client(store):
+    app = Flask(__name__)
+    app.register_blueprint(init_listing_routes(lambda f: f, store))
+    return app.test_client()
+
+
+def test_listing_routes(store, client):
+    _seed_entities(store, 5)
+    first = client.get("/api/list/entities?limit=3").get_json()
+    assert len(first["items"]) == 3 and first["next_cursor"]
+    second = client.get(f"/api/list/entities?limit=3&cursor={first['next_cursor']}").get_json()
+    assert len(second["items"]) == 2 and second["next_cursor"] is None
+
+    response = client.get("/api/list/entities/stream?kind=company")
+    assert response.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [r["id"] for r in lines] == [r["id"] for r in first["items"] + second["items"]]
+
+    assert client.get("/api/list/users").status_code == 400
+    assert client.get("/api/list/entities?cursor=bad").status_code == 400
+    assert client.get("/api/list/entities/stream?order=score").status_code == 400
+
+
+@pytest.fixture
+def graph_client(store, monkeypatch):
+    from flask import Blueprint
+
+    from garuda_intel.webapp.routes import entities
+
+    # A fresh blueprint: init_routes adds its routes to the module-level one
+    monkeypatch.setattr(entities, "bp", Blueprint("entities", entities.__name__, url_prefix="/api/entities"))
+    app = Flask(__name__)
+    app.register_blueprint(entities.init_routes(lambda f: f, None, store, None, None, None, None, None))
+    return app.test_client()
+
+
+def _seed_graph(store):
+    ids = store.save_entities([
+        {"name": "Acme Rockets", "kind": "company"},
+        {"name": "Jane Doe", "kind": "person"},
+        {"name": "Orbital Partners", "kind": "company"},
+        {"name": "Unrelated Org", "kind": "company"},
+    ])
+    ids = {name: value for (name, _), value in ids.items()}
+    store.save_intelligence(
+        {"persons": [{"name": "Jane Doe", "role": "CEO"}]}, 0.9,
+        entity_id=ids["Acme Rockets"], entity_name="Acme Rockets", entity_type="company",
+    )
+    for i in range(30):
+        store.save_intelligence({"note": f"filler {i}"}, 0.5, entity_name=f"Filler {i:02d}", entity_type="company")
+    store.save_relationship(ids["Acme Rockets"], ids["Orbital Partners"], "partner_of")
+    store.save_relationship(ids["Unrelated Org"], ids["Orbital Partners"], "partner_of")
+    return ids
+
+
+def test_entity_graph_reads_a_filtered_window(store, graph_client):
+    ids = _seed_graph(store)
+    graph = graph_client.get("/api/entities/graph?query=acme&depth=2").get_json()
+    labels = {n["label"]: n["id"] for n in graph["nodes"] if n["type"] != "intel"}
+    # Stored ids, relationships of the selected nodes only, no filler rows
+    assert labels["Acme Rockets"] == ids["Acme Rockets"]
+    assert labels["Jane Doe"] == ids["Jane Doe"]
+    assert labels["Orbital Partners"] == ids["Orbital Partners"]
+    assert "Unrelated Org" not in labels
+    assert not any(label.startswith("Filler") for label in labels)
+    assert graph["next_cursor"] is None
+
+    only_people = graph_client.get("/api/entities/graph?query=acme&type=person").get_json()
+    assert {n["label"] for n in only_people["nodes"] if n["type"] == "person"} <= {"Jane Doe"}
+
+
+def test_entity_graph_cursor_walks_every_window(store, graph_client):
+    _seed_graph(store)
+    seen, cursor, requests = [], "", 0
+    while True:
+        graph = graph_client.get(f"/api/entities/graph?limit=2&depth=0&node_types=intel&cursor={cursor}").get_json()
+        requests += 1
+        seen += [n["id"] for n in graph["nodes"] if n["type"] == "intel"]
+        cursor = graph["next_cursor"]
+        if not cursor:
+            break
+    # Four windows of 4 * limit rows cover the 31 intelligence rows
+    assert requests == 4
+    assert len(seen) == len(set(seen))
+    assert graph_client.get("/api/entities/graph?cursor=bad").status_code == 400
@@ -0,0 +1,161 @@
+"""
+Tests for marginal-gain crawl stopping:
+- Per-page gain from new entities, (gap) fields and relationships
+- Crawl-wide early stop and per-seed budget shifting
+- Fetch / LLM-call savings reported against the fixed page budget
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from garuda_intel.discover.information_gain import InformationGainTracker
+from garuda_intel.explorer.engine import IntelligentExplorer
+from garuda_intel.types.entity import EntityProfile, EntityType
+
+
+def _finding(persons=(), rels=(), **basic):
+    return {
+        "basic_info": {"official_name": "Acme", **basic},
+        "persons": [{"name": p} for p in persons],
+        "relationships": [
+            {"source": s, "target": t, "relation_type": r} for s, r, t in rels
+        ],
+    }
+
+
+def _page(*findings):
+    entities = [
+        {"name": p["name"], "kind": "person"}
+        for f in findings for p in f.get("persons", [])
+    ]
+    return {"extracted_intel": list(findings), "extracted": entities}
+
+
+class TestTracker:
+    def test_gain_counts_only_novelty(self):
+        tracker = InformationGainTracker(gap_fields=["industry"])
+        first = tracker.observe(_page(_finding(
+            persons=["Jane Doe"], rels=[("Jane Doe", "ceo_of", "Acme")],
+            industry="Rockets", website="acme.com",
+        )))
+        # entity 1.0 + gap field 2.0 + website 0.5 + persons section 0.5 + relationship 1.0
+        assert first == pytest.approx(5.0)
+        again = tracker.observe(_page(_finding(
+            persons=["jane  DOE"], rels=[("Jane Doe", "CEO_of", "acme")], industry="Space",
+        )))
+        assert again == 0.0
+        assert tracker.stats["gain_gap_fields_filled"] == 1
+        assert tracker.gap_fields_remaining == []
+
+    def test_stops_after_window_of_low_gain(self):
+        tracker = InformationGainTracker(min_gain=1.0, window=3, min_pages=3)
+        tracker.observe(_page(_finding(persons=["A", "B", "C", "D"])))
+        assert not tracker.should_stop()
+        tracker.observe(_page())
+        tracker.observe(_page())
+        assert not tracker.should_stop()  # window mean still >= 1
+        tracker.observe(_page())
+        assert tracker.should_stop()
+
+    def test_filled_gaps_stop_immediately(self):
+        tracker = InformationGainTracker(gap_fields=["founded"])
+        tracker.observe(_page(_finding(founded="1999")))
+        assert tracker.should_stop()
+
+    def test_seed_exhaustion_is_per_seed(self):
+        tracker = InformationGainTracker(seed_window=2)
+        for i in range(2):
+            tracker.observe(_page(), seed="a")
+            tracker.observe(_page(_finding(persons=[f"P{i}"])), seed="b")
+        assert tracker.seed_exhausted("a")
+        assert not tracker.seed_exhausted("b")
+        assert not tracker.seed_exhausted(None)
+
+
+def _site_page(path):
+    """/a and /b each link to ten children; /b children name new people."""
+    links = ""
+    if path in ("/a", "/b"):
+        links = "".join(f'<a href="{path}/{i}">Acme page {i}</a>' for i in range(10))
+    return f"<html><body><p>Acme {path}</p>{links}</body></html>"
+
+
+@pytest.fixture
+def site(local_site):
+    return local_site(_site_page).url
+
+
+def _llm(productive_prefixes):
+    llm = MagicMock()
+
+    def extract(profile, text, page_type, url, existing_intel=None):
+        path = "/" + url.split("/", 3)[-1]
+        if any(path.startswith(p) for p in productive_prefixes):
+            return _finding(persons=[f"Person {path}"])
+        return _finding()
+
+    llm.extract_intelligence.side_effect = extract
+    llm.reflect_and_verify.return_value = (True, 80)
+    llm.extract_entities_from_finding.side_effect = lambda f: [
+        {"name": p["name"], "kind": "person"} for p in f.get("persons", [])
+    ]
+    llm.infer_relationships_from_entities.return_value = []
+    llm.summarize_page.return_value = ""
+    return llm
+
+
+def _explorer(llm, **kwargs):
+    return IntelligentExplorer(
+        profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+        use_selenium=False,
+        llm_extractor=llm,
+        enable_llm_link_rank=False,
+        enable_politeness=False,
+        enable_near_duplicate_detection=False,
+        max_pages_per_domain=100,
+        max_total_pages=22,
+        max_depth=1,
+        max_fetch_workers=1,
+        score_threshold=-1000.0,
+        **kwargs,
+    )
+
+
+class TestExplorerIntegration:
+    def test_unproductive_crawl_stops_early_and_reports_savings(self, site):
+        explorer = _explorer(_llm([]), min_marginal_gain=0.5, marginal_gain_window=3)
+        explorer.gain_tracker.seed_window = 100  # isolate the crawl-wide rule
+        explored = explorer.explore([site + "/a", site + "/b"])
+        stats = explorer.get_crawl_stats()
+
+        assert len(explored) == 5  # min_pages
+        assert stats["gain_stopped_early"] == 1
+        # Only URLs already queued count; undiscovered pages are not estimated
+        assert 0 < stats["gain_fetches_saved"] <= 22 - 5
+        assert stats["gain_llm_calls_saved"] == 2 * stats["gain_fetches_saved"]
+
+    def test_exhausted_single_seed_ends_crawl(self, site):
+        explorer = _explorer(_llm([]), min_marginal_gain=0.5)
+        explored = explorer.explore([site + "/a"])
+        stats = explorer.get_crawl_stats()
+
+        assert len(explored) == 3  # seed_window pages from the only seed
+        assert stats["gain_urls_skipped"] == 8
+        assert stats["gain_fetches_saved"] == 8
+
+    def test_budget_shifts_to_productive_seed(self, site):
+        explorer = _explorer(_llm(["/b/"]), min_marginal_gain=0.5, marginal_gain_window=10)
+        explored = explorer.explore([site + "/a", site + "/b"])
+        stats = explorer.get_crawl_stats()
+
+        assert all(f"{site}/b/{i}" in explored for i in range(10))
+        assert sum(url.startswith(site + "/a/") for url in explored) < 10
+        assert stats["gain_urls_skipped"] > 0
+
+    def test_disabled_by_default(self, site):
+        explorer = _explorer(_llm([]))
+        explored = explorer.explore([site + "/a"])
+        assert len(explored) == 11
+        assert explorer.gain_tracker is None
+        assert "gain_pages" not in explorer.get_crawl_stats()
@@ -0,0 +1,182 @@
+"""
+Tests for SimHash-based near-duplicate page detection:
+- Fingerprint stability and Hamming distance behaviour
+- In-memory and store-backed candidate lookup
+- Explorer skips LLM extraction for near-duplicates and reports savings
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.discover.near_duplicate import (
+    NearDuplicateDetector,
+    hamming_distance,
+    simhash,
+    simhash_bands,
+    simhash_to_hex,
+)
+
+
+ARTICLE = (
+    "Acme Corporation announced today that it has completed the acquisition of "
+    "Widget Industries for an undisclosed sum. The deal expands Acme's presence "
+    "in the industrial automation market and adds more than four hundred "
+    "employees across three manufacturing sites in Ohio and Michigan. Chief "
+    "executive Jane Doe said the combined company would invest heavily in "
+    "robotics research over the next five years and expects the transaction "
+    "to be accretive to earnings within the first full fiscal year."
+)
+
+UNRELATED = (
+    "The city council met on Tuesday evening to discuss the new public library "
+    "budget, with several residents speaking in favour of extended weekend "
+    "opening hours. Council members also reviewed proposals for a bicycle lane "
+    "network along the river and agreed to commission a traffic study before "
+    "making a final decision on the route later this spring season."
+)
+
+
+class TestSimHash:
+    def test_short_text_has_no_fingerprint(self):
+        assert simhash("too short to fingerprint") is None
+        assert simhash("") is None
+
+    def test_identical_text_identical_fingerprint(self):
+        assert simhash(ARTICLE) == simhash(ARTICLE)
+
+    def test_minor_variation_is_close(self):
+        variant = ARTICLE + " Print version."
+        distance = hamming_distance(simhash(ARTICLE), simhash(variant))
+        assert distance <= 3
+
+    def test_unrelated_text_is_far(self):
+        distance = hamming_distance(simhash(ARTICLE), simhash(UNRELATED))
+        assert distance > 10
+
+    def test_bands_reassemble_fingerprint(self):
+        fp = simhash(ARTICLE)
+        bands = simhash_bands(fp)
+        assert len(bands) == 4
+        rebuilt = sum(b << (16 * i) for i, b in enumerate(bands))
+        assert rebuilt == fp
+
+
+class TestNearDuplicateDetector:
+    def test_rejects_distance_beyond_band_guarantee(self):
+        with pytest.raises(ValueError):
+            NearDuplicateDetector(max_distance=4)
+
+    def test_in_memory_detection(self):
+        detector = NearDuplicateDetector()
+        fp = detector.fingerprint(ARTICLE)
+        assert detector.find_duplicate(fp, "https://a.com/news") is None
+        detector.register(fp, "https://a.com/news", "p1")
+
+        match = detector.find_duplicate(
+            detector.fingerprint(ARTICLE + " Print version."), "https://b.com/print"
+        )
+        assert match is not None
+        assert match.url == "https://a.com/news"
+        assert match.page_id == "p1"
+
+    def test_same_url_is_not_a_duplicate(self):
+        detector = NearDuplicateDetector()
+        fp = detector.fingerprint(ARTICLE)
+        detector.register(fp, "https://a.com/news", "p1")
+        assert detector.find_duplicate(fp, "https://a.com/news") is None
+
+    def test_unrelated_page_not_matched(self):
+        detector = NearDuplicateDetector()
+        detector.register(detector.fingerprint(ARTICLE), "https://a.com/news", "p1")
+        assert detector.find_duplicate(detector.fingerprint(UNRELATED), "https://c.com") is None
+
+    def test_store_backed_detection_across_instances(self):
+        store = SQLAlchemyStore("sqlite:///:memory:")
+        page_id = store.save_page({"url": "https://a.com/news", "text_content": ARTICLE})
+
+        first = NearDuplicateDetector(store=store)
+        first.register(first.fingerprint(ARTICLE), "https://a.com/news", page_id)
+
+        # A fresh detector (new crawl) only knows the page via the table
+        second = NearDuplicateDetector(store=store)
+        match = second.find_duplicate(second.fingerprint(ARTICLE), "https://mirror.com/news")
+        assert match is not None
+        assert match.url == "https://a.com/news"
+        assert match.page_id == str(page_id)
+
+    def test_store_candidates_skip_duplicates_before_limit(self):
+        store = SQLAlchemyStore("sqlite:///:memory:")
+        fp = simhash(ARTICLE)
+        bands = simhash_bands(fp)
+        canonical_id = store.save_page({"url": "https://a.com/news", "text_content": ARTICLE})
+        store.save_page_simhash(str(canonical_id), "https://a.com/news", simhash_to_hex(fp), bands)
+        for i in range(5):
+            url = f"https://mirror{i}.com/news"
+            page_id = store.save_page({"url": url, "text_content": ARTICLE})
+            store.save_page_simhash(
+                str(page_id),
+                url,
+                simhash_to_hex(fp),
+                bands,
+                canonical_page_id=str(canonical_id),
+                distance=0,
+            )
+
+        rows = store.find_simhash_candidates(bands, url="https://b.com/news", limit=3)
+        assert [row["url"] for row in rows] == ["https://a.com/news"]
+        assert store.find_simhash_candidates(bands, url="https://a.com/news", limit=3) == []
+
+
+class TestExplorerNearDuplicateSkip:
+    @pytest.fixture
+    def explorer(self):
+        from garuda_intel.explorer.engine import IntelligentExplorer
+        from garuda_intel.types.entity import EntityProfile, EntityType
+
+        llm = MagicMock()
+        llm.extract_intelligence.return_value = []
+        llm.summarize_page.return_value = "summary"
+        store = SQLAlchemyStore("sqlite:///:memory:")
+        explorer = IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=False,
+            persistence=store,
+            llm_extractor=llm,
+            enable_llm_link_rank=False,
+        )
+        return explorer
+
+    def test_duplicate_skips_extraction_and_links_canonical(self, explorer):
+        html = f"<html><body><p>{ARTICLE}</p></body></html>"
+        print_html = f"<html><body><p>{ARTICLE} Print.</p></body></html>"
+
+        first = explorer._run_intelligence_pipeline("https://a.com/news", html, 0, 50.0)
+        second = explorer._run_intelligence_pipeline("https://a.com/news?print=1", print_html, 0, 50.0)
+
+        assert "near_duplicate_of" not in first
+        assert second["near_duplicate_of"] == "https://a.com/news"
+        assert explorer.llm_extractor.extract_intelligence.call_count == 1
+        assert explorer.llm_extractor.summarize_page.call_count == 1
+
+        rel = explorer.store.get_relationship_by_entities(
+            second["id"], first["id"], "near_duplicate_of"
+        )
+        assert rel is not None
+
+        stats = explorer.get_crawl_stats()
+        assert stats["near_duplicates"] == 1
+        assert stats["pages_processed"] == 1
+        assert stats["llm_calls_saved"] >= 2
+
+    def test_detection_can_be_disabled(self):
+        from garuda_intel.explorer.engine import IntelligentExplorer
+        from garuda_intel.types.entity import EntityProfile, EntityType
+
+        explorer = IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=False,
+            enable_near_duplicate_detection=False,
+        )
+        assert explorer.near_duplicate_detector is None
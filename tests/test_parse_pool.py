@@ -0,0 +1,178 @@
+"""
+Tests for process-pool HTML parsing:
+- Single-parse results match the separate ContentExtractor calls
+- Compact wire format and worker results match in-process parsing
+- Failed workers fall back to in-process parsing
+- Workers start from a fork server or spawn, never a fork of the crawler
+- Explorer crawl with parse workers; media candidates reach the extractor
+"""
+
+import threading
+import uuid
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+import pytest
+
+from garuda_intel.explorer.engine import IntelligentExplorer
+from garuda_intel.extractor.engine import ContentExtractor
+from garuda_intel.extractor.parse_pool import (
+    HTMLParsePool,
+    ParsedPage,
+    PendingParse,
+    parse_html,
+)
+from garuda_intel.extractor.semantic_chunker import SemanticChunker
+from garuda_intel.services.media_extractor import MediaExtractor
+from garuda_intel.types.entity import EntityProfile, EntityType
+
+
+PAGE = """<html><head><title>Acme Robotics</title>
+<meta name="description" content="Industrial robots">
+<script type="application/ld+json">{"@type": "Organization", "name": "Acme"}</script>
+</head><body>
+<nav><a href="/about">About</a></nav>
+<p>Jane Doe is the CEO of Acme. John Roe is the CTO of Acme! Acme builds robots.
+Its factory is in Lyon. It was founded in 1999?  Revenue grew.</p>
+<img src="/logo.png"><img src="data:image/png;base64,AAAA">
+<video><source src="https://cdn.example.com/intro.mp4"></video>
+<audio><source src="/talk.mp3"></audio>
+<a href="team">Team</a><a href="https://example.org/x">External</a>
+</body></html>"""
+URL = "https://acme.example.com/company/"
+
+
+class TestParseHtml:
+    def test_matches_separate_extractor_calls(self):
+        extractor = ContentExtractor()
+        parsed = parse_html(URL, PAGE, depth=1)
+
+        assert parsed.text == extractor.html_to_text(PAGE)
+        assert parsed.metadata == extractor.extract_metadata(PAGE)
+        assert parsed.metadata["structured_data"][0]["name"] == "Acme"
+        assert [link["href"] for link in parsed.links] == [
+            "https://acme.example.com/about",
+            "https://acme.example.com/company/team",
+            "https://example.org/x",
+        ]
+        assert all(link["depth"] == 2 for link in parsed.links)
+        assert parsed.media == [
+            ("image", "https://acme.example.com/logo.png"),
+            ("video", "https://cdn.example.com/intro.mp4"),
+            ("audio", "https://acme.example.com/talk.mp3"),
+        ]
+
+    def test_snippets_match_chunker(self):
+        parsed = parse_html(URL, PAGE.encode("utf-8"))
+        expected = SemanticChunker().chunk_into_snippets(parsed.text, source_url=URL, max_sentences=3)
+        assert parsed.snippets(URL) == expected
+        assert len(expected) == 3
+
+    def test_empty_html(self):
+        assert parse_html(URL, b"") == ParsedPage()
+
+    def test_wire_round_trip_rebuilds_links(self):
+        parsed = parse_html(URL, PAGE, depth=2)
+        wire = parsed.to_wire()
+        assert wire[2][0] == ("https://acme.example.com/about", "About")
+        assert ParsedPage.from_wire(wire, depth=2) == parsed
+
+
+class TestHTMLParsePool:
+    def test_workers_match_in_process(self):
+        pages = {f"{URL}{i}": PAGE.replace("Lyon", f"Lyon {i}") for i in range(6)}
+        with HTMLParsePool(workers=2) as pool:
+            assert pool.active
+            pending = {url: pool.submit(url, html, depth=1) for url, html in pages.items()}
+            results = {url: p.result() for url, p in pending.items()}
+        assert not pool.active
+        for url, html in pages.items():
+            expected = parse_html(url, html, depth=1)
+            got = results[url]
+            assert (got.text, got.metadata, got.links, got.media, got.snippet_texts) == (
+                expected.text, expected.metadata, expected.links, expected.media, expected.snippet_texts,
+            )
+            assert got.parse_ms > 0
+
+    def test_workers_are_not_forked_from_threaded_process(self):
+        # Threads running in this process must not be inherited by workers
+        stop = threading.Event()
+        busy = threading.Thread(target=stop.wait, daemon=True)
+        busy.start()
+        try:
+            with HTMLParsePool(workers=2) as pool:
+                assert pool._executor._mp_context.get_start_method() in ("forkserver", "spawn")
+                assert pool.submit(URL, PAGE).result().text == parse_html(URL, PAGE).text
+        finally:
+            stop.set()
+
+    def test_zero_workers_parse_in_process(self):
+        pool = HTMLParsePool(workers=0)
+        assert not pool.active
+        assert pool.submit(URL, PAGE).result().text == parse_html(URL, PAGE).text
+
+    def test_failed_worker_falls_back(self):
+        pool = HTMLParsePool(workers=0)
+        failed = Future()
+        failed.set_exception(RuntimeError("worker died"))
+        parsed = PendingParse(pool, URL, PAGE, 0, future=failed).result()
+        assert parsed.media and parsed.text == parse_html(URL, PAGE).text
+
+
+class TestMediaExtractor:
+    def test_candidates_skip_html_parsing(self):
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = None
+        store = MagicMock()
+        store.get_session.return_value.__enter__.return_value = session
+        extractor = MediaExtractor(store, media_processor=None, auto_process=False)
+
+        stats = extractor.extract_media_from_page(
+            uuid.uuid4(), URL, "<html></html>", candidates=parse_html(URL, PAGE).media
+        )
+        assert stats == {"images": 1, "videos": 1, "audio": 1}
+        assert [c.args[0].media_type for c in session.add.call_args_list] == ["image", "video", "audio"]
+        assert extractor.extract_media_from_page(uuid.uuid4(), URL, PAGE)["images"] == 1
+
+
+def _page(path):
+    links = "".join(f'<a href="/p/{i}">Acme {i}</a>' for i in range(3)) if path == "/" else ""
+    return (
+        f"<html><body><p>Acme page {path}. Jane Doe works here.</p>"
+        f'<img src="/img{path}.png">{links}</body></html>'
+    )
+
+
+@pytest.fixture
+def site(local_site):
+    return local_site(_page).url
+
+
+class TestExplorer:
+    def test_crawl_with_parse_workers(self, site):
+        store = MagicMock()
+        store.save_page.side_effect = lambda record: str(uuid.uuid4())
+        store.save_entities.return_value = {}
+        media = MagicMock()
+        explorer = IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=False,
+            persistence=store,
+            media_extractor=media,
+            enable_llm_link_rank=False,
+            enable_politeness=False,
+            enable_near_duplicate_detection=False,
+            max_pages_per_domain=10,
+            max_total_pages=10,
+            score_threshold=-1000.0,
+            parse_workers=2,
+        )
+        explored = explorer.explore([site + "/"])
+
+        assert sorted(explored) == [site + "/"] + [f"{site}/p/{i}" for i in range(3)]
+        assert explorer.parse_pool is None
+        home = explored[site + "/"]
+        assert home["text_content"].startswith("Acme page /.")
+        assert len(home["links"]) == 3
+        candidates = {c.kwargs["candidates"][0] for c in media.extract_media_from_page.call_args_list}
+        assert ("image", f"{site}/img/p/1.png") in candidates and len(candidates) == 4
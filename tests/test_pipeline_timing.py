@@ -0,0 +1,135 @@
+"""
+Tests for per-stage pipeline timing:
+- Lap timer with per-stage counters and nearest-rank percentiles
+- Page metadata and rolling per-crawl aggregate in the store
+- Explorer records every page; CLI report
+"""
+
+import argparse
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from garuda_intel.database.cli import cmd_stage_timings
+from garuda_intel.database.models import CrawlStageTiming, PageContent
+from garuda_intel.explorer.engine import IntelligentExplorer
+from garuda_intel.explorer.pipeline_timing import (
+    PageTiming,
+    StageTimingAggregate,
+    percentile,
+)
+from garuda_intel.types.entity import EntityProfile, EntityType
+
+
+class TestPageTiming:
+    def test_laps_accumulate_per_stage(self):
+        timing = PageTiming()
+        timing.add("fetch", 12.5)
+        timing.lap("extract", llm_calls=1, llm_tokens=100)
+        timing.lap("reflect", llm_calls=1)
+        timing.lap("extract", llm_calls=1)
+        result = timing.to_dict()
+        assert result["stages"]["fetch"]["ms"] == 12.5
+        assert result["stages"]["extract"]["llm_calls"] == 2
+        assert result["counts"] == {"llm_calls": 3, "llm_tokens": 100}
+        assert result["total_ms"] >= 12.5
+
+    def test_percentile_is_nearest_rank(self):
+        values = list(range(1, 21))
+        assert percentile(values, 50) == 10
+        assert percentile(values, 95) == 19
+        assert percentile([7.0], 95) == 7.0
+        assert percentile([], 50) == 0.0
+
+    def test_aggregate_orders_stages_and_sums_counts(self):
+        agg = StageTimingAggregate()
+        for ms in (10, 20, 30, 40):
+            agg.add({"stages": {"save_page": {"ms": ms, "db_rows": 1}, "fetch": {"ms": ms * 2}}})
+        summary = agg.summary()
+        assert list(summary) == ["fetch", "save_page"]
+        assert summary["save_page"]["p50_ms"] == 20
+        assert summary["save_page"]["p95_ms"] == 40
+        assert summary["save_page"]["counts"] == {"db_rows": 4}
+        assert agg.pages == 4
+
+
+class TestStore:
+    def test_page_timing_lands_in_page_metadata(self, store):
+        page_id = store.save_page({"url": "https://acme.com/", "metadata": {"title": "Acme"}})
+        store.save_page_timing(page_id, {"total_ms": 5.0, "stages": {}})
+        with store.Session() as s:
+            pc = s.execute(select(PageContent)).scalar_one()
+        assert pc.metadata_json == {"title": "Acme", "pipeline_timing": {"total_ms": 5.0, "stages": {}}}
+
+    def test_rolling_window_keeps_latest_crawls(self, store):
+        stage = {"pages": 2, "total_ms": 3.0, "p50_ms": 1.0, "p95_ms": 2.0, "max_ms": 2.0,
+                 "counts": {"llm_calls": 2}}
+        for i in range(4):
+            store.save_stage_timings(f"crawl-{i}", {"extract": stage, "fetch": stage},
+                                     entity_name="Acme", keep_crawls=2)
+        crawls = store.get_stage_timings(limit=10)
+        assert [c["crawl_id"] for c in crawls] == ["crawl-3", "crawl-2"]
+        assert crawls[0]["stages"]["extract"]["counts"] == {"llm_calls": 2}
+        assert store.get_stage_timings(crawl_id="crawl-2")[0]["pages"] == 2
+        with store.Session() as s:
+            assert len(s.execute(select(CrawlStageTiming)).scalars().all()) == 4
+
+
+def _page(path):
+    links = "".join(f'<a href="/p/{i}">Acme {i}</a>' for i in range(3)) if path == "/" else ""
+    return f"<html><body><p>Acme page {path} with Jane Doe.</p>{links}</body></html>"
+
+
+@pytest.fixture
+def site(local_site):
+    return local_site(_page).url
+
+
+def _llm():
+    llm = MagicMock()
+    llm.extract_intelligence.return_value = {
+        "basic_info": {"official_name": "Acme"}, "persons": [{"name": "Jane Doe"}],
+    }
+    llm.reflect_and_verify.return_value = (True, 80)
+    llm.extract_entities_from_finding.return_value = [{"name": "Jane Doe", "kind": "person"}]
+    llm.infer_relationships_from_entities.return_value = []
+    llm.summarize_page.return_value = "summary"
+    return llm
+
+
+class TestExplorer:
+    def test_every_page_timed_and_crawl_aggregated(self, site, store, capsys):
+        explorer = IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=False,
+            persistence=store,
+            llm_extractor=_llm(),
+            enable_llm_link_rank=False,
+            enable_politeness=False,
+            max_pages_per_domain=10,
+            max_total_pages=10,
+            score_threshold=-1000.0,
+        )
+        explored = explorer.explore([site + "/"])
+        assert len(explored) == 4
+
+        for record in explored.values():
+            stages = record["timing"]["stages"]
+            assert {"fetch", "parse", "extract", "reflect", "summarize", "save_page"} <= set(stages)
+            assert stages["extract"]["llm_calls"] == 1
+            assert stages["save_page"]["db_rows"] == 1
+        with store.Session() as s:
+            metadata = [pc.metadata_json for pc in s.execute(select(PageContent)).scalars()]
+        assert all("pipeline_timing" in m for m in metadata) and len(metadata) == 4
+
+        summary = explorer.get_stage_timings()
+        assert summary["fetch"]["pages"] == 4
+        assert summary["summarize"]["counts"]["llm_calls"] == 4
+        saved = store.get_stage_timings()
+        assert saved[0]["crawl_id"] == explorer.crawl_id
+        assert saved[0]["stages"]["extract"]["p95_ms"] >= saved[0]["stages"]["extract"]["p50_ms"]
+
+        cmd_stage_timings(store, argparse.Namespace(crawl_id=None, limit=5, format="table"))
+        out = capsys.readouterr().out
+        assert explorer.crawl_id in out and "summarize" in out and "p95 ms" in out
@@ -0,0 +1,250 @@
+"""
+Tests for per-host politeness scheduling:
+- Round-robin dispatch with at most one URL per host per batch
+- robots.txt disallow rules and Crawl-delay, fetched without blocking dispatch
+- Latency-adaptive delays and 429/503 backoff with bounded retries
+- Explorer integration
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+from urllib.robotparser import RobotFileParser
+
+import pytest
+
+from garuda_intel.discover.politeness import (
+    ROBOTS_POLL_SECONDS,
+    PolitenessScheduler,
+    RobotsCache,
+    _parse_retry_after,
+)
+
+
+def _robots(rules_by_host):
+    cache = RobotsCache()
+    for host, rules in rules_by_host.items():
+        cache.set_rules(host, rules)
+    return cache
+
+
+class TestRoundRobinDispatch:
+    def test_one_url_per_host_per_batch(self):
+        sched = PolitenessScheduler(min_delay=0.0)
+        for i in range(3):
+            sched.add(90 - i, 0, f"https://a.com/{i}")
+        sched.add(10, 0, "https://b.com/x")
+
+        batch = sched.next_batch(5, now=0.0)
+        hosts = sorted(url.split("/")[2] for _, _, url, _ in batch)
+        assert hosts == ["a.com", "b.com"]
+
+    def test_highest_score_first_within_host(self):
+        sched = PolitenessScheduler(min_delay=0.0)
+        sched.add(10, 0, "https://a.com/low")
+        sched.add(90, 0, "https://a.com/high")
+        assert sched.next_batch(1, now=0.0)[0][2] == "https://a.com/high"
+
+    def test_host_delay_enforced(self):
+        sched = PolitenessScheduler(min_delay=2.0)
+        sched.add(50, 0, "https://a.com/1")
+        sched.add(40, 0, "https://a.com/2")
+
+        assert len(sched.next_batch(5, now=100.0)) == 1
+        assert sched.next_batch(5, now=101.0) == []
+        assert sched.seconds_until_ready(now=101.0) == pytest.approx(1.0)
+        assert len(sched.next_batch(5, now=102.0)) == 1
+        assert sched.seconds_until_ready(now=102.0) is None
+
+
+class TestRobots:
+    def test_disallowed_url_blocked_and_counted(self):
+        sched = PolitenessScheduler(
+            robots=_robots({"a.com": "User-agent: *\nDisallow: /private"})
+        )
+        assert sched.allowed("https://a.com/public")
+        assert not sched.allowed("https://a.com/private/page")
+        assert sched.stats["robots_blocked"] == 1
+
+    def test_crawl_delay_sets_host_delay(self):
+        sched = PolitenessScheduler(
+            robots=_robots({"a.com": "User-agent: *\nCrawl-delay: 7"}), min_delay=0.5
+        )
+        sched.add(50, 0, "https://a.com/1")
+        sched.add(40, 0, "https://a.com/2")
+        sched.next_batch(1, now=0.0)
+        assert sched.seconds_until_ready(now=0.0) == pytest.approx(7.0)
+
+    def test_robots_fetched_in_background(self):
+        release = threading.Event()
+        cache = RobotsCache()
+
+        def fetch(scheme, netloc):
+            release.wait(5)
+            parser = RobotFileParser()
+            parser.parse(["User-agent: *", "Disallow: /private", "Crawl-delay: 4"])
+            return parser
+
+        sched = PolitenessScheduler(robots=cache, min_delay=0.0)
+        with patch.object(cache, "_fetch", side_effect=fetch):
+            sched.add(50, 0, "https://a.com/private/x")
+            sched.add(40, 0, "https://a.com/public")
+            # The host waits for its rules instead of blocking the caller
+            assert sched.next_batch(5, now=0.0) == []
+            assert sched.seconds_until_ready(now=0.0) == pytest.approx(ROBOTS_POLL_SECONDS)
+            release.set()
+            deadline = time.monotonic() + 5
+            while not cache.prefetch("https://a.com/") and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert [url for _, _, url, _ in sched.next_batch(5, now=0.0)] == ["https://a.com/public"]
+        assert sched.take_blocked() == ["https://a.com/private/x"]
+        assert sched.take_blocked() == []
+        assert sched.stats["robots_blocked"] == 1
+        sched.add(30, 0, "https://a.com/next")
+        assert sched.seconds_until_ready(now=0.0) == pytest.approx(4.0)
+
+    def test_close_cancels_pending_fetches(self):
+        release = threading.Event()
+        cache = RobotsCache(fetch_workers=1)
+        fetched = []
+
+        def fetch(scheme, netloc):
+            fetched.append(netloc)
+            release.wait(5)
+            return None
+
+        with patch.object(cache, "_fetch", side_effect=fetch):
+            assert not cache.prefetch("https://a.com/")
+            assert not cache.prefetch("https://b.com/")
+            cache.close()
+            release.set()
+            assert cache._pool is None
+            # b.com was still queued behind a.com and never runs; a later
+            # prefetch starts a fresh pool
+            deadline = time.monotonic() + 5
+            while not cache.prefetch("https://b.com/") and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert fetched == ["a.com", "b.com"]
+        cache.close()
+
+    def test_unreachable_robots_allows_and_is_cached(self):
+        cache = RobotsCache()
+        with patch(
+            "garuda_intel.discover.politeness.requests.get",
+            side_effect=ConnectionError("down"),
+        ) as get:
+            assert cache.can_fetch("https://down.example/a")
+            assert cache.can_fetch("https://down.example/b")
+        assert get.call_count == 1
+
+
+class TestFeedback:
+    def test_slow_host_gets_longer_delay(self):
+        sched = PolitenessScheduler(min_delay=0.5)
+        sched.add(50, 0, "https://slow.com/1")
+        sched.record_response("https://slow.com/1", 200, latency=3.0, now=0.0)
+        sched.next_batch(1, now=0.0)
+        sched.add(40, 0, "https://slow.com/2")
+        assert sched.seconds_until_ready(now=0.0) == pytest.approx(3.0)
+
+    def test_delay_recovers_with_latency(self):
+        sched = PolitenessScheduler(min_delay=0.5)
+        sched.record_response("https://a.com/1", 200, latency=12.0, now=0.0)
+        for _ in range(50):
+            sched.record_response("https://a.com/1", 200, latency=0.1, now=0.0)
+        sched.add(50, 0, "https://a.com/2")
+        sched.add(40, 0, "https://a.com/3")
+        sched.next_batch(1, now=0.0)
+        assert sched.seconds_until_ready(now=0.0) == pytest.approx(0.5)
+
+    def test_latency_does_not_undercut_crawl_delay(self):
+        sched = PolitenessScheduler(
+            robots=_robots({"a.com": "User-agent: *\nCrawl-delay: 7"}), min_delay=0.5
+        )
+        sched.add(50, 0, "https://a.com/1")
+        sched.record_response("https://a.com/1", 200, latency=20.0, now=0.0)
+        for _ in range(50):
+            sched.record_response("https://a.com/1", 200, latency=0.1, now=0.0)
+        sched.add(40, 0, "https://a.com/2")
+        sched.next_batch(1, now=0.0)
+        assert sched.seconds_until_ready(now=0.0) == pytest.approx(7.0)
+
+    def test_429_backs_off_and_requeues(self):
+        sched = PolitenessScheduler(min_delay=0.0, backoff_base=5.0, max_retries=1)
+        url = "https://busy.com/page"
+        sched.add(50, 0, url)
+        sched.next_batch(1, now=0.0)
+
+        sched.record_response(url, 429, now=0.0)
+        assert sched.requeue_if_throttled(50, 0, url)
+        assert sched.next_batch(1, now=1.0) == []
+        assert sched.next_batch(1, now=5.0)[0][2] == url
+
+        # Second throttle doubles the backoff and exhausts retries
+        sched.record_response(url, 503, now=5.0)
+        assert sched.seconds_until_ready(now=5.0) is None
+        assert not sched.requeue_if_throttled(50, 0, url)
+        assert sched.stats["throttled"] == 2
+        assert sched.stats["dropped"] == 1
+
+    def test_retry_after_header_used(self):
+        sched = PolitenessScheduler(min_delay=0.0)
+        sched.add(50, 0, "https://busy.com/a")
+        sched.record_response("https://busy.com/a", 429, retry_after="12", now=0.0)
+        assert sched.seconds_until_ready(now=0.0) == pytest.approx(12.0)
+
+    def test_non_throttled_url_not_requeued(self):
+        sched = PolitenessScheduler()
+        sched.record_response("https://a.com/x", 404, now=0.0)
+        assert not sched.requeue_if_throttled(50, 0, "https://a.com/x")
+
+    def test_parse_retry_after_invalid(self):
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("not a date") is None
+
+
+class TestExplorerIntegration:
+    def _explorer(self, **kwargs):
+        from garuda_intel.explorer.engine import IntelligentExplorer
+        from garuda_intel.types.entity import EntityProfile, EntityType
+
+        return IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=False,
+            enable_llm_link_rank=False,
+            **kwargs,
+        )
+
+    def test_disallowed_seed_not_fetched(self):
+        explorer = self._explorer(
+            robots_cache=_robots({"a.com": "User-agent: *\nDisallow: /"}),
+            politeness_min_delay=0.0,
+        )
+        with patch.object(explorer, "_fetch_with_requests", return_value="") as fetch:
+            explorer.explore(["https://a.com/about"])
+        fetch.assert_not_called()
+        assert explorer.get_crawl_stats()["robots_blocked"] == 1
+        # Only fetched URLs are visited and count against their domain
+        assert explorer._normalize_url("https://a.com/about") not in explorer.visited_urls
+        assert sum(explorer.domain_counts.values()) == 0
+
+    def test_explore_closes_robots_threads(self):
+        cache = RobotsCache()
+        explorer = self._explorer(robots_cache=cache, politeness_min_delay=0.0)
+        with patch.object(cache, "_fetch", return_value=None), patch.object(
+            explorer, "_fetch_with_requests", return_value=""
+        ):
+            explorer.explore(["https://a.com/about"])
+        assert cache._pool is None
+
+    def test_fetch_reports_status_to_scheduler(self):
+        explorer = self._explorer(respect_robots_txt=False)
+        response = MagicMock(status_code=429, text="", headers={"Retry-After": "3"})
+        with patch("garuda_intel.explorer.engine.requests.get", return_value=response):
+            assert explorer._fetch_with_requests("https://busy.com/x") == ""
+        assert explorer.politeness_scheduler.stats["throttled"] == 1
+
+    def test_politeness_can_be_disabled(self):
+        explorer = self._explorer(enable_politeness=False)
+        assert explorer.politeness_scheduler is None
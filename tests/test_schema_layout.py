@@ -0,0 +1,165 @@
+"""
+Tests for the schema layouts:
+- The derived flat schema matches the models loaded with GARUDA_SCHEMA_LAYOUT=flat
+- migrate_to_flat copies, catches up and removes deleted rows
+- A migrated database opens and is usable in the flat layout
+- Opening a database of the other layout is refused
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from garuda_intel.benchmark.storage import run_layout_benchmark
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.database.layout import check_layout, flat_metadata, migrate_to_flat
+from garuda_intel.database.models import FLAT_LAYOUT, Base, Entity
+
+pytestmark = pytest.mark.skipif(FLAT_LAYOUT, reason="migration runs with the joined layout")
+
+
+def run_flat(code: str) -> dict:
+    """Run *code* in an interpreter with the flat layout; it prints a JSON result."""
+    env = dict(os.environ, GARUDA_SCHEMA_LAYOUT="flat", PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)], env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def schema(metadata) -> dict:
+    return {
+        t.name: {
+            "columns": sorted((c.name, str(c.type), c.primary_key, c.nullable) for c in t.columns),
+            "fks": sorted(fk.target_fullname for fk in t.foreign_keys),
+            "indexes": sorted((ix.name, tuple(c.name for c in ix.columns), ix.unique) for ix in t.indexes),
+        }
+        for t in metadata.sorted_tables
+    }
+
+
+@pytest.fixture
+def source(tmp_path):
+    store = SQLAlchemyStore(f"sqlite:///{tmp_path / 'joined.db'}", blob_path=None)
+    yield store
+    store.engine.dispose()
+    store.read_engine.dispose()
+
+
+def _seed(store):
+    ids = store.save_entities([
+        {"name": "Acme Rockets", "kind": "company"},
+        {"name": "Jane Doe", "kind": "person"},
+    ])
+    acme, jane = ids[("Acme Rockets", "company")], ids[("Jane Doe", "person")]
+    store.save_relationship(jane, acme, "works_at")
+    store.save_page({"url": "https://acme.com/team", "text_content": "Jane Doe builds rockets at Acme."})
+    return acme, jane
+
+
+def test_flat_metadata_matches_flat_models():
+    flat_models = run_flat("""
+        import json
+        from garuda_intel.database.models import Base
+        print(json.dumps({t.name: {
+            "columns": sorted((c.name, str(c.type), c.primary_key, c.nullable) for c in t.columns),
+            "fks": sorted(fk.target_fullname for fk in t.foreign_keys),
+            "indexes": sorted((ix.name, [c.name for c in ix.columns], ix.unique) for ix in t.indexes),
+        } for t in Base.metadata.sorted_tables}))
+    """)
+    derived = json.loads(json.dumps(schema(flat_metadata())))
+    assert derived == flat_models
+    assert "entries" not in derived
+    assert "entries.id" not in derived["relationships"]["fks"]
+
+
+class TestMigration:
+    def test_copy_catch_up_and_delete(self, source, tmp_path):
+        acme, jane = _seed(source)
+        target = create_engine(f"sqlite:///{tmp_path / 'flat.db'}")
+
+        counts = migrate_to_flat(source.engine, target, batch_size=1)
+        assert counts["entities"] == 2 and counts["relationships"] == 1 and counts["deleted"] == 0
+        assert "entries" in inspect(target).get_view_names()
+        with target.connect() as conn:
+            types = dict(conn.execute(text("SELECT id, entry_type FROM entries")).all())
+            assert len(types) == sum(v for k, v in counts.items() if k != "deleted")
+            row = conn.execute(text("SELECT entry_type, created_at FROM entities WHERE name = 'Acme Rockets'")).one()
+            assert row.entry_type == "entity" and row.created_at is not None
+
+        # Writes between passes are picked up, deletions removed
+        source.save_entities([{"name": "Globex", "kind": "company"}])
+        with source.Session() as s:
+            s.delete(s.get(Entity, jane))
+            s.commit()
+        counts = migrate_to_flat(source.engine, target)
+        assert counts["deleted"] >= 1
+        with target.connect() as conn:
+            names = set(conn.execute(text("SELECT name FROM entities")).scalars())
+        assert names == {"Acme Rockets", "Globex"}
+        target.dispose()
+
+    def test_migrated_database_opens_flat(self, source, tmp_path):
+        _seed(source)
+        flat_path = tmp_path / "flat.db"
+        target = create_engine(f"sqlite:///{flat_path}")
+        migrate_to_flat(source.engine, target)
+        target.dispose()
+
+        result = run_flat(f"""
+            import json
+            from garuda_intel.database.engine import SQLAlchemyStore
+            store = SQLAlchemyStore("sqlite:///{flat_path}", blob_path=None)
+            ids = store.save_entities([{{"name": "Initech", "kind": "company"}}])
+            jane = store.get_entities(name_like="Jane")[0]["id"]
+            rel = store.save_relationship(jane, ids[("Initech", "company")], "advises")
+            relations = store.get_all_relationships_for_entity(jane)
+            print(json.dumps({{
+                "hits": [h["url"] for h in store.search_intel("rockets")],
+                "entities": sorted(e["name"] for e in store.get_entities()),
+                "relationships": sorted(
+                    (r.relation_type, r.source_type, r.target_type) for r in relations
+                ),
+            }}))
+        """)
+        assert result["hits"] == ["https://acme.com/team"]
+        assert result["entities"] == ["Acme Rockets", "Initech", "Jane Doe"]
+        assert result["relationships"] == [
+            ["advises", "entity", "entity"], ["works_at", "entity", "entity"],
+        ]
+
+    def test_refuses_joined_target(self, source, tmp_path):
+        with pytest.raises(RuntimeError):
+            migrate_to_flat(source.engine, source.engine)
+
+
+def test_layout_mismatch_is_refused(tmp_path):
+    flat = create_engine(f"sqlite:///{tmp_path / 'flat.db'}")
+    empty = create_engine("sqlite://")
+    Base.metadata.create_all(empty)
+    migrate_to_flat(empty, flat)
+    with pytest.raises(RuntimeError, match="GARUDA_SCHEMA_LAYOUT=flat"):
+        check_layout(flat)
+    flat.dispose()
+
+    joined = tmp_path / "joined.db"
+    SQLAlchemyStore(f"sqlite:///{joined}", blob_path=None).engine.dispose()
+    with pytest.raises(subprocess.CalledProcessError) as exc:
+        run_flat(f"""
+            from garuda_intel.database.engine import SQLAlchemyStore
+            SQLAlchemyStore("sqlite:///{joined}")
+        """)
+    assert "migrate-layout" in exc.value.stderr
+
+
+def test_layout_benchmark():
+    results = run_layout_benchmark(rows=300, lookups=50, batch_size=100)
+    assert set(results) == {"joined", "flat"}
+    for r in results.values():
+        assert r["rows"] == 300 and r["lookup_us"] > 0 and r["generic_lookup_us"] > 0
+    assert results["flat"]["db_bytes"] < results["joined"]["db_bytes"]
@@ -0,0 +1,168 @@
+"""
+Tests for cached, coalesced seed search:
+- Persistent search-result cache keyed by normalized query, with TTL
+- Concurrent identical queries share one provider call
+- Rate-limit aware (AIMD) concurrency with backoff retries
+- Fixture provider for hermetic discovery
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from garuda_intel.cache.search_cache import SearchCache, normalize_query
+from garuda_intel.search.providers import FixtureSearchProvider, SearchProvider, SearchRateLimited
+from garuda_intel.search.seed_discovery import (
+    AdaptiveConcurrencyLimiter,
+    SearchService,
+    collect_candidates,
+    collect_candidates_simple,
+)
+
+
+class SlowProvider(SearchProvider):
+    name = "slow"
+
+    def __init__(self, delay=0.1, rate_limit_first=0):
+        self.delay = delay
+        self.rate_limit_first = rate_limit_first
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def search(self, query, max_results):
+        with self._lock:
+            self.calls.append(query)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            throttled = len(self.calls) <= self.rate_limit_first
+        try:
+            time.sleep(self.delay)
+            if throttled:
+                raise SearchRateLimited("429")
+            return [{"href": f"https://{normalize_query(query).replace(' ', '-')}.com"}, "https://plain.com"]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestSearchCache:
+    def test_normalized_round_trip_and_ttl(self, tmp_path):
+        cache = SearchCache(str(tmp_path / "search.db"), ttl_seconds=60)
+        cache.put("ddg", "Acme  Corp", 5, [{"href": "https://acme.com"}])
+        assert cache.get("ddg", " acme corp ", 5) == [{"href": "https://acme.com"}]
+        assert cache.get("ddg", "acme corp", 10) is None
+        assert cache.get("other", "acme corp", 5) is None
+
+        expired = SearchCache(str(tmp_path / "search.db"), ttl_seconds=-1)
+        expired.put("ddg", "old", 5, [])
+        assert expired.get("ddg", "old", 5) is None
+        assert expired.cleanup_expired() == 1
+        assert cache.get_stats()["valid_entries"] == 1
+
+    def test_service_reuses_cache_across_instances(self, tmp_path):
+        path = str(tmp_path / "search.db")
+        provider = SlowProvider(delay=0)
+        first = SearchService(provider, SearchCache(path))
+        results = first.search("Acme Corp", 5)
+        assert results == [{"href": "https://acme-corp.com"}, {"href": "https://plain.com"}]
+
+        second = SearchService(provider, SearchCache(path))
+        assert second.search("acme   CORP", 5) == results
+        assert provider.calls == ["Acme Corp"]
+        assert second.get_stats()["search_cache_hits"] == 1
+
+    def test_failures_are_not_cached(self, tmp_path):
+        provider = SlowProvider(delay=0, rate_limit_first=1)
+        service = SearchService(provider, SearchCache(str(tmp_path / "s.db")), max_retries=0)
+        with pytest.raises(SearchRateLimited):
+            service.search("q", 5)
+        assert service.search("q", 5)
+        assert len(provider.calls) == 2
+
+
+class TestCoalescingAndConcurrency:
+    def test_concurrent_identical_queries_share_one_call(self):
+        provider = SlowProvider(delay=0.2)
+        service = SearchService(provider)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(service.search("Acme news", 5)))
+            for _ in range(6)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert provider.calls == ["Acme news"]
+        assert len(results) == 6 and all(r == results[0] for r in results)
+        assert service.stats["search_coalesced"] == 5
+
+    def test_coalesced_callers_see_the_error(self):
+        class Failing(SearchProvider):
+            name = "failing"
+            calls = 0
+
+            def search(self, query, max_results):
+                Failing.calls += 1
+                time.sleep(0.1)
+                raise RuntimeError("boom")
+
+        service = SearchService(Failing())
+        errors = []
+
+        def run():
+            try:
+                service.search("q", 5)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(errors) == 3 and Failing.calls == 1
+
+    def test_rate_limit_halves_concurrency_and_retries(self):
+        provider = SlowProvider(delay=0.01, rate_limit_first=2)
+        service = SearchService(provider, max_concurrency=4, retry_delay=0.01)
+        results = collect_candidates([f"query {i}" for i in range(4)], 5, service=service)
+        assert len(results) == 5  # four distinct hosts + plain.com, deduplicated
+        assert service.stats["search_rate_limited"] == 2
+        assert service.limiter.limit == 1
+        assert len(provider.calls) == 6
+
+    def test_limiter_recovers_after_successes(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, increase_after=2)
+        limiter.on_rate_limited()
+        assert limiter.limit == 2
+        for _ in range(4):
+            limiter.on_success()
+        assert limiter.limit == 4
+
+    def test_provider_calls_bounded_by_limit(self):
+        provider = SlowProvider(delay=0.05)
+        service = SearchService(provider, max_concurrency=2)
+        collect_candidates([f"q{i}" for i in range(6)], 5, service=service)
+        assert provider.max_active <= 2
+
+
+class TestFixtureProvider:
+    def test_fixture_file_drives_collection(self, tmp_path):
+        path = tmp_path / "fixtures.json"
+        path.write_text(json.dumps({
+            "Acme Corp": [{"href": "https://acme.com", "title": "Acme"}],
+            "*": [{"href": "https://fallback.com"}],
+        }))
+        provider = FixtureSearchProvider.from_file(str(path))
+        service = SearchService(provider)
+        results = collect_candidates_simple(["acme corp", "unknown"], limit=5, service=service)
+        assert {r["href"] for r in results} == {"https://acme.com", "https://fallback.com"}
+        assert sorted(provider.queries) == ["acme corp", "unknown"]
+
+    def test_empty_query_list(self):
+        assert collect_candidates([], 5, service=SearchService(FixtureSearchProvider({}))) == []
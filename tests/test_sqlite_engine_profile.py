@@ -0,0 +1,109 @@
+"""
+Tests for the SQLite storage engine profile:
+- Per-connection PRAGMAs (WAL, synchronous, busy timeout, cache, mmap)
+- Read-only engine for reads; in-memory / non-SQLite fallbacks
+- Concurrent writers and readers on one file without lock errors
+"""
+
+import threading
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from garuda_intel.benchmark.storage import run_storage_benchmark
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.database.engine_factory import (
+    SQLITE_PRAGMAS,
+    create_read_engine,
+    sqlite_file_path,
+)
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+class TestEngineProfile:
+    def test_pragmas_on_every_connection(self, store):
+        assert _pragma(store.engine, "journal_mode") == "wal"
+        assert _pragma(store.engine, "synchronous") == 1  # NORMAL
+        assert _pragma(store.engine, "busy_timeout") == SQLITE_PRAGMAS["busy_timeout"]
+        assert _pragma(store.engine, "cache_size") == SQLITE_PRAGMAS["cache_size"]
+        assert store.engine.pool.size() >= 10
+
+    def test_custom_pragmas(self, tmp_path):
+        s = SQLAlchemyStore(f"sqlite:///{tmp_path / 'plain.db'}", sqlite_pragmas={"busy_timeout": 250})
+        assert _pragma(s.engine, "journal_mode") == "delete"
+        assert _pragma(s.engine, "busy_timeout") == 250
+
+    def test_sqlite_file_path(self):
+        assert sqlite_file_path("sqlite:////data/crawler.db") == "/data/crawler.db"
+        assert sqlite_file_path("sqlite:///:memory:") is None
+        assert sqlite_file_path("sqlite://") is None
+        assert sqlite_file_path("postgresql://u:p@localhost/garuda") is None
+        assert create_read_engine("sqlite:///:memory:") is None
+
+
+class TestReadEngine:
+    def test_reads_see_commits_and_reject_writes(self, store):
+        store.save_entities([{"name": "Acme Corp", "kind": "company"}])
+        assert [e["name"] for e in store.get_entities(name_like="Acme")] == ["Acme Corp"]
+        assert store.ReadSession is not store.Session
+        with store.ReadSession() as s:
+            assert _pragma(store.read_engine, "query_only") == 1
+            with pytest.raises(OperationalError):
+                s.execute(text("DELETE FROM entities"))
+
+    def test_page_listing_uses_read_pool(self, store):
+        store.save_page({"url": "https://acme.com/", "text_content": "Acme", "score": 5.0})
+        assert store.get_page_content_by_url("https://acme.com/")["text"] == "Acme"
+        assert [p.url for p in store.get_all_pages()] == ["https://acme.com/"]
+
+    def test_in_memory_store_reads_through_session(self):
+        s = SQLAlchemyStore("sqlite:///:memory:")
+        assert s.read_engine is None and s.ReadSession is s.Session
+        s.save_entities([{"name": "Acme Corp", "kind": "company"}])
+        assert s.get_entities(name_like="Acme")
+
+    def test_store_without_init_falls_back(self, store):
+        bare = SQLAlchemyStore.__new__(SQLAlchemyStore)
+        bare.Session = sessionmaker(store.engine)
+        assert bare.ReadSession is bare.Session
+
+
+class TestConcurrency:
+    def test_threads_write_and_read_without_lock_errors(self, store):
+        errors = []
+
+        def write(worker):
+            try:
+                for i in range(20):
+                    store.save_page({"url": f"https://acme.com/{worker}/{i}", "text_content": "x" * 500})
+            except Exception as e:
+                errors.append(e)
+
+        def read():
+            try:
+                for _ in range(40):
+                    store.get_all_pages(limit=20)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(6)]
+        threads += [threading.Thread(target=read) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors
+        assert len(store.get_all_pages(limit=500)) == 120
+
+    @pytest.mark.parametrize("profile", ["baseline", "tuned"])
+    def test_storage_benchmark(self, profile):
+        result = run_storage_benchmark(profile=profile, writers=2, readers=2, seconds=0.5)
+        assert result["profile"] == profile
+        assert result["writes"] > 0 and result["reads"] > 0
+        assert result["write_errors"] == 0
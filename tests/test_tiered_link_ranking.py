@@ -0,0 +1,147 @@
+"""
+Tests for tiered LLM link ranking:
+- Heuristic pre-filter sends only the top-N ambiguous links to the LLM
+- Rankings cached per (profile, canonical URL, anchor) across pages
+- Per-crawl LLM budget, after which only heuristics apply
+- Explorer integration and crawl stats
+"""
+
+from unittest.mock import MagicMock
+
+from garuda_intel.discover.frontier import Frontier
+from garuda_intel.explorer.engine import IntelligentExplorer
+from garuda_intel.explorer.link_ranker import TieredLinkRanker
+from garuda_intel.types.entity import EntityProfile, EntityType
+
+
+PROFILE = EntityProfile(name="Acme", entity_type=EntityType.COMPANY)
+
+
+def _rank_fn(score=80):
+    def rank(profile, page_url, page_text, links):
+        for link in links:
+            link["llm_score"] = score
+        return sorted(links, key=lambda link: link["href"], reverse=True)
+    return MagicMock(side_effect=rank)
+
+
+def _links(n, prefix="https://acme.com/p"):
+    return [{"href": f"{prefix}{i}", "text": f"Page {i}"} for i in range(n)]
+
+
+class TestTieredSelection:
+    def test_confident_and_blacklisted_links_skip_llm(self):
+        rank_fn = _rank_fn()
+        ranker = TieredLinkRanker(rank_fn, PROFILE, top_n=10)
+        links = _links(3)
+        scores = [(0.0, "Blacklisted pattern"), (140.0, "strong"), (30.0, "weak")]
+        ranker.rank("https://acme.com", "text", links, scores, threshold=35)
+
+        sent = rank_fn.call_args[0][3]
+        assert [link["href"] for link in sent] == ["https://acme.com/p2"]
+        assert "llm_score" not in links[0] and "llm_score" not in links[1]
+        assert links[2]["llm_score"] == 80
+        assert ranker.stats["link_rank_heuristic_only"] == 1
+
+    def test_top_n_closest_to_threshold(self):
+        rank_fn = _rank_fn()
+        ranker = TieredLinkRanker(rank_fn, PROFILE, top_n=2)
+        links = _links(4)
+        scores = [(10.0, ""), (34.0, ""), (38.0, ""), (90.0, "")]
+        ranker.rank("https://acme.com", "", links, scores, threshold=35)
+
+        sent = {link["href"] for link in rank_fn.call_args[0][3]}
+        assert sent == {"https://acme.com/p1", "https://acme.com/p2"}
+        assert ranker.stats["link_rank_heuristic_only"] == 2
+
+
+class TestCacheAndBudget:
+    def test_repeated_nav_links_ranked_once(self):
+        rank_fn = _rank_fn(60)
+        ranker = TieredLinkRanker(rank_fn, PROFILE, top_n=10)
+        for page in range(5):
+            nav = [
+                {"href": "https://acme.com/about?utm_source=nav", "text": "About  us"},
+                {"href": "https://acme.com/team/", "text": "Team"},
+            ]
+            ranker.rank(f"https://acme.com/{page}", "", nav, [(40.0, "")] * 2, 35)
+            assert all(link["llm_score"] == 60 for link in nav)
+
+        assert rank_fn.call_count == 1
+        assert ranker.stats["link_rank_llm_links"] == 2
+        assert ranker.stats["link_rank_cache_hits"] == 8
+
+    def test_cache_key_includes_profile_and_anchor(self):
+        ranker = TieredLinkRanker(_rank_fn(), PROFILE)
+        other = TieredLinkRanker(_rank_fn(), EntityProfile(name="Other", entity_type=EntityType.COMPANY))
+        link = {"href": "https://x.com/a/", "text": "A"}
+        assert ranker._key(link) == ranker._key({"href": "https://X.com/a#top", "text": " a "})
+        assert ranker._key(link) != other._key(link)
+        assert ranker._key(link) != ranker._key({"href": "https://x.com/a", "text": "B"})
+
+    def test_budget_exhaustion_falls_back_to_heuristics(self):
+        rank_fn = _rank_fn()
+        ranker = TieredLinkRanker(rank_fn, PROFILE, top_n=3, llm_budget=5)
+        for page in range(4):
+            links = _links(3, prefix=f"https://acme.com/{page}/")
+            ranker.rank("u", "", links, [(40.0, "")] * 3, 35)
+
+        assert ranker.stats["link_rank_llm_links"] == 5
+        assert ranker.budget_remaining == 0
+        assert rank_fn.call_count == 2
+
+        ranker.reset()
+        assert ranker.budget_remaining == 5
+
+    def test_llm_failure_consumes_budget_without_caching(self):
+        rank_fn = MagicMock(side_effect=RuntimeError("ollama down"))
+        ranker = TieredLinkRanker(rank_fn, PROFILE, top_n=2, llm_budget=10)
+        links = _links(2)
+        ranker.rank("u", "", links, [(40.0, "")] * 2, 35)
+        assert all("llm_score" not in link for link in links)
+        assert ranker.budget_used == 2
+        assert not ranker._cache
+
+
+class TestExplorerIntegration:
+    def _explorer(self, **kwargs):
+        llm = MagicMock()
+        llm.rank_links.side_effect = _rank_fn(120).side_effect
+        return IntelligentExplorer(
+            profile=PROFILE,
+            use_selenium=False,
+            llm_extractor=llm,
+            enable_politeness=False,
+            enable_near_duplicate_detection=False,
+            score_threshold=35,
+            **kwargs,
+        ), llm
+
+    def test_enqueue_uses_tiered_ranker(self):
+        explorer, llm = self._explorer(llm_link_rank_top_n=2)
+        links = _links(6, prefix="https://other.com/page") + [
+            {"href": "mailto:x@acme.com", "text": "Mail"},
+        ]
+        frontier = Frontier()
+        explorer._enqueue_new_links(frontier, "https://acme.com", "", links, 0, "text")
+
+        sent = llm.rank_links.call_args[0][3]
+        assert len(sent) == 2
+        stats = explorer.get_crawl_stats()
+        assert stats["link_rank_llm_links"] == 2
+        assert stats["link_rank_budget_remaining"] == 198
+        pushed = {url: -neg for neg, _, url, _ in frontier.heap}
+        assert len(pushed) == 6  # mailto link filtered by the scorer
+        assert sorted(pushed.values(), reverse=True)[:2] == [120.0, 120.0]
+
+    def test_zero_budget_means_heuristics_only(self):
+        explorer, llm = self._explorer(llm_link_rank_budget=0)
+        explorer._enqueue_new_links(
+            Frontier(), "https://acme.com", "", _links(5), 0, "text"
+        )
+        llm.rank_links.assert_not_called()
+
+    def test_disabled_ranking_has_no_ranker(self):
+        explorer, _ = self._explorer(enable_llm_link_rank=False)
+        assert explorer.link_ranker is None
+        assert "link_rank_llm_links" not in explorer.get_crawl_stats()
@@ -0,0 +1,184 @@
+"""
+Tests for the trigram candidate index of entity names:
+- The entity_name_trigrams side table follows inserts, renames and deletes
+- Backfill of entities without trigram rows, once and from the CLI, not on every open
+- In-memory index: ranking, kind filter, commits and rows of other processes
+- Side-table lookups while a large index loads in the background
+- Fuzzy lookups (EntityMerger, deduplicator, store) find reordered and misspelled names
+"""
+
+import argparse
+import time
+import uuid
+
+from sqlalchemy import delete, select
+
+from garuda_intel.database import trigrams
+from garuda_intel.database.cli import cmd_trigrams_rebuild
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.database.models import Entity, entity_name_trigrams
+from garuda_intel.database.trigrams import (
+    TrigramIndex,
+    ensure_trigram_index,
+    name_trigrams,
+    sql_candidates,
+    trigram_candidates,
+    trigram_index,
+)
+from garuda_intel.extractor.entity_merger import EntityMerger, SemanticEntityDeduplicator
+
+
+def _seed(store):
+    ids = store.save_entities([
+        {"name": "Acme Rockets Corp", "kind": "company"},
+        {"name": "Acme Rocketry", "kind": "company"},
+        {"name": "Globex Europe GmbH", "kind": "company"},
+        {"name": "Jane Doe", "kind": "person"},
+    ])
+    return {key: uuid.UUID(value) for key, value in ids.items()}
+
+
+def _side_table(store):
+    with store.Session() as s:
+        rows = s.execute(select(entity_name_trigrams.c.entity_id, entity_name_trigrams.c.trigram)).all()
+    grams = {}
+    for entity_id, gram in rows:
+        grams.setdefault(str(entity_id), set()).add(gram)
+    return grams
+
+
+def test_name_trigrams():
+    assert name_trigrams("acme") == {"  a", " ac", "acm", "cme", "me "}
+    assert name_trigrams("jo doe") == {"  j", " jo", "jo ", "  d", " do", "doe", "oe "}
+    assert name_trigrams("") == set()
+
+
+def test_side_table_follows_entities(store):
+    ids = {key: str(value) for key, value in _seed(store).items()}
+    jane = ids[("Jane Doe", "person")]
+    assert _side_table(store)[jane] == name_trigrams("jane doe")
+
+    with store.Session() as s:
+        s.get(Entity, jane).name = "Jane Smith"
+        s.delete(s.get(Entity, ids[("Acme Rocketry", "company")]))
+        s.commit()
+    grams = _side_table(store)
+    assert grams[jane] == name_trigrams("jane smith")
+    assert ids[("Acme Rocketry", "company")] not in grams
+    assert len(grams) == 3
+
+
+def test_backfill(store):
+    ids = _seed(store)
+    expected = _side_table(store)
+    with store.engine.begin() as conn:
+        conn.execute(delete(entity_name_trigrams))
+    assert ensure_trigram_index(store.engine, batch_size=1) == len(ids)
+    assert _side_table(store) == expected
+    assert ensure_trigram_index(store.engine) == 0
+
+
+def test_reopen_does_not_backfill(store):
+    ids = _seed(store)
+    expected = _side_table(store)
+    with store.engine.begin() as conn:
+        conn.execute(delete(entity_name_trigrams))
+    # A normal open does no scan of the entities; the CLI command catches up
+    reopened = SQLAlchemyStore(str(store.engine.url), blob_path=None)
+    assert _side_table(reopened) == {}
+    cmd_trigrams_rebuild(reopened, argparse.Namespace(batch_size=2))
+    assert _side_table(reopened) == expected
+    assert len(expected) == len(ids)
+    reopened.engine.dispose()
+    reopened.read_engine.dispose()
+
+
+def test_in_memory_candidates(store):
+    ids = _seed(store)
+    index = trigram_index(store.engine)
+    index.start_loading()
+    assert index.ready and len(index) == 4
+
+    hits = index.candidates("Acme Rokets")
+    assert [h for h, _ in hits[:2]] == [ids[("Acme Rockets Corp", "company")], ids[("Acme Rocketry", "company")]]
+    assert all(0 < score <= 1 for _, score in hits)
+    assert [h for h, _ in index.candidates("Jane Do", kinds=["company"])] == []
+    assert [h for h, _ in index.candidates("Jane Do", kinds=["person", "ceo"])] == [ids[("Jane Doe", "person")]]
+    # The rarest trigram list is read even past the budget
+    index.scan_budget = 1
+    assert index.candidates("Globex")[0][0] == ids[("Globex Europe GmbH", "company")]
+
+
+def test_in_memory_index_follows_commits(store):
+    ids = _seed(store)
+    index = trigram_index(store.engine)
+    index.start_loading()
+    jane = ids[("Jane Doe", "person")]
+
+    new = uuid.UUID(store.save_entities([{"name": "Initech", "kind": "company"}])[("Initech", "company")])
+    with store.Session() as s:
+        s.get(Entity, jane).name = "Jane Smith"
+        s.delete(s.get(Entity, ids[("Globex Europe GmbH", "company")]))
+        s.commit()
+        # Uncommitted changes are not visible
+        s.add(Entity(name="Initrode", kind="company"))
+        s.flush()
+        s.rollback()
+
+    assert [h for h, _ in index.candidates("initech")] == [new]
+    assert [h for h, _ in index.candidates("smith")] == [jane]
+    assert index.candidates("jane doe")[0][1] < 0.5
+    assert index.candidates("globex") == []
+    assert index.candidates("initrode")[0][0] == new
+
+
+def test_refresh_picks_up_other_processes(store):
+    _seed(store)
+    index = trigram_index(store.engine)
+    index.start_loading()
+    other = SQLAlchemyStore(str(store.engine.url), blob_path=None)
+    new = uuid.UUID(other.save_entities([{"name": "Umbrella", "kind": "company"}])[("Umbrella", "company")])
+    other.engine.dispose()
+    other.read_engine.dispose()
+
+    assert index.candidates("umbrella") == []
+    assert index.refresh(force=True) == 1
+    assert index.candidates("umbrella")[0][0] == new
+    assert index.refresh(force=True) == 0
+
+
+def test_sql_candidates_while_loading(store, monkeypatch):
+    ids = _seed(store)
+    with store.Session() as s:
+        assert sql_candidates(s, "Acme Rokets", k=1) == [ids[("Acme Rockets Corp", "company")]]
+        assert sql_candidates(s, "Jane Do", kinds=["company"]) == []
+
+    # Above the limit the index loads in a thread and the side table answers meanwhile
+    monkeypatch.setattr(trigrams, "SYNC_LOAD_LIMIT", 0)
+    loaded = []
+    monkeypatch.setattr(TrigramIndex, "load", lambda self: loaded.append(self))
+    with store.Session() as s:
+        assert trigram_candidates(s, "Jane Do") == [ids[("Jane Doe", "person")]]
+    for _ in range(100):
+        if loaded:
+            break
+        time.sleep(0.01)
+    assert loaded == [trigram_index(store.engine)]
+
+
+def test_fuzzy_lookups_use_trigram_candidates(store):
+    ids = _seed(store)
+    acme = ids[("Acme Rockets Corp", "company")]
+
+    # Not a prefix of the stored name: found by trigrams, then word similarity
+    merger = EntityMerger(store.Session)
+    assert merger.find_existing_entity("Rockets Acme", kind="company")["id"] == str(acme)
+    assert merger.find_existing_entity("Rockets Acme", kind="person") is None
+
+    duplicates = SemanticEntityDeduplicator(store.Session).find_semantic_duplicates("Doe Jane", kind="person")
+    assert [(d["entity"]["name"], d["match_type"]) for d in duplicates] == [("Jane Doe", "semantic")]
+
+    assert {e.name for e in store.find_similar_entities("Acme Rocket", kind="company")} == {
+        "Acme Rockets Corp", "Acme Rocketry",
+    }
+    assert [e.name for e in store.find_similar_entities("Globex Eurpoe", kind="company")] == ["Globex Europe GmbH"]
@@ -0,0 +1,178 @@
+"""
+Tests for URL canonicalization and the Bloom-filtered visited-URL set:
+- Canonical form (host case, ports, query filtering/sorting, fragments)
+- Bloom filter false-positive behaviour and persistence round trip
+- Store-backed exact tier and memory reporting
+- Shared use by the explorer, save_links and seed discovery
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from garuda_intel.database.engine import SQLAlchemyStore
+from garuda_intel.discover.seen_urls import BloomFilter, SeenUrlSet, url_fingerprint
+from garuda_intel.discover.url_canonical import canonicalize_url
+
+
+class TestCanonicalizeUrl:
+    @pytest.mark.parametrize("raw,expected", [
+        ("HTTPS://Example.COM:443/About/", "https://example.com/About"),
+        ("http://example.com:80", "http://example.com"),
+        ("http://example.com:8080/x", "http://example.com:8080/x"),
+        ("https://example.com/a/./b/../c", "https://example.com/a/c"),
+        ("https://example.com/page#section", "https://example.com/page"),
+        ("https://example.com/p?b=2&a=1", "https://example.com/p?a=1&b=2"),
+        ("https://example.com/p?utm_source=x&id=5&fbclid=abc", "https://example.com/p?id=5"),
+        ("https://example.com/p;jsessionid=ABC?x=1", "https://example.com/p?x=1"),
+        ("https://example.com/%7Euser", "https://example.com/~user"),
+    ])
+    def test_canonical_form(self, raw, expected):
+        assert canonicalize_url(raw) == expected
+
+    def test_distinct_query_pages_kept_apart(self):
+        assert canonicalize_url("https://a.com/news?page=1") != canonicalize_url(
+            "https://a.com/news?page=2"
+        )
+
+    def test_non_http_and_relative_unchanged(self):
+        assert canonicalize_url("mailto:x@y.com") == "mailto:x@y.com"
+        assert canonicalize_url("/relative/path") == "/relative/path"
+
+    def test_extra_tracking_params(self):
+        assert canonicalize_url("https://a.com/?src=nl&q=1", ["src"]) == "https://a.com?q=1"
+
+
+class TestBloomFilter:
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        bf = BloomFilter(capacity=5000, error_rate=0.01)
+        for i in range(5000):
+            bf.add(url_fingerprint(f"https://a.com/{i}"))
+        assert all(url_fingerprint(f"https://a.com/{i}") in bf for i in range(5000))
+        fp = sum(url_fingerprint(f"https://b.com/{i}") in bf for i in range(5000))
+        assert fp / 5000 < 0.03
+
+    def test_state_round_trip(self):
+        bf = BloomFilter(capacity=100)
+        bf.add(42)
+        clone = BloomFilter.from_state(bf.to_state())
+        assert 42 in clone
+        assert clone.count == 1
+
+    def test_memory_per_million(self):
+        assert BloomFilter.bytes_for(1_000_000, 0.01) < 1_300_000
+
+
+class TestSeenUrlSet:
+    def test_set_semantics_use_canonical_form(self):
+        seen = SeenUrlSet(capacity=1000)
+        seen.add("https://a.com/page?utm_source=x")
+        assert "https://A.com/page/" in seen
+        assert "https://a.com/other" not in seen
+        seen.add("https://a.com/page")
+        assert len(seen) == 1
+
+    def test_store_backed_survives_restart(self):
+        store = SQLAlchemyStore("sqlite:///:memory:")
+        seen = SeenUrlSet(store, scope="crawl:x", capacity=1000, flush_every=2)
+        seen.update(["https://a.com/1", "https://a.com/2", "https://a.com/3"])
+        seen.flush()
+
+        restored = SeenUrlSet(store, scope="crawl:x", capacity=1000)
+        assert "https://a.com/2" in restored
+        assert "https://a.com/9" not in restored
+        assert len(restored) == 3
+        # Exact tier is in the table, not in memory
+        assert restored.memory_report()["exact_bytes"] < 1000
+
+    def test_false_positive_resolved_by_exact_tier(self):
+        store = SQLAlchemyStore("sqlite:///:memory:")
+        seen = SeenUrlSet(store, scope="s", capacity=1000)
+        seen.add("https://a.com/1")
+        seen.flush()
+        fp = url_fingerprint("https://a.com/unseen")
+        with patch.object(BloomFilter, "__contains__", return_value=True):
+            assert "https://a.com/unseen" not in seen
+        assert seen.stats["false_positives"] == 1
+        assert fp not in store.seen_urls_exist("s", [fp])
+
+    def test_contains_many_confirms_bloom_hits_in_one_query(self):
+        store = SQLAlchemyStore("sqlite:///:memory:")
+        seen = SeenUrlSet(store, scope="s", capacity=1000)
+        seen.update(["https://a.com/1", "https://a.com/2"])
+        seen.flush()
+        urls = ["https://a.com/1", "https://a.com/2?utm_source=x", "https://a.com/3"]
+        with patch.object(store, "seen_urls_exist", wraps=store.seen_urls_exist) as exist:
+            assert seen.contains_many(urls) == [True, True, False]
+        assert exist.call_count == 1
+        assert seen.contains_many(urls) == [url in seen for url in urls]
+
+    def test_store_without_support_keeps_exact_tier(self):
+        from garuda_intel.database.store import PersistenceStore
+
+        class MinimalStore(PersistenceStore):
+            pass
+
+        MinimalStore.__abstractmethods__ = frozenset()
+        seen = SeenUrlSet(MinimalStore(), scope="s", capacity=1000)
+        seen.add("https://a.com/1")
+        seen.flush()
+        assert "https://a.com/1" in seen
+
+    def test_memory_report(self):
+        seen = SeenUrlSet(capacity=10_000)
+        seen.update(f"https://a.com/{i}" for i in range(2000))
+        report = seen.memory_report()
+        assert report["items"] == 2000
+        # Fingerprints + filter stay well under a plain set of URL strings
+        assert report["bytes_per_million"] < 150_000_000
+
+
+class TestSharedUse:
+    def test_explorer_dedupes_tracking_variants(self):
+        from garuda_intel.explorer.engine import IntelligentExplorer
+        from garuda_intel.types.entity import EntityProfile, EntityType
+
+        explorer = IntelligentExplorer(
+            profile=EntityProfile(name="Acme", entity_type=EntityType.COMPANY),
+            use_selenium=False,
+            enable_politeness=False,
+        )
+        explorer.visited_urls.add(explorer._normalize_url("https://acme.com/news?id=1"))
+        assert "https://acme.com/news?id=1&utm_medium=email" in explorer.visited_urls
+        assert "https://acme.com/news?id=2" not in explorer.visited_urls
+        assert "visited_bytes_per_million" in explorer.get_crawl_stats()
+
+    def test_save_links_collapses_variants(self):
+        from garuda_intel.database.models import Link
+
+        store = SQLAlchemyStore("sqlite:///:memory:")
+        store.save_links("https://a.com", [
+            {"href": "https://b.com/x?utm_source=a", "text": "x"},
+            {"href": "https://B.com/x#top", "text": "x"},
+        ])
+        with store.Session() as s:
+            urls = [link.to_url for link in s.query(Link).all()]
+        # The first href is kept as written; the variant is dropped
+        assert urls == ["https://b.com/x?utm_source=a"]
+
+    def test_seed_candidates_deduped_canonically(self):
+        from garuda_intel.search import seed_discovery
+
+        class FakeDDGS:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *a):
+                return False
+
+            def text(self, query, max_results=5):
+                return [
+                    {"href": "https://a.com/?utm_campaign=q"},
+                    {"href": "https://a.com/"},
+                    {"href": "https://b.com/"},
+                ]
+
+        with patch.object(seed_discovery, "DDGS", FakeDDGS):
+            results = seed_discovery.collect_candidates(["q"], 5)
+        assert len(results) == 2
@@ -0,0 +1,244 @@
+"""
+Tests for batch link scoring in URLScorer:
+- score_links matches the per-link scorer exactly (score and reasons)
+- Combined blacklist / pattern regexes keep first-match semantics
+- Learned and dynamic boosts still apply per domain
+- Domain-dependent components are computed once per host of a list
+- Domain boosts come from a dict lookup by host suffix, matching the old scan
+- Throughput benchmark of per-link vs batched scoring
+"""
+
+import random
+import re
+from urllib.parse import urlparse
+
+import pytest
+
+from garuda_intel.benchmark.scorer import run_scorer_benchmark
+from garuda_intel.explorer.scorer import URLScorer
+from garuda_intel.types.entity import EntityType
+
+
+def _legacy_score_url(scorer, url, link_text="", current_depth=0):
+    """Per-link scorer as it was before batch scoring, kept as the reference."""
+    url_lower = url.lower()
+    text_lower = link_text.lower()
+    for pattern in scorer.blacklist_compiled:
+        if pattern.search(url_lower):
+            return (0.0, "Blacklisted pattern")
+    if not url_lower.startswith(("http://", "https://")):
+        return (0.0, "Non-HTTP URL")
+
+    score = 40.0
+    reasons = ["Base topic score"]
+    if scorer.entity_type == EntityType.TOPIC:
+        for kw in ["wiki", "encyclopedia", "journal", "edu", "theory", "science"]:
+            if kw in url_lower:
+                score += 30
+                reasons.append(f"Topic-relevant domain: {kw}")
+    for word in scorer.company_words:
+        if len(word) > 3 and (word in url_lower or word in text_lower):
+            score += 50
+            reasons.append(f"Match: {word}")
+
+    domain = urlparse(url).netloc.lower()
+    clean_sld = re.sub(r"[^a-z0-9]", "", domain.replace("www.", "").split(".")[0])
+    for d in scorer.domains:
+        if d["domain"] in domain:
+            score += d.get("weight", 0)
+            reasons.append(f"Domain pattern: {d['domain']}")
+            if d.get("is_official"):
+                score += 150
+                reasons.append("Official domain")
+            break
+    if scorer.clean_company_name and clean_sld == scorer.clean_company_name:
+        score += 40
+        reasons.append("Exact company name match in domain")
+    for p in scorer.patterns:
+        pat = p.get("pattern")
+        if pat and re.search(pat, url_lower, re.IGNORECASE):
+            score += p.get("weight", 0)
+            reasons.append(f"Pattern match: {pat}")
+            break
+
+    if scorer.entity_type == EntityType.NEWS:
+        keywords = ["news", "headline", "breaking", "latest"]
+    elif scorer.entity_type == EntityType.PERSON:
+        keywords = ["bio", "profile", "interview"]
+    elif scorer.entity_type == EntityType.COMPANY:
+        keywords = ["investor", "annual report", "leadership", "board", "sec"]
+    else:
+        keywords = ["about", "article", "story"]
+    for kw in keywords:
+        if kw in url_lower or kw in text_lower:
+            score += 20
+            reasons.append(f"Keyword: {kw}")
+    for word in scorer.company_words:
+        if len(word) > 3 and (word in url_lower or word in text_lower):
+            score += 15
+            reasons.append("Name match")
+    for dom, boost in scorer.dynamic_domains.items():
+        if dom in domain:
+            score += boost
+            reasons.append(f"Learned boost: {dom}")
+    learned_boost = scorer.get_learned_boost(domain)
+    if abs(learned_boost) > 0.1:
+        score += learned_boost
+        reasons.append(f"Domain learning: {learned_boost:+.1f}")
+
+    score -= current_depth * 5
+    score = max(0, min(score, 150))
+    return score, "; ".join(reasons)
+
+
+HOSTS = ["acme.com", "www.acme.com", "news.example.org", "wiki.science.edu",
+         "investors.acme-robotics.com", "cdn.other.net", "facebook.com"]
+PATHS = ["", "/about", "/news/latest", "/investor/annual-report", "/privacy",
+         "/login", "/board", "/products/robots", "/story/123", "/feed.xml",
+         "/2024/05/acme-robotics-interview", "/careers"]
+TEXTS = ["", "Acme Robotics", "Read more", "Leadership team", "Breaking news", "Bio"]
+
+
+def _random_links(n, seed=7):
+    rng = random.Random(seed)
+    links = []
+    for _ in range(n):
+        scheme = rng.choice(["https://", "http://", "https://", "mailto:"])
+        href = f"{scheme}{rng.choice(HOSTS)}{rng.choice(PATHS)}"
+        if rng.random() < 0.2:
+            href += f"?id={rng.randint(1, 50)}"
+        links.append({"href": href, "text": rng.choice(TEXTS)})
+    links.append({"href": "javascript:void(0)", "text": "x"})
+    links.append({"href": "https://acme.com/page#", "text": ""})
+    return links
+
+
+def _scorer(entity_type=EntityType.COMPANY):
+    scorer = URLScorer(
+        "Acme Robotics Inc",
+        entity_type,
+        patterns=[
+            {"pattern": r"/investor", "weight": 30},
+            {"pattern": r"/(news|press)/", "weight": 20},
+            {"pattern": r"/\d{4}/\d{2}/", "weight": 10},
+        ],
+        domains=[
+            {"domain": "acme.com", "weight": 20, "is_official": True},
+            {"domain": "example.org", "weight": 5},
+        ],
+    )
+    scorer.boost_domain("news.example.org", 25)
+    for _ in range(3):
+        scorer.learn_domain_pattern("cdn.other.net", success=False, intel_quality=0.0)
+        scorer.learn_domain_pattern("wiki.science.edu", success=True, intel_quality=0.9)
+    return scorer
+
+
+class TestBatchEquivalence:
+    @pytest.mark.parametrize("entity_type", list(EntityType))
+    def test_matches_legacy_scorer(self, entity_type):
+        scorer = _scorer(entity_type)
+        links = _random_links(2000)
+        batch = scorer.score_links(links, current_depth=2)
+        expected = [_legacy_score_url(scorer, link["href"], link["text"], 2) for link in links]
+        assert batch == expected
+
+    def test_score_url_matches_batch(self):
+        scorer = _scorer()
+        links = _random_links(200, seed=3)
+        assert scorer.score_links(links, 1) == [
+            scorer.score_url(link["href"], link["text"], 1) for link in links
+        ]
+
+    def test_first_matching_pattern_wins(self):
+        scorer = URLScorer("Acme", EntityType.COMPANY, patterns=[
+            {"pattern": "/news/", "weight": 7},
+            {"pattern": "/news/latest", "weight": 100},
+        ])
+        (score, reason), = scorer.score_links([{"href": "https://x.com/news/latest"}])
+        assert "Pattern match: /news/" in reason
+        assert "/news/latest" not in reason
+        assert score == 47
+
+    def test_backreference_patterns_fall_back_to_loop(self):
+        scorer = URLScorer("Acme", EntityType.COMPANY, patterns=[
+            {"pattern": r"/(\w+)/\1", "weight": 10},
+            {"pattern": r"/(a)(b)/\2", "weight": 5},
+        ])
+        _, combined = scorer._compiled_patterns()
+        assert combined is None
+        links = [{"href": "https://x.com/docs/docs"}, {"href": "https://x.com/ab/b"}]
+        assert scorer.score_links(links) == [
+            _legacy_score_url(scorer, link["href"], "", 0) for link in links
+        ]
+
+    def test_patterns_replaced_after_construction(self):
+        scorer = URLScorer("Acme", EntityType.COMPANY)
+        assert scorer.score_links([{"href": "https://x.com/team"}])[0][0] == 40
+        scorer.patterns = [{"pattern": "/team", "weight": 15}]
+        assert scorer.score_links([{"href": "https://x.com/team"}])[0][0] == 55
+
+    def test_patterns_edited_in_place(self):
+        patterns = [{"pattern": "/team", "weight": 15}]
+        scorer = URLScorer("Acme", EntityType.COMPANY, patterns=patterns)
+        assert scorer.score_url("https://x.com/team")[0] == 55
+        patterns[0] = {"pattern": "/team", "weight": 30}
+        assert scorer.score_url("https://x.com/team")[0] == 70
+        patterns[0] = {"pattern": "/staff", "weight": 30}
+        assert scorer.score_url("https://x.com/team")[0] == 40
+
+    def test_domain_index_matches_scan(self):
+        domains = [{"domain": f"site{i}.example.org", "weight": i % 7} for i in range(500)]
+        domains += [
+            {"domain": "example.org", "weight": 3},
+            {"domain": "acme.com", "weight": 20, "is_official": True},
+            {"domain": "www.acme.com", "weight": 50},
+        ]
+        scorer = URLScorer("Acme Robotics Inc", EntityType.COMPANY, domains=domains)
+        for i in range(0, 500, 5):
+            scorer.boost_domain(f"site{i}.example.org", i)
+        scorer.boost_domain("example.org", 4)
+        scorer.boost_domain("site10.example.org", 1)
+        hosts = [f"site{i}.example.org" for i in range(0, 520, 3)] + [
+            "www.acme.com", "acme.com:8443", "user@news.example.org", "other.net", "org",
+        ]
+        links = [{"href": f"https://{host}/news/latest", "text": "Acme"} for host in hosts]
+        assert scorer.score_links(links) == [
+            _legacy_score_url(scorer, link["href"], link["text"], 0) for link in links
+        ]
+
+    def test_domains_replaced_after_construction(self):
+        scorer = URLScorer("Acme", EntityType.COMPANY)
+        assert scorer.score_url("https://x.com/")[0] == 40
+        scorer.domains = [{"domain": "x.com", "weight": 12}]
+        assert scorer.score_url("https://x.com/")[0] == 52
+
+    def test_missing_text_and_empty_list(self):
+        scorer = _scorer()
+        assert scorer.score_links([]) == []
+        assert scorer.score_links([{"href": "https://acme.com/x", "text": None}])[0][0] > 0
+
+
+class TestBatchWork:
+    def test_domain_components_once_per_host(self, monkeypatch):
+        scorer = _scorer()
+        links = _random_links(5000, seed=11)
+        expected = [_legacy_score_url(scorer, link["href"], link["text"], 1) for link in links]
+
+        calls = []
+        domain_score = scorer._domain_score
+        monkeypatch.setattr(scorer, "_domain_score", lambda domain: calls.append(domain) or domain_score(domain))
+        assert scorer.score_links(links, 1) == expected
+        hosts = {
+            urlparse(link["href"]).netloc.lower()
+            for link in links
+            if link["href"].startswith("http")
+        }
+        assert sorted(calls) == sorted(hosts)
+
+    def test_benchmark_reports_both_modes(self):
+        r = run_scorer_benchmark(links=500, hosts=20, domains=50, page_size=50, repeats=1)
+        assert r["links"] == 500
+        assert r["identical"]
+        assert r["per_link_links_per_second"] > 0
+        assert r["batch_links_per_second"] > 0